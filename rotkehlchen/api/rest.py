@@ -6,15 +6,15 @@ import sys
 import tempfile
 import traceback
 from collections import defaultdict
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Hashable, Sequence
 from http import HTTPStatus
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, Optional, cast, get_args, overload
 from zipfile import BadZipFile, ZipFile
 
 import gevent
-from flask import Response, after_this_request, make_response, send_file
-from gevent.event import Event
+from flask import Response, after_this_request, make_response, request, send_file
+from gevent.event import AsyncResult, Event
 from gevent.lock import Semaphore
 from marshmallow.exceptions import ValidationError
 from pysqlcipher3 import dbapi2 as sqlcipher
@@ -40,6 +40,7 @@ from rotkehlchen.accounting.pot import AccountingPot
 from rotkehlchen.accounting.structures.balance import Balance, BalanceSheet, BalanceType
 from rotkehlchen.accounting.structures.processed_event import AccountingEventExportType
 from rotkehlchen.accounting.structures.types import ActionType
+from rotkehlchen.api.task_results import TaskResultsStore, serialize_task_result
 from rotkehlchen.api.v1.schemas import TradeSchema
 from rotkehlchen.api.v1.types import IncludeExcludeFilterData
 from rotkehlchen.assets.asset import (
@@ -101,12 +102,14 @@ from rotkehlchen.constants.limits import (
 )
 from rotkehlchen.constants.misc import (
     AIRDROPS_TOLERANCE,
+    APPDIR_NAME,
     AVATARIMAGESDIR_NAME,
     DEFAULT_MAX_LOG_BACKUP_FILES,
     DEFAULT_MAX_LOG_SIZE_IN_MB,
     DEFAULT_SQL_VM_INSTRUCTIONS_CB,
     HTTP_STATUS_INTERNAL_DB_ERROR,
     IMAGESDIR_NAME,
+    TASKRESULTSDIR_NAME,
     ZERO,
 )
 from rotkehlchen.constants.prices import ZERO_PRICE
@@ -124,6 +127,7 @@ from rotkehlchen.db.constants import (
 )
 from rotkehlchen.db.custom_assets import DBCustomAssets
 from rotkehlchen.db.ens import DBEns
+from rotkehlchen.db.eth2 import DBEth2
 from rotkehlchen.db.evmtx import DBEvmTx
 from rotkehlchen.db.filtering import (
     AccountingRulesFilterQuery,
@@ -168,6 +172,7 @@ from rotkehlchen.errors.misc import (
     DBUpgradeError,
     EthSyncError,
     GreenletKilledError,
+    InflightResultAbortedError,
     InputError,
     ModuleInactive,
     RemoteError,
@@ -296,6 +301,38 @@ def _wrap_in_result(result: Any, message: str) -> dict[str, Any]:
     return {'result': result, 'message': message}
 
 
+def _freeze_query_argument(value: Any) -> Hashable:
+    """Turn a validated query argument into a hashable value that compares equal only
+    to identical arguments. The type is kept so that e.g. 1 and True don't match.
+
+    May raise TypeError if the value can't be hashed."""
+    if isinstance(value, list | tuple):
+        frozen: Hashable = tuple(_freeze_query_argument(x) for x in value)
+    elif isinstance(value, set | frozenset):
+        frozen = frozenset(_freeze_query_argument(x) for x in value)
+    elif isinstance(value, dict):
+        frozen = tuple(sorted(
+            ((_freeze_query_argument(k), _freeze_query_argument(v)) for k, v in value.items()),
+            key=repr,
+        ))
+    else:
+        hash(value)
+        frozen = value
+    return type(value), frozen
+
+
+def _async_query_key(command: Callable, kwargs: dict[str, Any]) -> Hashable | None:
+    """Return the key identifying an async query by its command and validated arguments,
+    or None if the query can't be deduplicated since an argument is not hashable.
+    Arguments without value equality only match themselves so they are never deduped."""
+    try:
+        return (command.__name__, *(
+            (name, _freeze_query_argument(value)) for name, value in sorted(kwargs.items())
+        ))
+    except TypeError:
+        return None
+
+
 def wrap_in_fail_result(message: str, status_code: HTTPStatus | None = None) -> dict[str, Any]:
     result: dict[str, Any] = {'result': None, 'message': message}
     if status_code:
@@ -401,7 +438,12 @@ class RestAPI:
         self.task_lock = Semaphore()
         self.login_lock = Semaphore()
         self.task_id = 0
-        self.task_results: dict[int, Any] = {}
+        self.task_results = TaskResultsStore(
+            spill_dir=self.rotkehlchen.data_dir / APPDIR_NAME / TASKRESULTSDIR_NAME,
+        )
+        # results of ongoing async queries keyed by their call signature. Identical
+        # queries made while one is ongoing wait for its result instead of running again
+        self.inflight_async_queries: dict[Hashable, AsyncResult] = {}
         self.trade_schema = TradeSchema()
 
     # - Private functions not exposed to the API
@@ -412,8 +454,21 @@ class RestAPI:
         return task_id
 
     def _write_task_result(self, task_id: int, result: Any) -> None:
+        serialized_result = serialize_task_result(result)
         with self.task_lock:
-            self.task_results[task_id] = result
+            self._remove_evicted_tasks(self.task_results.add(task_id, serialized_result))
+
+    def _remove_evicted_tasks(self, evicted: list[int]) -> None:
+        """Forget the greenlets of tasks whose results were evicted without being fetched
+        so that they are not reported as pending forever. Must hold the task lock"""
+        if len(evicted) == 0:
+            return
+
+        evicted_ids = set(evicted)
+        self.rotkehlchen.api_task_greenlets[:] = [
+            greenlet for greenlet in self.rotkehlchen.api_task_greenlets
+            if greenlet.task_id not in evicted_ids
+        ]
 
     def _handle_killed_greenlets(self, greenlet: gevent.Greenlet) -> None:
         if not greenlet.exception:
@@ -450,17 +505,56 @@ class RestAPI:
             }
             self._write_task_result(task_id, result)
 
-    def _do_query_async(self, command: Callable, task_id: int, **kwargs: Any) -> None:
+    def _do_query_async(
+            self,
+            command: Callable,
+            task_id: int,
+            query_key: Hashable | None,
+            **kwargs: Any,
+    ) -> None:
+        """Run the command and write its result for the task. If query_key is given and an
+        identical query is ongoing then wait for its result or exception instead. If the
+        task running the identical query is killed then run the command again"""
+        while query_key is not None and (ongoing := self.inflight_async_queries.get(query_key)) is not None:  # noqa: E501
+            log.debug(f'Async task with task id {task_id} waits for an identical ongoing task')
+            try:
+                result = ongoing.get()
+            except InflightResultAbortedError:
+                continue  # the first woken up task runs it and the rest wait for it
+
+            self._write_task_result(task_id, result)
+            return
+
         log.debug(f'Async task with task id {task_id} started')
-        result = command(self, **kwargs)
+        if query_key is None:
+            result = command(self, **kwargs)
+        else:
+            self.inflight_async_queries[query_key] = async_result = AsyncResult()
+            try:
+                result = command(self, **kwargs)
+            except BaseException as e:
+                if isinstance(e, Exception) and not isinstance(e, GreenletKilledError):
+                    async_result.set_exception(e)
+                else:  # killed. Waiters wake up after the entry is dropped below and run it
+                    async_result.set_exception(InflightResultAbortedError())
+                raise
+            else:
+                async_result.set(result)
+            finally:
+                del self.inflight_async_queries[query_key]
+
         self._write_task_result(task_id, result)
 
     def _query_async(self, command: Callable, **kwargs: Any) -> Response:
         task_id = self._new_task_id()
+        query_key = None
+        if request.method == 'GET':  # only dedupe queries that don't modify anything
+            query_key = _async_query_key(command, kwargs)
         greenlet = gevent.spawn(
             self._do_query_async,
             command,
             task_id,
+            query_key,
             **kwargs,
         )
         greenlet.task_id = task_id
@@ -476,6 +570,7 @@ class RestAPI:
         log.debug('Waited for greenlets. Killing all other greenlets')
         gevent.killall(self.rotkehlchen.api_task_greenlets)
         self.rotkehlchen.api_task_greenlets.clear()
+        self.task_results.clear()  # also removes any results written to disk
         log.debug('Cleaning up global DB')
         GlobalDBHandler().cleanup()
         log.debug('Shutdown completed')
@@ -502,6 +597,9 @@ class RestAPI:
         return api_response(result=result_dict, status_code=HTTPStatus.OK)
 
     def query_tasks_outcome(self, task_id: int | None) -> Response:
+        with self.task_lock:  # drop results that expired since the last task finished
+            self._remove_evicted_tasks(self.task_results.evict())
+
         if task_id is None:
             # If no task id is given return list of all pending and completed tasks
             completed = []
@@ -519,18 +617,13 @@ class RestAPI:
         with self.task_lock:
             for idx, greenlet in enumerate(self.rotkehlchen.api_task_greenlets):
                 if greenlet.task_id == task_id:
-                    if task_id in self.task_results:
-                        # Task has completed and we just got the outcome
-                        function_response = self.task_results.pop(int(task_id), None)
-                        # The result of the original request
-                        result = function_response['result']
-                        # The message of the original request
-                        message = function_response['message']
-                        status_code = function_response.get('status_code')
-                        ret = {'result': result, 'message': message}
+                    if (function_response := self.task_results.pop(int(task_id))) is not None:
+                        # Task has completed and we just got the outcome. It holds the
+                        # already processed result and message of the original request
+                        status_code = function_response.pop('status_code', None)
                         returned_task_result = {
                             'status': 'completed',
-                            'outcome': process_result(ret),
+                            'outcome': function_response,
                         }
                         if status_code:
                             returned_task_result['status_code'] = status_code
@@ -647,7 +740,7 @@ class RestAPI:
                 updates_gnosispay and
                 (gnosispay_decoder := cast(
                     'GnosisPayDecoder',
-                    self.rotkehlchen.chains_aggregator.get_evm_manager(ChainID.GNOSIS).transactions_decoder.decoders.get('GnosisPay'),
+                    self.rotkehlchen.chains_aggregator.get_evm_manager(ChainID.GNOSIS).transactions_decoder.get_decoder('GnosisPay'),
                 )) is not None
         ):
             gnosispay_decoder.reload_data()
@@ -1357,7 +1450,7 @@ class RestAPI:
         gevent.killall(self.rotkehlchen.api_task_greenlets)
         self.rotkehlchen.api_task_greenlets.clear()
         with self.task_lock:
-            self.task_results = {}
+            self.task_results.clear()
         self.rotkehlchen.logout()
         result_dict['result'] = True
         return api_response(result_dict, status_code=HTTPStatus.OK)
@@ -2966,6 +3059,7 @@ class RestAPI:
                 write_cursor.execute(
                     'DELETE FROM evm_transactions WHERE tx_hash=? AND chain_id=?',
                     (tx_hash, evm_chain.serialize_for_db()))
+                DBEvmTx.lower_tokens_detection_watermarks(write_cursor)
             try:
                 chain_manager.transactions.get_or_query_transaction_receipt(tx_hash=tx_hash)
             except RemoteError as e:
@@ -3069,6 +3163,7 @@ class RestAPI:
                     'DELETE FROM history_events WHERE event_identifier=? RETURNING location_label',
                     (ZKL_IDENTIFIER.format(tx_hash=tx_hash.hex()),),
                 ).fetchone()
+                DBEth2.lower_combine_block_events_watermark(write_cursor)
                 if deleted_event_data is not None:
                     concerning_address = deleted_event_data[0]
 
@@ -3643,6 +3738,7 @@ class RestAPI:
                 query_specific_balances_before=None,
                 addresses=self.rotkehlchen.chains_aggregator.queried_addresses_for_module('nfts'),
                 uniswap_nfts=uniswap_result['result'],
+                ignore_cache=ignore_cache,
             )
 
         return self._eth_module_query(
@@ -4292,6 +4388,7 @@ class RestAPI:
             only_cache: bool,
             addresses: Sequence[ChecksumEvmAddress] | None,
             blockchain: SUPPORTED_EVM_CHAINS_TYPE,
+            full_scan: bool,
     ) -> dict[str, Any]:
         manager: EvmManager = self.rotkehlchen.chains_aggregator.get_chain_manager(blockchain)
         if addresses is None:
@@ -4301,6 +4398,7 @@ class RestAPI:
             account_tokens_info = manager.tokens.detect_tokens(
                 only_cache=only_cache,
                 addresses=addresses,
+                full_scan=full_scan,
             )
         except (RemoteError, BadFunctionCallOutput) as e:
             return wrap_in_fail_result(message=str(e), status_code=HTTPStatus.CONFLICT)
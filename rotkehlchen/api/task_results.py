@@ -0,0 +1,214 @@
+"""Bounded storage for the results of async API tasks until the client fetches them"""
+import json
+import logging
+import os
+import shutil
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Final, NamedTuple
+
+from rotkehlchen.logging import RotkehlchenLogsAdapter
+from rotkehlchen.serialization.serialize import process_result
+from rotkehlchen.types import Timestamp
+from rotkehlchen.utils.misc import ts_now
+from rotkehlchen.utils.serialization import jsonloads_dict
+
+logger = logging.getLogger(__name__)
+log = RotkehlchenLogsAdapter(logger)
+
+MAX_TASK_RESULTS: Final = 500
+MAX_TASK_RESULTS_MEMORY_BYTES: Final = 64 * 1024 * 1024
+MAX_TASK_RESULTS_DISK_BYTES: Final = 1024 * 1024 * 1024
+# Results not fetched within this many seconds from their completion are dropped
+TASK_RESULTS_TTL_SECS: Final = 3600
+# Results whose serialized size exceeds this are written to disk instead of kept in memory
+TASK_RESULTS_SPILL_THRESHOLD_BYTES: Final = 1024 * 1024
+
+
+class SerializedTaskResult(NamedTuple):
+    """The outcome of a finished task serialized for the API"""
+    payload: str
+    status_code: int | None
+
+
+def serialize_task_result(outcome: dict[str, Any]) -> SerializedTaskResult:
+    """Serialize the outcome of a task. It is a dict with a result, a message and
+    optionally a status code. Done without holding the store's lock since it can be
+    slow for large results."""
+    return SerializedTaskResult(
+        payload=json.dumps(process_result({
+            'result': outcome.get('result'),
+            'message': outcome.get('message', ''),
+        })),
+        status_code=outcome.get('status_code'),
+    )
+
+
+class StoredTaskResult(NamedTuple):
+    """The serialized outcome of a finished task. Either `payload` or `path` is set"""
+    payload: str | None
+    path: Path | None
+    size: int
+    status_code: int | None
+    timestamp: Timestamp
+
+
+class TaskResultsStats(NamedTuple):
+    """Metrics of the task results store"""
+    entries: int
+    memory_bytes: int  # size of the serialized results that are kept in memory
+    spilled_entries: int
+    disk_bytes: int  # size of the serialized results that were written to disk
+    evicted: int  # results dropped before being fetched since the store was created
+
+
+class TaskResultsStore:
+    """Keeps the outcome of finished async tasks until the client fetches it.
+
+    The outcomes are serialized when stored so that their size is known and they
+    take less memory than the python objects. The store is bounded by the number of
+    results, by their size in memory and on disk and by a TTL. When a bound is exceeded
+    the oldest results are evicted. If `spill_dir` is given then results larger than
+    `spill_threshold_bytes` are written in it, readable only by the user, instead of kept
+    in memory. Any files left in it by a previous run are removed at creation.
+
+    Not thread-safe. The caller is expected to hold a lock while using it.
+    """
+
+    def __init__(
+            self,
+            max_entries: int = MAX_TASK_RESULTS,
+            max_memory_bytes: int = MAX_TASK_RESULTS_MEMORY_BYTES,
+            max_disk_bytes: int = MAX_TASK_RESULTS_DISK_BYTES,
+            ttl_secs: int = TASK_RESULTS_TTL_SECS,
+            spill_dir: Path | None = None,
+            spill_threshold_bytes: int = TASK_RESULTS_SPILL_THRESHOLD_BYTES,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.ttl_secs = ttl_secs
+        self.spill_dir = spill_dir  # created at the first spill
+        self.spill_threshold_bytes = spill_threshold_bytes
+        self.entries: OrderedDict[int, StoredTaskResult] = OrderedDict()  # oldest first
+        self.memory_bytes = 0
+        self.disk_bytes = 0
+        self.evicted = 0
+        self._remove_spill_dir()  # results of a previous run can't be fetched anymore
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def stats(self) -> TaskResultsStats:
+        return TaskResultsStats(
+            entries=len(self.entries),
+            memory_bytes=self.memory_bytes,
+            spilled_entries=sum(1 for x in self.entries.values() if x.path is not None),
+            disk_bytes=self.disk_bytes,
+            evicted=self.evicted,
+        )
+
+    def add(self, task_id: int, result: SerializedTaskResult) -> list[int]:
+        """Store the serialized outcome of a task.
+        Returns the ids of the tasks whose results were evicted.
+
+        May raise OSError if a large result could not be written to disk.
+        """
+        payload, status_code = result
+        self._remove(task_id)  # in case of overwriting a result
+        if self.spill_dir is not None and len(payload) > self.spill_threshold_bytes:
+            self.spill_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            path = self.spill_dir / f'{task_id}.json'
+            with os.fdopen(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w', encoding='utf8') as f:  # noqa: E501
+                f.write(payload)
+            entry = StoredTaskResult(None, path, len(payload), status_code, ts_now())
+            self.disk_bytes += entry.size
+        else:
+            entry = StoredTaskResult(payload, None, len(payload), status_code, ts_now())
+            self.memory_bytes += entry.size
+
+        self.entries[task_id] = entry
+        return self.evict()
+
+    def pop(self, task_id: int) -> dict[str, Any] | None:
+        """Remove and return the outcome of a task with the result already processed
+        for the API. None if there is no result for the task"""
+        if (entry := self._remove(task_id, delete_file=False)) is None:
+            return None
+
+        if entry.path is not None:
+            try:
+                payload = entry.path.read_text(encoding='utf8')
+            except OSError as e:
+                log.error(f'Could not read the spilled result of task {task_id} due to {e!s}')
+                return {'result': None, 'message': f'Could not read the task result: {e!s}'}
+            entry.path.unlink(missing_ok=True)
+        else:
+            payload = entry.payload  # type: ignore[assignment]  # payload is set if path isn't
+
+        outcome = jsonloads_dict(payload)
+        if entry.status_code is not None:
+            outcome['status_code'] = entry.status_code
+        return outcome
+
+    def evict(self) -> list[int]:
+        """Drop the expired results and the oldest results exceeding the store's bounds.
+        The newest result is kept even if it alone exceeds them so that it can be fetched.
+        Returns the ids of the tasks whose results were evicted"""
+        evicted: list[int] = []
+        if len(self.entries) == 0:
+            return evicted
+
+        expiry_ts = ts_now() - self.ttl_secs
+        newest_task_id = next(reversed(self.entries))
+        for task_id, entry in list(self.entries.items()):
+            if task_id == newest_task_id and entry.timestamp >= expiry_ts:
+                break
+
+            too_many = len(self.entries) > self.max_entries
+            over_memory = self.memory_bytes > self.max_memory_bytes
+            over_disk = self.disk_bytes > self.max_disk_bytes
+            if entry.timestamp >= expiry_ts and not (too_many or over_memory or over_disk):
+                break  # entries are ordered by time so the rest are not expired either
+
+            if (
+                    entry.timestamp < expiry_ts or
+                    too_many or
+                    (over_memory and entry.path is None) or
+                    (over_disk and entry.path is not None)
+            ):
+                self._remove(task_id)
+                evicted.append(task_id)
+
+        if len(evicted) != 0:
+            self.evicted += len(evicted)
+            log.debug(f'Evicted the unfetched results of tasks {evicted}. {self.stats}')
+        return evicted
+
+    def clear(self) -> None:
+        """Remove all results including any that were written to disk"""
+        self.entries.clear()
+        self.memory_bytes = self.disk_bytes = 0
+        self._remove_spill_dir()
+
+    def _remove_spill_dir(self) -> None:
+        if self.spill_dir is not None:
+            shutil.rmtree(self.spill_dir, ignore_errors=True)
+
+    def _remove(self, task_id: int, delete_file: bool = True) -> StoredTaskResult | None:
+        """Remove the result of a task and update the sizes. If delete_file is False the
+        spilled file of the result is kept so that the caller can read it"""
+        if (entry := self.entries.pop(task_id, None)) is None:
+            return None
+
+        if entry.path is not None:
+            self.disk_bytes -= entry.size
+            if delete_file:
+                entry.path.unlink(missing_ok=True)
+        else:
+            self.memory_bytes -= entry.size
+        return entry
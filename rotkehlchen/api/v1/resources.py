@@ -2971,12 +2971,14 @@ class DetectTokensResource(BaseMethodView):
             async_query: bool,
             only_cache: bool,
             addresses: Sequence[ChecksumEvmAddress] | None,
+            full_scan: bool,
     ) -> Response:
         return self.rest_api.detect_evm_tokens(
             async_query=async_query,
             only_cache=only_cache,
             addresses=addresses,
             blockchain=blockchain,
+            full_scan=full_scan,
         )
 
 
@@ -3176,6 +3176,7 @@ class DetectTokensSchema(
     OptionalAddressesListSchema,
 ):
     blockchain = BlockchainField(required=True, exclude_types=list(NON_EVM_CHAINS))
+    full_scan = fields.Boolean(load_default=False)
 
 
 class UserNotesPutSchema(Schema):
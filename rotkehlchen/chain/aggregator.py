@@ -961,11 +961,14 @@ class ChainsAggregator(CacheableMixIn, LockableQueryMixIn):
             self,
             manager: 'EvmManager',
             balances: defaultdict[ChecksumEvmAddress, BalanceSheet],
+            native_balances: dict[ChecksumEvmAddress, FVal] | None = None,
+            ignore_cache: bool = False,
     ) -> None:
         """Queries evm token balance via either etherscan or evm node
 
         Should come here during addition of a new account or querying of all token
-        balances.
+        balances. If the native balances of the accounts are given, token balances of
+        accounts with no activity since the last query are reused unless ignore_cache is True.
 
         May raise:
         - RemoteError if an external service such as Etherscan or cryptocompare
@@ -976,6 +979,8 @@ class ChainsAggregator(CacheableMixIn, LockableQueryMixIn):
         try:
             balance_result, token_usd_price = manager.tokens.query_tokens_for_addresses(
                 addresses=self.accounts.get(manager.node_inquirer.blockchain),
+                native_balances=native_balances,
+                ignore_cache=ignore_cache,
             )
         except BadFunctionCallOutput as e:
             log.error(
@@ -1011,8 +1016,13 @@ class ChainsAggregator(CacheableMixIn, LockableQueryMixIn):
             self.defi_balances_last_query_ts = ts_now()
             return self.defi_balances
 
-    def query_evm_chain_balances(self, chain: SUPPORTED_EVM_CHAINS_TYPE) -> None:
-        """Queries all the balances for an evm chain and populates the state
+    def query_evm_chain_balances(
+            self,
+            chain: SUPPORTED_EVM_CHAINS_TYPE,
+            ignore_cache: bool = False,
+    ) -> None:
+        """Queries all the balances for an evm chain and populates the state.
+        If ignore_cache is True no token balances are reused.
 
         May raise:
         - RemoteError if an external service such as Etherscan or cryptocompare
@@ -1028,101 +1038,109 @@ class ChainsAggregator(CacheableMixIn, LockableQueryMixIn):
         manager = cast('EvmManager', self.get_chain_manager(chain))
         native_token_usd_price = Inquirer.find_usd_price(manager.node_inquirer.native_token)
         chain_balances = self.balances.get(chain)
-        for account, balance in manager.node_inquirer.get_multi_balance(accounts).items():
+        native_balances = manager.node_inquirer.get_multi_balance(accounts)
+        for account, balance in native_balances.items():
             chain_balances[account] = BalanceSheet(
                 assets=defaultdict(Balance, {
                     manager.node_inquirer.native_token: Balance(balance, balance * native_token_usd_price),  # noqa: E501
                 } if balance != ZERO else {}),  # accounts (e.g. multisigs) can have zero balances
             )
-        self.query_evm_tokens(manager=manager, balances=chain_balances)
+        self.query_evm_tokens(
+            manager=manager,
+            balances=chain_balances,
+            native_balances=native_balances,
+            ignore_cache=ignore_cache,
+        )
 
     @protect_with_lock()
-    @cache_response_timewise()
+    @cache_response_timewise(forward_ignore_cache=True)
     def query_optimism_balances(
-            self,  # pylint: disable=unused-argument
-            # Kwargs here is so linters don't complain when the "magic" ignore_cache kwarg is given
-            **kwargs: Any,
+            self,
+            ignore_cache: bool = False,
     ) -> None:
         """
         Queries all the optimism balances and populates the state.
         Same potential exceptions as ethereum
         """
-        self.query_evm_chain_balances(chain=SupportedBlockchain.OPTIMISM)
+        self.query_evm_chain_balances(
+            chain=SupportedBlockchain.OPTIMISM,
+            ignore_cache=ignore_cache,
+        )
         self._query_protocols_with_balance(chain_id=ChainID.OPTIMISM)
 
     @protect_with_lock()
-    @cache_response_timewise()
+    @cache_response_timewise(forward_ignore_cache=True)
     def query_polygon_pos_balances(
-            self,  # pylint: disable=unused-argument
-            # Kwargs here is so linters don't complain when the "magic" ignore_cache kwarg is given
-            **kwargs: Any,
+            self,
+            ignore_cache: bool = False,
     ) -> None:
         """
         Queries all the polygon pos balances and populates the state.
         Same potential exceptions as ethereum
         """
-        self.query_evm_chain_balances(chain=SupportedBlockchain.POLYGON_POS)
+        self.query_evm_chain_balances(
+            chain=SupportedBlockchain.POLYGON_POS,
+            ignore_cache=ignore_cache,
+        )
 
     @protect_with_lock()
-    @cache_response_timewise()
+    @cache_response_timewise(forward_ignore_cache=True)
     def query_arbitrum_one_balances(
-            self,  # pylint: disable=unused-argument
-            # Kwargs here is so linters don't complain when the "magic" ignore_cache kwarg is given
-            **kwargs: Any,
+            self,
+            ignore_cache: bool = False,
     ) -> None:
         """
         Queries all the arbitrum one balances and populates the state.
         Same potential exceptions as ethereum
         """
-        self.query_evm_chain_balances(chain=SupportedBlockchain.ARBITRUM_ONE)
+        self.query_evm_chain_balances(
+            chain=SupportedBlockchain.ARBITRUM_ONE,
+            ignore_cache=ignore_cache,
+        )
         self._query_protocols_with_balance(chain_id=ChainID.ARBITRUM_ONE)
 
     @protect_with_lock()
-    @cache_response_timewise()
+    @cache_response_timewise(forward_ignore_cache=True)
     def query_base_balances(
-            self,  # pylint: disable=unused-argument
-            # Kwargs here is so linters don't complain when the "magic" ignore_cache kwarg is given
-            **kwargs: Any,
+            self,
+            ignore_cache: bool = False,
     ) -> None:
         """
         Queries all the base balances and populates the state.
         Same potential exceptions as ethereum
         """
-        self.query_evm_chain_balances(chain=SupportedBlockchain.BASE)
+        self.query_evm_chain_balances(chain=SupportedBlockchain.BASE, ignore_cache=ignore_cache)
         self._query_protocols_with_balance(chain_id=ChainID.BASE)
 
     @protect_with_lock()
-    @cache_response_timewise()
+    @cache_response_timewise(forward_ignore_cache=True)
     def query_gnosis_balances(
-            self,  # pylint: disable=unused-argument
-            # Kwargs here is so linters don't complain when the "magic" ignore_cache kwarg is given
-            **kwargs: Any,
+            self,
+            ignore_cache: bool = False,
     ) -> None:
         """
         Queries all the gnosis balances and populates the state.
         Same potential exceptions as ethereum
         """
-        self.query_evm_chain_balances(chain=SupportedBlockchain.GNOSIS)
+        self.query_evm_chain_balances(chain=SupportedBlockchain.GNOSIS, ignore_cache=ignore_cache)
 
     @protect_with_lock()
-    @cache_response_timewise()
+    @cache_response_timewise(forward_ignore_cache=True)
     def query_scroll_balances(
-            self,  # pylint: disable=unused-argument
-            # Kwargs here is so linters don't complain when the "magic" ignore_cache kwarg is given
-            **kwargs: Any,
+            self,
+            ignore_cache: bool = False,
     ) -> None:
         """
         Queries all the scroll balances and populates the state.
         Same potential exceptions as ethereum
         """
-        self.query_evm_chain_balances(chain=SupportedBlockchain.SCROLL)
+        self.query_evm_chain_balances(chain=SupportedBlockchain.SCROLL, ignore_cache=ignore_cache)
 
     @protect_with_lock()
-    @cache_response_timewise()
+    @cache_response_timewise(forward_ignore_cache=True)
     def query_eth_balances(
-            self,  # pylint: disable=unused-argument
-            # Kwargs here is so linters don't complain when the "magic" ignore_cache kwarg is given
-            **kwargs: Any,
+            self,
+            ignore_cache: bool = False,
     ) -> None:
         """Queries all the ethereum balances and populates the state
 
@@ -1132,7 +1150,10 @@ class ChainsAggregator(CacheableMixIn, LockableQueryMixIn):
         - EthSyncError if querying the token balances through a provided ethereum
         client and the chain is not synced
         """
-        self.query_evm_chain_balances(chain=SupportedBlockchain.ETHEREUM)
+        self.query_evm_chain_balances(
+            chain=SupportedBlockchain.ETHEREUM,
+            ignore_cache=ignore_cache,
+        )
         self.query_defi_balances()
         self._add_eth_protocol_balances(eth_balances=self.balances.eth)
         self._query_protocols_with_balance(chain_id=ChainID.ETHEREUM)
@@ -1776,12 +1797,12 @@ class ChainsAggregator(CacheableMixIn, LockableQueryMixIn):
     def get_all_counterparties(self) -> set['CounterpartyDetails']:
         """
         obtain the set of unique counterparties from the decoders across
-        all the chains that have them.
+        all the chains that have them. Doesn't initialize the decoders.
         """
         return reduce(
             operator.or_,
             [
-                self.get_evm_manager(chain_id).transactions_decoder.rules.all_counterparties
+                self.get_evm_manager(chain_id).transactions_decoder.get_all_counterparties()
                 for chain_id in EVM_CHAIN_IDS_WITH_TRANSACTIONS
             ],
         )
@@ -5,6 +5,7 @@ from rotkehlchen.chain.evm.decoding.types import CounterpartyDetails
 from rotkehlchen.chain.evm.decoding.velodrome.constants import CPT_AERODROME
 from rotkehlchen.chain.evm.decoding.velodrome.decoder import VelodromeLikeDecoder
 from rotkehlchen.chain.evm.decoding.velodrome.velodrome_cache import (
+    AERODROME_CACHE_TYPES,
     read_aerodrome_pools_and_gauges_from_cache,
 )
 from rotkehlchen.chain.evm.types import string_to_evm_address
@@ -40,6 +41,7 @@ class AerodromeDecoder(VelodromeLikeDecoder):
             routers={ROUTER},
             pool_cache_type=CacheType.AERODROME_POOL_ADDRESS,
             read_fn=read_aerodrome_pools_and_gauges_from_cache,
+            read_fn_cache_types=AERODROME_CACHE_TYPES,
             pool_token_protocol=AERODROME_POOL_PROTOCOL,
         )
 
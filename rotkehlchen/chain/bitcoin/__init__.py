@@ -1,6 +1,12 @@
+from collections import defaultdict
 from collections.abc import Sequence
+from typing import Any, Final
+from urllib.parse import urlparse
 
+import gevent
 import requests
+from gevent.lock import BoundedSemaphore
+from gevent.pool import Pool
 
 from rotkehlchen.errors.misc import RemoteError, UnableToDecryptRemoteData
 from rotkehlchen.errors.serialization import DeserializationError
@@ -10,11 +16,60 @@ from rotkehlchen.types import BTCAddress
 from rotkehlchen.utils.misc import satoshis_to_btc
 from rotkehlchen.utils.network import request_get_dict
 
+BLOCKSTREAM_BASE_URL: Final = 'https://blockstream.info/api/address/'
+MEMPOOL_SPACE_BASE_URL: Final = 'https://mempool.space/api/address/'
+# Maximum number of requests in flight to each of the APIs queried once per address
+MAX_CONCURRENT_REQUESTS_PER_HOST: Final = 4
+# Shared by all callers so that the limit holds for concurrent balance and xpub queries
+_host_semaphores: defaultdict[str, BoundedSemaphore] = defaultdict(
+    lambda: BoundedSemaphore(MAX_CONCURRENT_REQUESTS_PER_HOST),
+)
+
 
 def _have_bc1_accounts(accounts: Sequence[BTCAddress]) -> bool:
     return any(account.lower()[0:3] == 'bc1' for account in accounts)
 
 
+def _query_addresses_chain_stats(
+        accounts: Sequence[BTCAddress],
+        base_url: str,
+) -> dict[BTCAddress, dict[str, Any]]:
+    """Queries the chain stats of each address from an esplora API such as blockstream.info
+    or mempool.space. The addresses are queried concurrently, with at most
+    MAX_CONCURRENT_REQUESTS_PER_HOST requests in flight to the host. If any request
+    fails the rest are killed.
+
+    May raise:
+    - RemoteError if got problems with querying the API
+    - KeyError if got unexpected json structure
+    """
+    semaphore = _host_semaphores[urlparse(base_url).netloc]
+
+    def query_account(account: BTCAddress) -> dict[str, Any]:
+        with semaphore:
+            response_data = request_get_dict(
+                url=base_url + account,
+                handle_429=True,
+                backoff_in_seconds=4,
+            )
+        return response_data['chain_stats']
+
+    if len(accounts) == 0:
+        return {}
+
+    pool = Pool(size=min(len(accounts), MAX_CONCURRENT_REQUESTS_PER_HOST))
+    greenlets = [pool.spawn(query_account, account) for account in accounts]
+    try:
+        gevent.joinall(greenlets, raise_error=True)
+    finally:
+        gevent.killall(greenlets)
+
+    return {
+        account: greenlet.value
+        for account, greenlet in zip(accounts, greenlets, strict=True)
+    }
+
+
 def _query_blockstream_or_mempool(
         accounts: Sequence[BTCAddress],
         base_url: str,
@@ -26,10 +81,7 @@ def _query_blockstream_or_mempool(
     - DeserializationError if got unexpected json values
     """
     balances = {}
-    for account in accounts:
-        url = base_url + account
-        response_data = request_get_dict(url=url, handle_429=True, backoff_in_seconds=4)
-        stats = response_data['chain_stats']
+    for account, stats in _query_addresses_chain_stats(accounts, base_url).items():
         funded_txo_sum = satoshis_to_btc(
             ensure_type(
                 symbol=stats['funded_txo_sum'],
@@ -52,14 +104,14 @@ def _query_blockstream_or_mempool(
 def _query_blockstream_info(accounts: Sequence[BTCAddress]) -> dict[BTCAddress, FVal]:
     return _query_blockstream_or_mempool(
         accounts=accounts,
-        base_url='https://blockstream.info/api/address/',
+        base_url=BLOCKSTREAM_BASE_URL,
     )
 
 
 def _query_mempool_space(accounts: Sequence[BTCAddress]) -> dict[BTCAddress, FVal]:
     return _query_blockstream_or_mempool(
         accounts=accounts,
-        base_url='https://mempool.space/api/address/',
+        base_url=MEMPOOL_SPACE_BASE_URL,
     )
 
 
@@ -142,10 +194,7 @@ def _check_blockstream_for_transactions(
     - DeserializationError if response values differ from the expected
     """
     have_transactions = {}
-    for account in accounts:
-        url = f'https://blockstream.info/api/address/{account}'
-        response_data = request_get_dict(url=url, handle_429=True, backoff_in_seconds=4)
-        stats = response_data['chain_stats']
+    for account, stats in _query_addresses_chain_stats(accounts, BLOCKSTREAM_BASE_URL).items():
         funded_txo_sum = satoshis_to_btc(
             ensure_type(
                 symbol=stats['funded_txo_sum'],
@@ -226,13 +226,15 @@ class HDKey:
             return int(idx[:-1]) + BIP32_HARDEN
         return int(idx)
 
-    def _child_from_xpub(self, index: int, child_xpub: str) -> 'HDKey':
+    def _make_child(self, index: int, child_pubkey: PublicKey, chain_code: bytes) -> 'HDKey':
         """
-        Returns a new HDKey object based on the current object and the new
-            child xpub. Don't call this directly, it's for child derivation.
+        Returns a new HDKey object based on the current object and the child key info.
+            Don't call this directly, it's for child derivation. The child is built from
+            the raw key material and its xpub is not encoded since it's never exported.
         Args:
-            index      (int): the index of the child
-            child_xpub (str): the child's xpub
+            index                (int): the index of the child
+            child_pubkey   (PublicKey): the child pubkey
+            chain_code         (bytes): the child chain code
         Returns
             HDKey: the new child object
         """
@@ -241,53 +243,23 @@ class HDKey:
             path = f'{self.path}/{index!s}'
         else:
             path = None
-        xpub_bytes = b58decode(child_xpub)
-        pubkey = xpub_bytes[45:78]
-
-        result = _parse_prefix(xpub_bytes[0:4])
-        if not result.is_public:
-            raise XPUBError('Given xpub is an extended private key')
 
         return HDKey(
             path=path,
-            network=result.network,
-            depth=xpub_bytes[4],
-            parent_fingerprint=xpub_bytes[5:9],
-            index=int.from_bytes(xpub_bytes[9:13], byteorder='big'),
+            network=self.network,
+            depth=cast('int', self.depth) + 1,
+            parent_fingerprint=self.fingerprint,
+            index=index,
             parent=self,
-            chain_code=xpub_bytes[13:45],
-            fingerprint=hash160(pubkey)[:4],
-            xpub=child_xpub,
+            chain_code=chain_code,
+            fingerprint=hash160(child_pubkey.format(COMPRESSED_PUBKEY))[:4],
+            xpub=None,
             xpub_type=self.xpub_type,
             privkey=None,
-            pubkey=PublicKey(pubkey),
-            hint=result.hint,
+            pubkey=child_pubkey,
+            hint=self.hint,
         )
 
-    def _make_child_xpub(
-            self,
-            child_pubkey: PublicKey,
-            index: int,
-            chain_code: bytes) -> str:
-        """
-        Makes a child xpub based on the current key and the child key info.
-        Args:
-            child_pubkey (bytes): the child pubkey
-            index          (int): the child index
-            chain_code   (bytes): the child chain code
-        Returns
-            (str): the child xpub
-        """
-        xpub = bytearray()
-
-        xpub.extend(b58decode(cast('str', self.xpub))[0:4])  # prefix
-        xpub.extend([cast('int', self.depth) + 1])               # depth
-        xpub.extend(self.fingerprint)                          # fingerprint
-        xpub.extend(index.to_bytes(4, byteorder='big'))        # index
-        xpub.extend(chain_code)                                # chain_code
-        xpub.extend(child_pubkey.format(COMPRESSED_PUBKEY))    # pubkey (comp)
-        return b58encode(bytes(xpub)).decode('ascii')
-
     @staticmethod
     def _parse_derivation(derivation_path: str) -> list[int]:
         """
@@ -399,25 +371,34 @@ class HDKey:
             return self.derive_child(index + 1)
 
         # no privkey here so make a new public child
-        child_xpub = self._make_child_xpub(
-            child_pubkey, index=index, chain_code=chain_code,
-        )
-        return self._child_from_xpub(index=index, child_xpub=child_xpub)
+        return self._make_child(index=index, child_pubkey=child_pubkey, chain_code=chain_code)
 
-    def address(self) -> BTCAddress:
+    def address_type(self) -> XpubType:
+        """The type of the addresses of this key. Taproot shares the xpub prefix with legacy"""
         if self.hint == 'xpub' and self.xpub_type == XpubType.P2TR:
-            return pubkey_to_bech32_address(
-                data=self.pubkey.format(COMPRESSED_PUBKEY),
-                witver=WitnessVersion.BECH32M,
-            )
+            return XpubType.P2TR
         if self.hint == 'xpub':
-            return pubkey_to_base58_address(self.pubkey.format(COMPRESSED_PUBKEY))
+            return XpubType.P2PKH
         if self.hint == 'ypub':
-            return pubkey_to_p2sh_p2wpkh_address(self.pubkey.format(COMPRESSED_PUBKEY))
+            return XpubType.P2SH_P2WPKH
         if self.hint == 'zpub':
+            return XpubType.WPKH
+        # else
+        raise AssertionError(f'Unknown hint {self.hint} ended up in an HDKey')
+
+    def address(self) -> BTCAddress:
+        address_type = self.address_type()
+        if address_type == XpubType.P2TR:
             return pubkey_to_bech32_address(
                 data=self.pubkey.format(COMPRESSED_PUBKEY),
-                witver=WitnessVersion.BECH32,
+                witver=WitnessVersion.BECH32M,
             )
-        # else
-        raise AssertionError(f'Unknown hint {self.hint} ended up in an HDKey')
+        if address_type == XpubType.P2PKH:
+            return pubkey_to_base58_address(self.pubkey.format(COMPRESSED_PUBKEY))
+        if address_type == XpubType.P2SH_P2WPKH:
+            return pubkey_to_p2sh_p2wpkh_address(self.pubkey.format(COMPRESSED_PUBKEY))
+        # else can only be WPKH
+        return pubkey_to_bech32_address(
+            data=self.pubkey.format(COMPRESSED_PUBKEY),
+            witver=WitnessVersion.BECH32,
+        )
@@ -1,7 +1,9 @@
 import logging
-from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+from typing import TYPE_CHECKING, Any, Final, Literal, NamedTuple
 
+import gevent
 from gevent.lock import Semaphore
+from gevent.pool import Pool
 
 from rotkehlchen.accounting.structures.balance import Balance
 from rotkehlchen.chain.accounts import BlockchainAccountData
@@ -24,6 +26,13 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+# Number of gap limit windows of each derivation chain that are derived and queried
+# ahead of knowing whether the previous ones contain used addresses. Only done once a window
+# of the chain had used addresses, so xpubs with no new activity need a single window query.
+XPUB_LOOKAHEAD_WINDOWS: Final = 3
+# Maximum number of window queries in flight for an xpub, across both derivation chains
+MAX_CONCURRENT_XPUB_QUERIES: Final = 4
+
 
 class XpubData(NamedTuple):
     xpub: HDKey
@@ -72,56 +81,108 @@ class XpubDerivedAddressData(NamedTuple):
     balance: FVal
 
 
+def _query_have_transactions(
+        blockchain: Literal[SupportedBlockchain.BITCOIN, SupportedBlockchain.BITCOIN_CASH],
+        addresses: list[BTCAddress],
+) -> dict[BTCAddress, tuple[bool, FVal]]:
+    """May raise:
+    - RemoteError: if blockstream/blockchain.info/haskoin can't be reached
+    """
+    if blockchain == SupportedBlockchain.BITCOIN:
+        return have_bitcoin_transactions(addresses)
+    return have_bch_transactions(addresses)
+
+
+def _process_window(
+        account_index: int,
+        batch_addresses: list[tuple[int, BTCAddress]],
+        have_tx_mapping: dict[BTCAddress, tuple[bool, FVal]],
+        addresses: list[XpubDerivedAddressData],
+) -> bool:
+    """Adds the addresses of the window that should be tracked to addresses and returns
+    whether the window had any used address, meaning that derivation should continue"""
+    should_continue = False
+    for idx, address in batch_addresses:
+        have_tx, balance = have_tx_mapping[address]
+        if have_tx:
+            addresses.append(XpubDerivedAddressData(
+                account_index=account_index,
+                derived_index=idx,
+                address=address,
+                balance=balance,
+            ))
+            should_continue = True
+
+    # do one more pass and add any addresses with no transactions before the max index
+    # this is so we can start new address generation from the max index later
+    if len(addresses) != 0:
+        max_index = max(x[0] for x in addresses)
+        for idx, address in batch_addresses[:max_index]:
+            have_tx, balance = have_tx_mapping[address]
+            if not have_tx:
+                addresses.append(XpubDerivedAddressData(
+                    account_index=account_index,
+                    derived_index=idx,
+                    address=address,
+                    balance=balance,
+                ))
+
+    return should_continue
+
+
 def _derive_addresses_loop(
         account_index: int,
         start_index: int,
         root: HDKey,
         gap_limit: int,
         blockchain: Literal[SupportedBlockchain.BITCOIN, SupportedBlockchain.BITCOIN_CASH],
+        derived_addresses_cache: dict[tuple[int, int], BTCAddress],
+        pool: Pool,
 ) -> list[XpubDerivedAddressData]:
-    """May raise:
+    """Addresses found in derived_addresses_cache are not derived again and the newly
+    derived addresses of the windows that were checked are added to it.
+
+    After a window with used addresses the next XPUB_LOOKAHEAD_WINDOWS windows of
+    gap_limit addresses are queried concurrently in the given pool. They are processed in
+    order, and once a window without used addresses confirms the gap limit the queries of
+    the windows after it are killed.
+
+    May raise:
     - RemoteError: if blockstream/blockchain.info can't be reached
     """
     step_index = start_index
     addresses: list[XpubDerivedAddressData] = []
-    should_continue = True
-    while should_continue:
-        batch_addresses: list[tuple[int, BTCAddress]] = []
-        for idx in range(step_index, step_index + gap_limit):
-            child = root.derive_child(idx)
-            batch_addresses.append((idx, child.address()))
-
-        if blockchain == SupportedBlockchain.BITCOIN:
-            have_tx_mapping = have_bitcoin_transactions([x[1] for x in batch_addresses])
-        else:
-            have_tx_mapping = have_bch_transactions([x[1] for x in batch_addresses])
-        should_continue = False
-        for idx, address in batch_addresses:
-            have_tx, balance = have_tx_mapping[address]
-            if have_tx:
-                addresses.append(XpubDerivedAddressData(
-                    account_index=account_index,
-                    derived_index=idx,
-                    address=address,
-                    balance=balance,
-                ))
-                should_continue = True
-
-        # do one more pass and add any addresses with no transactions before the max index
-        # this is so we can start new address generation from the max index later
-        if len(addresses) != 0:
-            max_index = max(x[0] for x in addresses)
-            for idx, address in batch_addresses[:max_index]:
-                have_tx, balance = have_tx_mapping[address]
-                if not have_tx:
-                    addresses.append(XpubDerivedAddressData(
-                        account_index=account_index,
-                        derived_index=idx,
-                        address=address,
-                        balance=balance,
-                    ))
-
-        step_index += gap_limit
+    pending: list[tuple[list[tuple[int, BTCAddress]], gevent.Greenlet]] = []
+    should_continue, lookahead_windows = True, 1
+    try:
+        while should_continue:
+            while len(pending) < lookahead_windows:
+                window_addresses: list[tuple[int, BTCAddress]] = []
+                for idx in range(step_index, step_index + gap_limit):
+                    if (address := derived_addresses_cache.get((account_index, idx))) is None:
+                        address = root.derive_child(idx).address()
+                    window_addresses.append((idx, address))
+
+                pending.append((window_addresses, pool.spawn(
+                    _query_have_transactions,
+                    blockchain=blockchain,
+                    addresses=[x[1] for x in window_addresses],
+                )))
+                step_index += gap_limit
+
+            batch_addresses, greenlet = pending.pop(0)
+            have_tx_mapping = greenlet.get()
+            for idx, address in batch_addresses:
+                derived_addresses_cache[account_index, idx] = address
+            if (should_continue := _process_window(
+                account_index=account_index,
+                batch_addresses=batch_addresses,
+                have_tx_mapping=have_tx_mapping,
+                addresses=addresses,
+            )) is True:
+                lookahead_windows = XPUB_LOOKAHEAD_WINDOWS
+    finally:  # gap limit confirmed or a query failed. Windows past it are not needed
+        gevent.killall([greenlet for _, greenlet in pending])
 
     return addresses
 
@@ -131,11 +192,18 @@ def _derive_addresses_from_xpub_data(
         start_receiving_index: int,
         start_change_index: int,
         gap_limit: int,
+        derived_addresses_cache: dict[tuple[int, int], BTCAddress],
 ) -> list[XpubDerivedAddressData]:
     """Derive all addresses from the xpub that have had transactions. Also includes
     any addresses until the biggest index derived addresses that have had no transactions.
     This is to make it easier to later derive and check more addresses
 
+    derived_addresses_cache maps account and derived index to already derived addresses.
+    Newly derived addresses are added to it.
+
+    The receiving and change chains are scanned concurrently, sharing a pool that bounds
+    the number of requests in flight to the external APIs.
+
     May raise:
     - RemoteError: if blockstream/blockchain.info/haskoin and others can't be reached
     """
@@ -144,28 +212,23 @@ def _derive_addresses_from_xpub_data(
     else:
         account_xpub = xpub_data.xpub
 
-    addresses = []
-    receiving_xpub = account_xpub.derive_child(0)
-    addresses.extend(
-        _derive_addresses_loop(
-            account_index=0,
-            start_index=start_receiving_index,
-            root=receiving_xpub,
-            gap_limit=gap_limit,
-            blockchain=xpub_data.blockchain,
-        ),
-    )
-    change_xpub = account_xpub.derive_child(1)
-    addresses.extend(
-        _derive_addresses_loop(
-            account_index=1,
-            start_index=start_change_index,
-            root=change_xpub,
-            gap_limit=gap_limit,
-            blockchain=xpub_data.blockchain,
-        ),
-    )
-    return addresses
+    pool = Pool(size=MAX_CONCURRENT_XPUB_QUERIES)
+    greenlets = [gevent.spawn(
+        _derive_addresses_loop,
+        account_index=account_index,
+        start_index=start_index,
+        root=account_xpub.derive_child(account_index),
+        gap_limit=gap_limit,
+        blockchain=xpub_data.blockchain,
+        derived_addresses_cache=derived_addresses_cache,
+        pool=pool,
+    ) for account_index, start_index in ((0, start_receiving_index), (1, start_change_index))]
+    try:
+        gevent.joinall(greenlets, raise_error=True)
+    finally:  # if one of the chains failed stop the other
+        gevent.killall(greenlets)
+
+    return [entry for greenlet in greenlets for entry in greenlet.value]
 
 
 class XpubManager:
@@ -190,11 +253,14 @@ class XpubManager:
         """
         with self.db.conn.read_ctx() as cursor:
             last_receiving_idx, last_change_idx = self.db.get_last_consecutive_xpub_derived_indices(cursor, xpub_data)  # noqa: E501
+            derived_addresses_cache = self.db.get_xpub_derived_addresses(cursor, xpub_data)
+            cached_indices = set(derived_addresses_cache)
             derived_addresses_data = _derive_addresses_from_xpub_data(
                 xpub_data=xpub_data,
                 start_receiving_index=last_receiving_idx,
                 start_change_index=last_change_idx,
                 gap_limit=self.chains_aggregator.btc_derivation_gap_limit,
+                derived_addresses_cache=derived_addresses_cache,
             )
             known_addresses = getattr(self.db.get_blockchain_accounts(cursor), xpub_data.blockchain.get_key())  # noqa: E501
 
@@ -248,6 +314,14 @@ class XpubManager:
                 xpub_data=xpub_data,
                 derived_addresses_data=derived_addresses_data,
             )
+            self.db.add_xpub_derived_addresses(
+                write_cursor=write_cursor,
+                xpub_data=xpub_data,
+                derived_addresses={
+                    indices: address for indices, address in derived_addresses_cache.items()
+                    if indices not in cached_indices
+                },
+            )
 
         # also add queried balances
         if xpub_data.blockchain == SupportedBlockchain.BITCOIN:
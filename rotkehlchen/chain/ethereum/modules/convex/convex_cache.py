@@ -1,5 +1,5 @@
 import logging
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Final, Literal
 
 from rotkehlchen.chain.ethereum.modules.convex.constants import BOOSTER
 from rotkehlchen.chain.evm.constants import ZERO_ADDRESS
@@ -25,6 +25,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
+# cache types read by read_convex_data_from_cache
+CONVEX_CACHE_TYPES: Final = (CacheType.CONVEX_POOL_ADDRESS, CacheType.CONVEX_POOL_NAME)
 
 
 def get_existing_pools(
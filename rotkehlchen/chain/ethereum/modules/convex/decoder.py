@@ -18,6 +18,7 @@ from rotkehlchen.chain.ethereum.modules.convex.constants import (
     WITHDRAWAL_TOPICS,
 )
 from rotkehlchen.chain.ethereum.modules.convex.convex_cache import (
+    CONVEX_CACHE_TYPES,
     query_convex_data,
     read_convex_data_from_cache,
 )
@@ -72,6 +73,7 @@ class ConvexDecoder(DecoderInterface, ReloadableCacheDecoderMixin):
             cache_type_to_check_for_freshness=CacheType.CONVEX_POOL_ADDRESS,
             query_data_method=query_convex_data,
             read_data_from_cache_method=read_convex_data_from_cache,
+            read_data_cache_types=CONVEX_CACHE_TYPES,
         )
         self.cvx = A_CVX.resolve_to_evm_token()
 
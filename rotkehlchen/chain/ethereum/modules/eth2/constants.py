@@ -12,3 +12,5 @@ CPT_ETH2: Final = 'eth2'
 BEACONCHAIN_MAX_EPOCH: Final = 9223372036854775807  # This is INT64 MAX. Beacon node API actually returns 18446744073709551615 which is UINT64 MAX # noqa: E501
 
 DEFAULT_VALIDATOR_CHUNK_SIZE: Final = 80
+
+MAX_COMBINED_EVENTS_PER_QUERY: Final = 1000
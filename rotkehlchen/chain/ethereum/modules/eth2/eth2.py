@@ -7,7 +7,6 @@ from typing import TYPE_CHECKING, Any, Literal
 
 import gevent
 from gevent.lock import Semaphore
-from pysqlcipher3 import dbapi2 as sqlcipher
 
 from rotkehlchen.accounting.structures.balance import Balance
 from rotkehlchen.chain.ethereum.modules.eth2.beacon import BeaconInquirer
@@ -31,11 +30,12 @@ from rotkehlchen.types import ChecksumEvmAddress, Eth2PubKey, Timestamp
 from rotkehlchen.user_messages import MessagesAggregator
 from rotkehlchen.utils.data_structures import LRUCacheWithRemove
 from rotkehlchen.utils.interfaces import EthereumModule
-from rotkehlchen.utils.misc import ts_now
+from rotkehlchen.utils.misc import get_chunks, ts_now
 
 from .constants import (
     CPT_ETH2,
     FREE_VALIDATORS_LIMIT,
+    MAX_COMBINED_EVENTS_PER_QUERY,
     UNKNOWN_VALIDATOR_INDEX,
     VALIDATOR_STATS_QUERY_BACKOFF_EVERY_N_VALIDATORS,
     VALIDATOR_STATS_QUERY_BACKOFF_TIME,
@@ -47,7 +47,6 @@ from .structures import (
     ValidatorDetailsWithStatus,
     ValidatorID,
 )
-from .utils import create_profit_filter_queries
 
 if TYPE_CHECKING:
     from rotkehlchen.chain.ethereum.node_inquirer import EthereumInquirer
@@ -211,19 +210,16 @@ class Eth2(EthereumModule):
         with self.database.conn.read_ctx() as cursor:
             accounts = self.database.get_blockchain_accounts(cursor)
 
-        withdrawals_filter_query, exits_filter_query, execution_filter_query = create_profit_filter_queries(  # noqa: E501
-            from_ts=from_ts,
-            to_ts=to_ts,
-            validator_indices=list(to_filter_indices) if to_filter_indices is not None else None,
-            tracked_addresses=accounts.eth,  # needed to exclude block recipients not tracked
-        )
+        with self.database.user_write() as write_cursor:
+            dbeth2.refresh_validators_daily_profit(write_cursor)
 
         with self.database.conn.read_ctx() as cursor:
             withdrawals_amounts, exits_pnl, execution_rewards_amounts = dbeth2.get_validators_profit(  # noqa: E501
                 cursor=cursor,
-                exits_filter_query=exits_filter_query,
-                withdrawals_filter_query=withdrawals_filter_query,
-                execution_filter_query=execution_filter_query,
+                from_ts=from_ts,
+                to_ts=to_ts,
+                validator_indices=to_filter_indices,
+                tracked_addresses=accounts.eth,  # needed to exclude block recipients not tracked
             )
 
         pnls: defaultdict[int, dict] = defaultdict(dict)
@@ -562,47 +558,87 @@ class Eth2(EthereumModule):
             dbeth2.add_or_update_validators(write_cursor, [result[0]])
 
     def combine_block_with_tx_events(self) -> None:
-        """Get all mev reward block production events and combine them with the
-        transaction events if they can be found"""
+        """Get the mev reward block production events and combine them with the
+        transaction events if they can be found.
+
+        Only pairs where either side was added after the last run are checked. The
+        watermark is the biggest history event identifier examined by the last run.
+        """
         with self.database.conn.read_ctx() as cursor:
-            cursor.execute(
-                'SELECT B_H.identifier, B_T.block_number, B_H.notes FROM evm_transactions B_T '
-                'LEFT JOIN evm_events_info B_E '
-                'ON B_T.tx_hash=B_E.tx_hash LEFT JOIN history_events B_H '
-                'ON B_E.identifier=B_H.identifier WHERE '
-                'B_H.asset=? AND B_H.type=? AND B_H.subtype=? '
-                'AND B_T.block_number=('
-                'SELECT A_S.is_exit_or_blocknumber '
-                'FROM history_events A_H LEFT JOIN eth_staking_events_info A_S '
-                'ON A_H.identifier=A_S.identifier WHERE A_H.subtype=? AND '
-                'A_S.is_exit_or_blocknumber=B_T.block_number AND '
-                'A_H.amount=B_H.amount AND A_H.location_label=B_H.location_label)',
-                (A_ETH.identifier, HistoryEventType.RECEIVE.serialize(),
-                 HistoryEventSubType.NONE.serialize(), HistoryEventSubType.MEV_REWARD.serialize()),
+            watermark_result = cursor.execute(
+                'SELECT value FROM key_value_cache WHERE name=?',
+                (DBCacheStatic.COMBINE_BLOCK_EVENTS_WATERMARK.value,),
+            ).fetchone()
+            watermark = 0 if watermark_result is None else int(watermark_result[0])
+            last_identifier = cursor.execute(
+                'SELECT COALESCE(MAX(identifier), 0) FROM history_events',
+            ).fetchone()[0]
+            if last_identifier == watermark:
+                return  # nothing got added since last run
+            if watermark > last_identifier:  # events were deleted without lowering it
+                watermark = 0
+
+            # one part for new transaction events and one for new block events
+            match_querystr = (
+                'SELECT B_H.identifier, A_S.is_exit_or_blocknumber, B_H.notes '
+                'FROM history_events A_H INNER JOIN eth_staking_events_info A_S '
+                'ON A_H.identifier=A_S.identifier INNER JOIN evm_transactions B_T '
+                'ON B_T.block_number=A_S.is_exit_or_blocknumber INNER JOIN evm_events_info B_E '
+                'ON B_T.tx_hash=B_E.tx_hash INNER JOIN history_events B_H '
+                'ON B_E.identifier=B_H.identifier WHERE A_H.subtype=? AND B_H.asset=? AND '
+                'B_H.type=? AND B_H.subtype=? AND A_H.amount=B_H.amount AND '
+                'A_H.location_label=B_H.location_label AND {side}.identifier > ?'
+            )
+            match_bindings = (
+                HistoryEventSubType.MEV_REWARD.serialize(),
+                A_ETH.identifier,
+                HistoryEventType.RECEIVE.serialize(),
+                HistoryEventSubType.NONE.serialize(),
+                watermark,
             )
-            result = cursor.fetchall()
-
-        changes = [(
-            EthBlockEvent.form_event_identifier(entry[1]),
-            2,
-            f'{entry[2]} as mev reward for block {entry[1]}',
-            HistoryEventType.STAKING.serialize(),
-            HistoryEventSubType.MEV_REWARD.serialize(),
-            entry[0],
-        ) for entry in result]
+            result = cursor.execute(
+                f"{match_querystr.format(side='B_H')} UNION {match_querystr.format(side='A_H')}",
+                match_bindings * 2,
+            ).fetchall()
+
         with self.database.user_write() as write_cursor:
-            for changes_entry in changes:
-                try:
-                    write_cursor.execute(
-                        'UPDATE history_events '
-                        'SET event_identifier=?, sequence_index=?, notes=?, type=?, subtype=?'
-                        'WHERE identifier=?',
-                        changes_entry,
-                    )
-                except sqlcipher.IntegrityError as e:  # pylint: disable=no-member
-                    log.warning(f'Could not update history events with {changes_entry} in combine_block_with_tx_events due to {e!s}')  # noqa: E501
-                    # already exists. Probably right after resetting events? Delete old one
-                    write_cursor.execute('DELETE FROM history_events WHERE identifier=?', (changes_entry[5],))  # noqa: E501
+            for chunk in get_chunks(result, n=MAX_COMBINED_EVENTS_PER_QUERY):
+                # ignore conflicts with an already combined event. Probably right after
+                # resetting events. The leftover transaction events are deleted below.
+                write_cursor.execute(
+                    f'WITH M(identifier, event_identifier, notes) AS (VALUES '
+                    f'{",".join(["(?, ?, ?)"] * len(chunk))}) UPDATE OR IGNORE history_events '
+                    f'SET event_identifier=M.event_identifier, sequence_index=2, '
+                    f'notes=M.notes, type=?, subtype=? FROM M '
+                    f'WHERE history_events.identifier=M.identifier',
+                    (
+                        *(value for identifier, block_number, notes in chunk for value in (
+                            identifier,
+                            EthBlockEvent.form_event_identifier(block_number),
+                            f'{notes} as mev reward for block {block_number}',
+                        )),
+                        HistoryEventType.STAKING.serialize(),
+                        HistoryEventSubType.MEV_REWARD.serialize(),
+                    ),
+                )
+                write_cursor.execute(
+                    f'DELETE FROM history_events WHERE identifier IN '
+                    f'({",".join(["?"] * len(chunk))}) AND type=? AND subtype=?',
+                    (
+                        *(entry[0] for entry in chunk),
+                        HistoryEventType.RECEIVE.serialize(),
+                        HistoryEventSubType.NONE.serialize(),
+                    ),
+                )
+                if write_cursor.rowcount != 0:
+                    log.warning(f'Deleted {write_cursor.rowcount} transaction events in combine_block_with_tx_events since their combined block event already exists')  # noqa: E501
+
+            write_cursor.execute(
+                'INSERT OR REPLACE INTO key_value_cache(name, value) VALUES(?, ?)',
+                (DBCacheStatic.COMBINE_BLOCK_EVENTS_WATERMARK.value, str(last_identifier)),
+            )
+            if len(result) != 0:  # the leftover transaction events may have been deleted
+                DBEth2.lower_combine_block_events_watermark(write_cursor)
 
     def detect_exited_validators(self) -> None:
         """This function will detect any validators that have exited from the ones that
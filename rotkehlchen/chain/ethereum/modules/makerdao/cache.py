@@ -12,6 +12,7 @@ from rotkehlchen.chain.evm.types import string_to_evm_address
 from rotkehlchen.constants.assets import A_ETH, A_WETH
 from rotkehlchen.errors.asset import UnknownAsset, WrongAssetType
 from rotkehlchen.errors.misc import RemoteError
+from rotkehlchen.globaldb.cache import globaldb_bump_cache_version
 from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.types import CacheType, ChainID, ChecksumEvmAddress, EvmTokenKind
@@ -246,6 +247,7 @@ def update_ilk_registry(
                 'INSERT OR REPLACE INTO unique_cache(key, value, last_queried_ts) VALUES(?, ?, ?)',
                 write_tuples,
             )
+            globaldb_bump_cache_version(write_cursor=write_cursor, key_parts=(CacheType.MAKERDAO_VAULT_ILK,))  # noqa: E501
 
         write_cursor.execute(
             'UPDATE unique_cache SET last_queried_ts=? WHERE key=?',
@@ -1,24 +1,28 @@
 import logging
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Final, Optional
 
+from gevent.pool import Pool
 from pysqlcipher3 import dbapi2 as sqlcipher
 
 from rotkehlchen.assets.asset import Asset
 from rotkehlchen.chain.evm.decoding.uniswap.v3.types import AddressToUniswapV3LPBalances
 from rotkehlchen.constants import ZERO
 from rotkehlchen.constants.assets import A_USD
+from rotkehlchen.constants.timing import DAY_IN_SECONDS
+from rotkehlchen.db.evmtx import DBEvmTx
 from rotkehlchen.db.filtering import NFTFilterQuery
 from rotkehlchen.errors.asset import UnknownAsset
 from rotkehlchen.errors.misc import InputError, RemoteError
-from rotkehlchen.externalapis.opensea import NFT, Opensea
+from rotkehlchen.externalapis.opensea import MAX_CONCURRENT_OPENSEA_REQUESTS, NFT, Opensea
 from rotkehlchen.fval import FVal
 from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import deserialize_fval_or_zero
-from rotkehlchen.types import ChecksumEvmAddress, Price
+from rotkehlchen.types import ChainID, ChecksumEvmAddress, Price, SupportedBlockchain, Timestamp
 from rotkehlchen.user_messages import MessagesAggregator
 from rotkehlchen.utils.interfaces import EthereumModule
+from rotkehlchen.utils.misc import get_chunks, ts_now
 from rotkehlchen.utils.mixins.cacheable import CacheableMixIn, cache_response_timewise_immutable
 from rotkehlchen.utils.mixins.lockable import LockableQueryMixIn, protect_with_lock
 
@@ -28,11 +32,19 @@ from .structures import NftLpHandling, NFTResult
 if TYPE_CHECKING:
     from rotkehlchen.chain.ethereum.node_inquirer import EthereumInquirer
     from rotkehlchen.db.dbhandler import DBHandler
+    from rotkehlchen.db.drivers.gevent import DBCursor
     from rotkehlchen.premium.premium import Premium
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+# The NFTs of an address are kept while there is no NFT transfer of it since they were queried.
+# Incoming transfers not sent by the address itself are not in its transactions, and the
+# prices change without any transfer, so the NFTs are queried again after this time.
+NFTS_REFRESH_MAX_AGE: Final = DAY_IN_SECONDS
+# Max number of addresses or NFT identifiers bound in a single DB lookup
+NFTS_LOOKUP_CHUNK_LENGTH: Final = 500
+
 NFT_DB_WRITE_TUPLE = tuple[
     str,  # identifier
     str | None,  # name
@@ -107,6 +119,9 @@ class Nfts(EthereumModule, CacheableMixIn, LockableQueryMixIn):
             msg_aggregator=msg_aggregator,
             ethereum_inquirer=ethereum_inquirer,
         )
+        # timestamp at which the NFTs of each address were last queried from opensea. Kept
+        # only in memory so after a restart all the addresses are queried once again.
+        self.last_refreshes: dict[ChecksumEvmAddress, Timestamp] = {}
 
     @protect_with_lock()
     @cache_response_timewise_immutable()
@@ -116,30 +131,81 @@ class Nfts(EthereumModule, CacheableMixIn, LockableQueryMixIn):
             # Kwargs here is so linters don't complain when the "magic" ignore_cache kwarg is given
             **kwargs: Any,
     ) -> tuple[dict[ChecksumEvmAddress, list[NFT]], int]:
-        """May raise RemoteError"""
+        """The NFTs of the addresses are queried concurrently, within the opensea
+        requests limit, and are processed in the order of the addresses.
+
+        May raise RemoteError"""
         result = {}
         total_nfts_num = 0
-        for address in addresses:
-            nfts = self.opensea.get_account_nfts(address)
-            nfts_num = len(nfts)
-            if nfts_num != 0:
-                if self.premium is None:
-                    if nfts_num + total_nfts_num > FREE_NFT_LIMIT:
-                        remaining_size = FREE_NFT_LIMIT - total_nfts_num
-                    else:
-                        remaining_size = nfts_num
-
-                    if remaining_size != 0:
-                        result[address] = nfts[:remaining_size]
-                        total_nfts_num += remaining_size
-                        continue
+        pool = Pool(size=MAX_CONCURRENT_OPENSEA_REQUESTS)
+        try:
+            for address, nfts in zip(
+                    addresses,
+                    pool.imap(self.opensea.get_account_nfts, addresses),
+                    strict=True,
+            ):
+                nfts_num = len(nfts)
+                if nfts_num != 0:
+                    if self.premium is None:
+                        if nfts_num + total_nfts_num > FREE_NFT_LIMIT:
+                            remaining_size = FREE_NFT_LIMIT - total_nfts_num
+                        else:
+                            remaining_size = nfts_num
+
+                        if remaining_size != 0:
+                            result[address] = nfts[:remaining_size]
+                            total_nfts_num += remaining_size
+                            continue
+
+                        break  # else we hit the nft limit so break
+
+                    result[address] = nfts
+                    total_nfts_num += nfts_num
+        finally:  # stop the queries of the addresses after the limit or a failure
+            pool.kill()
 
-                    break  # else we hit the nft limit so break
-
-                result[address] = nfts
-                total_nfts_num += nfts_num
         return result, total_nfts_num
 
+    def _get_unchanged_addresses(
+            self,
+            addresses: Sequence[ChecksumEvmAddress],
+    ) -> set[ChecksumEvmAddress]:
+        """Returns the addresses whose NFTs saved in the DB can be kept without querying
+        opensea again.
+
+        That is when they were queried less than NFTS_REFRESH_MAX_AGE ago, the ethereum
+        transactions of the address have been queried since and none of them has an ERC721
+        or ERC1155 transfer from or to the address. Without premium the NFT limit is applied
+        across all the addresses so they are always queried.
+        """
+        if self.premium is None:
+            return set()
+
+        now = ts_now()
+        candidates = {
+            address: last_refresh for address in addresses
+            if (last_refresh := self.last_refreshes.get(address)) is not None and
+            now - last_refresh < NFTS_REFRESH_MAX_AGE
+        }
+        if len(candidates) == 0:
+            return set()
+
+        dbevmtx = DBEvmTx(self.db)
+        with self.db.conn.read_ctx() as cursor:
+            synced_addresses = {
+                address: last_refresh for address, last_refresh in candidates.items()
+                if dbevmtx.get_queried_range(
+                    cursor=cursor,
+                    address=address,
+                    chain=SupportedBlockchain.ETHEREUM,
+                )[1] >= last_refresh
+            }
+            return set(synced_addresses) - DBEvmTx.get_addresses_with_nft_transfers(
+                cursor=cursor,
+                chain_id=ChainID.ETHEREUM,
+                timestamps=synced_addresses,
+            )
+
     def get_all_info(
             self,
             addresses: list[ChecksumEvmAddress],
@@ -217,11 +283,16 @@ class Nfts(EthereumModule, CacheableMixIn, LockableQueryMixIn):
             self,
             addresses: Sequence[ChecksumEvmAddress],
             uniswap_nfts: AddressToUniswapV3LPBalances | None,
+            ignore_cache: bool,
     ) -> None:
         """Queries NFT balances for the specified addresses and saves them to the db.
         Doesn't return anything. The actual opensea querying part is protected by a lock.
         If `uniswap_nfts` is not None then the worth of the LPs are used as the value of the NFTs.
 
+        If `ignore_cache` is False, addresses with no NFT transfer since their last query in
+        this session keep their saved NFTs and only the value of their LPs is updated. See
+        `_get_unchanged_addresses`. If it is True all the addresses are queried.
+
         May raise:
         - RemoteError
         """
@@ -229,6 +300,9 @@ class Nfts(EthereumModule, CacheableMixIn, LockableQueryMixIn):
             accounts = self.db.get_blockchain_accounts(cursor=cursor)
         # Be sure that the only addresses queried already exist in the database. Fix for #4456
         queried_addresses = sorted(set(accounts.eth) & set(addresses))  # Sorting for consistency in tests  # noqa: E501
+        unchanged_addresses = set() if ignore_cache else self._get_unchanged_addresses(queried_addresses)  # noqa: E501
+        queried_addresses = [x for x in queried_addresses if x not in unchanged_addresses]
+        refresh_ts = ts_now()  # taken before querying so that no transfer in between is missed
         nft_results, _ = self._get_all_nft_data(queried_addresses, ignore_cache=True)
         db_data: list[NFT_DB_WRITE_TUPLE] = []
         # get uniswap v3 lp balances and update nfts that are LPs with their worth.
@@ -246,42 +320,113 @@ class Nfts(EthereumModule, CacheableMixIn, LockableQueryMixIn):
                         continue
                     db_data.append((nft.token_identifier, nft.name, str(nft.price_in_asset), nft.price_asset.identifier, False, address, False, nft.image_url, collection_name))  # noqa: E501
 
-        # Update DB cache
-        fresh_nfts_identifiers = [x[0] for x in db_data]
         with self.db.user_write() as write_cursor:
-            # Remove NFTs that the user no longer owns from the DB cache
-            write_cursor.execute(
-                f'DELETE FROM nfts WHERE owner_address IN '
-                f'({",".join("?" * len(addresses))}) AND identifier NOT IN '
-                f'({",".join("?" * len(fresh_nfts_identifiers))})',
-                tuple(addresses) + tuple(fresh_nfts_identifiers),
+            self._update_db_nfts(
+                write_cursor=write_cursor,
+                addresses=[x for x in addresses if x not in unchanged_addresses],
+                db_data=db_data,
             )
+            if uniswap_nfts is not None and len(unchanged_addresses) != 0:
+                self._update_db_lp_nfts(
+                    write_cursor=write_cursor,
+                    addresses=unchanged_addresses,
+                    uniswap_nfts=uniswap_nfts,
+                )
 
-            # Add new NFTs to the DB cache
-            write_cursor.executemany(
-                'INSERT OR IGNORE INTO assets(identifier) VALUES(?)',
-                [(x,) for x in fresh_nfts_identifiers],
-            )
-            write_cursor.executemany(
-                'INSERT OR IGNORE INTO nfts('
-                'identifier, name, last_price, last_price_asset, manual_price, owner_address, is_lp, image_url, collection_name'  # noqa: E501
-                ') VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?)',
-                db_data,
-            )
+        if self.premium is not None:
+            for address in queried_addresses:
+                self.last_refreshes[address] = refresh_ts
 
-            # Update NFTs that already exist in the cache. First, update everything except price
-            write_cursor.executemany(
-                'UPDATE nfts SET name=?, owner_address=?, image_url=?, collection_name=? '
-                'WHERE identifier=?',
-                [(x[1], x[5], x[7], x[8], x[0]) for x in db_data],
-            )
-            # Then, update price where it was not manually input.
-            # To preserve user manually input price
-            write_cursor.executemany(
-                'UPDATE nfts SET last_price=?, last_price_asset=? '
-                'WHERE identifier=? AND manual_price=0',
-                [(x[2], x[3], x[0]) for x in db_data],
-            )
+    @staticmethod
+    def _update_db_nfts(
+            write_cursor: 'DBCursor',
+            addresses: Sequence[ChecksumEvmAddress],
+            db_data: list[NFT_DB_WRITE_TUPLE],
+    ) -> None:
+        """Brings the saved NFTs of the given addresses in line with the freshly queried
+        `db_data` by only deleting, adding and updating the NFTs that differ"""
+        fresh_nfts = {x[0]: x for x in db_data}
+        saved_nfts: dict[str, NFT_DB_WRITE_TUPLE] = {}
+        for column, values in (('owner_address', addresses), ('identifier', list(fresh_nfts))):
+            for chunk in get_chunks(values, n=NFTS_LOOKUP_CHUNK_LENGTH):
+                saved_nfts.update((x[0], x) for x in write_cursor.execute(
+                    'SELECT identifier, name, last_price, last_price_asset, manual_price, '
+                    'owner_address, is_lp, image_url, collection_name FROM nfts WHERE '
+                    f'{column} IN ({",".join("?" * len(chunk))})',
+                    chunk,
+                ))
+
+        # Remove NFTs that the user no longer owns from the DB cache
+        addresses_set = set(addresses)
+        write_cursor.executemany(
+            'DELETE FROM nfts WHERE identifier=?',
+            [
+                (identifier,) for identifier, entry in saved_nfts.items()
+                if identifier not in fresh_nfts and entry[5] in addresses_set
+            ],
+        )
+        # Add new NFTs to the DB cache
+        new_nfts = [x for identifier, x in fresh_nfts.items() if identifier not in saved_nfts]
+        write_cursor.executemany(
+            'INSERT OR IGNORE INTO assets(identifier) VALUES(?)',
+            [(x[0],) for x in new_nfts],
+        )
+        write_cursor.executemany(
+            'INSERT OR IGNORE INTO nfts('
+            'identifier, name, last_price, last_price_asset, manual_price, owner_address, is_lp, image_url, collection_name'  # noqa: E501
+            ') VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            new_nfts,
+        )
+
+        # Update NFTs that already exist in the cache and changed. First, everything except
+        # price. Then the price where it was not manually input, to preserve it.
+        changed_data, changed_prices = [], []
+        for identifier, saved in saved_nfts.items():
+            if (fresh := fresh_nfts.get(identifier)) is None:
+                continue
+
+            if (saved[1], saved[5], saved[7], saved[8]) != (fresh[1], fresh[5], fresh[7], fresh[8]):  # noqa: E501
+                changed_data.append((fresh[1], fresh[5], fresh[7], fresh[8], identifier))
+            if saved[4] == 0 and (saved[2], saved[3]) != (fresh[2], fresh[3]):
+                changed_prices.append((fresh[2], fresh[3], identifier))
+
+        write_cursor.executemany(
+            'UPDATE nfts SET name=?, owner_address=?, image_url=?, collection_name=? '
+            'WHERE identifier=?',
+            changed_data,
+        )
+        write_cursor.executemany(
+            'UPDATE nfts SET last_price=?, last_price_asset=? WHERE identifier=?',
+            changed_prices,
+        )
+
+    @staticmethod
+    def _update_db_lp_nfts(
+            write_cursor: 'DBCursor',
+            addresses: set[ChecksumEvmAddress],
+            uniswap_nfts: AddressToUniswapV3LPBalances,
+    ) -> None:
+        """Updates the worth of the saved LP NFTs of addresses that were not queried again.
+        LPs no longer in `uniswap_nfts` are exited positions and are removed, as when the
+        NFTs of the address are queried."""
+        lp_values = {
+            lp.nft_id: str(lp.user_balance.usd_value)
+            for address in addresses for lp in uniswap_nfts.get(address, [])
+        }
+        placeholders = ','.join('?' * len(addresses))
+        saved_lps = [x[0] for x in write_cursor.execute(
+            f'SELECT identifier FROM nfts WHERE is_lp=1 AND owner_address IN ({placeholders})',
+            tuple(addresses),
+        )]
+        write_cursor.executemany(
+            'DELETE FROM nfts WHERE identifier=?',
+            [(x,) for x in saved_lps if x not in lp_values],
+        )
+        write_cursor.executemany(
+            "UPDATE nfts SET last_price=?, last_price_asset='USD' "
+            'WHERE identifier=? AND manual_price=0',
+            [(lp_values[x], x) for x in saved_lps if x in lp_values],
+        )
 
     def get_nfts_with_price(
             self,
@@ -415,7 +560,7 @@ class Nfts(EthereumModule, CacheableMixIn, LockableQueryMixIn):
         pass
 
     def on_account_removal(self, address: ChecksumEvmAddress) -> None:
-        pass
+        self.last_refreshes.pop(address, None)
 
     def deactivate(self) -> None:
         pass
@@ -25,14 +25,29 @@ from rotkehlchen.constants.assets import (
 )
 from rotkehlchen.constants.prices import ZERO_PRICE
 from rotkehlchen.constants.resolver import ChainID, ethaddress_to_identifier
+from rotkehlchen.constants.timing import DAY_IN_SECONDS, WEEK_IN_SECONDS
 from rotkehlchen.errors.asset import UnknownAsset, WrongAssetType
 from rotkehlchen.errors.defi import DefiPoolError
 from rotkehlchen.errors.price import NoPriceForGivenTimestamp, PriceQueryUnsupportedAsset
 from rotkehlchen.fval import FVal
+from rotkehlchen.globaldb.cache import (
+    globaldb_get_unique_cache_last_queried_ts_by_key,
+    globaldb_get_unique_cache_value,
+    globaldb_set_unique_cache_value,
+)
+from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.interfaces import HistoricalPriceOracleInterface
 from rotkehlchen.logging import RotkehlchenLogsAdapter
-from rotkehlchen.types import ChecksumEvmAddress, EvmTokenKind, Price, Timestamp
+from rotkehlchen.types import (
+    CacheType,
+    ChecksumEvmAddress,
+    EvmTokenKind,
+    Price,
+    Timestamp,
+    UniqueCacheType,
+)
+from rotkehlchen.utils.misc import ts_now
 from rotkehlchen.utils.mixins.cacheable import CacheableMixIn, cache_response_timewise
 
 if TYPE_CHECKING:
@@ -42,6 +57,8 @@ UNISWAPV3_FACTORY_DEPLOYED_BLOCK: Final = 12369621
 UNISWAPV2_FACTORY_DEPLOYED_BLOCK: Final = 10000835
 MULTICALL_DEPLOYED_BLOCK: Final = 14353601
 SINGLE_SIDE_USD_POOL_LIMIT: Final = 5000
+POOLS_CACHE_TTL: Final = WEEK_IN_SECONDS
+NO_POOLS_CACHE_TTL: Final = DAY_IN_SECONDS
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
@@ -68,6 +85,7 @@ class UniswapOracle(HistoricalPriceOracleInterface, CacheableMixIn):
         CacheableMixIn.__init__(self)
         HistoricalPriceOracleInterface.__init__(self, oracle_name=f'Uniswap V{version} oracle')
         self.ethereum = ethereum_inquirer
+        self.version = version
         self.weth = A_WETH.resolve_to_evm_token()
         self.routing_assets = [
             self.weth,
@@ -81,13 +99,59 @@ class UniswapOracle(HistoricalPriceOracleInterface, CacheableMixIn):
     ) -> bool:
         return False
 
-    @abc.abstractmethod
+    @cache_response_timewise()
     def get_pool(
             self,
             token_0: EvmToken,
             token_1: EvmToken,
     ) -> list[str]:
-        """Given two tokens returns a list of pools where they can be swapped"""
+        """Given two tokens returns a list of pools where they can be swapped
+
+        Which pools exist for the two tokens is cached in the global DB per oracle version.
+        Known absences are also cached but for a shorter period since a pool may be created
+        for them at any point. The pools to use out of the existing ones are chosen per query
+        since that may depend on their current state.
+        """
+        cache_key: tuple[UniqueCacheType | str, ...] = (
+            CacheType.UNISWAP_ORACLE_POOLS,
+            str(self.version),
+            token_0.evm_address,
+            token_1.evm_address,
+        )
+        pools = None
+        with GlobalDBHandler().conn.read_ctx() as cursor:
+            cached_pools = globaldb_get_unique_cache_value(cursor=cursor, key_parts=cache_key)
+            if cached_pools is not None:
+                last_queried_ts = globaldb_get_unique_cache_last_queried_ts_by_key(
+                    cursor=cursor,
+                    key_parts=cache_key,
+                )
+                max_age = POOLS_CACHE_TTL if cached_pools != '' else NO_POOLS_CACHE_TTL
+                if ts_now() - last_queried_ts <= max_age:
+                    pools = cached_pools.split(',') if cached_pools != '' else []
+
+        if pools is None:
+            pools = [x for x in self._query_pools(token_0, token_1) if x != ZERO_ADDRESS]
+            with GlobalDBHandler().conn.write_ctx() as write_cursor:
+                globaldb_set_unique_cache_value(
+                    write_cursor=write_cursor,
+                    key_parts=cache_key,
+                    value=','.join(pools),
+                )
+
+        return self._choose_pools(pools)
+
+    @abc.abstractmethod
+    def _query_pools(
+            self,
+            token_0: EvmToken,
+            token_1: EvmToken,
+    ) -> list[str]:
+        """Queries the pools of the two tokens on-chain. Missing pools may be ZERO_ADDRESS"""
+
+    def _choose_pools(self, pools: list[str]) -> list[str]:
+        """Returns the pools to use out of the existing pools of two tokens"""
+        return pools
 
     @abc.abstractmethod
     def get_pool_price(
@@ -384,12 +448,12 @@ class UniswapV3Oracle(UniswapOracle):
         self.uniswap_v3_pool_abi = self.ethereum.contracts.abi('UNISWAP_V3_POOL')
         self.uniswap_v3_factory = self.ethereum.contracts.contract(string_to_evm_address('0x1F98431c8aD98523631AE4a59f267346ea31F984'))  # noqa: E501
 
-    @cache_response_timewise()
-    def get_pool(
+    def _query_pools(
             self,
             token_0: EvmToken,
             token_1: EvmToken,
     ) -> list[str]:
+        """Queries the pool of each fee tier"""
         result = self.ethereum.multicall_specific(
             contract=self.uniswap_v3_factory,
             method_name='getPool',
@@ -399,15 +463,14 @@ class UniswapV3Oracle(UniswapOracle):
                 fee,
             ] for fee in (3000, 500, 10000)],
         )
+        return [to_checksum_address(query[0]) for query in result]
 
-        # get liquidity for each pool and choose the pool with the highest liquidity
-        best_pool, max_liquidity = to_checksum_address(result[0][0]), 0
-        for query in result:
-            if query[0] == ZERO_ADDRESS:
-                continue
-            pool_address = to_checksum_address(query[0])
+    def _choose_pools(self, pools: list[str]) -> list[str]:
+        """Chooses the pool with the highest current liquidity"""
+        best_pool, max_liquidity = None, 0
+        for pool_address in pools:
             pool_contract = EvmContract(
-                address=pool_address,
+                address=string_to_evm_address(pool_address),
                 abi=self.uniswap_v3_pool_abi,
                 deployed_block=UNISWAPV3_FACTORY_DEPLOYED_BLOCK,
             )
@@ -421,7 +484,7 @@ class UniswapV3Oracle(UniswapOracle):
                 best_pool = pool_address
                 max_liquidity = pool_liquidity
 
-        if max_liquidity == 0:
+        if best_pool is None:
             # if there is no pool with assets don't return any pool
             return []
         return [best_pool]
@@ -485,8 +548,7 @@ class UniswapV2Oracle(UniswapOracle):
         self.uniswap_v2_lp_abi = self.ethereum.contracts.abi('UNISWAP_V2_LP')
         self.uniswap_v2_factory = self.ethereum.contracts.contract(string_to_evm_address('0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f'))  # noqa: E501
 
-    @cache_response_timewise()
-    def get_pool(
+    def _query_pools(
             self,
             token_0: EvmToken,
             token_1: EvmToken,
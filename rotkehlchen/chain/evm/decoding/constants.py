@@ -17,6 +17,10 @@ OUTGOING_EVENT_TYPES: Final = {
 
 # keccak of Transfer(address,address,uint256)
 ERC20_OR_ERC721_TRANSFER: Final = b'\xdd\xf2R\xad\x1b\xe2\xc8\x9bi\xc2\xb0h\xfc7\x8d\xaa\x95+\xa7\xf1c\xc4\xa1\x16(\xf5ZM\xf5#\xb3\xef'  # noqa: E501
+# keccak of TransferSingle(address,address,address,uint256,uint256)
+ERC1155_TRANSFER_SINGLE: Final = b'\xc3\xd5\x81h\xc5\xaes\x97s\x1d\x06=[\xbf=exTBsC\xf4\xc0\x83$\x0fz\xac\xaa-\x0fb'  # noqa: E501
+# keccak of TransferBatch(address,address,address,uint256[],uint256[])
+ERC1155_TRANSFER_BATCH: Final = b'J9\xdc\x06\xd4\xc0\xdb\xc6Kp\xaf\x90\xfdi\x8a#:Q\x8a\xa5\xd0~Y]\x98;\x8c\x05&\xc8\xf7\xfb'  # noqa: E501
 # keccak of approve(address,uint256)
 ERC20_APPROVE: Final = b'\x8c[\xe1\xe5\xeb\xec}[\xd1OqB}\x1e\x84\xf3\xdd\x03\x14\xc0\xf7\xb2)\x1e[ \n\xc8\xc7\xc3\xb9%'  # noqa: E501
 # keccak of DelegateChanged(address,address,address)
@@ -1,5 +1,5 @@
 import logging
-from typing import TYPE_CHECKING, Literal, NamedTuple
+from typing import TYPE_CHECKING, Final, Literal, NamedTuple
 
 from rotkehlchen.assets.asset import UnderlyingToken
 from rotkehlchen.assets.utils import TokenEncounterInfo, get_or_create_evm_token
@@ -58,6 +58,13 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
+# cache types read by read_curve_pools_and_gauges
+CURVE_CACHE_TYPES: Final = (
+    CacheType.CURVE_LP_TOKENS,
+    CacheType.CURVE_POOL_ADDRESS,
+    CacheType.CURVE_GAUGE_ADDRESS,
+    CacheType.CURVE_POOL_TOKENS,
+)
 
 
 class CurvePoolData(NamedTuple):
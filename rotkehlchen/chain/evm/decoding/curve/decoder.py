@@ -23,6 +23,7 @@ from rotkehlchen.chain.evm.decoding.curve.constants import (
     TOKEN_EXCHANGE_UNDERLYING,
 )
 from rotkehlchen.chain.evm.decoding.curve.curve_cache import (
+    CURVE_CACHE_TYPES,
     get_lp_and_gauge_token_addresses,
     query_curve_data,
     read_curve_pools_and_gauges,
@@ -89,6 +90,7 @@ class CurveCommonDecoder(DecoderInterface, ReloadablePoolsAndGaugesDecoderMixin)
             cache_type_to_check_for_freshness=CacheType.CURVE_LP_TOKENS,
             query_data_method=query_curve_data,
             read_data_from_cache_method=read_curve_pools_and_gauges,
+            read_data_cache_types=CURVE_CACHE_TYPES,
             chain_id=evm_inquirer.chain_id,
         )
         self.aave_pools = aave_pools
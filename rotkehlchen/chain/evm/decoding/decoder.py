@@ -8,9 +8,10 @@ from collections.abc import Callable, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Optional, Protocol
+from typing import TYPE_CHECKING, Any, Final, Optional, Protocol, cast
 
 import gevent
+from eth_utils import is_checksum_address
 from gevent.lock import Semaphore
 
 from rotkehlchen.accounting.structures.balance import Balance
@@ -18,7 +19,7 @@ from rotkehlchen.accounting.structures.types import ActionType
 from rotkehlchen.api.websockets.typedefs import WSMessageType
 from rotkehlchen.assets.utils import TokenEncounterInfo, get_or_create_evm_token, get_token
 from rotkehlchen.chain.ethereum.utils import token_normalized_value
-from rotkehlchen.chain.evm.decoding.interfaces import ReloadableDecoderMixin
+from rotkehlchen.chain.evm.decoding.interfaces import DecoderInterface, ReloadableDecoderMixin
 from rotkehlchen.chain.evm.decoding.oneinch.v5.decoder import Oneinchv5Decoder
 from rotkehlchen.chain.evm.decoding.oneinch.v6.decoder import Oneinchv6Decoder
 from rotkehlchen.chain.evm.decoding.safe.decoder import SafemultisigDecoder
@@ -62,6 +63,7 @@ from rotkehlchen.utils.mixins.customizable_date import CustomizableDateMixin
 
 from .base import BaseDecoderTools, BaseDecoderToolsWithDSProxy
 from .constants import CPT_GAS, ERC20_APPROVE, ERC20_OR_ERC721_TRANSFER, OUTGOING_EVENT_TYPES
+from .decoders_manifest import DECODERS_COUNTERPARTIES, DECODERS_MANIFEST, DECODERS_PRODUCTS
 from .structures import (
     DEFAULT_DECODING_OUTPUT,
     FAILED_ENRICHMENT_OUTPUT,
@@ -81,11 +83,25 @@ if TYPE_CHECKING:
     from rotkehlchen.db.drivers.gevent import DBCursor
     from rotkehlchen.history.events.structures.evm_event import EvmEvent
 
-    from .interfaces import DecoderInterface
-
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 MIN_LOGS_PROCESSED_TO_SLEEP = 1000
+# Decoders overriding any of these have rules that are not tied to an address, so they
+# need to be initialized before decoding anything
+ADDRESS_INDEPENDENT_RULES: Final = (
+    'decoding_rules',
+    'decoding_by_input_data',
+    'enricher_rules',
+    'post_decoding_rules',
+)
+# Decoders that are initialized for every chain regardless of the decoders manifest
+BUILTIN_DECODERS: Final[dict[str, type[DecoderInterface]]] = {
+    'Safemultisig': SafemultisigDecoder,
+    'Oneinchv5': Oneinchv5Decoder,
+    'Oneinchv6': Oneinchv6Decoder,
+    'SocketBridgeDecoder': SocketBridgeDecoder,
+    'Weth': WethDecoder,
+}
 
 
 class EventDecoderFunction(Protocol):
@@ -114,6 +130,18 @@ class DecodingRules:
     all_counterparties: set['CounterpartyDetails']
     addresses_to_counterparties: dict[ChecksumEvmAddress, str]
 
+    @classmethod
+    def empty(cls) -> 'DecodingRules':
+        return cls(
+            address_mappings={},
+            event_rules=[],
+            input_data_rules={},
+            token_enricher_rules=[],
+            post_decoding_rules={},
+            all_counterparties=set(),
+            addresses_to_counterparties={},
+        )
+
     def __add__(self, other: 'DecodingRules') -> 'DecodingRules':
         if not isinstance(other, DecodingRules):
             raise TypeError(
@@ -135,6 +163,144 @@ class DecodingRules:
         )
 
 
+class _DecoderStateStub:
+    """Stands in for a decoder instance when finding the addresses of its rules.
+
+    Attribute access and calls give back another stub, so rules built only from
+    constants can be evaluated. Using a stub as a value (hashing, comparing, iterating
+    etc.) raises, so that rules depending on the decoder's state are never mistaken
+    for constant ones.
+    """
+
+    def __getattr__(self, name: str) -> '_DecoderStateStub':
+        return _DecoderStateStub()
+
+    def __call__(self, *args: Any, **kwargs: Any) -> '_DecoderStateStub':
+        return _DecoderStateStub()
+
+    def __getitem__(self, key: Any) -> '_DecoderStateStub':
+        return _DecoderStateStub()
+
+    def _depends_on_state(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError('Decoder rules depend on the decoder state')
+
+    __hash__ = __eq__ = __ne__ = __lt__ = __le__ = __gt__ = __ge__ = _depends_on_state
+    __bool__ = __len__ = __iter__ = __contains__ = __index__ = __int__ = _depends_on_state
+    __str__ = __repr__ = __format__ = _depends_on_state
+
+
+def _find_constant_addresses(
+        decoder_class: type[DecoderInterface],
+) -> set[ChecksumEvmAddress] | None:
+    """Finds the addresses of the decoder's address rules. None if they depend on
+    the decoder's state, e.g. on the chain it runs on or on data loaded from the DB"""
+    stub = _DecoderStateStub()
+    try:
+        addresses = (
+            set(decoder_class.addresses_to_decoders(stub)) |  # type: ignore[arg-type]
+            set(decoder_class.addresses_to_counterparties(stub))  # type: ignore[arg-type]
+        )
+    except Exception:  # any failure means the addresses are not constant
+        return None
+
+    if not all(isinstance(x, str) and is_checksum_address(x) for x in addresses):
+        return None
+
+    return addresses
+
+
+def _is_address_triggered(decoder_class: type[DecoderInterface]) -> bool:
+    """Whether all of the decoder's rules are tied to an address so that it can be
+    initialized when a log or transaction of one of its addresses is decoded"""
+    if issubclass(decoder_class, ReloadableDecoderMixin) or hasattr(decoder_class, 'decoding_by_tx_type'):  # noqa: E501
+        return False
+
+    return all(
+        getattr(decoder_class, method_name) is getattr(DecoderInterface, method_name)
+        for method_name in ADDRESS_INDEPENDENT_RULES
+    )
+
+
+def find_chain_decoders(
+        chain_modules_root: str,
+) -> list[tuple[str, str, tuple[ChecksumEvmAddress, ...] | None]]:
+    """Walks the modules package of a chain and finds all the protocol decoders in it
+
+    Returns a list of (class name, decoder module, trigger addresses) in the order in
+    which they should be initialized. The class name is the decoder class without the
+    Decoder suffix. The trigger addresses are the ones whose logs or transactions need
+    the decoder, so it can be initialized at the first of them. They are None for the
+    decoders that need to be initialized before decoding anything, including those that
+    share an address with another decoder. This imports every decoder module so it's
+    only meant to generate the decoders manifest.
+    """
+    chain_modules_prefix_length = len(chain_modules_root)
+
+    def _walk(package: ModuleType) -> list[tuple[str, str]]:
+        decoders = []
+        for _, name, is_pkg in pkgutil.walk_packages(package.__path__):
+            full_name = package.__name__ + '.' + name
+            if full_name == __name__ or is_pkg is False:
+                continue  # skip
+
+            submodule = None
+            with suppress(ModuleNotFoundError):
+                submodule = importlib.import_module(full_name + '.decoder')
+
+            if submodule is not None:
+                # take module name, transform it and find decoder if exists
+                class_name = full_name[chain_modules_prefix_length:].translate({ord('.'): None})
+                class_name = ''.join([x.capitalize() for x in class_name.split('_')])
+                if getattr(submodule, f'{class_name}Decoder', None) is not None:
+                    decoders.append((class_name, submodule.__name__))
+
+            decoders.extend(_walk(importlib.import_module(full_name)))
+
+        return decoders
+
+    chain_decoders = _walk(importlib.import_module(chain_modules_root))
+    decoder_classes = [
+        getattr(importlib.import_module(module_name), f'{class_name}Decoder')
+        for class_name, module_name in chain_decoders
+    ]
+    decoders_addresses = [_find_constant_addresses(x) for x in decoder_classes]
+    address_uses: dict[ChecksumEvmAddress, int] = {}
+    for addresses in decoders_addresses + [_find_constant_addresses(x) for x in BUILTIN_DECODERS.values()]:  # noqa: E501
+        for address in addresses or ():
+            address_uses[address] = address_uses.get(address, 0) + 1
+
+    result: list[tuple[str, str, tuple[ChecksumEvmAddress, ...] | None]] = []
+    for (class_name, module_name), decoder_class, addresses in zip(chain_decoders, decoder_classes, decoders_addresses, strict=True):  # noqa: E501
+        if (
+                addresses is None or len(addresses) == 0 or
+                _is_address_triggered(decoder_class) is False or
+                any(address_uses[x] > 1 for x in addresses)
+        ):
+            result.append((class_name, module_name, None))
+        else:
+            result.append((class_name, module_name, tuple(sorted(addresses))))
+
+    return result
+
+
+def find_decoders_details(
+        decoders: Sequence[tuple[str, str, Any]],
+) -> tuple[list[CounterpartyDetails], dict[str, list[EvmProduct]]]:
+    """Collects the counterparties and products of the given manifest decoders so
+    that they can be listed without importing and initializing the decoders"""
+    counterparties: set[CounterpartyDetails] = set()
+    products: dict[str, list[EvmProduct]] = {}
+    for class_name, module_name, _ in decoders:
+        decoder_class = getattr(importlib.import_module(module_name), f'{class_name}Decoder')
+        counterparties.update(decoder_class.counterparties())
+        products |= decoder_class.possible_products()
+
+    return (
+        sorted(counterparties, key=lambda x: (x.identifier, x.label, x.image or '', x.icon or '')),
+        dict(sorted(products.items())),
+    )
+
+
 class EVMTransactionDecoder(ABC):
 
     def __init__(
@@ -175,12 +341,10 @@ class EVMTransactionDecoder(ABC):
         self.evm_inquirer = evm_inquirer
         self.transactions = transactions
         self.msg_aggregator = database.msg_aggregator
-        self.chain_modules_root = f'rotkehlchen.chain.{self.evm_inquirer.chain_name}.modules'
-        self.chain_modules_prefix_length = len(self.chain_modules_root)
         self.dbevmtx = dbevmtx_class(self.database)
         self.dbevents = DBHistoryEvents(self.database)
         self.base = base_tools
-        self.rules = DecodingRules(
+        self._rules = DecodingRules(
             address_mappings={},
             event_rules=[
                 self._maybe_decode_erc20_approve,
@@ -192,37 +356,145 @@ class EVMTransactionDecoder(ABC):
             all_counterparties=set(self.misc_counterparties),
             addresses_to_counterparties={},
         )
-        self.rules.event_rules.extend(event_rules)
+        self._rules.event_rules.extend(event_rules)
         self.value_asset = value_asset
-        self.decoders: dict[str, DecoderInterface] = {}
+        self._decoders: dict[str, DecoderInterface] = {}
+        self.decoders_initialized = False
+        # decoders that are initialized only when one of their addresses is decoded
+        self._lazy_decoders: dict[str, tuple[str, tuple[ChecksumEvmAddress, ...]]] = {}
+        self._lazy_decoders_addresses: dict[ChecksumEvmAddress, str] = {}
+        for class_name, module_name, trigger_addresses in DECODERS_MANIFEST.get(self.evm_inquirer.chain_name, ()):  # noqa: E501
+            if trigger_addresses is not None:
+                addresses = cast('tuple[ChecksumEvmAddress, ...]', trigger_addresses)
+                self._lazy_decoders[class_name] = (module_name, addresses)
+                self._lazy_decoders_addresses.update(dict.fromkeys(addresses, class_name))
+        self.decoders_initialization_lock = Semaphore()
         self.addresses_exceptions = addresses_exceptions or {}
         self.exceptions_mappings = exceptions_mappings or {}
-
-        # Add the built-in decoders
-        self._add_builtin_decoders(self.rules)
-        # Recursively check all submodules to get all decoder address mappings and rules
-        self.rules += self._recursively_initialize_decoders(self.chain_modules_root)
         self.undecoded_tx_query_lock = Semaphore()
 
+    @property
+    def rules(self) -> DecodingRules:
+        self._maybe_initialize_decoders()
+        return self._rules
+
+    @property
+    def decoders(self) -> dict[str, 'DecoderInterface']:
+        """All the decoders of the chain. This initializes those that are otherwise
+        initialized only when one of their addresses is decoded"""
+        self._maybe_initialize_decoders()
+        for class_name in list(self._lazy_decoders):
+            self._maybe_initialize_lazy_decoder(class_name)
+        return self._decoders
+
+    def get_decoder(self, class_name: str) -> 'DecoderInterface | None':
+        """Returns the decoder with the given class name (without the Decoder suffix)
+        initializing it if needed. None if there is no such decoder"""
+        self._maybe_initialize_decoders()
+        self._maybe_initialize_lazy_decoder(class_name)
+        return self._decoders.get(class_name)
+
+    def _maybe_initialize_decoders(self) -> None:
+        """Initializes the decoders of the chain the first time they are needed
+
+        Importing and instantiating hundreds of decoders takes a while, so instead of doing
+        it for every chain at login it's done the first time a chain's decoding rules are
+        used. The decoder modules are read from the generated decoders manifest instead
+        of walking the chain's modules package. Decoders whose rules are all tied to
+        known addresses are initialized later, at the first of those addresses.
+        """
+        if self.decoders_initialized is True:
+            return
+
+        with self.decoders_initialization_lock:
+            self._initialize_decoders()
+
+    def _maybe_initialize_decoder_of_address(self, address: ChecksumEvmAddress) -> None:
+        """Initializes the decoder of the given address if it was not yet initialized"""
+        if (class_name := self._lazy_decoders_addresses.get(address)) is not None:
+            self._maybe_initialize_lazy_decoder(class_name)
+
+    def _maybe_initialize_lazy_decoder(self, class_name: str) -> None:
+        """Initializes a decoder that is initialized at the first of its addresses.
+        The rest of the decoders need to have been initialized already."""
+        if class_name not in self._lazy_decoders:
+            return
+
+        with self.decoders_initialization_lock:
+            if (lazy_decoder := self._lazy_decoders.get(class_name)) is None:
+                return  # was initialized while waiting for the lock
+
+            module_name, addresses = lazy_decoder
+            decoder_class = getattr(importlib.import_module(module_name), f'{class_name}Decoder')
+            self._add_single_decoder(class_name=class_name, decoder_class=decoder_class, rules=self._rules)  # noqa: E501
+            for address in addresses:
+                self._lazy_decoders_addresses.pop(address, None)
+            self._lazy_decoders.pop(class_name)
+            log.debug(f'Initialized {self.evm_inquirer.chain_name} {class_name} decoder')
+
+    def _initialize_decoders(self) -> None:
+        """Must be called with the decoders initialization lock held"""
+        if self.decoders_initialized is True:
+            return  # was initialized while waiting for the lock
+
+        self._add_builtin_decoders(self._rules)
+        self._rules += self._initialize_manifest_decoders()
+        log.debug(f'Initialized {len(self._decoders)} {self.evm_inquirer.chain_name} decoders')
+        self.decoders_initialized = True
+
+    def _initialize_manifest_decoders(self) -> DecodingRules:
+        """Initializes the chain's protocol decoders listed in the decoders manifest
+
+        Each package gets its own rules which are merged into its parent package's rules
+        once the package is done, so that uniqueness is checked only between the decoders
+        of the same package and their siblings' subpackages as when walking the packages.
+        """
+        chain_modules_root = f'rotkehlchen.chain.{self.evm_inquirer.chain_name}.modules'
+        levels: list[tuple[str, DecodingRules]] = [(chain_modules_root, DecodingRules.empty())]
+        for class_name, module_name, trigger_addresses in DECODERS_MANIFEST.get(self.evm_inquirer.chain_name, ()):  # noqa: E501
+            if trigger_addresses is not None:
+                continue  # initialized at the first of its addresses
+
+            parent_package = module_name.rsplit('.', maxsplit=2)[0]
+            while not (parent_package + '.').startswith(levels[-1][0] + '.'):
+                self._close_package_level(levels)
+
+            for part in parent_package[len(levels[-1][0]) + 1:].split('.'):
+                if part != '':  # open the packages between the last level and the decoder
+                    levels.append((f'{levels[-1][0]}.{part}', DecodingRules.empty()))
+
+            decoder_class = getattr(importlib.import_module(module_name), f'{class_name}Decoder')
+            self._add_single_decoder(class_name=class_name, decoder_class=decoder_class, rules=levels[-1][1])  # noqa: E501
+
+        while len(levels) > 1:
+            self._close_package_level(levels)
+
+        return levels[0][1]
+
+    @staticmethod
+    def _close_package_level(levels: list[tuple[str, DecodingRules]]) -> None:
+        """Merges the rules of the last package level into its parent package's rules"""
+        _, package_rules = levels.pop()
+        levels[-1] = (levels[-1][0], levels[-1][1] + package_rules)
+
     def _add_builtin_decoders(self, rules: DecodingRules) -> None:
         """Adds decoders that should be built-in for every EVM decoding run
 
         Think: Perhaps we can move them under a specific directory and use the
         normal loading?
         """
-        self._add_single_decoder(class_name='Safemultisig', decoder_class=SafemultisigDecoder, rules=rules)  # noqa: E501
-        self._add_single_decoder(class_name='Oneinchv5', decoder_class=Oneinchv5Decoder, rules=rules)  # noqa: E501
-        self._add_single_decoder(class_name='Oneinchv6', decoder_class=Oneinchv6Decoder, rules=rules)  # noqa: E501
-        self._add_single_decoder(class_name='SocketBridgeDecoder', decoder_class=SocketBridgeDecoder, rules=rules)  # noqa: E501
-
-        # Excluding Gnosis and Polygon PoS because they dont have ETH as native token
-        # Also arb and scroll because they don't follow the weth9 design
-        if self.evm_inquirer.chain_id not in CHAINS_WITHOUT_NATIVE_ETH | CHAINS_WITH_SPECIAL_WETH:
-            self._add_single_decoder(
-                class_name='Weth',
-                decoder_class=WethDecoder,
-                rules=rules,
-            )
+        for class_name, decoder_class in self._builtin_decoders():
+            self._add_single_decoder(class_name=class_name, decoder_class=decoder_class, rules=rules)  # noqa: E501
+
+    def _builtin_decoders(self) -> list[tuple[str, type['DecoderInterface']]]:
+        """Returns the builtin decoders that apply to this chain"""
+        return [
+            (class_name, decoder_class)
+            for class_name, decoder_class in BUILTIN_DECODERS.items()
+            # Excluding Gnosis and Polygon PoS because they dont have ETH as native token
+            # Also arb and scroll because they don't follow the weth9 design
+            if class_name != 'Weth' or self.evm_inquirer.chain_id not in CHAINS_WITHOUT_NATIVE_ETH | CHAINS_WITH_SPECIAL_WETH  # noqa: E501
+        ]
 
     def _add_single_decoder(
             self,
@@ -233,11 +505,11 @@ class EVMTransactionDecoder(ABC):
         """Initialize a single decoder, add it to the set of decoders to use
         and append its rules to the passed rules
         """
-        if class_name in self.decoders:
+        if class_name in self._decoders:
             raise ModuleLoadingError(f'{self.evm_inquirer.chain_name} decoder with name {class_name} already loaded')  # noqa: E501
 
         try:  # not giving kwargs since, kwargs name can differ
-            self.decoders[class_name] = decoder_class(
+            self._decoders[class_name] = decoder_class(
                 self.evm_inquirer,  # evm_inquirer
                 self.base,  # base_tools
                 self.msg_aggregator,  # msg_aggregator
@@ -255,9 +527,9 @@ class EVMTransactionDecoder(ABC):
             )
             return
 
-        new_input_data_rules = self.decoders[class_name].decoding_by_input_data()
-        new_address_to_decoders = self.decoders[class_name].addresses_to_decoders()
-        new_address_to_counterparties = self.decoders[class_name].addresses_to_counterparties()
+        new_input_data_rules = self._decoders[class_name].decoding_by_input_data()
+        new_address_to_decoders = self._decoders[class_name].addresses_to_decoders()
+        new_address_to_counterparties = self._decoders[class_name].addresses_to_counterparties()
 
         if __debug__:  # sanity checks for now only in debug as decoders are constant
             for new_struct, main_struct, type_name in (
@@ -268,63 +540,32 @@ class EVMTransactionDecoder(ABC):
                 self.assert_keys_are_unique(new_struct=new_struct, main_struct=main_struct, class_name=class_name, type_name=type_name)  # noqa: E501
 
         rules.address_mappings.update(new_address_to_decoders)
-        rules.event_rules.extend(self.decoders[class_name].decoding_rules())
+        rules.event_rules.extend(self._decoders[class_name].decoding_rules())
         rules.input_data_rules.update(new_input_data_rules)
-        rules.token_enricher_rules.extend(self.decoders[class_name].enricher_rules())
-        rules.post_decoding_rules.update(self.decoders[class_name].post_decoding_rules())
-        rules.all_counterparties.update(self.decoders[class_name].counterparties())
+        rules.token_enricher_rules.extend(self._decoders[class_name].enricher_rules())
+        rules.post_decoding_rules.update(self._decoders[class_name].post_decoding_rules())
+        rules.all_counterparties.update(self._decoders[class_name].counterparties())
         rules.addresses_to_counterparties.update(new_address_to_counterparties)
-        self._chain_specific_decoder_initialization(self.decoders[class_name])
-
-    def _recursively_initialize_decoders(
-            self,
-            package: str | ModuleType,
-    ) -> DecodingRules:
-        if isinstance(package, str):
-            package = importlib.import_module(package)
-
-        rules = DecodingRules(
-            address_mappings={},
-            event_rules=[],
-            input_data_rules={},
-            token_enricher_rules=[],
-            post_decoding_rules={},
-            all_counterparties=set(),
-            addresses_to_counterparties={},
-        )
-
-        for _, name, is_pkg in pkgutil.walk_packages(package.__path__):
-            full_name = package.__name__ + '.' + name
-            if full_name == __name__ or is_pkg is False:
-                continue  # skip
-
-            submodule = None
-            with suppress(ModuleNotFoundError):
-                submodule = importlib.import_module(full_name + '.decoder')
-
-            if submodule is not None:
-                # take module name, transform it and find decoder if exists
-                class_name = full_name[self.chain_modules_prefix_length:].translate({ord('.'): None})  # noqa: E501
-                parts = class_name.split('_')
-                class_name = ''.join([x.capitalize() for x in parts])
-                submodule_decoder = getattr(submodule, f'{class_name}Decoder', None)
-
-                if submodule_decoder:
-                    self._add_single_decoder(class_name=class_name, decoder_class=submodule_decoder, rules=rules)  # noqa: E501
-
-            if is_pkg:
-                recursive_results = self._recursively_initialize_decoders(full_name)
-                rules += recursive_results
-
-        return rules
+        self._chain_specific_decoder_initialization(self._decoders[class_name])
 
     def get_decoders_products(self) -> dict[str, list[EvmProduct]]:
-        """Get the list of possible products"""
+        """Get the list of possible products. Read from the decoders manifest so that
+        the decoders don't need to be initialized"""
         possible_products: dict[str, list[EvmProduct]] = {}
-        for decoder in self.decoders.values():
-            possible_products |= decoder.possible_products()
+        for _, decoder_class in self._builtin_decoders():
+            possible_products |= decoder_class.possible_products()
 
-        return possible_products
+        return possible_products | DECODERS_PRODUCTS.get(self.evm_inquirer.chain_name, {})
+
+    def get_all_counterparties(self) -> set[CounterpartyDetails]:
+        """Get the counterparties of all the decoders. Read from the decoders manifest
+        so that the decoders don't need to be initialized"""
+        counterparties = set(self.misc_counterparties)
+        for _, decoder_class in self._builtin_decoders():
+            counterparties.update(decoder_class.counterparties())
+
+        counterparties.update(DECODERS_COUNTERPARTIES.get(self.evm_inquirer.chain_name, ()))
+        return counterparties
 
     def _reload_single_decoder(self, cursor: 'DBCursor', decoder: 'DecoderInterface') -> None:
         """Reload data for a single decoder"""
@@ -341,7 +582,8 @@ class EVMTransactionDecoder(ABC):
         so that decoding happens with latest data
         """
         self.base.refresh_tracked_accounts(cursor)
-        for decoder in self.decoders.values():
+        self._maybe_initialize_decoders()
+        for decoder in self._decoders.values():  # uninitialized decoders load data at init
             self._reload_single_decoder(cursor, decoder)
 
     def reload_specific_decoders(self, cursor: 'DBCursor', decoders: set[str]) -> None:
@@ -349,8 +591,12 @@ class EVMTransactionDecoder(ABC):
         (without the Decoder suffix)
         """
         self.base.refresh_tracked_accounts(cursor)
+        self._maybe_initialize_decoders()
         for decoder_name in decoders:
-            if (decoder := self.decoders.get(decoder_name)) is None:
+            if decoder_name in self._lazy_decoders:
+                continue  # not initialized yet, so it will load the latest data at init
+
+            if (decoder := self._decoders.get(decoder_name)) is None:
                 log.error(f'Requested reloading of data for unknown {self.evm_inquirer.chain_name} decoder {decoder_name}')  # noqa: E501
                 continue
 
@@ -393,8 +639,9 @@ class EVMTransactionDecoder(ABC):
         - ConversionError
         - UnknownAsset
         """
-        mapping_result = self.rules.address_mappings.get(context.tx_log.address)
-        if mapping_result is None:
+        rules = self.rules
+        self._maybe_initialize_decoder_of_address(context.tx_log.address)
+        if (mapping_result := rules.address_mappings.get(context.tx_log.address)) is None:
             return DEFAULT_DECODING_OUTPUT
         method = mapping_result[0]
 
@@ -428,6 +675,7 @@ class EVMTransactionDecoder(ABC):
         transaction to_address field.
         """
         if transaction.to_address is not None:
+            self._maybe_initialize_decoder_of_address(transaction.to_address)
             address_counterparty = self.rules.addresses_to_counterparties.get(transaction.to_address)  # noqa: E501
             if address_counterparty is not None:
                 counterparties.add(address_counterparty)
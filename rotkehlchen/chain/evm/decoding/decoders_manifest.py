@@ -0,0 +1,471 @@
+# This file contains the decoders of each EVM chain and it should not be touched manually but only generated by tools/scripts/generate_decoders_manifest.py
+# Created at 2026-10-19 00:11:59 UTC with rotki version 1.36.1 by rotki
+from typing import Final
+
+from rotkehlchen.chain.evm.decoding.types import CounterpartyDetails
+from rotkehlchen.history.events.structures.evm_event import EvmProduct
+
+# chain name -> (decoder class name without the Decoder suffix, decoder module, addresses
+# at the first of which the decoder is initialized or None if it is initialized up front)
+DECODERS_MANIFEST: Final[dict[str, tuple[tuple[str, str, tuple[str, ...] | None], ...]]] = {
+    'ethereum': (
+        ('Aave', 'rotkehlchen.chain.ethereum.modules.aave.decoder', ('0x4da27a545c0c5B758a6BA100e3a049001de870f5',)),
+        ('Aavev1', 'rotkehlchen.chain.ethereum.modules.aave.v1.decoder', ('0x398eC7346DcD622eDc5ae82352F02bE94C62d119',)),
+        ('Aavev2', 'rotkehlchen.chain.ethereum.modules.aave.v2.decoder', None),
+        ('Aavev3', 'rotkehlchen.chain.ethereum.modules.aave.v3.decoder', None),
+        ('Airdrops', 'rotkehlchen.chain.ethereum.modules.airdrops.decoder', ('0x01F89EB04481052A75D32D726Cc5b6B2f567001D', '0x02Bd4A3b1b95b01F2Aa61655415A5d3EAAcaafdD', '0x02FfdC5bfAbe5c66BE067ff79231585082CA5fe2', '0x090D4613473dEE047c3f2706764f49E0821D256e', '0x0DCDc346ADF5a808F8e683C31BA89fA6C6E5775D', '0x164D113F46676CA92d54537aC5aF10aC20940b94', '0x2977F92D5BaddfB411beb642F97d125aA55C000A', '0x2E088A0A19dda628B4304301d1EA70b114e4AcCd', '0x394DCfbCf25C5400fcC147EbD9970eD34A474543', '0x4C20CDAdBcaE364Edc03E2B90F09eB97d08ce3C8', '0x61A1f84F12Ba9a56C22c31dDB10EC2e2CA0ceBCf', '0x7BC08798465B8475Db9BCA781C2Fd6063A09320D', '0x91B9A78658273913bf3F5444Cb5F2592d1123eA7', '0xB90381DAE1a72528660278100C5Aa44e1108ceF7', '0xC18360217D8F7Ab5e7c516566761Ea12Ce7F9D72', '0xCd966F6F78100CB9e02724bb6A82081D078Cc37A', '0xE295aD71242373C37C5FdA7B57F26f9eA1088AFe', '0xa4A3603000F5495F924A5C474AF67622B6b9c8Fa', '0xa6c22196309eF252232a0C62951fcEC1FE3b26FB', '0xd1Fa5AA6AD65eD6FEA863c2e7fB91e731DcD559F', '0xd28b7Ca9c6Bf8BB82Ea3d7F9948304F7C0B4e907', '0xe099e688D12DBc19ab46D128d1Db297575474a0d', '0xf4BBE639CCEd35210dA2018b0A31f4E1449B2a8a')),
+        ('ArbitrumOneBridge', 'rotkehlchen.chain.ethereum.modules.arbitrum_one_bridge.decoder', ('0x011B6E24FfB0B5f5fCc564cf4183C5BBBc96D515', '0x4Dbd4fc535Ac27206064B68FfCf827b0A60BAB3f', '0x8315177aB297bA92A06054cE80a67Ed4DBd7ed3a')),
+        ('AuraFinance', 'rotkehlchen.chain.ethereum.modules.aura_finance.decoder', None),
+        ('Balancerv1', 'rotkehlchen.chain.ethereum.modules.balancer.v1.decoder', None),
+        ('Balancerv2', 'rotkehlchen.chain.ethereum.modules.balancer.v2.decoder', None),
+        ('BaseBridge', 'rotkehlchen.chain.ethereum.modules.base_bridge.decoder', ('0x49048044D57e1C92A77f79988d21Fa8fAF74E97e',)),
+        ('Blur', 'rotkehlchen.chain.ethereum.modules.blur.decoder', ('0xB38283CB75faaBb384c22F97c633606265DdF093', '0xeC2432a227440139DDF1044c3feA7Ae03203933E')),
+        ('Cctp', 'rotkehlchen.chain.ethereum.modules.cctp.decoder', None),
+        ('Compoundv2', 'rotkehlchen.chain.ethereum.modules.compound.v2.decoder', None),
+        ('Compoundv3', 'rotkehlchen.chain.ethereum.modules.compound.v3.decoder', None),
+        ('Convex', 'rotkehlchen.chain.ethereum.modules.convex.decoder', None),
+        ('Cowswap', 'rotkehlchen.chain.ethereum.modules.cowswap.decoder', None),
+        ('Curve', 'rotkehlchen.chain.ethereum.modules.curve.decoder', None),
+        ('CurveLend', 'rotkehlchen.chain.ethereum.modules.curve_lend.decoder', None),
+        ('Defisaver', 'rotkehlchen.chain.ethereum.modules.defisaver.decoder', ('0x1612fc28Ee0AB882eC99842Cde0Fc77ff0691e90',)),
+        ('Diva', 'rotkehlchen.chain.ethereum.modules.diva.decoder', ('0x777E2B2Cc7980A6bAC92910B95269895EEf0d2E8', '0xBFAbdE619ed5C4311811cF422562709710DB587d', '0xFb6B7C11a55C57767643F1FF65c34C8693a11A70')),
+        ('Dripsv1', 'rotkehlchen.chain.ethereum.modules.drips.v1.decoder', None),
+        ('Dxdaomesa', 'rotkehlchen.chain.ethereum.modules.dxdaomesa.decoder', None),
+        ('Eas', 'rotkehlchen.chain.ethereum.modules.eas.decoder', None),
+        ('Efp', 'rotkehlchen.chain.ethereum.modules.efp.decoder', None),
+        ('Eigenlayer', 'rotkehlchen.chain.ethereum.modules.eigenlayer.decoder', None),
+        ('Ens', 'rotkehlchen.chain.ethereum.modules.ens.decoder', ('0x00000000000C2E074eC69A0dFb2997BA6C7d2e1e', '0x231b0Ee14048e9dCcD1d247744d114a4EB5E8E63', '0x253553366Da8546fC250F225fe3d25d0C782303b', '0x283Af0B28c62C092C9727F1Ee09c02CA627EB7F5', '0x323A76393544d5ecca80cd6ef2A560C6a395b7E3', '0x4976fb03C32e5B8cfe2b6cCB31c09Ba78EBaBa41', '0x57f1887a8BF19b14fC0dF6Fd9B2acc9Af147eA85')),
+        ('Eth2', 'rotkehlchen.chain.ethereum.modules.eth2.decoder', ('0x00000000219ab540356cBB839Cbe05303d7705Fa',)),
+        ('Fluence', 'rotkehlchen.chain.ethereum.modules.fluence.decoder', ('0x6081d7F04a8c31e929f25152d4ad37c83638C62b',)),
+        ('Gearbox', 'rotkehlchen.chain.ethereum.modules.gearbox.decoder', None),
+        ('Gitcoin', 'rotkehlchen.chain.ethereum.modules.gitcoin.decoder', None),
+        ('Gitcoinv2', 'rotkehlchen.chain.ethereum.modules.gitcoinv2.decoder', None),
+        ('Golem', 'rotkehlchen.chain.ethereum.modules.golem.decoder', ('0xBFAd98d76598961827bA832108c21445aa4FEE9A',)),
+        ('HarvestFinance', 'rotkehlchen.chain.ethereum.modules.harvest_finance.decoder', ('0xeE24de972295c20177e82BDe34F64cA5C11958EB',)),
+        ('Hop', 'rotkehlchen.chain.ethereum.modules.hop.decoder', None),
+        ('Juicebox', 'rotkehlchen.chain.ethereum.modules.juicebox.decoder', ('0x1d9619E10086FdC1065B114298384aAe3F680CC0',)),
+        ('Kyber', 'rotkehlchen.chain.ethereum.modules.kyber.decoder', ('0x6131B5fae19EA4f9D964eAc0408E4408b66337b5', '0x65bF64Ff5f51272f729BDcD7AcFB00677ced86Cd', '0x9AAb3f75489902f3a48495025729a0AF77d4b11e', '0x9ae49C0d7F8F9EF4B864e004FE86Ac8294E20950')),
+        ('Lido', 'rotkehlchen.chain.ethereum.modules.lido.decoder', None),
+        ('Liquity', 'rotkehlchen.chain.ethereum.modules.liquity.decoder', None),
+        ('Lockedgno', 'rotkehlchen.chain.ethereum.modules.lockedgno.decoder', ('0x4f8AD938eBA0CD19155a835f617317a6E788c868',)),
+        ('Makerdao', 'rotkehlchen.chain.ethereum.modules.makerdao.decoder', None),
+        ('Makerdaosai', 'rotkehlchen.chain.ethereum.modules.makerdao.sai.decoder', None),
+        ('Metamask', 'rotkehlchen.chain.ethereum.modules.metamask.decoder', None),
+        ('Monerium', 'rotkehlchen.chain.ethereum.modules.monerium.decoder', None),
+        ('Morpho', 'rotkehlchen.chain.ethereum.modules.morpho.decoder', None),
+        ('Octant', 'rotkehlchen.chain.ethereum.modules.octant.decoder', ('0x879133Fd79b7F48CE1c368b0fCA9ea168eaF117c', '0xc64783f0BE60A81A716535287539a694403183ba')),
+        ('Odosv1', 'rotkehlchen.chain.ethereum.modules.odos.v1.decoder', None),
+        ('Odosv2', 'rotkehlchen.chain.ethereum.modules.odos.v2.decoder', None),
+        ('Omni', 'rotkehlchen.chain.ethereum.modules.omni.decoder', ('0xD0c155595929FD6bE034c3848C00DAeBC6D330F6', '0xD2639676dA3dEA5491d27DA19340556b3a7d58B8')),
+        ('Omnibridge', 'rotkehlchen.chain.ethereum.modules.omnibridge.decoder', None),
+        ('Oneinchv1', 'rotkehlchen.chain.ethereum.modules.oneinch.v1.decoder', ('0x11111254369792b2Ca5d084aB5eEA397cA8fa48B',)),
+        ('Oneinchv2', 'rotkehlchen.chain.ethereum.modules.oneinch.v2.decoder', None),
+        ('Oneinchv3', 'rotkehlchen.chain.ethereum.modules.oneinch.v3.decoder', None),
+        ('Oneinchv4', 'rotkehlchen.chain.ethereum.modules.oneinch.v4.decoder', None),
+        ('Paladin', 'rotkehlchen.chain.ethereum.modules.paladin.decoder', ('0xce6dc32252d85e2e955Bfd3b85660917F040a933',)),
+        ('Paraswap', 'rotkehlchen.chain.ethereum.modules.paraswap.decoder', None),
+        ('PickleFinance', 'rotkehlchen.chain.ethereum.modules.pickle_finance.decoder', None),
+        ('Polygon', 'rotkehlchen.chain.ethereum.modules.polygon.decoder', None),
+        ('PolygonPosBridge', 'rotkehlchen.chain.ethereum.modules.polygon_pos_bridge.decoder', ('0x28e4F3a7f651294B9564800b2D01f35189A5bFbE', '0x2A88696e0fFA76bAA1338F2C74497cC013495922', '0x40ec5B33f54e0E8A33A975908C5BA1c14e5BbbDf', '0x8484Ef722627bf18ca5Ae6BcF031c23E6e922B30', '0xA0c68C638235ee32657e8f720a23ceC1bFc77C77')),
+        ('Puffer', 'rotkehlchen.chain.ethereum.modules.puffer.decoder', ('0x5Ae97e4770b7034C7Ca99Ab7edC26a18a23CB412',)),
+        ('Safe', 'rotkehlchen.chain.ethereum.modules.safe.decoder', ('0x0a7CB434f96f65972D46A5c1A64a9654dC9959b2', '0x96B71e2551915d98d22c448b040A3BC4801eA4ff')),
+        ('ScrollBridge', 'rotkehlchen.chain.ethereum.modules.scroll_bridge.decoder', ('0x6774Bcbd5ceCeF1336b5300fb5186a12DDD8b367', '0x7F2b8C31F88B6006c382775eea88297Ec1e3E905', '0xD8A791fE2bE73eb6E6cF1eb0cb3F36adC9B3F8f9', '0xf1AF3b23DE0A5Ca3CAb7261cb0061C0D779A5c7B')),
+        ('Shutter', 'rotkehlchen.chain.ethereum.modules.shutter.decoder', None),
+        ('Sky', 'rotkehlchen.chain.ethereum.modules.sky.decoder', ('0x3225737a9Bbb6473CB4a45b7244ACa2BeFdB276A', '0xBDcFCA946b6CDd965f99a839e4435Bcdc1bc470B', '0xa3931d71877C0E7a3148CB7Eb4463524FEc27fbD')),
+        ('Stakedao', 'rotkehlchen.chain.ethereum.modules.stakedao.decoder', ('0x0000000895cB182E6f983eb4D8b4E0Aa0B31Ae4c', '0x0000000BE1d98523B5469AfF51A1e7b4891c6225', '0x9f8386001D2245F3052725Dd29da68D268B7F4bB')),
+        ('SuperchainBridgebase', 'rotkehlchen.chain.ethereum.modules.superchain_bridge.base.decoder', None),
+        ('SuperchainBridgeop', 'rotkehlchen.chain.ethereum.modules.superchain_bridge.op.decoder', None),
+        ('Sushiswap', 'rotkehlchen.chain.ethereum.modules.sushiswap.decoder', None),
+        ('Thegraph', 'rotkehlchen.chain.ethereum.modules.thegraph.decoder', None),
+        ('Uniswapv1', 'rotkehlchen.chain.ethereum.modules.uniswap.v1.decoder', None),
+        ('Uniswapv2', 'rotkehlchen.chain.ethereum.modules.uniswap.v2.decoder', None),
+        ('Uniswapv3', 'rotkehlchen.chain.ethereum.modules.uniswap.v3.decoder', None),
+        ('Votium', 'rotkehlchen.chain.ethereum.modules.votium.decoder', ('0x34590960981f98b55d236b70E8B4d9929ad89C9c', '0x378Ba9B73309bE80BF4C2c027aAD799766a7ED5A')),
+        ('XdaiBridge', 'rotkehlchen.chain.ethereum.modules.xdai_bridge.decoder', None),
+        ('Yearn', 'rotkehlchen.chain.ethereum.modules.yearn.decoder', None),
+        ('Yearnygov', 'rotkehlchen.chain.ethereum.modules.yearn.ygov.decoder', ('0x0001FB050Fe7312791bF6475b96569D83F695C9f',)),
+        ('Zerox', 'rotkehlchen.chain.ethereum.modules.zerox.decoder', None),
+        ('Zksync', 'rotkehlchen.chain.ethereum.modules.zksync.decoder', ('0xaBEA9132b05A70803a4E85094fD0e1800777fBEF',)),
+    ),
+    'optimism': (
+        ('Aavev3', 'rotkehlchen.chain.optimism.modules.aave.v3.decoder', None),
+        ('Airdrops', 'rotkehlchen.chain.optimism.modules.airdrops.decoder', ('0xFb4D5A94b516DF77Fbdbcf3CfeB262baAF7D4dB7', '0xFeDFAF1A10335448b7FA0268F56D2B44DBD357de')),
+        ('AuraFinance', 'rotkehlchen.chain.optimism.modules.aura_finance.decoder', None),
+        ('Balancerv2', 'rotkehlchen.chain.optimism.modules.balancer.v2.decoder', None),
+        ('Cctp', 'rotkehlchen.chain.optimism.modules.cctp.decoder', None),
+        ('Curve', 'rotkehlchen.chain.optimism.modules.curve.decoder', None),
+        ('CurveLend', 'rotkehlchen.chain.optimism.modules.curve_lend.decoder', None),
+        ('Eas', 'rotkehlchen.chain.optimism.modules.eas.decoder', None),
+        ('Efp', 'rotkehlchen.chain.optimism.modules.efp.decoder', None),
+        ('Extrafi', 'rotkehlchen.chain.optimism.modules.extrafi.decoder', None),
+        ('Gearbox', 'rotkehlchen.chain.optimism.modules.gearbox.decoder', None),
+        ('Gitcoin', 'rotkehlchen.chain.optimism.modules.gitcoin.decoder', None),
+        ('Giveth', 'rotkehlchen.chain.optimism.modules.giveth.decoder', None),
+        ('Hop', 'rotkehlchen.chain.optimism.modules.hop.decoder', None),
+        ('Kyber', 'rotkehlchen.chain.optimism.modules.kyber.decoder', ('0x6131B5fae19EA4f9D964eAc0408E4408b66337b5',)),
+        ('Llamazip', 'rotkehlchen.chain.optimism.modules.llamazip.decoder', None),
+        ('Metamask', 'rotkehlchen.chain.optimism.modules.metamask.decoder', None),
+        ('Odosv1', 'rotkehlchen.chain.optimism.modules.odos.v1.decoder', None),
+        ('Odosv2', 'rotkehlchen.chain.optimism.modules.odos.v2.decoder', None),
+        ('Oneinchv4', 'rotkehlchen.chain.optimism.modules.oneinch.v4.decoder', None),
+        ('Optimism', 'rotkehlchen.chain.optimism.modules.optimism.decoder', ('0x4200000000000000000000000000000000000042',)),
+        ('OptimismGovernor', 'rotkehlchen.chain.optimism.modules.optimism_governor.decoder', ('0xcDF27F107725988f2261Ce2256bDfCdE8B382B10',)),
+        ('Paraswap', 'rotkehlchen.chain.optimism.modules.paraswap.decoder', None),
+        ('SuperchainBridge', 'rotkehlchen.chain.optimism.modules.superchain_bridge.decoder', None),
+        ('Uniswapv3', 'rotkehlchen.chain.optimism.modules.uniswap.v3.decoder', None),
+        ('Velodrome', 'rotkehlchen.chain.optimism.modules.velodrome.decoder', None),
+        ('Walletconnect', 'rotkehlchen.chain.optimism.modules.walletconnect.decoder', ('0x4ee97a759AACa2EdF9c1445223b6Cd17c2eD3fb4', '0x521B4C065Bbdbe3E20B3727340730936912DfA46')),
+        ('Zerox', 'rotkehlchen.chain.optimism.modules.zerox.decoder', None),
+    ),
+    'polygon_pos': (
+        ('Aavev2', 'rotkehlchen.chain.polygon_pos.modules.aave.v2.decoder', None),
+        ('Aavev3', 'rotkehlchen.chain.polygon_pos.modules.aave.v3.decoder', None),
+        ('AuraFinance', 'rotkehlchen.chain.polygon_pos.modules.aura_finance.decoder', None),
+        ('Balancerv2', 'rotkehlchen.chain.polygon_pos.modules.balancer.v2.decoder', None),
+        ('Cctp', 'rotkehlchen.chain.polygon_pos.modules.cctp.decoder', None),
+        ('Compoundv3', 'rotkehlchen.chain.polygon_pos.modules.compound.v3.decoder', None),
+        ('Curve', 'rotkehlchen.chain.polygon_pos.modules.curve.decoder', None),
+        ('Dripsv1', 'rotkehlchen.chain.polygon_pos.modules.drips.v1.decoder', None),
+        ('Gitcoin', 'rotkehlchen.chain.polygon_pos.modules.gitcoin.decoder', None),
+        ('Gitcoinv2', 'rotkehlchen.chain.polygon_pos.modules.gitcoinv2.decoder', None),
+        ('Hop', 'rotkehlchen.chain.polygon_pos.modules.hop.decoder', None),
+        ('Kyber', 'rotkehlchen.chain.polygon_pos.modules.kyber.decoder', ('0x6131B5fae19EA4f9D964eAc0408E4408b66337b5',)),
+        ('Metamask', 'rotkehlchen.chain.polygon_pos.modules.metamask.decoder', None),
+        ('Monerium', 'rotkehlchen.chain.polygon_pos.modules.monerium.decoder', None),
+        ('Odosv1', 'rotkehlchen.chain.polygon_pos.modules.odos.v1.decoder', None),
+        ('Odosv2', 'rotkehlchen.chain.polygon_pos.modules.odos.v2.decoder', None),
+        ('Oneinchv4', 'rotkehlchen.chain.polygon_pos.modules.oneinch.v4.decoder', None),
+        ('Paraswap', 'rotkehlchen.chain.polygon_pos.modules.paraswap.decoder', None),
+        ('PolygonPosBridge', 'rotkehlchen.chain.polygon_pos.modules.polygon_pos_bridge.decoder', None),
+        ('Uniswapv3', 'rotkehlchen.chain.polygon_pos.modules.uniswap.v3.decoder', None),
+        ('Wmatic', 'rotkehlchen.chain.polygon_pos.modules.wmatic.decoder', None),
+        ('Zerox', 'rotkehlchen.chain.polygon_pos.modules.zerox.decoder', None),
+    ),
+    'arbitrum_one': (
+        ('Aavev3', 'rotkehlchen.chain.arbitrum_one.modules.aave.v3.decoder', None),
+        ('Airdrops', 'rotkehlchen.chain.arbitrum_one.modules.airdrops.decoder', None),
+        ('ArbitrumGovernor', 'rotkehlchen.chain.arbitrum_one.modules.arbitrum_governor.decoder', ('0x467923B9AE90BDB36BA88eCA11604D45F13b712C', '0x6f3a242cA91A119F872f0073BC14BC8a74a315Ad', '0x789fC99093B09aD01C34DC7251D0C89ce743e5a4', '0x8a1cDA8dee421cD06023470608605934c16A05a0', '0xf07DeD9dC292157749B6Fd268E37DF6EA38395B9')),
+        ('ArbitrumOneBridge', 'rotkehlchen.chain.arbitrum_one.modules.arbitrum_one_bridge.decoder', None),
+        ('AuraFinance', 'rotkehlchen.chain.arbitrum_one.modules.aura_finance.decoder', None),
+        ('Balancerv1', 'rotkehlchen.chain.arbitrum_one.modules.balancer.v1.decoder', None),
+        ('Balancerv2', 'rotkehlchen.chain.arbitrum_one.modules.balancer.v2.decoder', None),
+        ('Cctp', 'rotkehlchen.chain.arbitrum_one.modules.cctp.decoder', None),
+        ('Clrfund', 'rotkehlchen.chain.arbitrum_one.modules.clrfund.decoder', None),
+        ('Compoundv3', 'rotkehlchen.chain.arbitrum_one.modules.compound.v3.decoder', None),
+        ('Cowswap', 'rotkehlchen.chain.arbitrum_one.modules.cowswap.decoder', None),
+        ('Curve', 'rotkehlchen.chain.arbitrum_one.modules.curve.decoder', None),
+        ('CurveLend', 'rotkehlchen.chain.arbitrum_one.modules.curve_lend.decoder', None),
+        ('Eas', 'rotkehlchen.chain.arbitrum_one.modules.eas.decoder', None),
+        ('Gearbox', 'rotkehlchen.chain.arbitrum_one.modules.gearbox.decoder', None),
+        ('Gitcoin', 'rotkehlchen.chain.arbitrum_one.modules.gitcoin.decoder', None),
+        ('Gmx', 'rotkehlchen.chain.arbitrum_one.modules.gmx.decoder', None),
+        ('Hop', 'rotkehlchen.chain.arbitrum_one.modules.hop.decoder', None),
+        ('Kyber', 'rotkehlchen.chain.arbitrum_one.modules.kyber.decoder', ('0x6131B5fae19EA4f9D964eAc0408E4408b66337b5',)),
+        ('Llamazip', 'rotkehlchen.chain.arbitrum_one.modules.llamazip.decoder', None),
+        ('Metamask', 'rotkehlchen.chain.arbitrum_one.modules.metamask.decoder', None),
+        ('Odosv1', 'rotkehlchen.chain.arbitrum_one.modules.odos.v1.decoder', None),
+        ('Odosv2', 'rotkehlchen.chain.arbitrum_one.modules.odos.v2.decoder', None),
+        ('Oneinchv4', 'rotkehlchen.chain.arbitrum_one.modules.oneinch.v4.decoder', None),
+        ('Paraswap', 'rotkehlchen.chain.arbitrum_one.modules.paraswap.decoder', None),
+        ('Thegraph', 'rotkehlchen.chain.arbitrum_one.modules.thegraph.decoder', None),
+        ('Umami', 'rotkehlchen.chain.arbitrum_one.modules.umami.decoder', None),
+        ('Uniswapv3', 'rotkehlchen.chain.arbitrum_one.modules.uniswap.v3.decoder', None),
+        ('Weth', 'rotkehlchen.chain.arbitrum_one.modules.weth.decoder', None),
+        ('Zerox', 'rotkehlchen.chain.arbitrum_one.modules.zerox.decoder', None),
+    ),
+    'base': (
+        ('Aavev3', 'rotkehlchen.chain.base.modules.aave.v3.decoder', None),
+        ('Aerodrome', 'rotkehlchen.chain.base.modules.aerodrome.decoder', None),
+        ('AuraFinance', 'rotkehlchen.chain.base.modules.aura_finance.decoder', None),
+        ('Balancerv2', 'rotkehlchen.chain.base.modules.balancer.v2.decoder', None),
+        ('Basenames', 'rotkehlchen.chain.base.modules.basenames.decoder', ('0x03c4738Ee98aE44591e1A4A4F3CaB6641d95DD9a', '0x4cCb0BB02FCABA27e82a56646E81d8c5bC4119a5', '0xB94704422c2a1E396835A571837Aa5AE53285a95', '0xC6d566A56A1aFf6508b41f6c90ff131615583BCD')),
+        ('Cctp', 'rotkehlchen.chain.base.modules.cctp.decoder', None),
+        ('Compoundv3', 'rotkehlchen.chain.base.modules.compound.v3.decoder', None),
+        ('Curve', 'rotkehlchen.chain.base.modules.curve.decoder', None),
+        ('Degen', 'rotkehlchen.chain.base.modules.degen.decoder', ('0x0Bf676823f958d0aE6af9860880FC7A327a0c582', '0x88d42b6DBc10D2494A0c6c189CeFC7573a6dCE62')),
+        ('Eas', 'rotkehlchen.chain.base.modules.eas.decoder', None),
+        ('Efp', 'rotkehlchen.chain.base.modules.efp.decoder', None),
+        ('Extrafi', 'rotkehlchen.chain.base.modules.extrafi.decoder', None),
+        ('Hop', 'rotkehlchen.chain.base.modules.hop.decoder', None),
+        ('Kyber', 'rotkehlchen.chain.base.modules.kyber.decoder', ('0x6131B5fae19EA4f9D964eAc0408E4408b66337b5',)),
+        ('Morpho', 'rotkehlchen.chain.base.modules.morpho.decoder', None),
+        ('Odosv2', 'rotkehlchen.chain.base.modules.odos.v2.decoder', None),
+        ('Paraswap', 'rotkehlchen.chain.base.modules.paraswap.decoder', None),
+        ('SuperchainBridge', 'rotkehlchen.chain.base.modules.superchain_bridge.decoder', None),
+        ('Uniswapv3', 'rotkehlchen.chain.base.modules.uniswap.v3.decoder', None),
+        ('Zerox', 'rotkehlchen.chain.base.modules.zerox.decoder', None),
+    ),
+    'gnosis': (
+        ('Aavev3', 'rotkehlchen.chain.gnosis.modules.aave.v3.decoder', None),
+        ('AuraFinance', 'rotkehlchen.chain.gnosis.modules.aura_finance.decoder', None),
+        ('Balancerv1', 'rotkehlchen.chain.gnosis.modules.balancer.v1.decoder', None),
+        ('Balancerv2', 'rotkehlchen.chain.gnosis.modules.balancer.v2.decoder', None),
+        ('Cowswap', 'rotkehlchen.chain.gnosis.modules.cowswap.decoder', None),
+        ('Curve', 'rotkehlchen.chain.gnosis.modules.curve.decoder', None),
+        ('Giveth', 'rotkehlchen.chain.gnosis.modules.giveth.decoder', None),
+        ('GnosisPay', 'rotkehlchen.chain.gnosis.modules.gnosis_pay.decoder', None),
+        ('Hop', 'rotkehlchen.chain.gnosis.modules.hop.decoder', None),
+        ('Monerium', 'rotkehlchen.chain.gnosis.modules.monerium.decoder', None),
+        ('Omnibridge', 'rotkehlchen.chain.gnosis.modules.omnibridge.decoder', None),
+        ('Oneinchv4', 'rotkehlchen.chain.gnosis.modules.oneinch.v4.decoder', None),
+        ('Sdai', 'rotkehlchen.chain.gnosis.modules.sdai.decoder', ('0xaf204776c7245bF4147c2612BF6e5972Ee483701',)),
+        ('Wxdai', 'rotkehlchen.chain.gnosis.modules.wxdai.decoder', None),
+        ('XdaiBridge', 'rotkehlchen.chain.gnosis.modules.xdai_bridge.decoder', None),
+    ),
+    'scroll': (
+        ('Aavev3', 'rotkehlchen.chain.scroll.modules.aave.v3.decoder', None),
+        ('Compoundv3', 'rotkehlchen.chain.scroll.modules.compound.v3.decoder', None),
+        ('Kyber', 'rotkehlchen.chain.scroll.modules.kyber.decoder', ('0x6131B5fae19EA4f9D964eAc0408E4408b66337b5',)),
+        ('Odosv2', 'rotkehlchen.chain.scroll.modules.odos.v2.decoder', None),
+        ('ScrollAirdrop', 'rotkehlchen.chain.scroll.modules.scroll_airdrop.decoder', ('0x3b04F9398Ce7aBa9e34a789dC5632002A3Dc9953', '0xE8bE8eB940c0ca3BD19D911CD3bEBc97Bea0ED62')),
+        ('ScrollBridge', 'rotkehlchen.chain.scroll.modules.scroll_bridge.decoder', None),
+        ('Weth', 'rotkehlchen.chain.scroll.modules.weth.decoder', None),
+    ),
+}
+
+# chain name -> counterparties of the chain decoders
+DECODERS_COUNTERPARTIES: Final[dict[str, tuple[CounterpartyDetails, ...]]] = {
+    'ethereum': (
+        CounterpartyDetails(identifier='0x', label='0x', image='0x.svg', icon=None),
+        CounterpartyDetails(identifier='1inch', label='1inch', image='1inch.svg', icon=None),
+        CounterpartyDetails(identifier='1inch-v1', label='1inch', image='1inch.svg', icon=None),
+        CounterpartyDetails(identifier='1inch-v2', label='1inch V2', image='1inch.svg', icon=None),
+        CounterpartyDetails(identifier='1inch-v3', label='1inch V3', image='1inch.svg', icon=None),
+        CounterpartyDetails(identifier='1inch-v4', label='1inch V4', image='1inch.svg', icon=None),
+        CounterpartyDetails(identifier='Locked GNO', label='Locked GNO', image='gnosis.svg', icon=None),
+        CounterpartyDetails(identifier='aave', label='Aave', image='aave.svg', icon=None),
+        CounterpartyDetails(identifier='aave-v1', label='Aave V1', image='aave.svg', icon=None),
+        CounterpartyDetails(identifier='aave-v2', label='Aave V2', image='aave.svg', icon=None),
+        CounterpartyDetails(identifier='aave-v3', label='Aave V3', image='aave.svg', icon=None),
+        CounterpartyDetails(identifier='arbitrum_one', label='Arbitrum One', image='arbitrum_one.svg', icon=None),
+        CounterpartyDetails(identifier='aura-finance', label='Aura Finance', image='aura-finance.png', icon=None),
+        CounterpartyDetails(identifier='badger', label='Badger', image='badger.png', icon=None),
+        CounterpartyDetails(identifier='balancer-v1', label='Balancer', image='balancer.svg', icon=None),
+        CounterpartyDetails(identifier='balancer-v2', label='Balancer', image='balancer.svg', icon=None),
+        CounterpartyDetails(identifier='base', label='Base', image='base.svg', icon=None),
+        CounterpartyDetails(identifier='blur', label='Blur', image='blur.png', icon=None),
+        CounterpartyDetails(identifier='cctp', label='Circle CCTP', image='cctp.svg', icon=None),
+        CounterpartyDetails(identifier='compound', label='Compound', image='compound.svg', icon=None),
+        CounterpartyDetails(identifier='compound-v3', label='Compound V3', image='compound.svg', icon=None),
+        CounterpartyDetails(identifier='convex', label='Convex', image='convex.jpeg', icon=None),
+        CounterpartyDetails(identifier='cowswap', label='Cowswap', image='cowswap.jpg', icon=None),
+        CounterpartyDetails(identifier='curve', label='Curve.fi', image='curve.png', icon=None),
+        CounterpartyDetails(identifier='defisaver', label='Defisaver', image='defisaver.jpeg', icon=None),
+        CounterpartyDetails(identifier='diva', label='Diva', image='diva.svg', icon=None),
+        CounterpartyDetails(identifier='drips', label='Drips', image='drips.png', icon=None),
+        CounterpartyDetails(identifier='dxdaomesa', label='dxdao', image='dxdao.svg', icon=None),
+        CounterpartyDetails(identifier='eas', label='Ethereum Attestation Service', image='eas.png', icon=None),
+        CounterpartyDetails(identifier='efp', label='EFP', image='efp.svg', icon=None),
+        CounterpartyDetails(identifier='eigenlayer', label='EigenLayer', image='eigenlayer.png', icon=None),
+        CounterpartyDetails(identifier='element-finance', label='Element Finance', image='element_finance.png', icon=None),
+        CounterpartyDetails(identifier='ens', label='ens', image='ens.svg', icon=None),
+        CounterpartyDetails(identifier='eth2', label='ETH2', image='ethereum.svg', icon=None),
+        CounterpartyDetails(identifier='fluence', label='Fluence', image='fluence.png', icon=None),
+        CounterpartyDetails(identifier='frax', label='FRAX', image='frax.png', icon=None),
+        CounterpartyDetails(identifier='gearbox', label='Gearbox', image='gearbox.svg', icon=None),
+        CounterpartyDetails(identifier='gitcoin', label='Gitcoin', image='gitcoin.svg', icon=None),
+        CounterpartyDetails(identifier='gnosis-chain', label='Gnosis Chain', image='gnosis.svg', icon=None),
+        CounterpartyDetails(identifier='golem', label='Golem', image='golem.svg', icon=None),
+        CounterpartyDetails(identifier='harvest finance', label='Harve Finance', image='harvest.gif', icon=None),
+        CounterpartyDetails(identifier='hop', label='Hop Protocol', image='hop_protocol.png', icon=None),
+        CounterpartyDetails(identifier='juicebox', label='Juicebox', image='juicebox.svg', icon=None),
+        CounterpartyDetails(identifier='kyber', label='Kyber', image='kyber.svg', icon=None),
+        CounterpartyDetails(identifier='kyber legacy', label='Kyber', image='kyber.svg', icon=None),
+        CounterpartyDetails(identifier='lido', label='Lido eth', image='lido.svg', icon=None),
+        CounterpartyDetails(identifier='liquity', label='Liquity', image='liquity.svg', icon=None),
+        CounterpartyDetails(identifier='makerdao dsr', label='Makerdao DSR', image='makerdao.svg', icon=None),
+        CounterpartyDetails(identifier='makerdao migration', label='Makerdao migration', image='makerdao.svg', icon=None),
+        CounterpartyDetails(identifier='makerdao sai', label='Makerdao SAI', image='makerdao.svg', icon=None),
+        CounterpartyDetails(identifier='makerdao vault', label='Makerdao vault', image='makerdao.svg', icon=None),
+        CounterpartyDetails(identifier='metamask_swaps', label='metamask swaps', image='metamask.svg', icon=None),
+        CounterpartyDetails(identifier='monerium', label='Monerium', image='monerium.svg', icon=None),
+        CounterpartyDetails(identifier='morpho', label='Morpho', image='morpho.svg', icon=None),
+        CounterpartyDetails(identifier='octant', label='Octant', image='octant.svg', icon=None),
+        CounterpartyDetails(identifier='odos-v1', label='Odos v1', image='odos.svg', icon=None),
+        CounterpartyDetails(identifier='odos-v2', label='Odos v2', image='odos.svg', icon=None),
+        CounterpartyDetails(identifier='omni', label='Omni', image='omni.svg', icon=None),
+        CounterpartyDetails(identifier='optimism', label='Optimism', image='optimism.svg', icon=None),
+        CounterpartyDetails(identifier='paladin', label='Paladin', image='paladin.png', icon=None),
+        CounterpartyDetails(identifier='paraswap', label='Paraswap', image='paraswap.svg', icon=None),
+        CounterpartyDetails(identifier='pickle finance', label='Pickle Finance', image='pickle.svg', icon=None),
+        CounterpartyDetails(identifier='polygon', label='Polygon', image='polygon_pos.svg', icon=None),
+        CounterpartyDetails(identifier='puffer', label='Puffer', image='puffer.svg', icon=None),
+        CounterpartyDetails(identifier='sDAI', label='sDAI contract', image='sdai.svg', icon=None),
+        CounterpartyDetails(identifier='safe', label='Safe', image='safemultisig.svg', icon=None),
+        CounterpartyDetails(identifier='scroll', label='Scroll', image='scroll.svg', icon=None),
+        CounterpartyDetails(identifier='shapeshift', label='Shapeshift', image='shapeshift.svg', icon=None),
+        CounterpartyDetails(identifier='shutter', label='Shutter', image='shutter.png', icon=None),
+        CounterpartyDetails(identifier='sky', label='Sky', image='sky_money.svg', icon=None),
+        CounterpartyDetails(identifier='stakedao', label='Stakedao', image='stakedao.png', icon=None),
+        CounterpartyDetails(identifier='sushiswap-v2', label='Sushiswap', image='sushiswap.svg', icon=None),
+        CounterpartyDetails(identifier='thegraph', label='The Graph', image='thegraph.svg', icon=None),
+        CounterpartyDetails(identifier='uniswap', label='Uniswap', image='uniswap.svg', icon=None),
+        CounterpartyDetails(identifier='uniswap-v1', label='Uniswap V1', image='uniswap.svg', icon=None),
+        CounterpartyDetails(identifier='uniswap-v2', label='Uniswap V2', image='uniswap.svg', icon=None),
+        CounterpartyDetails(identifier='uniswap-v3', label='Uniswap V3', image='uniswap.svg', icon=None),
+        CounterpartyDetails(identifier='votium', label='Votium', image='votium.png', icon=None),
+        CounterpartyDetails(identifier='yearn-v1', label='Yearn V1', image='yearn_vaults.svg', icon=None),
+        CounterpartyDetails(identifier='yearn-v2', label='Yearn V2', image='yearn_vaults.svg', icon=None),
+        CounterpartyDetails(identifier='yearn-v3', label='Yearn V3', image='yearn_vaults.svg', icon=None),
+        CounterpartyDetails(identifier='ygov', label='Yearn Governance', image='yearn_vaults.svg', icon=None),
+        CounterpartyDetails(identifier='zksync', label='zkSync', image='zksync.jpg', icon=None),
+    ),
+    'optimism': (
+        CounterpartyDetails(identifier='0x', label='0x', image='0x.svg', icon=None),
+        CounterpartyDetails(identifier='1inch-v4', label='1inch V4', image='1inch.svg', icon=None),
+        CounterpartyDetails(identifier='aave-v3', label='Aave V3', image='aave.svg', icon=None),
+        CounterpartyDetails(identifier='aura-finance', label='Aura Finance', image='aura-finance.png', icon=None),
+        CounterpartyDetails(identifier='balancer-v2', label='Balancer', image='balancer.svg', icon=None),
+        CounterpartyDetails(identifier='cctp', label='Circle CCTP', image='cctp.svg', icon=None),
+        CounterpartyDetails(identifier='curve', label='Curve.fi', image='curve.png', icon=None),
+        CounterpartyDetails(identifier='eas', label='Ethereum Attestation Service', image='eas.png', icon=None),
+        CounterpartyDetails(identifier='efp', label='EFP', image='efp.svg', icon=None),
+        CounterpartyDetails(identifier='extrafi', label='Extrafi', image='extrafi.svg', icon=None),
+        CounterpartyDetails(identifier='gearbox', label='Gearbox', image='gearbox.svg', icon=None),
+        CounterpartyDetails(identifier='gitcoin', label='Gitcoin', image='gitcoin.svg', icon=None),
+        CounterpartyDetails(identifier='giveth', label='Giveth', image='giveth.jpg', icon=None),
+        CounterpartyDetails(identifier='hop', label='Hop Protocol', image='hop_protocol.png', icon=None),
+        CounterpartyDetails(identifier='kyber', label='Kyber', image='kyber.svg', icon=None),
+        CounterpartyDetails(identifier='llamazip', label='LlamaZip', image='llamazip.png', icon=None),
+        CounterpartyDetails(identifier='metamask_swaps', label='metamask swaps', image='metamask.svg', icon=None),
+        CounterpartyDetails(identifier='odos-v1', label='Odos v1', image='odos.svg', icon=None),
+        CounterpartyDetails(identifier='odos-v2', label='Odos v2', image='odos.svg', icon=None),
+        CounterpartyDetails(identifier='optimism', label='Optimism', image='optimism.svg', icon=None),
+        CounterpartyDetails(identifier='paraswap', label='Paraswap', image='paraswap.svg', icon=None),
+        CounterpartyDetails(identifier='uniswap-v3', label='Uniswap V3', image='uniswap.svg', icon=None),
+        CounterpartyDetails(identifier='velodrome', label='velodrome_finance', image='velodrome.svg', icon=None),
+        CounterpartyDetails(identifier='walletconnect', label='WalletConnect', image='walletconnect.svg', icon=None),
+    ),
+    'polygon_pos': (
+        CounterpartyDetails(identifier='0x', label='0x', image='0x.svg', icon=None),
+        CounterpartyDetails(identifier='1inch-v4', label='1inch V4', image='1inch.svg', icon=None),
+        CounterpartyDetails(identifier='aave-v2', label='Aave V2', image='aave.svg', icon=None),
+        CounterpartyDetails(identifier='aave-v3', label='Aave V3', image='aave.svg', icon=None),
+        CounterpartyDetails(identifier='aura-finance', label='Aura Finance', image='aura-finance.png', icon=None),
+        CounterpartyDetails(identifier='balancer-v2', label='Balancer', image='balancer.svg', icon=None),
+        CounterpartyDetails(identifier='cctp', label='Circle CCTP', image='cctp.svg', icon=None),
+        CounterpartyDetails(identifier='compound-v3', label='Compound V3', image='compound.svg', icon=None),
+        CounterpartyDetails(identifier='curve', label='Curve.fi', image='curve.png', icon=None),
+        CounterpartyDetails(identifier='drips', label='Drips', image='drips.png', icon=None),
+        CounterpartyDetails(identifier='gitcoin', label='Gitcoin', image='gitcoin.svg', icon=None),
+        CounterpartyDetails(identifier='hop', label='Hop Protocol', image='hop_protocol.png', icon=None),
+        CounterpartyDetails(identifier='kyber', label='Kyber', image='kyber.svg', icon=None),
+        CounterpartyDetails(identifier='metamask_swaps', label='metamask swaps', image='metamask.svg', icon=None),
+        CounterpartyDetails(identifier='monerium', label='Monerium', image='monerium.svg', icon=None),
+        CounterpartyDetails(identifier='odos-v1', label='Odos v1', image='odos.svg', icon=None),
+        CounterpartyDetails(identifier='odos-v2', label='Odos v2', image='odos.svg', icon=None),
+        CounterpartyDetails(identifier='paraswap', label='Paraswap', image='paraswap.svg', icon=None),
+        CounterpartyDetails(identifier='polygon', label='Polygon', image='polygon_pos.svg', icon=None),
+        CounterpartyDetails(identifier='uniswap-v3', label='Uniswap V3', image='uniswap.svg', icon=None),
+        CounterpartyDetails(identifier='wmatic', label='WMatic', image='matic.svg', icon=None),
+    ),
+    'arbitrum_one': (
+        CounterpartyDetails(identifier='0x', label='0x', image='0x.svg', icon=None),
+        CounterpartyDetails(identifier='1inch-v4', label='1inch V4', image='1inch.svg', icon=None),
+        CounterpartyDetails(identifier='aave-v3', label='Aave V3', image='aave.svg', icon=None),
+        CounterpartyDetails(identifier='arbitrum_one', label='Arbitrum One', image='arbitrum_one.svg', icon=None),
+        CounterpartyDetails(identifier='aura-finance', label='Aura Finance', image='aura-finance.png', icon=None),
+        CounterpartyDetails(identifier='balancer-v1', label='Balancer', image='balancer.svg', icon=None),
+        CounterpartyDetails(identifier='balancer-v2', label='Balancer', image='balancer.svg', icon=None),
+        CounterpartyDetails(identifier='cctp', label='Circle CCTP', image='cctp.svg', icon=None),
+        CounterpartyDetails(identifier='clrfund', label='Clrfund', image='clrfund.png', icon=None),
+        CounterpartyDetails(identifier='compound-v3', label='Compound V3', image='compound.svg', icon=None),
+        CounterpartyDetails(identifier='cowswap', label='Cowswap', image='cowswap.jpg', icon=None),
+        CounterpartyDetails(identifier='curve', label='Curve.fi', image='curve.png', icon=None),
+        CounterpartyDetails(identifier='eas', label='Ethereum Attestation Service', image='eas.png', icon=None),
+        CounterpartyDetails(identifier='gearbox', label='Gearbox', image='gearbox.svg', icon=None),
+        CounterpartyDetails(identifier='gitcoin', label='Gitcoin', image='gitcoin.svg', icon=None),
+        CounterpartyDetails(identifier='gmx', label='GMX', image='gmx.svg', icon=None),
+        CounterpartyDetails(identifier='hop', label='Hop Protocol', image='hop_protocol.png', icon=None),
+        CounterpartyDetails(identifier='kyber', label='Kyber', image='kyber.svg', icon=None),
+        CounterpartyDetails(identifier='llamazip', label='LlamaZip', image='llamazip.png', icon=None),
+        CounterpartyDetails(identifier='metamask_swaps', label='metamask swaps', image='metamask.svg', icon=None),
+        CounterpartyDetails(identifier='odos-v1', label='Odos v1', image='odos.svg', icon=None),
+        CounterpartyDetails(identifier='odos-v2', label='Odos v2', image='odos.svg', icon=None),
+        CounterpartyDetails(identifier='paraswap', label='Paraswap', image='paraswap.svg', icon=None),
+        CounterpartyDetails(identifier='thegraph', label='The Graph', image='thegraph.svg', icon=None),
+        CounterpartyDetails(identifier='umami', label='Umami', image='umami.svg', icon=None),
+        CounterpartyDetails(identifier='uniswap-v3', label='Uniswap V3', image='uniswap.svg', icon=None),
+        CounterpartyDetails(identifier='weth', label='WETH', image='weth.svg', icon=None),
+    ),
+    'base': (
+        CounterpartyDetails(identifier='0x', label='0x', image='0x.svg', icon=None),
+        CounterpartyDetails(identifier='aave-v3', label='Aave V3', image='aave.svg', icon=None),
+        CounterpartyDetails(identifier='aerodrome', label='Aerodrome Finance', image='aerodrome.svg', icon=None),
+        CounterpartyDetails(identifier='aura-finance', label='Aura Finance', image='aura-finance.png', icon=None),
+        CounterpartyDetails(identifier='balancer-v2', label='Balancer', image='balancer.svg', icon=None),
+        CounterpartyDetails(identifier='base', label='Base', image='base.svg', icon=None),
+        CounterpartyDetails(identifier='basenames', label='Basenames', image='base.svg', icon=None),
+        CounterpartyDetails(identifier='cctp', label='Circle CCTP', image='cctp.svg', icon=None),
+        CounterpartyDetails(identifier='compound-v3', label='Compound V3', image='compound.svg', icon=None),
+        CounterpartyDetails(identifier='curve', label='Curve.fi', image='curve.png', icon=None),
+        CounterpartyDetails(identifier='degen', label='Degen', image='degen.svg', icon=None),
+        CounterpartyDetails(identifier='eas', label='Ethereum Attestation Service', image='eas.png', icon=None),
+        CounterpartyDetails(identifier='efp', label='EFP', image='efp.svg', icon=None),
+        CounterpartyDetails(identifier='extrafi', label='Extrafi', image='extrafi.svg', icon=None),
+        CounterpartyDetails(identifier='hop', label='Hop Protocol', image='hop_protocol.png', icon=None),
+        CounterpartyDetails(identifier='kyber', label='Kyber', image='kyber.svg', icon=None),
+        CounterpartyDetails(identifier='morpho', label='Morpho', image='morpho.svg', icon=None),
+        CounterpartyDetails(identifier='odos-v2', label='Odos v2', image='odos.svg', icon=None),
+        CounterpartyDetails(identifier='paraswap', label='Paraswap', image='paraswap.svg', icon=None),
+        CounterpartyDetails(identifier='uniswap-v3', label='Uniswap V3', image='uniswap.svg', icon=None),
+    ),
+    'gnosis': (
+        CounterpartyDetails(identifier='1inch-v4', label='1inch V4', image='1inch.svg', icon=None),
+        CounterpartyDetails(identifier='aave-v3', label='Aave V3', image='aave.svg', icon=None),
+        CounterpartyDetails(identifier='aura-finance', label='Aura Finance', image='aura-finance.png', icon=None),
+        CounterpartyDetails(identifier='balancer-v1', label='Balancer', image='balancer.svg', icon=None),
+        CounterpartyDetails(identifier='balancer-v2', label='Balancer', image='balancer.svg', icon=None),
+        CounterpartyDetails(identifier='cowswap', label='Cowswap', image='cowswap.jpg', icon=None),
+        CounterpartyDetails(identifier='curve', label='Curve.fi', image='curve.png', icon=None),
+        CounterpartyDetails(identifier='giveth', label='Giveth', image='giveth.jpg', icon=None),
+        CounterpartyDetails(identifier='gnosis-chain', label='Gnosis Chain', image='gnosis.svg', icon=None),
+        CounterpartyDetails(identifier='gnosis_pay', label='Gnosis Pay', image='gnosis_pay.png', icon=None),
+        CounterpartyDetails(identifier='hop', label='Hop Protocol', image='hop_protocol.png', icon=None),
+        CounterpartyDetails(identifier='monerium', label='Monerium', image='monerium.svg', icon=None),
+        CounterpartyDetails(identifier='sDAI', label='sDAI contract', image='sdai.svg', icon=None),
+        CounterpartyDetails(identifier='wxdai', label='WXDAI', image='wxdai.png', icon=None),
+    ),
+    'scroll': (
+        CounterpartyDetails(identifier='aave-v3', label='Aave V3', image='aave.svg', icon=None),
+        CounterpartyDetails(identifier='compound-v3', label='Compound V3', image='compound.svg', icon=None),
+        CounterpartyDetails(identifier='kyber', label='Kyber', image='kyber.svg', icon=None),
+        CounterpartyDetails(identifier='odos-v2', label='Odos v2', image='odos.svg', icon=None),
+        CounterpartyDetails(identifier='scroll', label='Scroll', image='scroll.svg', icon=None),
+        CounterpartyDetails(identifier='weth', label='WETH', image='weth.svg', icon=None),
+    ),
+}
+
+# chain name -> counterparty -> possible products of the chain decoders
+DECODERS_PRODUCTS: Final[dict[str, dict[str, list[EvmProduct]]]] = {
+    'ethereum': {
+        'convex': [EvmProduct.GAUGE, EvmProduct.STAKING],
+        'curve': [EvmProduct.GAUGE, EvmProduct.BRIBE],
+        'eigenlayer': [EvmProduct.STAKING],
+        'gearbox': [EvmProduct.STAKING],
+        'paladin': [EvmProduct.BRIBE],
+        'stakedao': [EvmProduct.BRIBE],
+        'votium': [EvmProduct.BRIBE],
+    },
+    'optimism': {
+        'curve': [EvmProduct.GAUGE],
+        'gearbox': [EvmProduct.STAKING],
+        'velodrome': [EvmProduct.POOL, EvmProduct.GAUGE],
+    },
+    'polygon_pos': {
+        'curve': [EvmProduct.GAUGE],
+    },
+    'arbitrum_one': {
+        'curve': [EvmProduct.GAUGE],
+        'gearbox': [EvmProduct.STAKING],
+    },
+    'base': {
+        'aerodrome': [EvmProduct.POOL, EvmProduct.GAUGE],
+        'curve': [EvmProduct.GAUGE],
+    },
+    'gnosis': {
+        'curve': [EvmProduct.GAUGE],
+    },
+    'scroll': {
+    },
+}
@@ -1,5 +1,5 @@
 import logging
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Final, Literal
 
 from rotkehlchen.chain.evm.contracts import EvmContract
 from rotkehlchen.chain.evm.decoding.extrafi.constants import EXTRAFI_POOL_CONTRACT
@@ -26,6 +26,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 MAX_RESERVES_QUERIED_PER_CHUNK = 20  # the maximum number of reserves that we can query without etherscan failing  # noqa: E501
+# cache types read by get_existing_reward_pools
+EXTRAFI_CACHE_TYPES: Final = (CacheType.EXTRAFI_REWARD_CONTRACTS,)
 
 
 def get_existing_reward_pools(chain_id: ChainID) -> tuple[set[ChecksumEvmAddress]]:
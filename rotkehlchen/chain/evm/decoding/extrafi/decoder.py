@@ -12,6 +12,7 @@ from rotkehlchen.chain.ethereum.utils import (
 )
 from rotkehlchen.chain.evm.decoding.constants import CPT_GAS
 from rotkehlchen.chain.evm.decoding.extrafi.cache import (
+    EXTRAFI_CACHE_TYPES,
     get_existing_reward_pools,
     query_extrafi_data,
 )
@@ -77,6 +78,7 @@ class ExtrafiCommonDecoder(DecoderInterface, ReloadableCacheDecoderMixin):
             cache_type_to_check_for_freshness=CacheType.EXTRAFI_NEXT_RESERVE_ID,
             query_data_method=query_extrafi_data,
             read_data_from_cache_method=get_existing_reward_pools,
+            read_data_cache_types=EXTRAFI_CACHE_TYPES,
             chain_id=evm_inquirer.chain_id,
         )
         super().__init__(
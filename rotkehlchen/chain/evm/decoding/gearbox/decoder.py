@@ -9,6 +9,7 @@ from rotkehlchen.chain.ethereum.utils import (
 )
 from rotkehlchen.chain.evm.constants import DEFAULT_TOKEN_DECIMALS
 from rotkehlchen.chain.evm.decoding.gearbox.gearbox_cache import (
+    GEARBOX_CACHE_TYPES,
     GearboxPoolData,
     query_gearbox_data,
     read_gearbox_data_from_cache,
@@ -66,6 +67,7 @@ class GearboxCommonDecoder(DecoderInterface, ReloadableCacheDecoderMixin):
             cache_type_to_check_for_freshness=CacheType.GEARBOX_POOL_ADDRESS,
             query_data_method=query_gearbox_data,
             read_data_from_cache_method=read_gearbox_data_from_cache,
+            read_data_cache_types=GEARBOX_CACHE_TYPES,
             chain_id=self.evm_inquirer.chain_id,
         )
         self.staking_contract = staking_contract
@@ -1,6 +1,6 @@
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Final, Literal
 
 from rotkehlchen.assets.asset import EvmToken, UnderlyingToken
 from rotkehlchen.assets.utils import TokenEncounterInfo, get_or_create_evm_token
@@ -43,6 +43,13 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
+# cache types read by read_gearbox_data_from_cache
+GEARBOX_CACHE_TYPES: Final = (
+    CacheType.GEARBOX_POOL_ADDRESS,
+    CacheType.GEARBOX_POOL_NAME,
+    CacheType.GEARBOX_POOL_FARMING_TOKEN,
+    CacheType.GEARBOX_POOL_LP_TOKENS,
+)
 
 
 @dataclass(init=True, repr=True, eq=True, order=False, unsafe_hash=False, frozen=False)
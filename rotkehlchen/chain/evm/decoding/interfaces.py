@@ -21,6 +21,8 @@ from rotkehlchen.chain.evm.decoding.structures import (
 from rotkehlchen.constants.assets import A_ETH
 from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.fval import FVal
+from rotkehlchen.globaldb.cache import globaldb_get_cache_versions
+from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.history.events.structures.evm_event import EvmProduct
 from rotkehlchen.history.events.structures.types import HistoryEventSubType, HistoryEventType
 from rotkehlchen.logging import RotkehlchenLogsAdapter
@@ -411,6 +413,7 @@ class ReloadableCacheDecoderMixin(ReloadableDecoderMixin, ABC):
             cache_type_to_check_for_freshness: CacheType,
             query_data_method: CACHE_QUERY_METHOD_TYPE,
             read_data_from_cache_method: Callable[[], tuple[dict[ChecksumEvmAddress, Any] | set[ChecksumEvmAddress], ...]],  # noqa: E501
+            read_data_cache_types: tuple[CacheType, ...],
     ) -> None:
         ...
 
@@ -421,6 +424,7 @@ class ReloadableCacheDecoderMixin(ReloadableDecoderMixin, ABC):
             cache_type_to_check_for_freshness: CacheType,
             query_data_method: CACHE_QUERY_METHOD_TYPE,
             read_data_from_cache_method: Callable[[ChainID], tuple[dict[ChecksumEvmAddress, Any] | set[ChecksumEvmAddress], ...]],  # noqa: E501
+            read_data_cache_types: tuple[CacheType, ...],
             chain_id: ChainID,
     ) -> None:
         ...
@@ -431,6 +435,7 @@ class ReloadableCacheDecoderMixin(ReloadableDecoderMixin, ABC):
             cache_type_to_check_for_freshness: CacheType,
             query_data_method: CACHE_QUERY_METHOD_TYPE,
             read_data_from_cache_method: Callable[..., tuple[dict[ChecksumEvmAddress, Any] | set[ChecksumEvmAddress], ...]],  # noqa: E501
+            read_data_cache_types: tuple[CacheType, ...],
             chain_id: ChainID | None = None,
     ) -> None:
         """
@@ -439,6 +444,8 @@ class ReloadableCacheDecoderMixin(ReloadableDecoderMixin, ABC):
         :param query_data_method: The method that queries the remote source
         for data and saves the new information.
         :param read_data_from_cache_method: The method that reads the data from the local cache.
+        :param read_data_cache_types: All the cache types read by read_data_from_cache_method.
+        Their versions are checked to know if the data needs to be read again.
         :param chain_id: The optional chain id of the data to read from the cache tables.
         cache tables.
         """
@@ -446,8 +453,10 @@ class ReloadableCacheDecoderMixin(ReloadableDecoderMixin, ABC):
         self.cache_type_to_check_for_freshness = cache_type_to_check_for_freshness
         self.query_data_method = query_data_method
         self.read_data_from_cache_method = read_data_from_cache_method
+        self.read_data_cache_types = read_data_cache_types
         self.chain_id = chain_id
         self.cache_data: tuple[dict[ChecksumEvmAddress, Any] | set[ChecksumEvmAddress], ...] = ()
+        self.cache_version: tuple[int, ...] | None = None  # versions of the read cache types
 
     @abstractmethod
     def _cache_mapping_methods(self) -> tuple[Callable, ...]:
@@ -462,7 +471,8 @@ class ReloadableCacheDecoderMixin(ReloadableDecoderMixin, ABC):
         saved in the DB and loaded to the decoder's memory.
 
         If a query happens and any new mappings are generated they are returned,
-        otherwise `None` is returned.
+        otherwise `None` is returned. The data is read from the DB only if any of the
+        read cache types was modified since the last time it was read.
         """
         self.evm_inquirer.ensure_cache_data_is_updated(
             cache_type=self.cache_type_to_check_for_freshness,
@@ -470,7 +480,16 @@ class ReloadableCacheDecoderMixin(ReloadableDecoderMixin, ABC):
             chain_id=self.chain_id,
             cache_key_parts=(str(self.chain_id.serialize_for_db()),) if self.chain_id else None,
         )
+        with GlobalDBHandler().conn.read_ctx() as cursor:
+            cache_version = globaldb_get_cache_versions(
+                cursor=cursor,
+                cache_types=self.read_data_cache_types,
+            )
+
+        if cache_version == self.cache_version:
+            return None  # nothing changed in the cache since the last read
 
+        self.cache_version = cache_version  # read before the data so no change can be missed
         if self.chain_id is None:
             new_cache_data = self.read_data_from_cache_method()
         else:
@@ -58,6 +58,7 @@ class VelodromeLikeDecoder(DecoderInterface, ReloadablePoolsAndGaugesDecoderMixi
             routers: set[ChecksumEvmAddress],
             pool_cache_type: CacheType,
             read_fn: Callable[[], tuple[set[ChecksumEvmAddress], set[ChecksumEvmAddress]]],
+            read_fn_cache_types: tuple[CacheType, ...],
             pool_token_protocol: str,
     ) -> None:
         super().__init__(
@@ -71,6 +72,7 @@ class VelodromeLikeDecoder(DecoderInterface, ReloadablePoolsAndGaugesDecoderMixi
             cache_type_to_check_for_freshness=pool_cache_type,
             query_data_method=query_velodrome_like_data,
             read_data_from_cache_method=read_fn,
+            read_data_cache_types=read_fn_cache_types,
         )
         self.counterparty = counterparty
         self.pool_token_protocol = pool_token_protocol
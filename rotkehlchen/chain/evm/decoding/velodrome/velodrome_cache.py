@@ -1,5 +1,5 @@
 import logging
-from typing import TYPE_CHECKING, Literal, NamedTuple
+from typing import TYPE_CHECKING, Final, Literal, NamedTuple
 
 from rotkehlchen.assets.utils import TokenEncounterInfo, get_or_create_evm_token
 from rotkehlchen.chain.evm.constants import ZERO_ADDRESS
@@ -39,6 +39,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
+# cache types read by read_velodrome_pools_and_gauges_from_cache
+VELODROME_CACHE_TYPES: Final = (CacheType.VELODROME_POOL_ADDRESS, CacheType.VELODROME_GAUGE_ADDRESS)  # noqa: E501
+# cache types read by read_aerodrome_pools_and_gauges_from_cache
+AERODROME_CACHE_TYPES: Final = (CacheType.AERODROME_POOL_ADDRESS, CacheType.AERODROME_GAUGE_ADDRESS)  # noqa: E501
 
 VELODROME_SUGAR_V2_CONTRACT = string_to_evm_address('0xc734656F0112CA18cdcaD424ddd8949F3D4c1DdD')  # Velodrome Finance LP Sugar v3  # noqa: E501
 AERODROME_SUGAR_V2_CONTRACT = string_to_evm_address('0xC301856B4262E49E9239ec8a2d0c754d5ae317c0')  # Aerodrome Finance LP Sugar v3  # noqa: E501
@@ -74,13 +74,11 @@ class CurveManagerMixin:
         ) is False:
             return
 
-        try:
-            curve_decoder = transactions_decoder.decoders['Curve']
-        except KeyError as e:
+        if (curve_decoder := transactions_decoder.get_decoder('Curve')) is None:
             raise InputError(
                 'Expected to find Curve decoder but it was not loaded. '
                 'Please open an issue on github.com/rotki/rotki/issues if you saw this.',
-            ) from e
+            )
         new_mappings = curve_decoder.reload_data()  # type: ignore  # we know type here
         if new_mappings:
             transactions_decoder.rules.address_mappings.update(new_mappings)
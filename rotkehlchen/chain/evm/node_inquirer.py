@@ -41,6 +41,7 @@ from rotkehlchen.constants import ONE
 from rotkehlchen.errors.misc import (
     BlockchainQueryError,
     EventNotInABI,
+    NodesQueryError,
     NotERC721Conformant,
     RemoteError,
 )
@@ -48,6 +49,8 @@ from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.externalapis.blockscout import Blockscout
 from rotkehlchen.externalapis.etherscan import Etherscan
 from rotkehlchen.fval import FVal
+from rotkehlchen.globaldb.handler import GlobalDBHandler
+from rotkehlchen.globaldb.response_cache import CachedEndpoint
 from rotkehlchen.greenlets.manager import GreenletManager
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import (
@@ -523,8 +526,9 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
         """Queries evm related data by performing a query of the provided method to all given nodes
 
         The first node in the call order that gets a successful response returns.
-        If none get a result then RemoteError is raised
+        If none get a result then NodesQueryError is raised
         """
+        node_errors = []
         for weighted_node in call_order:
             node_info = weighted_node.node_info
             web3node = self.web3_mapping.get(node_info, None)
@@ -570,6 +574,7 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
                     ValueError,  # not removing yet due to possibility of raising from missing trie error  # noqa: E501
             ) as e:
                 log.warning(f'Failed to query {node_info.name} for {method!s} due to {e!s}')
+                node_errors.append(str(e))
                 # Catch all possible errors here and just try next node call
                 continue
 
@@ -580,8 +585,9 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
             f'Failed to query {method!s} after trying the following '
             f'nodes: {[x.node_info.name for x in call_order]}',
         )
-        raise RemoteError(
-            f'Please check your network and confirm sufficient nodes are connected for {self.blockchain!s}.',  # noqa: E501
+        raise NodesQueryError(
+            message=f'Please check your network and confirm sufficient nodes are connected for {self.blockchain!s}.',  # noqa: E501
+            node_errors=node_errors,
         )
 
     def _get_latest_block_number(self, web3: Web3 | None) -> int:
@@ -608,6 +614,36 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
             num=num,
         )
 
+    def get_block_timestamp(
+            self,
+            num: int,
+            call_order: Sequence[WeightedNode] | None = None,
+    ) -> Timestamp:
+        """Returns the timestamp of the given block. Timestamps of finalized blocks
+        are kept in the on-disk response cache so they are only queried once.
+
+        May raise:
+        - RemoteError if an external service such as Etherscan is queried and
+        there is a problem with its query.
+        - BlockNotFound if the block can't be found.
+        """
+        response_cache = GlobalDBHandler().response_cache
+        if (timestamp := response_cache.get(
+            CachedEndpoint.BLOCK_TIMESTAMP,
+            chain=self.blockchain.value,
+            block=num,
+        )) is not None:
+            return Timestamp(timestamp)
+
+        timestamp = Timestamp(self.get_block_by_number(num=num, call_order=call_order)['timestamp'])  # noqa: E501
+        response_cache.set(
+            CachedEndpoint.BLOCK_TIMESTAMP,
+            timestamp,
+            chain=self.blockchain.value,
+            block=num,
+        )
+        return timestamp
+
     def _get_block_by_number(self, web3: Web3 | None, num: int) -> dict[str, Any]:
         """Returns the block object corresponding to the given block number
 
@@ -1106,9 +1142,7 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
             return Timestamp(event['timeStamp'])
 
         # event from web3
-        block_number = event['blockNumber']
-        block_data = self.get_block_by_number(block_number)
-        return Timestamp(block_data['timestamp'])
+        return self.get_block_timestamp(event['blockNumber'])
 
     def multicall(
             self,
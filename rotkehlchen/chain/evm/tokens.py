@@ -1,8 +1,11 @@
 import logging
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from collections.abc import Mapping, Sequence
-from typing import TYPE_CHECKING, TypeVar
+from collections.abc import Callable, Mapping, Sequence
+from typing import TYPE_CHECKING, Final, NamedTuple, TypeVar
+
+from gevent.lock import BoundedSemaphore
+from gevent.pool import Pool
 
 from rotkehlchen.assets.asset import Asset, EvmToken, Nft
 from rotkehlchen.chain.ethereum.utils import (
@@ -11,13 +14,16 @@ from rotkehlchen.chain.ethereum.utils import (
 )
 from rotkehlchen.chain.evm.types import WeightedNode, asset_id_is_evm_token
 from rotkehlchen.chain.structures import EvmTokenDetectionData
-from rotkehlchen.errors.misc import RemoteError
+from rotkehlchen.constants.timing import DAY_IN_SECONDS, WEEK_IN_SECONDS
+from rotkehlchen.db.cache import DBCacheDynamic
+from rotkehlchen.db.evmtx import DBEvmTx
+from rotkehlchen.errors.misc import NodesQueryError, RemoteError
 from rotkehlchen.fval import FVal
 from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.types import ChecksumEvmAddress, Price, SupportedBlockchain, Timestamp
-from rotkehlchen.utils.misc import combine_dicts, get_chunks
+from rotkehlchen.utils.misc import combine_dicts, get_chunks, ts_now
 
 if TYPE_CHECKING:
     from rotkehlchen.chain.evm.node_inquirer import EvmNodeInquirerWithDSProxy
@@ -69,6 +75,10 @@ DetectedTokensType = dict[
 
 OTHER_MAX_TOKEN_CHUNK_LENGTH = 460
 
+# Tokens are detected incrementally from the transfers of each address. All the known tokens
+# are checked again at this interval to catch the balances that came without a transfer log.
+FULL_TOKENS_DETECTION_PERIOD: Final = WEEK_IN_SECONDS
+
 # maximum 32-bytes arguments in one call to a contract (either tokensBalance or multicall)
 ETHERSCAN_MAX_ARGUMENTS_TO_CONTRACT = 110
 
@@ -76,7 +86,43 @@ ETHERSCAN_MAX_ARGUMENTS_TO_CONTRACT = 110
 # to multicall. In total, it occupies (7 + number of tokens passed) arguments.
 PURE_TOKENS_BALANCE_ARGUMENTS = 7
 
+# Token balance chunks are queried concurrently, spread over the nodes of the call order.
+# A node gets at most this many chunks in flight so that open nodes don't rate limit us.
+MAX_CONCURRENT_CHUNKS_PER_NODE: Final = 3
+# When a chunk fails in all nodes due to the gas or response size limits of the nodes, it is
+# split in half and the chunk length of the next queries is halved down to this minimum.
+# Each successful chunk at the current length increases it again by a small step.
+MIN_TOKEN_CHUNK_LENGTH: Final = 20
+TOKEN_CHUNK_LENGTH_INCREASE: Final = 20
+# Parts of the node error messages for queries exceeding the gas or response size limits
+CHUNK_LIMIT_ERROR_PARTS: Final = ('gas', 'size', 'too large', 'exceeds')
+
+# The token balances of an address are reused while there is no sign of activity for it. Some
+# tokens (rebasing, interest bearing) change balance without any transaction so the balances
+# are queried again after this time even if the address looks inactive.
+ADDRESS_TOKEN_BALANCES_MAX_AGE: Final = DAY_IN_SECONDS
+# The transactions of an address have to be queried up to at most this many seconds before its
+# token balances were last queried for them to be reused. Tx sync usually runs right before.
+ADDRESS_TOKEN_BALANCES_RANGE_TOLERANCE: Final = 10 * 60
+
 T = TypeVar('T')
+R = TypeVar('R')
+
+
+def is_chunk_limit_error(error: RemoteError) -> bool:
+    """Whether a chunk query failed due to the gas or response size limits of the nodes.
+    Only then querying the chunk split in smaller parts can succeed."""
+    errors = error.node_errors if isinstance(error, NodesQueryError) else [str(error)]
+    return any(part in x.lower() for x in errors for part in CHUNK_LIMIT_ERROR_PARTS)
+
+
+class AddressTokenBalances(NamedTuple):
+    """Token balances of an address as they were queried at a block"""
+    block_number: int
+    timestamp: Timestamp
+    native_balance: FVal
+    tokens: frozenset[EvmToken]
+    balances: dict[EvmToken, FVal]
 
 
 def generate_multicall_chunks(
@@ -132,6 +178,65 @@ class EvmTokens(ABC):
     ):
         self.db = database
         self.evm_inquirer = evm_inquirer
+        # chunk length that the nodes have shown to handle, None if no chunk has failed.
+        # See MIN_TOKEN_CHUNK_LENGTH
+        self.max_chunk_length: int | None = None
+        self.node_semaphores: dict[str, BoundedSemaphore] = {}
+        self.address_balances: dict[ChecksumEvmAddress, AddressTokenBalances] = {}
+
+    def _adapt_chunk_length(self, chunk_length: int, success: bool) -> None:
+        """Halves the chunk length after a failed chunk and increases it slowly again
+        after successful chunks of the current length"""
+        if success is False:
+            self.max_chunk_length = max(
+                MIN_TOKEN_CHUNK_LENGTH,
+                min(self.max_chunk_length or chunk_length, chunk_length // 2),
+            )
+        elif self.max_chunk_length is not None and chunk_length >= self.max_chunk_length:
+            self.max_chunk_length += TOKEN_CHUNK_LENGTH_INCREASE
+            if self.max_chunk_length >= OTHER_MAX_TOKEN_CHUNK_LENGTH:
+                self.max_chunk_length = None
+
+    def _get_chunk_size_call_order(self) -> tuple[int, list[WeightedNode]]:
+        """Same as get_chunk_size_call_order but limited by the adapted chunk length"""
+        chunk_size, call_order = get_chunk_size_call_order(self.evm_inquirer)
+        if self.max_chunk_length is not None:
+            chunk_size = min(chunk_size, self.max_chunk_length)
+        return chunk_size, call_order
+
+    def _query_chunks_concurrently(
+            self,
+            chunks: Sequence[T],
+            query: Callable[[T, list[WeightedNode]], R],
+            call_order: list[WeightedNode],
+    ) -> list[R]:
+        """Runs the query for each chunk in a bounded greenlet pool and returns the
+        results in the order of the chunks.
+
+        The chunks are assigned round robin to the owned nodes, or to all the nodes if
+        there is no owned node, by rotating the call order so that each of them is tried
+        first by a share of the chunks. The rest of the call order is kept as fallback.
+        Etherscan does its own rate limiting so with it the chunks are queried serially.
+        """
+        primary_nodes = [x for x in call_order if x.node_info.owned] or call_order
+        if len(chunks) <= 1 or call_order == [self.evm_inquirer.etherscan_node]:
+            return [query(chunk, call_order) for chunk in chunks]
+
+        def query_chunk(index_and_chunk: tuple[int, T]) -> R:
+            index, chunk = index_and_chunk
+            primary_idx = index % len(primary_nodes)
+            chunk_call_order = call_order[primary_idx:] + call_order[:primary_idx]
+            node_name = chunk_call_order[0].node_info.name
+            if (semaphore := self.node_semaphores.get(node_name)) is None:
+                semaphore = self.node_semaphores[node_name] = BoundedSemaphore(MAX_CONCURRENT_CHUNKS_PER_NODE)  # noqa: E501
+            with semaphore:
+                return query(chunk, chunk_call_order)
+
+        pool = Pool(size=min(len(chunks), MAX_CONCURRENT_CHUNKS_PER_NODE * len(primary_nodes)))
+        try:
+            return list(pool.imap(query_chunk, enumerate(chunks)))
+        finally:  # stop the queries of the other chunks after a failure
+            pool.kill()
 
     def get_token_balances(
             self,
@@ -143,9 +248,12 @@ class EvmTokens(ABC):
         Returns Asset objects instead of EvmTokens for performance optimization since
         we avoid loading from the database extra information not used here.
 
+        If the query fails due to the gas or response size limits of the nodes the tokens are
+        queried again in two halves, until the minimum chunk length is reached.
+
         May raise:
-        - RemoteError if an external service such as Etherscan is queried and
-          there is a problem with its query.
+        - RemoteError if there is a problem with querying the nodes or Etherscan, other than
+          the nodes limits.
         - BadFunctionCallOutput if a local node is used and the contract for the
           token has no code. That means the chain is not synced
         """
@@ -163,12 +271,29 @@ class EvmTokens(ABC):
                 call_order=call_order,
             )
         except RemoteError as e:
+            if not is_chunk_limit_error(e):
+                raise
+
+            self._adapt_chunk_length(chunk_length=len(tokens), success=False)
+            if len(tokens) >= 2 * MIN_TOKEN_CHUNK_LENGTH:
+                log.debug(
+                    f'{self.evm_inquirer.chain_name} tokensBalance call failed for address '
+                    f'{address} with {len(tokens)} tokens. Retrying in two halves. Error: {e}',
+                )
+                half = len(tokens) // 2
+                return combine_dicts(
+                    self.get_token_balances(address=address, tokens=tokens[:half], call_order=call_order),  # noqa: E501
+                    self.get_token_balances(address=address, tokens=tokens[half:], call_order=call_order),  # noqa: E501
+                )
+
             log.error(
                 f'{self.evm_inquirer.chain_name} tokensBalance call failed for address {address}.'
                 f' Token addresses: {[x.address for x in tokens]}. Error: {e}',
             )
             return balances
 
+        self._adapt_chunk_length(chunk_length=len(tokens), success=True)
+
         try:
             for token_balance, token in zip(result, tokens, strict=True):
                 if token_balance == 0:
@@ -199,9 +324,13 @@ class EvmTokens(ABC):
     ) -> dict[ChecksumEvmAddress, dict[EvmToken, FVal]]:
         """Gets token balances from a chunk of address -> token address
 
+        If the multicall fails due to the gas or response size limits of the nodes the chunk
+        is queried again split in two, until the minimum chunk length is reached.
+
         May raise:
         - RemoteError if no result is queried in multicall
         """
+        chunk_length = sum(PURE_TOKENS_BALANCE_ARGUMENTS + len(tokens) for _, tokens in chunk)
         calls: list[tuple[ChecksumEvmAddress, str]] = []
         for address, tokens in chunk:
             tokens_addrs = [token.evm_address for token in tokens]
@@ -214,11 +343,37 @@ class EvmTokens(ABC):
                     ),
                 ),
             )
-        results = self.evm_inquirer.multicall(
-            calls=calls,
-            call_order=call_order,
-        )
         balances: dict[ChecksumEvmAddress, dict[EvmToken, FVal]] = defaultdict(lambda: defaultdict(FVal))  # noqa: E501
+        try:
+            results = self.evm_inquirer.multicall(
+                calls=calls,
+                call_order=call_order,
+            )
+        except RemoteError as e:
+            if not is_chunk_limit_error(e):
+                raise
+
+            self._adapt_chunk_length(chunk_length=chunk_length, success=False)
+            if chunk_length < 2 * MIN_TOKEN_CHUNK_LENGTH:
+                raise
+
+            log.debug(
+                f'{self.evm_inquirer.chain_name} tokens balance multicall of {chunk_length} '
+                f'arguments failed. Retrying in two halves. Error: {e}',
+            )
+            for sub_chunk in generate_multicall_chunks(
+                chunk_length=chunk_length // 2 + 1,
+                addresses_to_tokens=dict(chunk),
+            ):
+                for address, address_balances in self._get_multicall_token_balances(
+                    chunk=sub_chunk,
+                    call_order=call_order,
+                ).items():
+                    for token, balance in address_balances.items():
+                        balances[address][token] += balance
+            return balances
+
+        self._adapt_chunk_length(chunk_length=chunk_length, success=True)
         for (address, tokens), result in zip(chunk, results, strict=True):
             decoded_result = self.evm_inquirer.contract_scan.decode(
                 result=result,
@@ -245,16 +400,19 @@ class EvmTokens(ABC):
             call_order: list[WeightedNode],
     ) -> dict[Asset, FVal]:
         """Processes token balance queries in batches of chunk_size to avoid hitting gas limits.
-        Uses Asset objects directly instead of EvmToken to minimize database queries.
+        The batches are queried concurrently. Uses Asset objects directly instead of EvmToken
+        to minimize database queries.
         """
         total_token_balances: dict[Asset, FVal] = defaultdict(FVal)
-        chunks = get_chunks(tokens, n=chunk_size)
-        for chunk in chunks:
-            new_token_balances = self.get_token_balances(
-                address=address,
-                tokens=chunk,
+        for new_token_balances in self._query_chunks_concurrently(
+                chunks=list(get_chunks(tokens, n=chunk_size)),
+                query=lambda chunk, chunk_call_order: self.get_token_balances(
+                    address=address,
+                    tokens=chunk,
+                    call_order=chunk_call_order,
+                ),
                 call_order=call_order,
-            )
+        ):
             total_token_balances = combine_dicts(total_token_balances, new_token_balances)
         return total_token_balances
 
@@ -277,26 +435,94 @@ class EvmTokens(ABC):
 
         return addresses_info
 
-    def _query_new_tokens(self, addresses: Sequence[ChecksumEvmAddress]) -> None:
-        all_tokens = GlobalDBHandler.get_token_detection_data(
-            chain_id=self.evm_inquirer.chain_id,
-            exceptions=self._get_token_exceptions(),
-        )
-        self._detect_tokens(
-            addresses=addresses,
-            tokens_to_check=all_tokens,
-        )
+    def _query_new_tokens(
+            self,
+            addresses: Sequence[ChecksumEvmAddress],
+            full_scan: bool,
+    ) -> None:
+        """Detects the tokens of the given addresses.
+
+        Addresses whose tokens were checked against all the known tokens in the last
+        FULL_TOKENS_DETECTION_PERIOD are detected incrementally. For them only the already
+        detected tokens and the tokens transferred in receipt logs saved since their last
+        detection are checked. All other addresses, or all of them if full_scan is True,
+        are checked against all the known tokens of the chain.
+        """
+        now = ts_now()
+        chain_id_str = str(self.evm_inquirer.chain_id.serialize_for_db())
+        watermarks: dict[ChecksumEvmAddress, int] = {}
+        incremental_candidates: dict[ChecksumEvmAddress, set[ChecksumEvmAddress]] = {}
+        with self.db.conn.read_ctx() as cursor:
+            # read before detecting, so that logs saved in the meantime are checked next time
+            log_watermark = DBEvmTx.get_max_receipt_log_id(cursor)
+            for address in addresses if full_scan is False else ():
+                if (
+                    (last_full_ts := self.db.get_dynamic_cache(
+                        cursor=cursor,
+                        name=DBCacheDynamic.LAST_FULL_TOKENS_DETECTION_TS,
+                        chain_id=chain_id_str,
+                        address=address,
+                    )) is not None and now - last_full_ts < FULL_TOKENS_DETECTION_PERIOD and
+                    (watermark := self.db.get_dynamic_cache(
+                        cursor=cursor,
+                        name=DBCacheDynamic.TOKENS_DETECTION_LOG_WATERMARK,
+                        chain_id=chain_id_str,
+                        address=address,
+                    )) is not None
+                ):
+                    watermarks[address] = watermark
+
+            transferred_tokens = DBEvmTx.get_transferred_tokens(
+                cursor=cursor,
+                chain_id=self.evm_inquirer.chain_id,
+                watermarks=watermarks,
+            )
+            for address in watermarks:
+                saved_tokens, _ = self.db.get_tokens_for_address(
+                    cursor=cursor,
+                    address=address,
+                    blockchain=self.evm_inquirer.blockchain,
+                    token_exceptions=self._per_chain_token_exceptions(),
+                )
+                incremental_candidates[address] = transferred_tokens.get(address, set()) | {
+                    token.evm_address for token in saved_tokens or []
+                }
+
+        exceptions = self._get_token_exceptions()
+        if len(full_scan_addresses := [x for x in addresses if x not in watermarks]) != 0:
+            self._detect_tokens(
+                addresses=full_scan_addresses,
+                tokens_to_check=GlobalDBHandler.get_token_detection_data(
+                    chain_id=self.evm_inquirer.chain_id,
+                    exceptions=exceptions,
+                ),
+                log_watermark=log_watermark,
+                full_detection_ts=now,
+            )
+
+        for address, candidates in incremental_candidates.items():
+            self._detect_tokens(
+                addresses=[address],
+                tokens_to_check=GlobalDBHandler.get_token_detection_data(
+                    chain_id=self.evm_inquirer.chain_id,
+                    exceptions=exceptions,
+                    addresses=candidates,
+                ) if len(candidates) != 0 else [],
+                log_watermark=log_watermark,
+            )
 
     def detect_tokens(
             self,
             only_cache: bool,
             addresses: Sequence[ChecksumEvmAddress],
+            full_scan: bool = False,
     ) -> DetectedTokensType:
         """
         Detect tokens for the given addresses.
 
         If only_cache is True, only tokens saved in the database are returned.
-        Otherwise, tokens are re-detected.
+        Otherwise, tokens are re-detected. Re-detection is incremental for addresses
+        whose tokens were recently fully detected, unless full_scan is True.
 
         May raise:
         - RemoteError if an external service such as Etherscan is queried and
@@ -305,7 +531,7 @@ class EvmTokens(ABC):
           token has no code. That means the chain is not synced
         """
         if only_cache is False:
-            self._query_new_tokens(addresses)
+            self._query_new_tokens(addresses=addresses, full_scan=full_scan)
 
         return self._compute_detected_tokens_info(addresses)
 
@@ -313,17 +539,23 @@ class EvmTokens(ABC):
             self,
             addresses: Sequence[ChecksumEvmAddress],
             tokens_to_check: list[EvmTokenDetectionData],
+            log_watermark: int | None = None,
+            full_detection_ts: Timestamp | None = None,
     ) -> None:
         """
         Detect tokens for the given addresses.
 
+        If given, the receipt log watermark and the full detection timestamp are saved
+        for each address so that the next detection can be incremental.
+
         May raise:
         - RemoteError if an external service such as Etherscan is queried and
           there is a problem with its query.
         - BadFunctionCallOutput if a local node is used and the contract for the
           token has no code. That means the chain is not synced
         """
-        chunk_size, call_order = get_chunk_size_call_order(self.evm_inquirer)
+        chunk_size, call_order = self._get_chunk_size_call_order()
+        chain_id_str = str(self.evm_inquirer.chain_id.serialize_for_db())
         for address in addresses:
             token_balances = self._query_chunks(
                 address=address,
@@ -339,14 +571,80 @@ class EvmTokens(ABC):
                     blockchain=self.evm_inquirer.blockchain,
                     tokens=detected_tokens,
                 )
+                if log_watermark is not None:
+                    self.db.set_dynamic_cache(
+                        write_cursor=write_cursor,
+                        name=DBCacheDynamic.TOKENS_DETECTION_LOG_WATERMARK,
+                        value=log_watermark,
+                        chain_id=chain_id_str,
+                        address=address,
+                    )
+                if full_detection_ts is not None:
+                    self.db.set_dynamic_cache(
+                        write_cursor=write_cursor,
+                        name=DBCacheDynamic.LAST_FULL_TOKENS_DETECTION_TS,
+                        value=full_detection_ts,
+                        chain_id=chain_id_str,
+                        address=address,
+                    )
+
+    def _get_inactive_addresses(
+            self,
+            addresses_to_tokens: dict[ChecksumEvmAddress, list[EvmToken]],
+            native_balances: Mapping[ChecksumEvmAddress, FVal],
+    ) -> set[ChecksumEvmAddress]:
+        """Returns the addresses whose last queried token balances can be reused.
+
+        That is when, since the last query, the native balance is the same, the tracked tokens
+        are the same, the transactions of the address have been queried up to around the last
+        query and none of them is mined after the block of the last query. Sending transactions
+        spends gas so a changed native balance also covers a changed nonce without a call per
+        address.
+        """
+        now = ts_now()
+        candidates: dict[ChecksumEvmAddress, AddressTokenBalances] = {}
+        for address, tokens in addresses_to_tokens.items():
+            if (
+                    (cached := self.address_balances.get(address)) is not None and
+                    now - cached.timestamp < ADDRESS_TOKEN_BALANCES_MAX_AGE and
+                    native_balances.get(address) == cached.native_balance and
+                    cached.tokens == frozenset(tokens)
+            ):
+                candidates[address] = cached
+
+        if len(candidates) == 0:
+            return set()
+
+        dbevmtx = DBEvmTx(self.db)
+        with self.db.conn.read_ctx() as cursor:
+            inactive_addresses = {
+                address for address, cached in candidates.items()
+                if dbevmtx.get_queried_range(
+                    cursor=cursor,
+                    address=address,
+                    chain=self.evm_inquirer.blockchain,
+                )[1] >= cached.timestamp - ADDRESS_TOKEN_BALANCES_RANGE_TOLERANCE
+            }
+            return inactive_addresses - DBEvmTx.get_addresses_with_activity(
+                cursor=cursor,
+                chain_id=self.evm_inquirer.chain_id,
+                block_numbers={x: candidates[x].block_number for x in inactive_addresses},
+            )
 
     def query_tokens_for_addresses(
             self,
             addresses: Sequence[ChecksumEvmAddress],
+            native_balances: Mapping[ChecksumEvmAddress, FVal] | None = None,
+            ignore_cache: bool = False,
     ) -> TokenBalancesType:
         """Queries token balances for a list of addresses
         Returns the token balances of each address and the usd prices of the tokens.
 
+        If the native balances of the addresses are given then the token balances are
+        remembered with the block they were queried at, and are reused for the addresses
+        that have shown no activity since. Only their prices are queried again. If
+        ignore_cache is True all the balances are queried and remembered.
+
         May raise:
         - RemoteError if an external service such as Etherscan is queried and
           there is a problem with its query.
@@ -356,7 +654,7 @@ class EvmTokens(ABC):
         addresses_to_balances: dict[ChecksumEvmAddress, dict[EvmToken, FVal]] = defaultdict(dict)
         all_tokens = set()
         addresses_to_tokens: dict[ChecksumEvmAddress, list[EvmToken]] = {}
-        chunk_size, call_order = get_chunk_size_call_order(self.evm_inquirer)
+        chunk_size, call_order = self._get_chunk_size_call_order()
 
         with self.db.conn.read_ctx() as cursor:
             for address in addresses:
@@ -382,19 +680,58 @@ class EvmTokens(ABC):
                 all_tokens.update(token_list)
                 addresses_to_tokens[address] = token_list
 
+        block_number = None
+        if native_balances is not None:
+            inactive_addresses = set() if ignore_cache else self._get_inactive_addresses(
+                addresses_to_tokens=addresses_to_tokens,
+                native_balances=native_balances,
+            )
+            for address in inactive_addresses:
+                log.debug(f'Reusing {self.evm_inquirer.chain_name} token balances of inactive address {address}')  # noqa: E501
+                if len(cached_balances := self.address_balances[address].balances) != 0:
+                    addresses_to_balances[address] = dict(cached_balances)
+                del addresses_to_tokens[address]
+
+            if len(addresses_to_tokens) != 0:
+                # queried before the balances so that activity in between is not missed
+                timestamp = ts_now()
+                try:
+                    block_number = self.evm_inquirer.get_latest_block_number()
+                except RemoteError as e:
+                    log.warning(
+                        f'Could not query the {self.evm_inquirer.chain_name} latest block '
+                        f'number due to {e!s}. Token balances will not be reused.',
+                    )
+
         multicall_chunks = generate_multicall_chunks(
             addresses_to_tokens=addresses_to_tokens,
             chunk_length=chunk_size,
         )
-        for chunk in multicall_chunks:
-            new_balances = self._get_multicall_token_balances(
-                chunk=chunk,
+        for new_balances in self._query_chunks_concurrently(
+                chunks=multicall_chunks,
+                query=lambda chunk, chunk_call_order: self._get_multicall_token_balances(
+                    chunk=chunk,
+                    call_order=chunk_call_order,
+                ),
                 call_order=call_order,
-            )
+        ):
             for address, balances in new_balances.items():
                 addresses_to_balances[address].update(balances)
 
-        token_usd_price: dict[EvmToken, Price] = {token: Inquirer.find_usd_price(asset=token) for token in all_tokens}  # noqa: E501
+        if native_balances is not None and block_number is not None:
+            for address, tokens in addresses_to_tokens.items():
+                if (native_balance := native_balances.get(address)) is None:
+                    continue
+
+                self.address_balances[address] = AddressTokenBalances(
+                    block_number=block_number,
+                    timestamp=timestamp,
+                    native_balance=native_balance,
+                    tokens=frozenset(tokens),
+                    balances=dict(addresses_to_balances.get(address, {})),
+                )
+
+        token_usd_price = Inquirer.find_usd_prices(all_tokens)
 
         return dict(addresses_to_balances), token_usd_price
 
@@ -431,8 +768,12 @@ class EvmTokensWithDSProxy(EvmTokens, ABC):
         super().__init__(database=database, evm_inquirer=evm_inquirer)
         self.evm_inquirer: EvmNodeInquirerWithDSProxy  # set explicit type
 
-    def _query_new_tokens(self, addresses: Sequence[ChecksumEvmAddress]) -> None:
-        super()._query_new_tokens(addresses)
+    def _query_new_tokens(
+            self,
+            addresses: Sequence[ChecksumEvmAddress],
+            full_scan: bool,
+    ) -> None:
+        super()._query_new_tokens(addresses=addresses, full_scan=full_scan)
         self.maybe_detect_proxies_tokens(addresses)
 
     def maybe_detect_proxies_tokens(self, addresses: Sequence[ChecksumEvmAddress]) -> None:  # pylint: disable=unused-argument
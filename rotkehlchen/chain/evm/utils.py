@@ -18,6 +18,7 @@ from rotkehlchen.types import (
     UNISWAP_PROTOCOL,
     VELODROME_POOL_PROTOCOL,
     ChainID,
+    ChecksumEvmAddress,
     EvmTokenKind,
     Price,
     Timestamp,
@@ -38,10 +39,40 @@ LP_TOKEN_AS_POOL_PROTOCOL_TO_ABI_NAME: Final[dict[str, 'LP_TOKEN_AS_POOL_CONTRAC
     VELODROME_POOL_PROTOCOL: 'VELO_V2_LP',
     UNISWAP_PROTOCOL: 'UNISWAP_V2_LP',
 }
+UNISWAPLIKE_POOL_METHODS: Final = ('token0', 'token1', 'totalSupply', 'getReserves', 'decimals')
 FVAL_ERROR_NAME: Final = 'token supply'
 FVAL_ERROR_LOCATION: Final = 'uniswap-like pool price query'
 
 
+def uniswaplike_pool_contract_calls(
+        evm_inquirer: 'EvmNodeInquirer',
+        token: EvmToken,
+) -> tuple[EvmContract, list[tuple[ChecksumEvmAddress, str]]] | None:
+    """Returns the contract of a uniswap like LP token and the calls needed to calculate
+    its price. Returns None if there is no known contract abi for the token's protocol."""
+    if token.protocol is None:
+        return None
+
+    try:
+        abi_name = LP_TOKEN_AS_POOL_PROTOCOL_TO_ABI_NAME[token.protocol]  # the lp token's contract abi that will be used to query the info needed for lp token price calculation  # noqa: E501
+    except KeyError:
+        log.debug(
+            f'There is no suitable contract abi for protocol {token.protocol} '
+            f'of token {token.evm_address}. Cannot calculate price',
+        )
+        return None
+
+    contract = EvmContract(
+        address=token.evm_address,
+        abi=evm_inquirer.contracts.abi(abi_name),
+        deployed_block=0,
+    )
+    return contract, [
+        (token.evm_address, contract.encode(method_name=method))
+        for method in UNISWAPLIKE_POOL_METHODS
+    ]
+
+
 def lp_price_from_uniswaplike_pool_contract(
         evm_inquirer: 'EvmNodeInquirer',
         token: EvmToken,
@@ -61,50 +92,59 @@ def lp_price_from_uniswaplike_pool_contract(
     - Pooled amount of token 1
     - Total supply of pool token
     """
-    if token.protocol is None:
+    if (contract_and_calls := uniswaplike_pool_contract_calls(
+        evm_inquirer=evm_inquirer,
+        token=token,
+    )) is None:
         return None
 
-    try:
-        abi_name = LP_TOKEN_AS_POOL_PROTOCOL_TO_ABI_NAME[token.protocol]  # the lp token's contract abi that will be used to query the info needed for lp token price calculation  # noqa: E501
-    except KeyError:
-        log.debug(
-            f'There is no suitable contract abi for protocol {token.protocol} '
-            f'of token {token.evm_address}. Cannot calculate price',
-        )
-        return None
-
-    contract = EvmContract(
-        address=token.evm_address,
-        abi=evm_inquirer.contracts.abi(abi_name),
-        deployed_block=0,
-    )
-    methods = ('token0', 'token1', 'totalSupply', 'getReserves', 'decimals')
+    contract, calls = contract_and_calls
     if (
         isinstance(block_identifier, int) and
         block_identifier <= evm_inquirer.contract_multicall.deployed_block
     ):
         log.error(
             f'No multicall contract at {evm_inquirer.chain_name} block {block_identifier}. '
-            f'{abi_name} query failed. Should implement direct queries',
+            f'{token.protocol} LP token query failed. Should implement direct queries',
         )
         return None
 
     try:
         output = evm_inquirer.multicall(
             require_success=True,
-            calls=[(token.evm_address, contract.encode(method_name=method)) for method in methods],
+            calls=calls,
             block_identifier=block_identifier,
         )
     except (RemoteError, BlockchainQueryError) as e:
         log.error(
-            f'Remote error calling {evm_inquirer.chain_name} multicall contract for {abi_name} '
-            f'token {token.evm_address} properties: {e!s}',
+            f'Remote error calling {evm_inquirer.chain_name} multicall contract for '
+            f'{token.protocol} LP token {token.evm_address} properties: {e!s}',
         )
         return None
 
+    return lp_price_from_uniswaplike_pool_output(
+        evm_inquirer=evm_inquirer,
+        token=token,
+        contract=contract,
+        output=output,
+        token_price_func=token_price_func,
+        token_price_func_args=token_price_func_args,
+    )
+
+
+def lp_price_from_uniswaplike_pool_output(
+        evm_inquirer: 'EvmNodeInquirer',
+        token: EvmToken,
+        contract: EvmContract,
+        output: list[bytes],
+        token_price_func: Callable,
+        token_price_func_args: list[Any],
+) -> Price | None:
+    """Calculates the price of a uniswap like LP token from the output of the calls
+    returned by uniswaplike_pool_contract_calls. An empty output means a failed call."""
     # decode output
     decoded = []
-    for (method_output, method_name) in zip(output, methods, strict=True):
+    for (method_output, method_name) in zip(output, UNISWAPLIKE_POOL_METHODS, strict=True):
         call_success = True
         if call_success and len(method_output) != 0:
             decoded_method = contract.decode(method_output, method_name)
@@ -112,7 +152,7 @@ def lp_price_from_uniswaplike_pool_contract(
             decoded.append(decoded_method[0] if len(decoded_method) == 1 else decoded_method)
         else:
             log.debug(
-                f'{evm_inquirer.chain_name} multicall to {abi_name} failed to fetch field '
+                f'{evm_inquirer.chain_name} multicall to {token.protocol} failed to fetch field '
                 f'{method_name} for token {token.evm_address}',
             )
             return None
@@ -125,13 +165,13 @@ def lp_price_from_uniswaplike_pool_contract(
     if len(decoded) < 4:
         log.debug(
             f'Unexpected number of decoded values ({len(decoded)}) while querying price from '
-            f'{evm_inquirer.chain_name} {abi_name} for token {token.evm_address}',
+            f'{evm_inquirer.chain_name} {token.protocol} for token {token.evm_address}',
         )
         return None
     elif len(decoded[3]) < 2:
         log.debug(
             f'Unexpected number of decoded pool reserves ({len(decoded[3])}) while querying '
-            f'price from {evm_inquirer.chain_name} {abi_name} for token {token.evm_address}',
+            f'price from {evm_inquirer.chain_name} {token.protocol} for token {token.evm_address}',
         )
         return None
 
@@ -149,7 +189,7 @@ def lp_price_from_uniswaplike_pool_contract(
     except (UnknownAsset, WrongAssetType):
         log.debug(
             f'Unknown assets {decoded[0]} {decoded[1]} while querying price from '
-            f'{evm_inquirer.chain_name} {abi_name} for token {token.evm_address}',
+            f'{evm_inquirer.chain_name} {token.protocol} for token {token.evm_address}',
         )
         return None
 
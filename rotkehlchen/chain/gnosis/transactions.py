@@ -59,10 +59,9 @@ def _process_withdrawals_events_cb(
                     must_exist=True,
                 )
     try:
-        block = cb_arguments.gnosis_transactions.evm_inquirer.get_block_by_number(
+        last_queried_ts = cb_arguments.gnosis_transactions.evm_inquirer.get_block_timestamp(
             num=last_block_queried,
         )
-        last_queried_ts = block['timestamp']
     except (KeyError, RemoteError) as e:
         msg = f'Missing key {e}' if isinstance(e, KeyError) else str(e)
         log.error(f'Failed to query block timestamp for gnosis bridge for {cb_arguments.addresses} due to {msg}')   # noqa: E501
@@ -5,6 +5,7 @@ from rotkehlchen.chain.evm.decoding.types import CounterpartyDetails
 from rotkehlchen.chain.evm.decoding.velodrome.constants import CPT_VELODROME
 from rotkehlchen.chain.evm.decoding.velodrome.decoder import VelodromeLikeDecoder
 from rotkehlchen.chain.evm.decoding.velodrome.velodrome_cache import (
+    VELODROME_CACHE_TYPES,
     read_velodrome_pools_and_gauges_from_cache,
 )
 from rotkehlchen.chain.evm.types import string_to_evm_address
@@ -41,6 +42,7 @@ class VelodromeDecoder(VelodromeLikeDecoder):
             routers={ROUTER_V1, ROUTER_V2},
             pool_cache_type=CacheType.VELODROME_POOL_ADDRESS,
             read_fn=read_velodrome_pools_and_gauges_from_cache,
+            read_fn_cache_types=VELODROME_CACHE_TYPES,
             pool_token_protocol=VELODROME_POOL_PROTOCOL,
         )
 
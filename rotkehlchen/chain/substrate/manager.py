@@ -24,6 +24,7 @@ from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import deserialize_int_from_str
 from rotkehlchen.types import SUPPORTED_SUBSTRATE_CHAINS, SupportedBlockchain
 from rotkehlchen.user_messages import MessagesAggregator
+from rotkehlchen.utils.misc import get_chunks
 from rotkehlchen.utils.serialization import jsonloads_dict
 
 from .types import (
@@ -37,7 +38,7 @@ from .types import (
     SubstrateAddress,
     SubstrateChainId,
 )
-from .utils import SUBSTRATE_NODE_CONNECTION_TIMEOUT
+from .utils import SUBSTRATE_ACCOUNTS_CHUNK_LENGTH, SUBSTRATE_NODE_CONNECTION_TIMEOUT
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
@@ -321,10 +322,14 @@ class SubstrateManager:
             account=account,
             result=result,
         )
+        return self._deserialize_account_balance(result)
 
+    def _deserialize_account_balance(self, account_info: Any) -> FVal:
+        """Given the result of a `System.Account` storage query return the sum of
+        the free and reserved amounts of chain native token"""
         balance = ZERO
-        if result is not None:
-            account_data = result.value['data']
+        if account_info is not None and account_info.value is not None:
+            account_data = account_info.value['data']
             balance = (
                 FVal(account_data['free'] + account_data['reserved']) /
                 FVal('10') ** self.chain_properties.token_decimals
@@ -332,6 +337,57 @@ class SubstrateManager:
 
         return balance
 
+    def _get_accounts_balance(
+            self,
+            accounts: Sequence[SubstrateAddress],
+            node_interface: SubstrateInterface,
+    ) -> dict[SubstrateAddress, FVal]:
+        """Given a list of accounts get their amount of chain native token by querying
+        the `System.Account` storage of all of them in a single request.
+
+        May raise:
+        - RemoteError: if there is an error requesting the node.
+        """
+        log.debug(
+            f'{self.chain} querying {self.chain_properties.token.identifier} balances',
+            url=node_interface.url,
+            accounts_num=len(accounts),
+        )
+        try:
+            with gevent.Timeout(SUBSTRATE_NODE_CONNECTION_TIMEOUT):
+                storage_keys = [
+                    node_interface.create_storage_key(
+                        pallet='System',
+                        storage_function='Account',
+                        params=[account],
+                    ) for account in accounts
+                ]
+                result = node_interface.query_multi(storage_keys=storage_keys)
+        except (
+                requests.exceptions.RequestException,
+                SubstrateRequestException,
+                ValueError,
+                WebSocketException,
+                gevent.Timeout,
+                BlockNotFound,
+                AttributeError,  # happens in substrate library when timeout occurs some times
+        ) as e:
+            msg = str(e)
+            if isinstance(e, gevent.Timeout):
+                msg = f'a timeout of {msg}'
+            message = (
+                f'{self.chain} failed to request {self.chain_properties.token.identifier} '
+                f'accounts balance at endpoint {node_interface.url} due to: {msg}'
+            )
+            log.error(message, accounts=accounts)
+            raise RemoteError(message) from e
+
+        balances = dict.fromkeys(accounts, ZERO)
+        for storage_key, account_info in result:
+            balances[storage_key.params[0]] = self._deserialize_account_balance(account_info)
+
+        return balances
+
     def _get_chain_id(self, node_interface: SubstrateInterface) -> SubstrateChainId:
         """Return the chain identifier (name for substrate chains)"""
         log.debug(f'{self.chain} querying chain ID', url=node_interface.url)
@@ -565,14 +621,34 @@ class SubstrateManager:
     ) -> dict[SubstrateAddress, FVal]:
         """Given a list of accounts get their amount of chain native token.
 
-        This method is not decorated with `request_available_nodes` on purpose,
-        so each request can use all available nodes.
+        The accounts are queried in chunks of SUBSTRATE_ACCOUNTS_CHUNK_LENGTH, each
+        in a single storage request. This method is not decorated with
+        `request_available_nodes` on purpose, so each chunk can use all available nodes.
+
+        May raise:
+        - RemoteError: `request_available_nodes()` fails to request after
+        trying with all the available nodes.
+        """
+        balances: dict[SubstrateAddress, FVal] = {}
+        for chunk in get_chunks(accounts, n=SUBSTRATE_ACCOUNTS_CHUNK_LENGTH):
+            balances.update(self.get_accounts_chunk_balance(accounts=chunk))
+
+        return balances
+
+    @request_available_nodes
+    def get_accounts_chunk_balance(
+            self,
+            accounts: Sequence[SubstrateAddress],
+            node_interface: SubstrateInterface | None = None,
+    ) -> dict[SubstrateAddress, FVal]:
+        """Given a list of accounts get their amount of chain native token in a
+        single storage request.
 
         May raise:
         - RemoteError: `request_available_nodes()` fails to request after
         trying with all the available nodes.
         """
-        return {account: self.get_account_balance(account) for account in accounts}
+        return self._get_accounts_balance(accounts=accounts, node_interface=node_interface)
 
     @request_available_nodes
     def get_chain_id(
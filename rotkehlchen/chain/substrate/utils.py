@@ -26,6 +26,9 @@ POLKADOT_NODES_TO_CONNECT_AT_START = (
 # switched in the meantime
 SUBSTRATE_NODE_CONNECTION_TIMEOUT = 60
 
+# Number of accounts whose storage is requested in a single state_queryStorageAt call
+SUBSTRATE_ACCOUNTS_CHUNK_LENGTH = 100
+
 
 def is_valid_substrate_address(chain: SUPPORTED_SUBSTRATE_CHAINS, value: str) -> bool:
     return is_valid_ss58_address(
@@ -18,6 +18,7 @@ from rotkehlchen.chain.ethereum.utils import asset_normalized_value
 from rotkehlchen.chain.evm.constants import ZERO_ADDRESS
 from rotkehlchen.constants import ZERO
 from rotkehlchen.constants.assets import A_ETH
+from rotkehlchen.db.eth2 import DBEth2
 from rotkehlchen.db.history_events import DBHistoryEvents
 from rotkehlchen.db.settings import CachedSettings
 from rotkehlchen.errors.asset import UnknownAsset
@@ -826,6 +827,7 @@ class ZksyncLiteManager:
                     'DELETE FROM history_events WHERE event_identifier=?',
                     (ZKL_IDENTIFIER.format(tx_hash=transaction.tx_hash.hex()),),
                 )
+                DBEth2.lower_combine_block_events_watermark(write_cursor)
 
             self.decode_transaction(transaction, tracked_addresses)
 
@@ -40,3 +40,4 @@ MISCDIR_NAME: Final = 'misc'
 APPDIR_NAME: Final = 'app'
 AIRDROPSDIR_NAME: Final = 'airdrops'
 AIRDROPSPOAPDIR_NAME: Final = 'airdrops_poap'
+TASKRESULTSDIR_NAME: Final = 'task_results'
@@ -2,7 +2,11 @@ from collections.abc import Callable
 from typing import Final, TypedDict, Unpack, overload
 
 from rotkehlchen.chain.evm.types import string_to_evm_address
-from rotkehlchen.db.constants import EXTRAINTERNALTXPREFIX
+from rotkehlchen.db.constants import (
+    EXTRAINTERNALTXPREFIX,
+    LAST_FULL_TOKENS_DETECTION_TS_PREFIX,
+    TOKENS_DETECTION_LOG_WATERMARK_PREFIX,
+)
 from rotkehlchen.types import ChecksumEvmAddress, Timestamp
 from rotkehlchen.utils.mixins.enums import Enum
 
@@ -26,6 +30,7 @@ class DBCacheStatic(Enum):
     LAST_CREATE_REMINDER_CHECK_TS: Final = 'last_create_reminder_check_ts'
     LAST_GRAPH_DELEGATIONS_CHECK_TS: Final = 'last_graph_delegations_check_ts'
     LAST_GNOSISPAY_QUERY_TS: Final = 'last_gnosispay_query_ts'
+    COMBINE_BLOCK_EVENTS_WATERMARK: Final = 'combine_block_events_watermark'
 
 
 class LabeledLocationArgsType(TypedDict):
@@ -44,6 +49,12 @@ class AddressArgType(TypedDict):
     address: ChecksumEvmAddress
 
 
+class ChainAddressArgType(TypedDict):
+    """Type of kwargs, used to get the value of `DBCacheDynamic.TOKENS_DETECTION_LOG_WATERMARK` and `DBCacheDynamic.LAST_FULL_TOKENS_DETECTION_TS`"""  # noqa: E501
+    chain_id: str
+    address: ChecksumEvmAddress
+
+
 class ExtraTxArgType(TypedDict):
     """Type of kwargs, used to get the value of `DBCacheDynamic.EXTRA_INTERNAL_TX`"""
     tx_hash: str  # using str instead of EVMTxHash because DB schema is in TEXT
@@ -68,6 +79,8 @@ class DBCacheDynamic(Enum):
     WITHDRAWALS_TS: Final = 'ethwithdrawalsts_{address}', _deserialize_timestamp_from_str
     WITHDRAWALS_IDX: Final = 'ethwithdrawalsidx_{address}', _deserialize_int_from_str
     EXTRA_INTERNAL_TX: Final = f'{EXTRAINTERNALTXPREFIX}_{{tx_hash}}_{{receiver}}', string_to_evm_address  # noqa: E501
+    TOKENS_DETECTION_LOG_WATERMARK: Final = f'{TOKENS_DETECTION_LOG_WATERMARK_PREFIX}_{{chain_id}}_{{address}}', _deserialize_int_from_str  # noqa: E501
+    LAST_FULL_TOKENS_DETECTION_TS: Final = f'{LAST_FULL_TOKENS_DETECTION_TS_PREFIX}_{{chain_id}}_{{address}}', _deserialize_timestamp_from_str  # noqa: E501
 
     @overload
     def get_db_key(self, **kwargs: Unpack[LabeledLocationArgsType]) -> str:
@@ -85,6 +98,10 @@ class DBCacheDynamic(Enum):
     def get_db_key(self, **kwargs: Unpack[ExtraTxArgType]) -> str:
         ...
 
+    @overload
+    def get_db_key(self, **kwargs: Unpack[ChainAddressArgType]) -> str:
+        ...
+
     def get_db_key(self, **kwargs: str) -> str:
         """Get the key that is used in the DB schema for the given kwargs.
 
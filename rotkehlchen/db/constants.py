@@ -68,3 +68,5 @@ ETH_STAKING_EVENT_FIELDS = 'validator_index, is_exit_or_blocknumber'
 ETH_STAKING_FIELD_LENGTH = 2
 
 EXTRAINTERNALTXPREFIX: Final = 'extrainternaltx'
+TOKENS_DETECTION_LOG_WATERMARK_PREFIX: Final = 'tokensdetectionlogwatermark'
+LAST_FULL_TOKENS_DETECTION_TS_PREFIX: Final = 'lastfulltokensdetectionts'
@@ -66,6 +66,8 @@ class DBCustomAssets:
             )
             with self.db.user_write() as db_write_cursor:
                 self.db.add_asset_identifiers(db_write_cursor, [custom_asset.identifier])
+
+        GlobalDBHandler().assets_search_index.mark_dirty(custom_asset.identifier)
         return custom_asset.identifier
 
     def edit_custom_asset(self, custom_asset: CustomAsset) -> None:
@@ -93,6 +95,8 @@ class DBCustomAssets:
                     f'{custom_asset.name} but it was not found',
                 )
 
+        GlobalDBHandler().assets_search_index.mark_dirty(custom_asset.identifier)
+
     @staticmethod
     def _raise_if_custom_asset_exists(custom_asset: CustomAsset) -> None:
         """
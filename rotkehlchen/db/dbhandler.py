@@ -43,6 +43,7 @@ from rotkehlchen.constants.misc import NFT_DIRECTIVE, USERDB_NAME
 from rotkehlchen.constants.timing import HOUR_IN_SECONDS
 from rotkehlchen.db.cache import (
     AddressArgType,
+    ChainAddressArgType,
     DBCacheDynamic,
     DBCacheStatic,
     ExtraTxArgType,
@@ -58,6 +59,7 @@ from rotkehlchen.db.constants import (
     USER_CREDENTIAL_MAPPING_KEYS,
 )
 from rotkehlchen.db.drivers.gevent import DBConnection, DBConnectionType, DBCursor
+from rotkehlchen.db.eth2 import DBEth2
 from rotkehlchen.db.evmtx import DBEvmTx
 from rotkehlchen.db.filtering import (
     AssetMovementsFilterQuery,
@@ -755,6 +757,24 @@ class DBHandler:
     ) -> ChecksumEvmAddress | None:
         ...
 
+    @overload
+    def get_dynamic_cache(
+            self,
+            cursor: 'DBCursor',
+            name: Literal[DBCacheDynamic.TOKENS_DETECTION_LOG_WATERMARK],
+            **kwargs: Unpack[ChainAddressArgType],
+    ) -> int | None:
+        ...
+
+    @overload
+    def get_dynamic_cache(
+            self,
+            cursor: 'DBCursor',
+            name: Literal[DBCacheDynamic.LAST_FULL_TOKENS_DETECTION_TS],
+            **kwargs: Unpack[ChainAddressArgType],
+    ) -> Timestamp | None:
+        ...
+
     def get_dynamic_cache(
             self,
             cursor: 'DBCursor',
@@ -838,6 +858,26 @@ class DBHandler:
     ) -> None:
         ...
 
+    @overload
+    def set_dynamic_cache(
+            self,
+            write_cursor: 'DBCursor',
+            name: Literal[DBCacheDynamic.TOKENS_DETECTION_LOG_WATERMARK],
+            value: int,
+            **kwargs: Unpack[ChainAddressArgType],
+    ) -> None:
+        ...
+
+    @overload
+    def set_dynamic_cache(
+            self,
+            write_cursor: 'DBCursor',
+            name: Literal[DBCacheDynamic.LAST_FULL_TOKENS_DETECTION_TS],
+            value: Timestamp,
+            **kwargs: Unpack[ChainAddressArgType],
+    ) -> None:
+        ...
+
     def set_dynamic_cache(
             self,
             write_cursor: 'DBCursor',
@@ -928,17 +968,28 @@ class DBHandler:
             (asset.identifier,),
         )
 
-    def get_ignored_asset_ids(self, cursor: 'DBCursor', only_nfts: bool = False) -> set[str]:
+    def get_ignored_asset_ids(
+            self,
+            cursor: 'DBCursor',
+            only_nfts: bool = False,
+            identifiers: Sequence[str] | None = None,
+    ) -> set[str]:
         """Gets the ignored asset ids without converting each one of them to an asset object
 
         We used to have a heavier version which converted them to an asset but removed
         it due to unnecessary roundtrips to the global DB for each asset initialization
+
+        If identifiers is given only the ignored ones among them are returned. The caller
+        has to keep them within the SQLite bindings limit.
         """
         bindings = []
         query = "SELECT value FROM multisettings WHERE name='ignored_asset' "
         if only_nfts is True:
-            query += 'AND value LIKE ?'
+            query += 'AND value LIKE ? '
             bindings.append(f'{NFT_DIRECTIVE}%')
+        if identifiers is not None:
+            query += f'AND value IN ({",".join(["?"] * len(identifiers))})'
+            bindings.extend(identifiers)
         cursor.execute(query, bindings)
         return {x[0] for x in cursor}
 
@@ -1106,6 +1157,7 @@ class DBHandler:
             write_cursor.execute(
                 f'DELETE FROM {table} WHERE location = ?;', (serialized_location,),
             )
+        DBEth2.lower_combine_block_events_watermark(write_cursor)
 
     def update_used_query_range(self, write_cursor: 'DBCursor', name: str, start_ts: Timestamp, end_ts: Timestamp) -> None:  # noqa: E501
         write_cursor.execute(
@@ -2180,6 +2232,14 @@ class DBHandler:
             f"DELETE FROM key_value_cache WHERE name LIKE '{EXTRAINTERNALTXPREFIX}_%' AND value = ?",  # noqa: E501
             (address,),
         )
+        chain_id_str = str(blockchain.to_chain_id().serialize_for_db())
+        write_cursor.executemany(
+            'DELETE FROM key_value_cache WHERE name=?',
+            [
+                (DBCacheDynamic.TOKENS_DETECTION_LOG_WATERMARK.get_db_key(chain_id=chain_id_str, address=address),),  # noqa: E501
+                (DBCacheDynamic.LAST_FULL_TOKENS_DETECTION_TS.get_db_key(chain_id=chain_id_str, address=address),),  # noqa: E501
+            ],
+        )
 
         dbtx = DBEvmTx(self)
         dbtx.delete_transactions(write_cursor=write_cursor, address=address, chain=blockchain)
@@ -2228,6 +2288,7 @@ class DBHandler:
                 f'({", ".join(["?"] * len(hashes_chunk))}) AND H.location=?)',
                 hashes_chunk + [Location.ZKSYNC_LITE.serialize_for_db()],
             )
+        DBEth2.lower_combine_block_events_watermark(write_cursor)
 
     def add_trades(self, write_cursor: 'DBCursor', trades: list[Trade]) -> None:
         trade_tuples = [(
@@ -3102,6 +3163,11 @@ class DBHandler:
                 xpub_data.blockchain.value,
             ),
         )
+        # The cache of derived addresses is shared by both chains. The other chain rebuilds it
+        write_cursor.execute(
+            'DELETE FROM xpub_derived_addresses WHERE xpub=? AND derivation_path=?',
+            (xpub_data.xpub.xpub, xpub_data.serialize_derivation_path_for_db()),
+        )
         # And then finally delete the xpub itself
         write_cursor.execute(
             'DELETE FROM xpubs WHERE xpub=? AND derivation_path IS ? AND blockchain=?;',
@@ -3248,6 +3314,45 @@ class DBHandler:
 
         return data
 
+    def get_xpub_derived_addresses(
+            self,
+            cursor: 'DBCursor',
+            xpub_data: XpubData,
+    ) -> dict[tuple[int, int], BTCAddress]:
+        """Get the cached addresses derived from the given xpub keyed by
+        their account index and derived index"""
+        cursor.execute(
+            'SELECT account_index, derived_index, address FROM xpub_derived_addresses '
+            'WHERE xpub=? AND derivation_path=? AND xpub_type=?',
+            (
+                xpub_data.xpub.xpub,
+                xpub_data.serialize_derivation_path_for_db(),
+                xpub_data.xpub.address_type().serialize(),
+            ),
+        )
+        return {(entry[0], entry[1]): BTCAddress(entry[2]) for entry in cursor}
+
+    def add_xpub_derived_addresses(
+            self,
+            write_cursor: 'DBCursor',
+            xpub_data: XpubData,
+            derived_addresses: dict[tuple[int, int], BTCAddress],
+    ) -> None:
+        """Save addresses derived from the given xpub, keyed by their account
+        index and derived index, so that they don't need to be derived again"""
+        write_cursor.executemany(
+            'INSERT OR IGNORE INTO xpub_derived_addresses(xpub, derivation_path, xpub_type, '
+            'account_index, derived_index, address) VALUES(?, ?, ?, ?, ?, ?)',
+            [(
+                xpub_data.xpub.xpub,
+                xpub_data.serialize_derivation_path_for_db(),
+                xpub_data.xpub.address_type().serialize(),
+                account_index,
+                derived_index,
+                address,
+            ) for (account_index, derived_index), address in derived_addresses.items()],
+        )
+
     def ensure_xpub_mappings_exist(
             self,
             write_cursor: 'DBCursor',
@@ -1,4 +1,6 @@
 import logging
+from collections import defaultdict
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Literal
 
 from pysqlcipher3 import dbapi2 as sqlcipher
@@ -11,17 +13,14 @@ from rotkehlchen.chain.ethereum.modules.eth2.structures import (
 from rotkehlchen.chain.ethereum.modules.eth2.utils import form_withdrawal_notes
 from rotkehlchen.constants import ONE, ZERO
 from rotkehlchen.constants.timing import DAY_IN_SECONDS, HOUR_IN_SECONDS
-from rotkehlchen.db.filtering import (
-    ETH_STAKING_EVENT_JOIN,
-    EthStakingEventFilterQuery,
-    EthWithdrawalFilterQuery,
-)
+from rotkehlchen.db.cache import DBCacheStatic
 from rotkehlchen.errors.misc import InputError
 from rotkehlchen.fval import FVal
 from rotkehlchen.history.events.structures.base import HistoryBaseEntryType
+from rotkehlchen.history.events.structures.types import HistoryEventSubType, HistoryEventType
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.types import ChecksumEvmAddress, Eth2PubKey, Timestamp
-from rotkehlchen.utils.misc import ts_ms_to_sec
+from rotkehlchen.utils.misc import ts_ms_to_sec, ts_now
 
 if TYPE_CHECKING:
     from rotkehlchen.db.dbhandler import DBHandler
@@ -31,6 +30,28 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+# Staking events with the type of profit they represent for their validator. W for partial
+# withdrawals, X for exits, B for block production and mev rewards and NULL for the rest.
+STAKING_PROFIT_EVENTS_QUERY = (
+    'SELECT S.validator_index AS validator_index, S.identifier AS identifier, '
+    'H.timestamp AS timestamp, H.location_label AS location_label, H.amount AS amount, '
+    'CASE WHEN H.entry_type=? AND H.subtype=? THEN '
+    "(CASE WHEN S.is_exit_or_blocknumber=1 THEN 'X' ELSE 'W' END) "
+    "WHEN H.entry_type=? AND H.subtype IN (?, ?) THEN 'B' END AS profit_type "
+    'FROM history_events H INNER JOIN eth_staking_events_info S '
+    'ON H.identifier=S.identifier WHERE H.type=?'
+)
+STAKING_PROFIT_EVENTS_BINDINGS = (
+    HistoryBaseEntryType.ETH_WITHDRAWAL_EVENT.serialize_for_db(),
+    HistoryEventSubType.REMOVE_ASSET.serialize(),
+    HistoryBaseEntryType.ETH_BLOCK_EVENT.serialize_for_db(),
+    HistoryEventSubType.BLOCK_PRODUCTION.serialize(),
+    HistoryEventSubType.MEV_REWARD.serialize(),
+    HistoryEventType.STAKING.serialize(),
+)
+# the profit of an exit is what is withdrawn on top of the 32 ETH deposit
+PROFIT_AMOUNT_QUERYSTR = "CAST(amount AS REAL) - (CASE WHEN profit_type='X' THEN 32 ELSE 0 END)"
+
 
 class DBEth2:
 
@@ -233,6 +254,7 @@ class DBEth2:
                 'UPDATE eth_staking_events_info SET is_exit_or_blocknumber=? WHERE identifier=?',
                 (1, latest_result[0]),
             )
+            self.invalidate_validators_daily_profit(write_cursor, [latest_result[0]])
             write_cursor.execute(
                 'UPDATE history_events SET notes=? WHERE identifier=?',
                 (form_withdrawal_notes(is_exit=True, validator_index=index, amount=latest_result[2]), latest_result[0]),  # noqa: E501
@@ -335,47 +357,159 @@ class DBEth2:
                 f'({",".join(question_marks)})) AND entry_type != ?',
                 (*validator_indices, HistoryBaseEntryType.ETH_DEPOSIT_EVENT.serialize_for_db()),
             )
+            self.lower_combine_block_events_watermark(cursor)
 
     @staticmethod
-    def _validator_stats_process_queries(
-            cursor: 'DBCursor',
-            amount_querystr: str,
-            filter_query: EthStakingEventFilterQuery,
-    ) -> dict[int, FVal]:
-        """Execute DB query and extract numerical value per validator after using filter_query
+    def lower_combine_block_events_watermark(write_cursor: 'DBCursor') -> None:
+        """Lowers the watermark of the block and transaction events combination to the
+        latest remaining history event. Has to be called after deleting history events
+        since sqlite reuses the identifiers of the deleted events if they were the latest
+        ones, and the events saved with them would otherwise never be combined."""
+        write_cursor.execute(
+            'UPDATE key_value_cache SET value=MIN(CAST(value AS INTEGER), '
+            '(SELECT COALESCE(MAX(identifier), 0) FROM history_events)) WHERE name=?',
+            (DBCacheStatic.COMBINE_BLOCK_EVENTS_WATERMARK.value,),
+        )
+
+    @staticmethod
+    def invalidate_validators_daily_profit(
+            write_cursor: 'DBCursor',
+            event_identifiers: Sequence[int],
+    ) -> None:
+        """Drops the materialized daily profit of the validators of the given staking events.
 
-        Return a dict of validator index to sum of amounts per validator in the filter
+        Needs to be called before and after an in-place edit of staking events since
+        such edits can not be detected by the events number/identifier checkpoints.
+        The validators are fully rebuilt at the next refresh_validators_daily_profit.
         """
-        base_query = f'SELECT validator_index, {amount_querystr} ' + ETH_STAKING_EVENT_JOIN
-        query, bindings = filter_query.prepare(with_pagination=False, with_order=False)
-        cursor.execute(base_query + query + ' GROUP BY eth_staking_events_info.validator_index', bindings)  # noqa: E501
+        for table in ('eth2_validators_daily_profit', 'eth2_validators_profit_checkpoints'):
+            write_cursor.executemany(
+                f'DELETE FROM {table} WHERE validator_index IN (SELECT validator_index '
+                f'FROM eth_staking_events_info WHERE identifier=?)',
+                [(identifier,) for identifier in event_identifiers],
+            )
+
+    @staticmethod
+    def refresh_validators_daily_profit(write_cursor: 'DBCursor') -> None:
+        """Brings the materialized daily profit of all validators up to date.
+
+        Validators whose staking events only got new entries since their checkpoint
+        get just the new events added to their daily sums. Validators whose events
+        got deleted or re-indexed are dirty and get rebuilt from scratch.
+        """
+        current = {
+            entry[0]: (entry[1], entry[2]) for entry in write_cursor.execute(
+                'SELECT validator_index, COUNT(*), MAX(identifier) FROM eth_staking_events_info '
+                'GROUP BY validator_index',
+            )
+        }
+        checkpoints = {
+            entry[0]: (entry[1], entry[2]) for entry in write_cursor.execute(
+                'SELECT validator_index, events_num, last_identifier '
+                'FROM eth2_validators_profit_checkpoints',
+            )
+        }
+        new_events_num = dict(write_cursor.execute(
+            'SELECT S.validator_index, COUNT(*) FROM eth_staking_events_info S INNER JOIN '
+            'eth2_validators_profit_checkpoints C ON S.validator_index=C.validator_index '
+            'WHERE S.identifier > C.last_identifier GROUP BY S.validator_index',
+        ))
+        dirty_indices = [
+            validator_index for validator_index, (events_num, _) in checkpoints.items()
+            if validator_index not in current or
+            events_num + new_events_num.get(validator_index, 0) != current[validator_index][0]
+        ]
+        changed = [
+            (validator_index, events_num, last_identifier)
+            for validator_index, (events_num, last_identifier) in current.items()
+            if checkpoints.get(validator_index) != (events_num, last_identifier)
+        ]
+        if len(changed) == 0 and len(dirty_indices) == 0:
+            return
+
+        for table in ('eth2_validators_daily_profit', 'eth2_validators_profit_checkpoints'):
+            write_cursor.executemany(
+                f'DELETE FROM {table} WHERE validator_index=?',
+                [(validator_index,) for validator_index in dirty_indices],
+            )
 
-        return {entry[0]: FVal(entry[1]) for entry in cursor}
+        # validators without a checkpoint here have no daily profit either so only
+        # events after the last checkpointed identifier need to be added to the sums
+        write_cursor.execute(
+            'INSERT INTO eth2_validators_daily_profit(validator_index, timestamp, profit_type, '
+            "location_label, amount) SELECT P.validator_index, P.timestamp / 1000 / ? * ?, "
+            "P.profit_type, CASE WHEN P.profit_type='B' THEN COALESCE(P.location_label, '') "
+            f"ELSE '' END, SUM({PROFIT_AMOUNT_QUERYSTR}) FROM ({STAKING_PROFIT_EVENTS_QUERY}) P "
+            'LEFT JOIN eth2_validators_profit_checkpoints C ON '
+            'P.validator_index=C.validator_index WHERE P.profit_type IS NOT NULL AND '
+            'P.identifier > COALESCE(C.last_identifier, -1) GROUP BY 1, 2, 3, 4 '
+            'ON CONFLICT(validator_index, timestamp, profit_type, location_label) DO UPDATE '
+            'SET amount=CAST(amount AS REAL) + CAST(excluded.amount AS REAL)',
+            (DAY_IN_SECONDS, DAY_IN_SECONDS, *STAKING_PROFIT_EVENTS_BINDINGS),
+        )
+        write_cursor.executemany(
+            'INSERT OR REPLACE INTO eth2_validators_profit_checkpoints('
+            'validator_index, events_num, last_identifier) VALUES(?, ?, ?)',
+            changed,
+        )
 
+    @staticmethod
     def get_validators_profit(
-            self,
             cursor: 'DBCursor',
-            withdrawals_filter_query: EthWithdrawalFilterQuery,
-            exits_filter_query: EthWithdrawalFilterQuery,
-            execution_filter_query: EthStakingEventFilterQuery,
+            from_ts: Timestamp,
+            to_ts: Timestamp,
+            validator_indices: set[int] | None,
+            tracked_addresses: Sequence[ChecksumEvmAddress],
     ) -> tuple[dict[int, FVal], dict[int, FVal], dict[int, FVal]]:
-        """Query withdrawals, exits, EL rewards amounts for the given filter.
+        """Query withdrawals, exits, EL rewards amounts for the given period.
+
+        Whole days are read from the materialized daily profit so that needs to have been
+        refreshed first. Only the parts of the period that do not cover a full day are
+        summed from the staking events. Block production and mev rewards count only
+        if the recipient is one of the tracked addresses.
 
         Returns each of the different amount sums for the period per validator
         """
-        withdrawals_amounts = self._validator_stats_process_queries(
-            cursor=cursor,
-            amount_querystr='SUM(CAST(amount AS REAL))',
-            filter_query=withdrawals_filter_query,
-        )
-        exits_pnl = self._validator_stats_process_queries(
-            cursor=cursor,
-            amount_querystr='CAST(amount AS REAL) - 32',
-            filter_query=exits_filter_query,
-        )
-        execution_rewards_amounts = self._validator_stats_process_queries(
-            cursor=cursor,
-            amount_querystr='SUM(CAST(amount AS REAL))',
-            filter_query=execution_filter_query,
-        )
-        return withdrawals_amounts, exits_pnl, execution_rewards_amounts
+        first_day = -(-from_ts // DAY_IN_SECONDS) * DAY_IN_SECONDS
+        if to_ts >= ts_now():  # no events can exist after now so the last day is whole
+            end_day = (to_ts // DAY_IN_SECONDS + 1) * DAY_IN_SECONDS
+        else:
+            end_day = to_ts // DAY_IN_SECONDS * DAY_IN_SECONDS
+
+        filters = [f"(profit_type != 'B' OR location_label IN ({','.join('?' * len(tracked_addresses))}))"]  # noqa: E501
+        filter_bindings: list[int | str] = list(tracked_addresses)
+        if validator_indices is not None:
+            filters.append(f'validator_index IN ({",".join("?" * len(validator_indices))})')
+            filter_bindings.extend(validator_indices)
+
+        profits: dict[str, defaultdict[int, FVal]] = {
+            profit_type: defaultdict(FVal) for profit_type in ('W', 'X', 'B')
+        }
+        ranges_ms = [(from_ts * 1000, to_ts * 1000)]
+        if first_day < end_day:
+            ranges_ms = [(from_ts * 1000, first_day * 1000 - 1), (end_day * 1000, to_ts * 1000)]
+            cursor.execute(
+                'SELECT validator_index, profit_type, SUM(CAST(amount AS REAL)) FROM '
+                'eth2_validators_daily_profit WHERE timestamp >= ? AND timestamp < ? AND '
+                f'{" AND ".join(filters)} GROUP BY validator_index, profit_type',
+                (first_day, end_day, *filter_bindings),
+            )
+            for validator_index, profit_type, amount in cursor:
+                profits[profit_type][validator_index] += FVal(amount)
+
+        if len(ranges_ms := [(start, end) for start, end in ranges_ms if start <= end]) != 0:
+            cursor.execute(
+                f'SELECT validator_index, profit_type, SUM({PROFIT_AMOUNT_QUERYSTR}) FROM '
+                f'({STAKING_PROFIT_EVENTS_QUERY}) WHERE profit_type IS NOT NULL AND '
+                f'({" OR ".join(["timestamp BETWEEN ? AND ?"] * len(ranges_ms))}) AND '
+                f'{" AND ".join(filters)} GROUP BY validator_index, profit_type',
+                (
+                    *STAKING_PROFIT_EVENTS_BINDINGS,
+                    *(ts for time_range in ranges_ms for ts in time_range),
+                    *filter_bindings,
+                ),
+            )
+            for validator_index, profit_type, amount in cursor:
+                profits[profit_type][validator_index] += FVal(amount)
+
+        return profits['W'], profits['X'], profits['B']
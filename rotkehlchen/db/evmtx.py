@@ -1,4 +1,5 @@
 import logging
+from collections import defaultdict
 from typing import TYPE_CHECKING, Any, get_args
 
 from pysqlcipher3 import dbapi2 as sqlcipher
@@ -7,6 +8,11 @@ from rotkehlchen.chain.arbitrum_one.constants import ARBITRUM_ONE_GENESIS
 from rotkehlchen.chain.base.constants import BASE_GENESIS
 from rotkehlchen.chain.ethereum.constants import ETHEREUM_GENESIS
 from rotkehlchen.chain.evm.constants import GENESIS_HASH, ZERO_ADDRESS
+from rotkehlchen.chain.evm.decoding.constants import (
+    ERC20_OR_ERC721_TRANSFER,
+    ERC1155_TRANSFER_BATCH,
+    ERC1155_TRANSFER_SINGLE,
+)
 from rotkehlchen.chain.evm.structures import EvmTxReceipt, EvmTxReceiptLog
 from rotkehlchen.chain.evm.types import EvmAccount
 from rotkehlchen.chain.gnosis.constants import GNOSIS_GENESIS
@@ -17,7 +23,9 @@ from rotkehlchen.db.constants import (
     EVMTX_DECODED,
     EVMTX_SPAM,
     EXTRAINTERNALTXPREFIX,
+    TOKENS_DETECTION_LOG_WATERMARK_PREFIX,
 )
+from rotkehlchen.db.eth2 import DBEth2
 from rotkehlchen.db.filtering import EvmTransactionsFilterQuery, TransactionsNotDecodedFilterQuery
 from rotkehlchen.db.history_events import DBHistoryEvents
 from rotkehlchen.errors.serialization import DeserializationError
@@ -41,6 +49,7 @@ from rotkehlchen.types import (
     deserialize_evm_tx_hash,
 )
 from rotkehlchen.utils.hexbytes import hexstring_to_bytes
+from rotkehlchen.utils.misc import address_to_bytes32
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
@@ -221,7 +230,7 @@ class DBEvmTx:
     ) -> None:
         """Deletes evm transaction related data from the DB.
         Either all data, data related to a single chain or a single chain/tx_hash only"""
-        query_ranges_tuples = []
+        query_ranges_tuples, watermarks_tuples = [], []
         delete_query = 'DELETE FROM evm_transactions'
         delete_bindings = ()
         if chain is not None:
@@ -241,14 +250,134 @@ class DBEvmTx:
                     (f'{entry.to_range_prefix("internaltxs")}\\_%', '\\'),
                     (f'{entry.to_range_prefix("tokentxs")}\\_%', '\\'),
                 ])
+                # receipt log identifiers may be reused so tokens need to be fully detected again
+                watermarks_tuples.append((
+                    f'{TOKENS_DETECTION_LOG_WATERMARK_PREFIX}\\_{entry.to_chain_id().serialize_for_db()}\\_%',
+                    '\\',
+                ))
                 with self.db.user_write() as write_cursor:
                     write_cursor.executemany(
                         'DELETE FROM used_query_ranges WHERE name LIKE ? ESCAPE ?;',
                         query_ranges_tuples,
                     )
+                    write_cursor.executemany(
+                        'DELETE FROM key_value_cache WHERE name LIKE ? ESCAPE ?;',
+                        watermarks_tuples,
+                    )
 
         with self.db.user_write() as write_cursor:  # finally delete transactions
             write_cursor.execute(delete_query, delete_bindings)
+            self.lower_tokens_detection_watermarks(write_cursor)
+
+    @staticmethod
+    def get_max_receipt_log_id(cursor: 'DBCursor') -> int:
+        """Returns the identifier of the latest saved receipt log or 0 if there are none"""
+        return cursor.execute('SELECT MAX(identifier) FROM evmtx_receipt_logs').fetchone()[0] or 0
+
+    @staticmethod
+    def lower_tokens_detection_watermarks(write_cursor: 'DBCursor') -> None:
+        """Lowers the token detection watermarks of all addresses to the latest saved
+        receipt log. Has to be called after deleting transactions since sqlite reuses the
+        identifiers of the deleted receipt logs if they were the latest ones and the new
+        logs would otherwise be below the watermarks and never checked."""
+        max_log_id = DBEvmTx.get_max_receipt_log_id(write_cursor)
+        write_cursor.execute(
+            'UPDATE key_value_cache SET value=? WHERE name LIKE ? ESCAPE ? AND '
+            'CAST(value AS INTEGER) > ?',
+            (str(max_log_id), f'{TOKENS_DETECTION_LOG_WATERMARK_PREFIX}\\_%', '\\', max_log_id),
+        )
+
+    @staticmethod
+    def get_transferred_tokens(
+            cursor: 'DBCursor',
+            chain_id: ChainID,
+            watermarks: dict[ChecksumEvmAddress, int],
+    ) -> dict[ChecksumEvmAddress, set[ChecksumEvmAddress]]:
+        """Returns the contracts that emitted an ERC20 or ERC721 transfer log from or to each
+        of the given addresses in a receipt log newer than the address's watermark, which is
+        the identifier of the latest receipt log already checked for that address."""
+        transferred_tokens: dict[ChecksumEvmAddress, set[ChecksumEvmAddress]] = defaultdict(set)
+        if len(watermarks) == 0:
+            return transferred_tokens
+
+        topics_to_addresses = {address_to_bytes32(address): address for address in watermarks}
+        for log_id, token_address, topic in cursor.execute(
+            'SELECT L.identifier, L.address, A.topic FROM evmtx_receipt_logs AS L '
+            'INNER JOIN evm_transactions AS T ON L.tx_id=T.identifier '
+            'INNER JOIN evmtx_receipt_log_topics AS E ON E.log=L.identifier AND E.topic_index=0 '
+            'INNER JOIN evmtx_receipt_log_topics AS A ON A.log=L.identifier AND A.topic_index IN (1, 2) '  # noqa: E501
+            'WHERE L.identifier > ? AND T.chain_id=? AND E.topic=?',
+            (min(watermarks.values()), chain_id.serialize_for_db(), ERC20_OR_ERC721_TRANSFER),
+        ):
+            if (
+                    (address := topics_to_addresses.get(topic)) is not None and
+                    log_id > watermarks[address]
+            ):
+                transferred_tokens[address].add(token_address)
+
+        return transferred_tokens
+
+    @staticmethod
+    def get_addresses_with_activity(
+            cursor: 'DBCursor',
+            chain_id: ChainID,
+            block_numbers: dict[ChecksumEvmAddress, int],
+    ) -> set[ChecksumEvmAddress]:
+        """Returns the addresses that are related to a saved transaction mined after the
+        given block number of each address"""
+        active_addresses: set[ChecksumEvmAddress] = set()
+        if len(block_numbers) == 0:
+            return active_addresses
+
+        for address, block_number in cursor.execute(
+            'SELECT M.address, MAX(T.block_number) FROM evmtx_address_mappings AS M '
+            'INNER JOIN evm_transactions AS T ON M.tx_id=T.identifier '
+            f'WHERE T.chain_id=? AND M.address IN ({",".join("?" * len(block_numbers))}) '
+            'GROUP BY M.address',
+            (chain_id.serialize_for_db(), *block_numbers),
+        ):
+            if block_number > block_numbers[address]:
+                active_addresses.add(address)
+
+        return active_addresses
+
+    @staticmethod
+    def get_addresses_with_nft_transfers(
+            cursor: 'DBCursor',
+            chain_id: ChainID,
+            timestamps: dict[ChecksumEvmAddress, Timestamp],
+    ) -> set[ChecksumEvmAddress]:
+        """Returns the addresses that are in the topics of an ERC721 or ERC1155 transfer log
+        of a saved transaction mined at or after the given timestamp of each address"""
+        active_addresses: set[ChecksumEvmAddress] = set()
+        if len(timestamps) == 0:
+            return active_addresses
+
+        topics_to_addresses = {address_to_bytes32(address): address for address in timestamps}
+        for topic, timestamp in cursor.execute(
+            'SELECT A.topic, MAX(T.timestamp) FROM evmtx_receipt_logs AS L '
+            'INNER JOIN evm_transactions AS T ON L.tx_id=T.identifier '
+            'INNER JOIN evmtx_receipt_log_topics AS E ON E.log=L.identifier AND E.topic_index=0 '
+            'INNER JOIN evmtx_receipt_log_topics AS A ON A.log=L.identifier AND A.topic_index IN (1, 2, 3) '  # noqa: E501
+            'WHERE T.chain_id=? AND T.timestamp>=? AND (E.topic IN (?, ?) OR (E.topic=? AND '
+            # ERC721 transfers index the token id, unlike ERC20 transfers with the same topic
+            'EXISTS (SELECT 1 FROM evmtx_receipt_log_topics WHERE log=L.identifier AND topic_index=3))) '  # noqa: E501
+            'GROUP BY A.topic',
+            (
+                chain_id.serialize_for_db(),
+                min(timestamps.values()),
+                ERC1155_TRANSFER_SINGLE,
+                ERC1155_TRANSFER_BATCH,
+                ERC20_OR_ERC721_TRANSFER,
+            ),
+        ):
+            if (
+                    (address := topics_to_addresses.get(topic)) is not None and
+                    timestamp >= timestamps[address]
+            ):
+                active_addresses.add(address)
+
+        return active_addresses
 
     def get_transaction_hashes_no_receipt(
             self,
@@ -500,6 +629,7 @@ class DBEvmTx:
             'ON H.identifier=E.identifier WHERE E.tx_hash=? AND H.location_label=?)',
             (GENESIS_HASH, address),
         )
+        DBEth2.lower_combine_block_events_watermark(write_cursor)
         genesis_events_count = write_cursor.execute(
             'SELECT COUNT (*) FROM history_events H INNER JOIN evm_events_info E'
             ' WHERE H.identifier=E.identifier and E.tx_hash=?',
@@ -517,6 +647,7 @@ class DBEvmTx:
             'DELETE FROM evm_transactions WHERE tx_hash=? AND chain_id=? AND tx_hash NOT IN (SELECT tx_hash FROM evm_events_info)',  # noqa: E501
             [(x, chain_id_serialized) for x in tx_hashes],
         )
+        self.lower_tokens_detection_watermarks(write_cursor)
         # Delete all remaining evm_tx_mappings so decoding can happen again
         write_cursor.executemany(
             'DELETE FROM evm_tx_mappings WHERE tx_id=? AND value IN (?, ?)',
@@ -1854,6 +1854,8 @@ class LevenshteinFilterQuery(MultiTableFilterQuery):
     """
     substring_search: str | None
     ignored_assets_handling: IgnoredAssetsHandling = IgnoredAssetsHandling.NONE
+    chain_id: ChainID | None = None
+    address: ChecksumEvmAddress | None = None
 
     @classmethod
     def make(
@@ -1869,6 +1871,8 @@ class LevenshteinFilterQuery(MultiTableFilterQuery):
             and_op=and_op,
             filters=[],
             substring_search=substring_search,
+            chain_id=chain_id,
+            address=address,
         )
         filter_query.ignored_assets_handling = ignored_assets_handling
         filters: list[tuple[DBFilter, str]] = []  # filter + table name for which to use it.
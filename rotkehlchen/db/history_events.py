@@ -20,6 +20,7 @@ from rotkehlchen.db.constants import (
     HISTORY_MAPPING_KEY_STATE,
     HISTORY_MAPPING_STATE_CUSTOMIZED,
 )
+from rotkehlchen.db.eth2 import DBEth2
 from rotkehlchen.db.filtering import (
     ALL_EVENTS_DATA_JOIN,
     EVM_EVENT_JOIN,
@@ -153,7 +154,10 @@ class DBHistoryEvents:
         Edit a history entry to the DB with information provided by the user.
         NOTE: It edits all the fields except the extra_data one.
         """
+        assert event.identifier is not None, 'edited events always come with an identifier'
         with self.db.user_write() as write_cursor:
+            # the edit may move the event to another validator so drop both profits
+            DBEth2.invalidate_validators_daily_profit(write_cursor, [event.identifier])
             for idx, (_, updatestr, bindings) in enumerate(event.serialize_for_db()):
                 if idx == 0:  # base history event data
                     try:
@@ -170,6 +174,7 @@ class DBHistoryEvents:
                 else:  # all other data
                     write_cursor.execute(f'{updatestr} WHERE identifier=?', (*bindings, event.identifier))  # noqa: E501
 
+            DBEth2.invalidate_validators_daily_profit(write_cursor, [event.identifier])
             # Also mark it as customized
             write_cursor.execute(
                 'INSERT OR IGNORE INTO history_events_mappings(parent_identifier, name, value) '
@@ -217,6 +222,7 @@ class DBHistoryEvents:
                     'DELETE FROM history_events WHERE identifier=?', (identifier,),
                 )
                 affected_rows = write_cursor.rowcount
+                DBEth2.lower_combine_block_events_watermark(write_cursor)
             if affected_rows != 1:
                 return (
                     f'Tried to remove history event with id {identifier} which does not exist'
@@ -243,6 +249,7 @@ class DBHistoryEvents:
 
         transaction_hashes = write_cursor.execute(f'SELECT evm_events_info.tx_hash FROM history_events INNER JOIN evm_events_info ON history_events.identifier=evm_events_info.identifier {whereclause}', bindings).fetchall()  # noqa: E501
         write_cursor.execute(f'DELETE FROM history_events {whereclause}', bindings)
+        DBEth2.lower_combine_block_events_watermark(write_cursor)
 
         if location != Location.ZKSYNC_LITE and len(transaction_hashes) != 0:
             write_cursor.executemany(
@@ -276,6 +283,7 @@ class DBHistoryEvents:
             bindings = tx_hashes  # type: ignore  # different type of elements in the list
 
         write_cursor.execute(querystr, bindings)
+        DBEth2.lower_combine_block_events_watermark(write_cursor)
 
     def get_customized_event_identifiers(
             self,
@@ -35,11 +35,14 @@ MINIMIZED_USER_DB_SCHEMA = {
     "tag_mappings": "object_referencetext,tag_nametext,foreignkey(tag_name)referencestags(name)primarykey(object_reference,tag_name)",
     "xpubs": "xpubtextnotnull,derivation_pathtextnotnull,labeltext,blockchaintextnotnull,primarykey(xpub,derivation_path,blockchain)",
     "xpub_mappings": "addresstextnotnull,xpubtextnotnull,derivation_pathtextnotnull,account_indexinteger,derived_indexinteger,blockchaintextnotnull,foreignkey(blockchain,address)referencesblockchain_accounts(blockchain,account)ondeletecascadeforeignkey(xpub,derivation_path,blockchain)referencesxpubs(xpub,derivation_path,blockchain)ondeletecascadeprimarykey(address,xpub,derivation_path,blockchain)",
+    "xpub_derived_addresses": "xpubtextnotnull,derivation_pathtextnotnull,xpub_typetextnotnull,account_indexintegernotnull,derived_indexintegernotnull,addresstextnotnull,primarykey(xpub,derivation_path,xpub_type,account_index,derived_index)",
     "eth2_validators": "identifierintegernotnullprimarykey,validator_indexintegerunique,public_keytextnotnullunique,ownership_proportiontextnotnull,withdrawal_addresstext,activation_timestampinteger,withdrawable_timestampinteger,exited_timestampinteger",
     "eth2_daily_staking_details": "validator_indexintegernotnull,timestampintegernotnull,pnltextnotnull,foreignkey(validator_index)referenceseth2_validators(validator_index)onupdatecascadeondeletecascade,primarykey(validator_index,timestamp)",
     "history_events": "identifierintegernotnullprimarykey,entry_typeintegernotnull,event_identifiertextnotnull,sequence_indexintegernotnull,timestampintegernotnull,locationchar(1)notnulldefault('a')referenceslocation(location),location_labeltext,assettextnotnull,amounttextnotnull,usd_valuetextnotnull,notestext,typetextnotnull,subtypetextnotnull,extra_datatext,foreignkey(asset)referencesassets(identifier)onupdatecascade,unique(event_identifier,sequence_index)",
     "evm_events_info": "identifierintegerprimarykey,tx_hashblobnotnull,counterpartytext,producttext,addresstext,foreignkey(identifier)referenceshistory_events(identifier)onupdatecascadeondeletecascade",
     "eth_staking_events_info": "identifierintegerprimarykey,validator_indexintegernotnull,is_exit_or_blocknumberintegernotnull,foreignkey(identifier)referenceshistory_events(identifier)onupdatecascadeondeletecascade",
+    "eth2_validators_daily_profit": "validator_indexintegernotnull,timestampintegernotnull,profit_typechar(1)notnull,location_labeltextnotnull,amounttextnotnull,primarykey(validator_index,timestamp,profit_type,location_label)",
+    "eth2_validators_profit_checkpoints": "validator_indexintegernotnullprimarykey,events_numintegernotnull,last_identifierintegernotnull",
     "history_events_mappings": "parent_identifierintegernotnull,nametextnotnull,valueintegernotnull,foreignkey(parent_identifier)referenceshistory_events(identifier)onupdatecascadeondeletecascade,primarykey(parent_identifier,name,value)",
     "action_type": "typechar(1)primarykeynotnull,seqintegerunique",
     "ignored_actions": "typechar(1)notnulldefault('a')referencesaction_type(type),identifiertext,primarykey(type,identifier)",
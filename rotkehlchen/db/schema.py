@@ -277,6 +277,21 @@ CREATE TABLE IF NOT EXISTS xpub_mappings (
 );
 """
 
+# Cache of all addresses derived from an xpub, including the unused ones checked for the
+# gap limit, so that they don't need to be derived again. The xpub type is the type of the
+# derived addresses since legacy and taproot xpubs share the same prefix.
+DB_CREATE_XPUB_DERIVED_ADDRESSES = """
+CREATE TABLE IF NOT EXISTS xpub_derived_addresses (
+    xpub TEXT NOT NULL,
+    derivation_path TEXT NOT NULL,
+    xpub_type TEXT NOT NULL,
+    account_index INTEGER NOT NULL,
+    derived_index INTEGER NOT NULL,
+    address TEXT NOT NULL,
+    PRIMARY KEY (xpub, derivation_path, xpub_type, account_index, derived_index)
+);
+"""
+
 
 # Store information about the tokens queried for each combination of account and blockchain.
 # The table is designed to have a key-value structure where we use the key `token` to
@@ -622,6 +637,30 @@ CREATE TABLE IF NOT EXISTS eth_staking_events_info(
 );
 """  # noqa: E501
 
+# Materialized daily sums of the staking profit of each validator. The profit_type is
+# W for partial withdrawals, X for exits (amount - 32) and B for block production and
+# mev rewards. location_label is only set for B since those are filtered by recipient.
+DB_CREATE_ETH2_VALIDATORS_DAILY_PROFIT = """
+CREATE TABLE IF NOT EXISTS eth2_validators_daily_profit(
+    validator_index INTEGER NOT NULL,
+    timestamp INTEGER NOT NULL,
+    profit_type CHAR(1) NOT NULL,
+    location_label TEXT NOT NULL,
+    amount TEXT NOT NULL,
+    PRIMARY KEY(validator_index, timestamp, profit_type, location_label)
+);
+"""
+
+# Number of staking events and the biggest event identifier of each validator at the time
+# its daily profit was last materialized. Validators missing from here need a full rebuild.
+DB_CREATE_ETH2_VALIDATORS_PROFIT_CHECKPOINTS = """
+CREATE TABLE IF NOT EXISTS eth2_validators_profit_checkpoints(
+    validator_index INTEGER NOT NULL PRIMARY KEY,
+    events_num INTEGER NOT NULL,
+    last_identifier INTEGER NOT NULL
+);
+"""
+
 
 # This table is used to store for specific history events:
 # - whether it is customized
@@ -831,11 +870,14 @@ BEGIN TRANSACTION;
 {DB_CREATE_TAG_MAPPINGS}
 {DB_CREATE_XPUBS}
 {DB_CREATE_XPUB_MAPPINGS}
+{DB_CREATE_XPUB_DERIVED_ADDRESSES}
 {DB_CREATE_ETH2_VALIDATORS}
 {DB_CREATE_ETH2_DAILY_STAKING_DETAILS}
 {DB_CREATE_HISTORY_EVENTS}
 {DB_CREATE_EVM_EVENTS_INFO}
 {DB_CREATE_ETH_STAKING_EVENTS_INFO}
+{DB_CREATE_ETH2_VALIDATORS_DAILY_PROFIT}
+{DB_CREATE_ETH2_VALIDATORS_PROFIT_CHECKPOINTS}
 {DB_CREATE_HISTORY_EVENTS_MAPPINGS}
 {DB_CREATE_ACTION_TYPE}
 {DB_CREATE_IGNORED_ACTIONS}
@@ -1,18 +1,24 @@
 import operator
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Final
 
 from polyleven import levenshtein
 
+from rotkehlchen.assets.ignored_assets_handling import IgnoredAssetsHandling
 from rotkehlchen.assets.types import AssetType
 from rotkehlchen.constants.assets import A_ETH, A_ETH2
 from rotkehlchen.constants.resolver import ChainID
-from rotkehlchen.globaldb.handler import ALL_ASSETS_TABLES_QUERY, GlobalDBHandler
+from rotkehlchen.db.settings import CachedSettings
+from rotkehlchen.globaldb.handler import GlobalDBHandler
+from rotkehlchen.utils.misc import get_chunks
 
 if TYPE_CHECKING:
     from rotkehlchen.db.dbhandler import DBHandler
     from rotkehlchen.db.drivers.gevent import DBCursor
     from rotkehlchen.db.filtering import LevenshteinFilterQuery
 
+# Search results whose ignored status is checked at once when the results are limited
+IGNORED_SEARCH_RESULTS_CHUNK_LENGTH: Final = 100
+
 
 def _search_only_nfts_levenstein(
         cursor: 'DBCursor',
@@ -45,63 +51,92 @@ def _search_only_nfts_levenstein(
 
 
 def _search_only_assets_levenstein(
-        userdb_cursor: 'DBCursor',
-        userdb: 'DBHandler',
         filter_query: 'LevenshteinFilterQuery',
 ) -> list[tuple[int, dict[str, Any]]]:
+    """Searches the global DB assets using the in-memory assets search index.
+    The index narrows down the candidates so the levenshtein distance is only
+    calculated for the assets that match the filters. Ignored assets are handled
+    by the caller."""
     search_result: list[tuple[int, dict[str, Any]]] = []
-    should_skip = filter_query.ignored_assets_handling.get_should_skip_handler()
-    treat_eth2_as_eth = userdb.get_settings(userdb_cursor).treat_eth2_as_eth
-    ignored_assets = userdb.get_ignored_asset_ids(userdb_cursor)
-
-    with GlobalDBHandler().conn.read_ctx() as cursor:
-        query, bindings = filter_query.prepare('assets')
-        query = ALL_ASSETS_TABLES_QUERY + query
-        cursor.execute(query, bindings)
-        found_eth = False
-        for entry in cursor:
-            if should_skip(entry[0], ignored_assets):
+    treat_eth2_as_eth = CachedSettings().get_entry('treat_eth2_as_eth')
+    globaldb = GlobalDBHandler()
+    with globaldb.conn.read_ctx() as cursor:
+        entries = globaldb.assets_search_index.search(
+            cursor=cursor,
+            substring=filter_query.substring_search,
+            chain_id=filter_query.chain_id,
+            address=filter_query.address,
+        )
+
+    found_eth = False
+    for entry in entries:
+        lev_dist_min = 100
+        if filter_query.substring_search is not None:  # we search for address only
+            if entry.name is not None:
+                lev_dist_min = min(
+                    lev_dist_min,
+                    levenshtein(filter_query.substring_search, entry.casefolded_name),
+                )
+            if entry.symbol is not None:
+                lev_dist_min = min(
+                    lev_dist_min,
+                    levenshtein(filter_query.substring_search, entry.casefolded_symbol),
+                )
+            if treat_eth2_as_eth is True and entry.identifier in (A_ETH.identifier, A_ETH2.identifier):  # noqa: E501
+                if found_eth is False:
+                    search_result.append((lev_dist_min, {
+                        'identifier': 'ETH',
+                        'name': 'Ethereum',
+                        'symbol': 'ETH',
+                        'asset_type': AssetType.OWN_CHAIN.serialize(),
+                    }))
+                    found_eth = True
                 continue
 
-            lev_dist_min = 100
-            if filter_query.substring_search is not None:  # we search for address only
-                if entry[1] is not None:
-                    lev_dist_min = min(
-                        lev_dist_min,
-                        levenshtein(filter_query.substring_search, entry[1].casefold()),
-                    )
-                if entry[2] is not None:
-                    lev_dist_min = min(
-                        lev_dist_min,
-                        levenshtein(filter_query.substring_search, entry[2].casefold()),
-                    )
-                if treat_eth2_as_eth is True and entry[0] in (A_ETH.identifier, A_ETH2.identifier):
-                    if found_eth is False:
-                        search_result.append((lev_dist_min, {
-                            'identifier': 'ETH',
-                            'name': 'Ethereum',
-                            'symbol': 'ETH',
-                            'asset_type': AssetType.OWN_CHAIN.serialize(),
-                        }))
-                        found_eth = True
-                    continue
-
-            entry_info = {
-                'identifier': entry[0],
-                'name': entry[1],
-                'symbol': entry[2],
-                'asset_type': AssetType.deserialize_from_db(entry[4]).serialize(),
-            }
-            if entry[3] is not None:
-                entry_info['evm_chain'] = ChainID.deserialize_from_db(entry[3]).to_name()
-            if entry[5] is not None:
-                entry_info['custom_asset_type'] = entry[5]
-
-            search_result.append((lev_dist_min, entry_info))
+        entry_info = {
+            'identifier': entry.identifier,
+            'name': entry.name,
+            'symbol': entry.symbol,
+            'asset_type': AssetType.deserialize_from_db(entry.asset_type).serialize(),
+        }
+        if entry.chain is not None:
+            entry_info['evm_chain'] = ChainID.deserialize_from_db(entry.chain).to_name()
+        if entry.custom_asset_type is not None:
+            entry_info['custom_asset_type'] = entry.custom_asset_type
+
+        search_result.append((lev_dist_min, entry_info))
 
     return search_result
 
 
+def _handle_ignored_search_results(
+        cursor: 'DBCursor',
+        db: 'DBHandler',
+        ignored_assets_handling: IgnoredAssetsHandling,
+        sorted_search_result: list[dict[str, Any]],
+        limit: int | None,
+) -> list[dict[str, Any]]:
+    """Includes or excludes the ignored assets from the sorted search results. With a limit
+    only the top results are checked, in chunks, instead of loading all the ignored assets
+    of the user at every search."""
+    should_skip = ignored_assets_handling.get_should_skip_handler()
+    if limit is None:
+        ignored_assets = db.get_ignored_asset_ids(cursor)
+        return [x for x in sorted_search_result if not should_skip(x['identifier'], ignored_assets)]  # noqa: E501
+
+    result: list[dict[str, Any]] = []
+    for chunk in get_chunks(sorted_search_result, n=IGNORED_SEARCH_RESULTS_CHUNK_LENGTH):
+        ignored_assets = db.get_ignored_asset_ids(
+            cursor=cursor,
+            identifiers=[x['identifier'] for x in chunk],
+        )
+        result.extend(x for x in chunk if not should_skip(x['identifier'], ignored_assets))
+        if len(result) >= limit:
+            break
+
+    return result[:limit]
+
+
 def search_assets_levenshtein(
         db: 'DBHandler',
         filter_query: 'LevenshteinFilterQuery',
@@ -109,15 +144,19 @@ def search_assets_levenshtein(
         search_nfts: bool,
 ) -> list[dict[str, Any]]:
     """Returns a list of asset details that match the search keyword using the Levenshtein distance approach."""  # noqa: E501
-    search_result = []
+    search_result = _search_only_assets_levenstein(filter_query=filter_query)
     with db.conn.read_ctx() as cursor:
-        search_result = _search_only_assets_levenstein(
-            userdb_cursor=cursor,
-            userdb=db,
-            filter_query=filter_query,
-        )
         if search_nfts is True:
             search_result += _search_only_nfts_levenstein(cursor=cursor, filter_query=filter_query)
 
-    sorted_search_result = [result for _, result in sorted(search_result, key=operator.itemgetter(0))]  # noqa: E501
+        sorted_search_result = [result for _, result in sorted(search_result, key=operator.itemgetter(0))]  # noqa: E501
+        if filter_query.ignored_assets_handling != IgnoredAssetsHandling.NONE:
+            return _handle_ignored_search_results(
+                cursor=cursor,
+                db=db,
+                ignored_assets_handling=filter_query.ignored_assets_handling,
+                sorted_search_result=sorted_search_result,
+                limit=limit,
+            )
+
     return sorted_search_result[:limit] if limit is not None else sorted_search_result
@@ -383,6 +383,8 @@ class RotkiDataUpdater:
                 except OperationalError as e:
                     log.error(f'Could not {raw_data_key} location unsupported asset for {raw_location} due to: {e!s}')  # noqa: E501
 
+        GlobalDBHandler().asset_mappings_index.invalidate()
+
     def check_for_updates(self, updates: Sequence[UpdateType] = tuple(UpdateType)) -> None:
         """Retrieve the information about the latest available update"""
         log.debug('Checking for remote updates')
@@ -1,7 +1,6 @@
 import logging
-import os
-import shutil
 import traceback
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from pysqlcipher3 import dbapi2 as sqlcipher
@@ -30,7 +29,7 @@ from rotkehlchen.db.upgrades.v44_v45 import upgrade_v44_to_v45
 from rotkehlchen.db.upgrades.v45_v46 import upgrade_v45_to_v46
 from rotkehlchen.errors.misc import DBUpgradeError
 from rotkehlchen.logging import RotkehlchenLogsAdapter
-from rotkehlchen.utils.misc import ts_now
+from rotkehlchen.utils.misc import clone_or_copy_file, ts_now
 from rotkehlchen.utils.upgrades import DBUpgradeProgressHandler, UpgradeRecord
 
 if TYPE_CHECKING:
@@ -168,28 +167,59 @@ class DBUpgradeManager:
             messages_aggregator=self.db.msg_aggregator,
             target_version=ROTKEHLCHEN_DB_VERSION,
         )
-        for upgrade in UPGRADES_LIST:
-            self._perform_single_upgrade(upgrade, progress_handler)
+        if our_version < ROTKEHLCHEN_DB_VERSION:
+            self._perform_upgrades(from_version=our_version, progress_handler=progress_handler)
 
         # Finally make sure to always have latest version in the DB
         with self.db.user_write() as cursor:
             self.db.set_setting(cursor, name='version', value=ROTKEHLCHEN_DB_VERSION)
         return False
 
-    def _perform_single_upgrade(
+    def _perform_upgrades(
             self,
-            upgrade: UpgradeRecord,
+            from_version: int,
             progress_handler: DBUpgradeProgressHandler,
     ) -> None:
+        """Performs all the pending upgrades starting from `from_version`
+
+        A single backup of the DB is made before the first upgrade and the ongoing upgrade
+        flag points to it until all upgrades finish. So if any of the upgrades fails or the
+        app is stopped midway the DB is restored to the state it had before this run.
+        Copying a multi-GB DB before every single upgrade was the slowest part of
+        upgrading from an old version.
+
+        If any upgrade requested a VACUUM it is performed once at the end.
+
+        May raise:
+        - DBUpgradeError if any of the upgrades fails
         """
-        This is the wrapper function that performs each DB upgrade
+        backup_path = self._backup_db(from_version=from_version)
+        # Add a flag to the db that an upgrade is happening
+        with self.db.user_write() as write_cursor:
+            self.db.set_setting(
+                write_cursor=write_cursor,
+                name='ongoing_upgrade_from_version',
+                value=from_version,
+            )
 
-        The logic is:
-            1. Check version, if not at from_version get out.
-            2. If at from_version make a DB backup before performing the upgrade
-            3. Perform the upgrade action
-            4. If something went wrong during upgrade restore backup and quit
-            5. If all went well set version and delete the backup
+        for upgrade in UPGRADES_LIST:
+            self._perform_single_upgrade(
+                upgrade=upgrade,
+                progress_handler=progress_handler,
+                backup_path=backup_path,
+            )
+
+        with self.db.user_write() as cursor:
+            cursor.execute('DELETE FROM settings WHERE name=?', ('ongoing_upgrade_from_version',))
+
+        if progress_handler.vacuum_pending is True:
+            progress_handler.set_total_steps(progress_handler.current_round_total_steps + 1)
+            progress_handler.new_step('Vacuuming database.')
+            self.db.conn.execute('VACUUM;')
+
+    def _backup_db(self, from_version: int) -> Path:
+        """Make a backup of the DB before upgrading it and return its path.
+        Note: We keep the backups even for success
 
         We do a WAL checkpoint at the start. That blocks until there is no database
         writer and all readers are reading from the most recent database snapshot. It
@@ -200,6 +230,26 @@ class DBUpgradeManager:
         backup as we only copy that file.
         """
         self.db.conn.execute('PRAGMA wal_checkpoint(FULL);')
+        backup_path = self.db.user_data_dir / f'{ts_now()}_rotkehlchen_db_v{from_version}.backup'
+        clone_or_copy_file(self.db.user_data_dir / USERDB_NAME, backup_path)
+        return backup_path
+
+    def _perform_single_upgrade(
+            self,
+            upgrade: UpgradeRecord,
+            progress_handler: DBUpgradeProgressHandler,
+            backup_path: Path,
+    ) -> None:
+        """
+        This is the wrapper function that performs each DB upgrade
+
+        The logic is:
+            1. Check version, if not at from_version get out.
+            2. Perform the upgrade action
+            3. If something went wrong during upgrade restore the backup made at the
+            start of this run and quit
+            4. If all went well set version
+        """
         with self.db.conn.read_ctx() as cursor:
             current_version = self.db.get_setting(cursor, 'version')
         if current_version != upgrade.from_version:
@@ -207,21 +257,6 @@ class DBUpgradeManager:
         to_version = upgrade.from_version + 1
         progress_handler.new_round(version=to_version)
 
-        # First make a backup of the DB
-        tmp_db_filename = f'{ts_now()}_rotkehlchen_db_v{upgrade.from_version}.backup'
-        shutil.copyfile(
-            os.path.join(self.db.user_data_dir, USERDB_NAME),
-            os.path.join(self.db.user_data_dir, tmp_db_filename),
-        )
-
-        # Add a flag to the db that an upgrade is happening
-        with self.db.user_write() as write_cursor:
-            self.db.set_setting(
-                write_cursor=write_cursor,
-                name='ongoing_upgrade_from_version',
-                value=upgrade.from_version,
-            )
-
         try:
             kwargs = upgrade.kwargs if upgrade.kwargs is not None else {}
             upgrade.function(db=self.db, progress_handler=progress_handler, **kwargs)
@@ -233,13 +268,8 @@ class DBUpgradeManager:
             )
             stacktrace = traceback.format_exc()
             log.error(f'{error_message}\n{stacktrace}')
-            shutil.copyfile(
-                os.path.join(self.db.user_data_dir, tmp_db_filename),
-                os.path.join(self.db.user_data_dir, USERDB_NAME),
-            )
+            clone_or_copy_file(backup_path, self.db.user_data_dir / USERDB_NAME)
             raise DBUpgradeError(error_message) from e
 
-        # Upgrade success all is good - Note: We keep the backups even for success
         with self.db.user_write() as cursor:
-            cursor.execute('DELETE FROM settings WHERE name=?', ('ongoing_upgrade_from_version',))
             self.db.set_setting(write_cursor=cursor, name='version', value=to_version)
@@ -186,8 +186,7 @@ def upgrade_v31_to_v32(db: 'DBHandler', progress_handler: 'DBUpgradeProgressHand
     @progress_step(description='Updating manual balances tags.')
     def _update_manual_balances_tags(write_cursor: 'DBCursor') -> None:
         with db.conn.read_ctx() as read_cursor:
-            manual_balances = read_cursor.execute('SELECT id, label FROM manually_tracked_balances')  # noqa: E501
-            for balance_id, label in manual_balances:
-                write_cursor.execute('UPDATE tag_mappings SET object_reference=? WHERE object_reference=?', (balance_id, label))  # noqa: E501
+            manual_balances = read_cursor.execute('SELECT id, label FROM manually_tracked_balances').fetchall()  # noqa: E501
+        write_cursor.executemany('UPDATE tag_mappings SET object_reference=? WHERE object_reference=?', manual_balances)  # noqa: E501
 
     perform_userdb_upgrade_steps(db=db, progress_handler=progress_handler)
@@ -181,11 +181,10 @@ def upgrade_v36_to_v37(db: 'DBHandler', progress_handler: 'DBUpgradeProgressHand
 
         # add all non-evm entries to the new table (no data lost)
         write_cursor.executemany('INSERT INTO history_events_copy VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', new_entries)  # noqa: E501
-        for entry in extra_evm_info_entries:
-            write_cursor.execute(
-                'INSERT INTO evm_events_info VALUES(?, ?, ?, ?, ?, ?)',
-                (entry[0], entry[1], entry[2], None, None, entry[3]),
-            )
+        write_cursor.executemany(
+            'INSERT INTO evm_events_info VALUES(?, ?, ?, ?, ?, ?)',
+            [(entry[0], entry[1], entry[2], None, None, entry[3]) for entry in extra_evm_info_entries],  # noqa: E501
+        )
 
         write_cursor.switch_foreign_keys('OFF')  # need FK off or history_events_mappings get deleted  # noqa: E501
         write_cursor.execute('DROP TABLE history_events')
@@ -23,6 +23,9 @@ def upgrade_v45_to_v46(db: 'DBHandler', progress_handler: 'DBUpgradeProgressHand
 
     - Remove balancer module from settings
     - Refresh icons
+    - Move extra data of EVM events to the history_events table
+    - Add the tables materializing the daily profit of ETH validators
+    - Add the table caching the addresses derived from xpubs
     """
     @progress_step(description='Removing balancer module from user settings.')
     def _remove_balancer_module(write_cursor: 'DBCursor') -> None:
@@ -63,4 +66,35 @@ def upgrade_v45_to_v46(db: 'DBHandler', progress_handler: 'DBUpgradeProgressHand
         )
         write_cursor.execute('ALTER TABLE evm_events_info DROP COLUMN extra_data;')
 
+    @progress_step(description='Adding the ETH validators daily profit tables.')
+    def _add_validators_daily_profit_tables(write_cursor: 'DBCursor') -> None:
+        write_cursor.execute("""
+        CREATE TABLE IF NOT EXISTS eth2_validators_daily_profit(
+            validator_index INTEGER NOT NULL,
+            timestamp INTEGER NOT NULL,
+            profit_type CHAR(1) NOT NULL,
+            location_label TEXT NOT NULL,
+            amount TEXT NOT NULL,
+            PRIMARY KEY(validator_index, timestamp, profit_type, location_label)
+        );""")
+        write_cursor.execute("""
+        CREATE TABLE IF NOT EXISTS eth2_validators_profit_checkpoints(
+            validator_index INTEGER NOT NULL PRIMARY KEY,
+            events_num INTEGER NOT NULL,
+            last_identifier INTEGER NOT NULL
+        );""")
+
+    @progress_step(description='Adding the xpub derived addresses table.')
+    def _add_xpub_derived_addresses_table(write_cursor: 'DBCursor') -> None:
+        write_cursor.execute("""
+        CREATE TABLE IF NOT EXISTS xpub_derived_addresses (
+            xpub TEXT NOT NULL,
+            derivation_path TEXT NOT NULL,
+            xpub_type TEXT NOT NULL,
+            account_index INTEGER NOT NULL,
+            derived_index INTEGER NOT NULL,
+            address TEXT NOT NULL,
+            PRIMARY KEY (xpub, derivation_path, xpub_type, account_index, derived_index)
+        );""")
+
     perform_userdb_upgrade_steps(db=db, progress_handler=progress_handler, should_vacuum=True)
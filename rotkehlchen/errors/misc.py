@@ -39,6 +39,15 @@ class RemoteError(Exception):
         super().__init__(message)
 
 
+class NodesQueryError(RemoteError):
+    """Thrown when a query failed in all the nodes it was tried with. The error
+    of each of the nodes is kept in node_errors"""
+
+    def __init__(self, message: str, node_errors: list[str]):
+        self.node_errors = node_errors
+        super().__init__(message)
+
+
 class XPUBError(Exception):
     """Error XPUB Parsing and address derivation"""
 
@@ -82,6 +91,11 @@ class GreenletKilledError(Exception):
     """Raised when a greenlet is killed"""
 
 
+class InflightResultAbortedError(Exception):
+    """Raised to the callers waiting for a result whose computing greenlet got killed.
+    They should compute the result themselves"""
+
+
 class AccountingError(Exception):
     """Fatal error while processing accounting events during a PnL report"""
 
@@ -53,7 +53,6 @@ from rotkehlchen.history.events.structures.asset_movement import (
 from rotkehlchen.history.events.structures.base import HistoryBaseEntry, HistoryEvent
 from rotkehlchen.history.events.structures.types import HistoryEventSubType, HistoryEventType
 from rotkehlchen.history.price import PriceHistorian
-from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import (
     deserialize_asset_amount,
@@ -478,10 +477,10 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
 
     def _add_balances(
             self,
-            balances: defaultdict[AssetWithOracles, Balance],
+            amounts: defaultdict[AssetWithOracles, FVal],
             new_balances: list[dict],
-    ) -> defaultdict[AssetWithOracles, Balance]:
-        """Add new balances to balances dict"""
+    ) -> defaultdict[AssetWithOracles, FVal]:
+        """Add the amounts of new balances to the amounts dict"""
         for entry in new_balances:
             try:
                 # force string https://github.com/rotki/rotki/issues/2342
@@ -529,23 +528,14 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
                 )
                 continue
 
-            try:
-                usd_price = Inquirer.find_usd_price(asset)
-            except RemoteError as e:
-                log.error(
-                    f'Error processing {self.name} balance entry due to inability to '
-                    f'query USD price: {e!s}. Skipping balance entry',
-                )
-                continue
+            amounts[asset] += amount
 
-            balances[asset] += Balance(amount=amount, usd_value=amount * usd_price)
-
-        return balances
+        return amounts
 
     def _query_spot_balances(
             self,
-            balances: defaultdict[AssetWithOracles, Balance],
-    ) -> defaultdict[AssetWithOracles, Balance]:
+            amounts: defaultdict[AssetWithOracles, FVal],
+    ) -> defaultdict[AssetWithOracles, FVal]:
         try:
             account_data = self.api_query_dict(api_type='api', method='account')
         except (RemoteError, BinancePermissionError) as e:
@@ -553,17 +543,17 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
                 f'Failed to query {self.name} spot wallet balances.'
                 f'Skipping query. Response details: {e!s}',
             )
-            return balances
+            return amounts
 
         if (binance_balances := account_data.get('balances', None)) is None:
             raise RemoteError('Binance spot balances response did not contain the balances key')
 
-        return self._add_balances(balances=balances, new_balances=binance_balances)
+        return self._add_balances(amounts=amounts, new_balances=binance_balances)
 
     def _query_funding_balances(
             self,
-            balances: defaultdict[AssetWithOracles, Balance],
-    ) -> defaultdict[AssetWithOracles, Balance]:
+            amounts: defaultdict[AssetWithOracles, FVal],
+    ) -> defaultdict[AssetWithOracles, FVal]:
         """Query the balances of funding wallet in binance.
         Docs: https://binance-docs.github.io/apidocs/spot/en/#funding-wallet-user_data
 
@@ -575,21 +565,21 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
                 request_method='POST',
                 request_options_key='data',
             )) == 0:
-                return balances
+                return amounts
         except (RemoteError, BinancePermissionError) as e:
             log.warning(
                 f'Failed to query {self.name} funding wallet balances.'
                 f'Skipping query. Response details: {e!s}',
             )
-            return balances
+            return amounts
 
-        return self._add_balances(balances=balances, new_balances=funding_balances)
+        return self._add_balances(amounts=amounts, new_balances=funding_balances)
 
     def _query_lending_balances(
             self,
-            balances: defaultdict[AssetWithOracles, Balance],
-    ) -> defaultdict[AssetWithOracles, Balance]:
-        """Queries binance lending balances and if any found adds them to `balances`
+            amounts: defaultdict[AssetWithOracles, FVal],
+    ) -> defaultdict[AssetWithOracles, FVal]:
+        """Queries binance lending balances and if any found adds them to `amounts`
 
         May raise:
         - RemoteError
@@ -663,21 +653,9 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
                     )
                     continue
 
-                try:
-                    usd_price = Inquirer.find_usd_price(asset)
-                except RemoteError as e:
-                    log.error(
-                        f'Error processing {self.name} balance entry due to inability to '
-                        f'query USD price: {e!s}. Skipping balance entry',
-                    )
-                    continue
-
-                balances[asset] += Balance(
-                    amount=amount,
-                    usd_value=amount * usd_price,
-                )
+                amounts[asset] += amount
 
-        return balances
+        return amounts
 
     def query_lending_interests_history(
             self,
@@ -908,9 +886,9 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
 
     def _query_cross_collateral_futures_balances(
             self,
-            balances: defaultdict[AssetWithOracles, Balance],
-    ) -> defaultdict[AssetWithOracles, Balance]:
-        """Queries binance collateral future balances and if any found adds them to `balances`
+            amounts: defaultdict[AssetWithOracles, FVal],
+    ) -> defaultdict[AssetWithOracles, FVal]:
+        """Queries binance collateral future balances and if any found adds them to `amounts`
 
         May raise:
         - RemoteError
@@ -944,19 +922,7 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
                     )
                     continue
 
-                try:
-                    usd_price = Inquirer.find_usd_price(asset)
-                except RemoteError as e:
-                    log.error(
-                        f'Error processing {self.name} balance entry due to inability to '
-                        f'query USD price: {e!s}. Skipping balance entry',
-                    )
-                    continue
-
-                balances[asset] += Balance(
-                    amount=amount,
-                    usd_value=amount * usd_price,
-                )
+                amounts[asset] += amount
 
         except KeyError as e:
             self.msg_aggregator.add_error(
@@ -964,22 +930,22 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
                 f'{e!s}. Skipping futures query...',
             )
 
-        return balances
+        return amounts
 
-    def _query_margined_fapi(self, balances: defaultdict[AssetWithOracles, Balance]) -> defaultdict[AssetWithOracles, Balance]:  # noqa: E501
+    def _query_margined_fapi(self, amounts: defaultdict[AssetWithOracles, FVal]) -> defaultdict[AssetWithOracles, FVal]:  # noqa: E501
         """Only a convenience function to give same interface as other query methods"""
-        return self._query_margined_futures_balances('fapi', balances)
+        return self._query_margined_futures_balances('fapi', amounts)
 
-    def _query_margined_dapi(self, balances: defaultdict[AssetWithOracles, Balance]) -> defaultdict[AssetWithOracles, Balance]:  # noqa: E501
+    def _query_margined_dapi(self, amounts: defaultdict[AssetWithOracles, FVal]) -> defaultdict[AssetWithOracles, FVal]:  # noqa: E501
         """Only a convenience function to give same interface as other query methods"""
-        return self._query_margined_futures_balances('dapi', balances)
+        return self._query_margined_futures_balances('dapi', amounts)
 
     def _query_margined_futures_balances(
             self,
             api_type: Literal['fapi', 'dapi'],
-            balances: defaultdict[AssetWithOracles, Balance],
-    ) -> defaultdict[AssetWithOracles, Balance]:
-        """Queries binance margined future balances and if any found adds them to `balances`
+            amounts: defaultdict[AssetWithOracles, FVal],
+    ) -> defaultdict[AssetWithOracles, FVal]:
+        """Queries binance margined future balances and if any found adds them to `amounts`
 
         May raise:
         - RemoteError
@@ -991,7 +957,7 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
                 f'Insufficient permission to query {self.name} {api_type} balances.'
                 f'Skipping query. Response details: {e!s}',
             )
-            return balances
+            return amounts
 
         try:
             for entry in response:
@@ -1020,19 +986,7 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
                     )
                     continue
 
-                try:
-                    usd_price = Inquirer.find_usd_price(asset)
-                except RemoteError as e:
-                    log.error(
-                        f'Error processing {self.name} balance entry due to inability to '
-                        f'query USD price: {e!s}. Skipping margined futures balance entry',
-                    )
-                    continue
-
-                balances[asset] += Balance(
-                    amount=amount,
-                    usd_value=amount * usd_price,
-                )
+                amounts[asset] += amount
 
         except KeyError as e:
             self.msg_aggregator.add_error(
@@ -1040,13 +994,13 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
                 f'expected key {e!s}. Skipping margin futures query...',
             )
 
-        return balances
+        return amounts
 
     def _query_pools_balances(
             self,
-            balances: defaultdict[AssetWithOracles, Balance],
-    ) -> defaultdict[AssetWithOracles, Balance]:
-        """Queries binance pool balances and if any found adds them to `balances`
+            amounts: defaultdict[AssetWithOracles, FVal],
+    ) -> defaultdict[AssetWithOracles, FVal]:
+        """Queries binance pool balances and if any found adds them to `amounts`
 
         May raise:
         - RemoteError
@@ -1077,19 +1031,7 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
                 )
                 return None
 
-            try:
-                usd_price = Inquirer.find_usd_price(asset)
-            except RemoteError as e:
-                log.error(
-                    f'Error processing {self.name} balance entry due to inability to '
-                    f'query USD price: {e!s}. Skipping {self.name} pool balance entry',
-                )
-                return None
-
-            balances[asset] += Balance(
-                amount=asset_amount,
-                usd_value=asset_amount * usd_price,
-            )
+            amounts[asset] += asset_amount
             return None
 
         try:
@@ -1099,7 +1041,7 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
                 f'Insufficient permission to query {self.name} pool balances.'
                 f'Skipping query. Response details: {e!s}',
             )
-            return balances
+            return amounts
 
         try:
             for entry in response:
@@ -1119,16 +1061,16 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
                 f'Data: {response}. Error: {msg}',
             )
 
-        return balances
+        return amounts
 
     @protect_with_lock()
     @cache_response_timewise()
     def query_balances(self) -> ExchangeQueryBalances:
         try:
             self.first_connection()
-            returned_balances: defaultdict[AssetWithOracles, Balance] = defaultdict(Balance)
-            returned_balances = self._query_spot_balances(returned_balances)
-            returned_balances = self._query_funding_balances(returned_balances)
+            amounts: defaultdict[AssetWithOracles, FVal] = defaultdict(FVal)
+            amounts = self._query_spot_balances(amounts)
+            amounts = self._query_funding_balances(amounts)
             if self.location != Location.BINANCEUS:
                 for method in (
                         self._query_lending_balances,
@@ -1138,7 +1080,7 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
                         self._query_pools_balances,
                 ):
                     try:
-                        returned_balances = method(returned_balances)
+                        amounts = method(amounts)
                     except RemoteError as e:  # errors in any of these methods should not be fatal
                         log.warning(f'Failed to query binance method {method.__name__} due to {e!s}')  # noqa: E501
 
@@ -1150,11 +1092,12 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
             self.msg_aggregator.add_error(msg)
             return None, msg
 
+        returned_balances = self.balances_from_amounts(amounts)
         log.debug(
             f'{self.name} balance query result',
             balances=returned_balances,
         )
-        return dict(returned_balances), ''
+        return returned_balances, ''
 
     def query_online_trade_history(
             self,
@@ -9,7 +9,6 @@ from urllib.parse import urlencode
 
 import requests
 
-from rotkehlchen.accounting.structures.balance import Balance
 from rotkehlchen.assets.asset import AssetWithOracles
 from rotkehlchen.assets.converters import asset_from_bitcoinde
 from rotkehlchen.constants.assets import A_EUR
@@ -24,7 +23,6 @@ from rotkehlchen.exchanges.data_structures import (
     Trade,
 )
 from rotkehlchen.exchanges.exchange import ExchangeInterface, ExchangeQueryBalances
-from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import (
     deserialize_asset_amount,
@@ -37,6 +35,7 @@ from rotkehlchen.utils.misc import iso8601ts_to_timestamp
 
 if TYPE_CHECKING:
     from rotkehlchen.db.dbhandler import DBHandler
+    from rotkehlchen.fval import FVal
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
@@ -226,7 +225,7 @@ class Bitcoinde(ExchangeInterface):
             return True, ''
 
     def query_balances(self, **kwargs: Any) -> ExchangeQueryBalances:
-        assets_balance: dict[AssetWithOracles, Balance] = {}
+        amounts: dict[AssetWithOracles, FVal] = {}
         try:
             resp_info = self._api_query('get', 'account')
         except RemoteError as e:
@@ -247,14 +246,6 @@ class Bitcoinde(ExchangeInterface):
                     details='balance query',
                 )
                 continue
-            try:
-                usd_price = Inquirer.find_usd_price(asset=asset)
-            except RemoteError as e:
-                self.msg_aggregator.add_error(
-                    f'Error processing Bitcoin.de balance entry due to inability to '
-                    f'query USD price: {e!s}. Skipping balance entry',
-                )
-                continue
 
             try:
                 amount = deserialize_asset_amount(balance['total_amount'])
@@ -265,12 +256,9 @@ class Bitcoinde(ExchangeInterface):
                 )
                 continue
 
-            assets_balance[asset] = Balance(
-                amount=amount,
-                usd_value=amount * usd_price,
-            )
+            amounts[asset] = amount
 
-        return assets_balance, ''
+        return self.balances_from_amounts(amounts), ''
 
     def query_online_trade_history(
             self,
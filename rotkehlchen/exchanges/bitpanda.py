@@ -8,7 +8,6 @@ from urllib.parse import urlencode
 import gevent
 import requests
 
-from rotkehlchen.accounting.structures.balance import Balance
 from rotkehlchen.assets.converters import asset_from_bitpanda
 from rotkehlchen.constants import ZERO
 from rotkehlchen.constants.assets import A_BEST
@@ -19,12 +18,12 @@ from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.exchanges.data_structures import MarginPosition, Trade
 from rotkehlchen.exchanges.exchange import ExchangeInterface, ExchangeQueryBalances
+from rotkehlchen.fval import FVal
 from rotkehlchen.history.deserialization import deserialize_price
 from rotkehlchen.history.events.structures.asset_movement import (
     AssetMovement,
     create_asset_movement_with_fee,
 )
-from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import (
     deserialize_asset_amount,
@@ -483,7 +482,7 @@ class Bitpanda(ExchangeInterface):
             msg = f'Failed to query Bitpanda balances. {e!s}'
             return None, msg
 
-        assets_balance: defaultdict[AssetWithOracles, Balance] = defaultdict(Balance)
+        amounts: defaultdict[AssetWithOracles, FVal] = defaultdict(FVal)
         wallets_len = len(wallets)
         for idx, entry in enumerate(wallets + fiat_wallets):
 
@@ -519,20 +518,9 @@ class Bitpanda(ExchangeInterface):
             if amount == ZERO:
                 continue
 
-            try:
-                usd_price = Inquirer.find_usd_price(asset=asset)
-            except RemoteError as e:
-                self.msg_aggregator.add_error(
-                    f'Error processing Bitpanda balance entry due to inability to '
-                    f'query USD price: {e!s}. Skipping balance entry',
-                )
-                continue
-            assets_balance[asset] += Balance(
-                amount=amount,
-                usd_value=amount * usd_price,
-            )
+            amounts[asset] += amount
 
-        return dict(assets_balance), ''
+        return self.balances_from_amounts(amounts), ''
 
     def query_online_trade_history(
             self,
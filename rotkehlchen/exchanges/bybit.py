@@ -25,6 +25,7 @@ from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.exchanges.data_structures import MarginPosition, Trade
 from rotkehlchen.exchanges.exchange import ExchangeInterface, ExchangeQueryBalances
 from rotkehlchen.exchanges.utils import pair_symbol_to_base_quote
+from rotkehlchen.fval import FVal
 from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.history.deserialization import deserialize_price
 from rotkehlchen.history.events.structures.asset_movement import (
@@ -33,7 +34,6 @@ from rotkehlchen.history.events.structures.asset_movement import (
 )
 from rotkehlchen.history.events.structures.base import HistoryBaseEntry
 from rotkehlchen.history.events.structures.types import HistoryEventType
-from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import (
     deserialize_asset_amount,
@@ -428,6 +428,7 @@ class Bybit(ExchangeInterface):
         """
         self.first_connection()
         assets_balance: defaultdict[AssetWithOracles, Balance] = defaultdict(Balance)
+        amounts_to_price: defaultdict[AssetWithOracles, FVal] = defaultdict(FVal)
 
         try:
             response = self._api_query(
@@ -453,11 +454,11 @@ class Bybit(ExchangeInterface):
                 try:
                     asset = asset_from_bybit(coin_data['coin'])
                     amount = deserialize_fval(coin_data['walletBalance'], name=f'Bybit wallet balance for {asset}', location='bybit')  # noqa: E501
-                    if coin_data['usdValue'] != '':
-                        usd_value = deserialize_fval(coin_data['usdValue'], name=f'Bybit usd value for {asset}', location='bybit')  # we don't need to calculate it since it is provided by bybit  # noqa: E501
-                    else:
-                        usd_price = Inquirer.find_usd_price(asset=asset)
-                        usd_value = usd_price * amount
+                    if coin_data['usdValue'] == '':  # priced together after the parsing
+                        amounts_to_price[asset] += amount
+                        continue
+
+                    usd_value = deserialize_fval(coin_data['usdValue'], name=f'Bybit usd value for {asset}', location='bybit')  # we don't need to calculate it since it is provided by bybit  # noqa: E501
                 except UnknownAsset as e:
                     self.send_unknown_asset_message(
                         asset_identifier=e.identifier,
@@ -472,6 +473,9 @@ class Bybit(ExchangeInterface):
 
                 assets_balance[asset] += Balance(amount=amount, usd_value=usd_value)
 
+        for asset, balance in self.balances_from_amounts(amounts_to_price).items():
+            assets_balance[asset] += balance
+
         return assets_balance, ''
 
     def _query_deposits_withdrawals(
@@ -1,6 +1,6 @@
 import logging
 from abc import abstractmethod
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from typing import TYPE_CHECKING, Any
 
 import requests
@@ -16,6 +16,8 @@ from rotkehlchen.db.history_events import DBHistoryEvents
 from rotkehlchen.db.ranges import DBQueryRanges
 from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.exchanges.data_structures import AssetMovement, MarginPosition, Trade
+from rotkehlchen.fval import FVal
+from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.types import (
     ApiKey,
@@ -150,6 +152,36 @@ class ExchangeInterface(CacheableMixIn, LockableQueryMixIn):
         """
         raise NotImplementedError('query_balances should only be implemented by subclasses')
 
+    def balances_from_amounts(
+            self,
+            amounts: Mapping[AssetWithOracles, FVal],
+    ) -> dict[AssetWithOracles, Balance]:
+        """Turns the amounts per asset collected while parsing a balances response into
+        balances. The usd prices of all the assets are resolved together through
+        Inquirer.find_usd_prices, which prices them concurrently, instead of one price query
+        after the other while parsing the response. Prices are shared with the other exchanges
+        of the same snapshot through the inquirer's price cache.
+
+        Assets whose usd price can not be queried are skipped.
+        """
+        try:
+            prices = Inquirer.find_usd_prices(amounts)
+        except RemoteError:  # query them one by one to only skip the failing assets
+            prices = {}
+            for asset in amounts:
+                try:
+                    prices[asset] = Inquirer.find_usd_price(asset)
+                except RemoteError as e:
+                    self.msg_aggregator.add_error(
+                        f'Error processing {self.name} balance entry of {asset} due to '
+                        f'inability to query USD price: {e!s}. Skipping balance entry',
+                    )
+
+        return {
+            asset: Balance(amount=amount, usd_value=amount * prices[asset])
+            for asset, amount in amounts.items() if asset in prices
+        }
+
     def query_exchange_specific_history(
             self,
             start_ts: Timestamp,  # pylint: disable=unused-argument
@@ -28,9 +28,9 @@ from rotkehlchen.exchanges.utils import (
     get_key_if_has_val,
     pair_symbol_to_base_quote,
 )
+from rotkehlchen.fval import FVal
 from rotkehlchen.history.deserialization import deserialize_price
 from rotkehlchen.history.events.structures.asset_movement import AssetMovement
-from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import (
     deserialize_asset_amount,
@@ -304,7 +304,7 @@ class Gemini(ExchangeInterface):
             log.error(msg)
             return None, msg
 
-        returned_balances: defaultdict[AssetWithOracles, Balance] = defaultdict(Balance)
+        amounts: defaultdict[AssetWithOracles, FVal] = defaultdict(FVal)
         for entry in balances:
             try:
                 balance_type = entry['type']
@@ -317,19 +317,7 @@ class Gemini(ExchangeInterface):
                     continue
 
                 asset = asset_from_gemini(entry['currency'])
-                try:
-                    usd_price = Inquirer.find_usd_price(asset=asset)
-                except RemoteError as e:
-                    self.msg_aggregator.add_error(
-                        f'Error processing gemini {balance_type} balance result due to '
-                        f'inability to query USD price: {e!s}. Skipping balance entry',
-                    )
-                    continue
-
-                returned_balances[asset] += Balance(
-                    amount=amount,
-                    usd_value=amount * usd_price,
-                )
+                amounts[asset] += amount
             except UnknownAsset as e:
                 self.send_unknown_asset_message(
                     asset_identifier=e.identifier,
@@ -356,7 +344,7 @@ class Gemini(ExchangeInterface):
                 )
                 continue
 
-        return returned_balances, ''
+        return self.balances_from_amounts(amounts), ''
 
     def _get_paginated_query(
             self,
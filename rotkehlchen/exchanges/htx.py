@@ -9,7 +9,6 @@ from typing import TYPE_CHECKING, Any, Final, Literal
 
 import requests
 
-from rotkehlchen.accounting.structures.balance import Balance
 from rotkehlchen.assets.converters import asset_from_htx
 from rotkehlchen.constants.misc import ZERO
 from rotkehlchen.constants.timing import DAY_IN_SECONDS
@@ -28,7 +27,6 @@ from rotkehlchen.history.events.structures.asset_movement import (
 )
 from rotkehlchen.history.events.structures.base import HistoryBaseEntry
 from rotkehlchen.history.events.structures.types import HistoryEventType
-from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import (
     deserialize_asset_amount,
@@ -50,6 +48,7 @@ if TYPE_CHECKING:
     from rotkehlchen.assets.asset import AssetWithOracles
     from rotkehlchen.db.dbhandler import DBHandler
     from rotkehlchen.exchanges.data_structures import MarginPosition
+    from rotkehlchen.fval import FVal
     from rotkehlchen.user_messages import MessagesAggregator
 
 
@@ -162,7 +161,7 @@ class Htx(ExchangeInterface):
 
     def query_balances(self, **kwargs: Any) -> ExchangeQueryBalances:
         """Query balances for the accounts linked to the api key"""
-        returned_balances: dict[AssetWithOracles, Balance] = {}
+        amounts: dict[AssetWithOracles, FVal] = {}
         for account in self.get_accounts():
             account_id = account['id']
             path = f'/v1/account/accounts/{account_id}/balance'
@@ -171,7 +170,7 @@ class Htx(ExchangeInterface):
             except RemoteError as e:
                 error_prefix = 'Failed to query HTX'
                 log.error(f'{error_prefix} balances due to {e}')
-                return returned_balances, f'{error_prefix} due to a remote error. Check logs for more details'  # noqa: E501
+                return self.balances_from_amounts(amounts), f'{error_prefix} due to a remote error. Check logs for more details'  # noqa: E501
 
             if (account_balance_type := data['type']) is None:
                 log.error(f'Response for balances does not contain the type key {data}. Skipping')
@@ -214,21 +213,9 @@ class Htx(ExchangeInterface):
                     log.error(f'HTX balance does not contain the key {e}. Skipping')
                     continue
 
-                try:
-                    usd_price = Inquirer.find_usd_price(asset=asset)
-                except RemoteError as e:
-                    self.msg_aggregator.add_error(
-                        f'Error processing HTX balance entry due to inability to '
-                        f'query USD price: {e!s}. Skipping balance entry',
-                    )
-                    continue
-
-                returned_balances[asset] = Balance(
-                    amount=amount,
-                    usd_value=amount * usd_price,
-                )
+                amounts[asset] = amount
 
-        return returned_balances, ''
+        return self.balances_from_amounts(amounts), ''
 
     def _paginated_query(
             self,
@@ -10,7 +10,6 @@ from typing import TYPE_CHECKING, Any, Literal
 import gevent
 import requests
 
-from rotkehlchen.accounting.structures.balance import Balance
 from rotkehlchen.assets.asset import AssetWithOracles
 from rotkehlchen.constants import ZERO
 from rotkehlchen.constants.assets import (
@@ -62,7 +61,6 @@ from rotkehlchen.exchanges.data_structures import (
 )
 from rotkehlchen.exchanges.exchange import ExchangeInterface, ExchangeQueryBalances
 from rotkehlchen.fval import FVal
-from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import (
     deserialize_asset_amount,
@@ -348,7 +346,7 @@ class Independentreserve(ExchangeInterface):
             return True, ''
 
     def query_balances(self, **kwargs: Any) -> ExchangeQueryBalances:
-        assets_balance: dict[AssetWithOracles, Balance] = {}
+        amounts: dict[AssetWithOracles, FVal] = {}
         try:
             response = self._api_query(verb='post', method_type='Private', path='GetAccounts')
         except RemoteError as e:
@@ -361,7 +359,6 @@ class Independentreserve(ExchangeInterface):
         for entry in response:
             try:
                 asset = independentreserve_asset(entry['CurrencyCode'])
-                usd_price = Inquirer.find_usd_price(asset=asset)
                 amount = deserialize_asset_amount(entry['TotalBalance'])
                 account_guids.append(entry['AccountGuid'])
             except UnknownAsset as e:
@@ -370,12 +367,6 @@ class Independentreserve(ExchangeInterface):
                     details='balance query',
                 )
                 continue
-            except RemoteError as e:  # raised only by find_usd_price
-                self.msg_aggregator.add_error(
-                    f'Error processing IndependentReserve balance entry due to inability to '
-                    f'query USD price: {e!s}. Skipping balance entry',
-                )
-                continue
             except (DeserializationError, KeyError) as e:
                 msg = str(e)
                 if isinstance(e, KeyError):
@@ -385,13 +376,10 @@ class Independentreserve(ExchangeInterface):
             if amount == ZERO:
                 continue
 
-            assets_balance[asset] = Balance(
-                amount=amount,
-                usd_value=amount * usd_price,
-            )
+            amounts[asset] = amount
 
         self.account_guids = account_guids
-        return assets_balance, ''
+        return self.balances_from_amounts(amounts), ''
 
     def _gather_paginated_data(self, path: str, extra_options: dict | None = None) -> list[dict[str, Any]]:  # noqa: E501
         """May raise KeyError"""
@@ -41,13 +41,13 @@ from rotkehlchen.exchanges.exchange import (
     ExchangeQueryBalances,
     ExchangeWithExtras,
 )
+from rotkehlchen.fval import FVal
 from rotkehlchen.history.events.structures.base import (
     HistoryBaseEntryType,
     HistoryEvent,
     HistoryEventSubType,
     HistoryEventType,
 )
-from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import (
     deserialize_asset_amount,
@@ -399,6 +399,7 @@ class Kraken(ExchangeInterface, ExchangeWithExtras):
                 return None, msg
 
         assets_balance: defaultdict[AssetWithOracles, Balance] = defaultdict(Balance)
+        amounts: defaultdict[AssetWithOracles, FVal] = defaultdict(FVal)
         for kraken_name, amount_ in kraken_balances.items():
             try:
                 amount = deserialize_asset_amount(amount_)
@@ -426,28 +427,18 @@ class Kraken(ExchangeInterface, ExchangeWithExtras):
                 )
                 continue
 
-            balance = Balance(amount=amount)
-            if our_asset.identifier != 'KFEE':
-                # There is no price value for KFEE
-                try:
-                    usd_price = Inquirer.find_usd_price(our_asset)
-                except RemoteError as e:
-                    self.msg_aggregator.add_error(
-                        f'Error processing kraken balance entry due to inability to '
-                        f'query USD price: {e!s}. Skipping balance entry',
-                    )
-                    continue
-
-                balance.usd_value = balance.amount * usd_price
+            if our_asset.identifier == 'KFEE':  # There is no price value for KFEE
+                assets_balance[our_asset] += Balance(amount=amount)
+            else:
+                amounts[our_asset] += amount
 
-            assets_balance[our_asset] += balance
             log.debug(
                 'kraken balance query result',
                 currency=our_asset,
-                amount=balance.amount,
-                usd_value=balance.usd_value,
+                amount=amount,
             )
 
+        assets_balance.update(self.balances_from_amounts(amounts))
         return dict(assets_balance), ''
 
     def query_until_finished(
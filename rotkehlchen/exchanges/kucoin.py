@@ -26,8 +26,8 @@ from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.exchanges.data_structures import AssetMovement, MarginPosition, Trade
 from rotkehlchen.exchanges.exchange import ExchangeInterface, ExchangeQueryBalances
+from rotkehlchen.fval import FVal
 from rotkehlchen.history.deserialization import deserialize_price
-from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import (
     deserialize_asset_amount,
@@ -456,7 +456,7 @@ class Kucoin(ExchangeInterface):
             log.error(msg, response_dict)
             raise RemoteError(msg) from e
 
-        assets_balance: defaultdict[AssetWithOracles, Balance] = defaultdict(Balance)
+        amounts: defaultdict[AssetWithOracles, FVal] = defaultdict(FVal)
         for raw_result in accounts_data:
             try:
                 amount = deserialize_asset_amount(raw_result['balance'])
@@ -503,21 +503,10 @@ class Kucoin(ExchangeInterface):
                     details='balance deserialization',
                 )
                 continue
-            try:
-                usd_price = Inquirer.find_usd_price(asset=asset)
-            except RemoteError:
-                self.msg_aggregator.add_error(
-                    f'Failed to deserialize a kucoin balance after failing to '
-                    f'request the USD price of {asset.identifier}. Ignoring it.',
-                )
-                continue
 
-            assets_balance[asset] += Balance(
-                amount=amount,
-                usd_value=amount * usd_price,
-            )
+            amounts[asset] += amount
 
-        return dict(assets_balance)
+        return self.balances_from_amounts(amounts)
 
     @staticmethod
     def _deserialize_asset_movement(
@@ -9,7 +9,6 @@ from urllib.parse import urlencode, urljoin
 
 import requests
 
-from rotkehlchen.accounting.structures.balance import Balance
 from rotkehlchen.assets.converters import asset_from_okx
 from rotkehlchen.constants import ZERO
 from rotkehlchen.errors.asset import UnknownAsset, UnsupportedAsset
@@ -18,8 +17,8 @@ from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.exchanges.data_structures import AssetMovement, MarginPosition, Trade
 from rotkehlchen.exchanges.exchange import ExchangeInterface, ExchangeQueryBalances
 from rotkehlchen.exchanges.utils import deserialize_asset_movement_address
+from rotkehlchen.fval import FVal
 from rotkehlchen.history.deserialization import deserialize_price
-from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import deserialize_asset_amount, deserialize_fee
 from rotkehlchen.types import (
@@ -245,7 +244,7 @@ class Okx(ExchangeInterface):
                 f'{self.name} balance API request failed due to unexpected response {msg}',
             ) from e
 
-        assets_balance: defaultdict[AssetWithOracles, Balance] = defaultdict(Balance)
+        amounts: defaultdict[AssetWithOracles, FVal] = defaultdict(FVal)
         for currency_data in currencies_data:
             try:
                 asset = asset_from_okx(okx_name=currency_data['ccy'])
@@ -262,15 +261,6 @@ class Okx(ExchangeInterface):
                 )
                 continue
 
-            try:
-                usd_price = Inquirer.find_usd_price(asset=asset)
-            except RemoteError as e:
-                self.msg_aggregator.add_error(
-                    f'Error processing {self.name} {asset.name} balance result due to inability '
-                    f'to query USD price: {e!s}. Skipping balance result.',
-                )
-                continue
-
             try:
                 amount = deserialize_asset_amount(currency_data['availBal']) + deserialize_asset_amount(currency_data['frozenBal'])  # noqa: E501
             except DeserializationError as e:
@@ -280,12 +270,9 @@ class Okx(ExchangeInterface):
                 )
                 continue
 
-            assets_balance[asset] += Balance(
-                amount=amount,
-                usd_value=amount * usd_price,
-            )
+            amounts[asset] += amount
 
-        return dict(assets_balance), ''
+        return self.balances_from_amounts(amounts), ''
 
     def query_online_trade_history(
             self,
@@ -10,7 +10,6 @@ from typing import TYPE_CHECKING, Any, Literal, NamedTuple, overload
 
 import requests
 
-from rotkehlchen.accounting.structures.balance import Balance
 from rotkehlchen.assets.asset import AssetWithOracles
 from rotkehlchen.assets.converters import asset_from_woo
 from rotkehlchen.constants import ZERO
@@ -25,8 +24,8 @@ from rotkehlchen.exchanges.data_structures import (
     TradeType,
 )
 from rotkehlchen.exchanges.exchange import ExchangeInterface, ExchangeQueryBalances
+from rotkehlchen.fval import FVal
 from rotkehlchen.history.deserialization import deserialize_price
-from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import (
     deserialize_asset_amount,
@@ -113,13 +112,12 @@ class Woo(ExchangeInterface):
             log.error(msg, response)
             raise RemoteError(msg) from e
 
-        assets_balance: defaultdict[AssetWithOracles, Balance] = defaultdict(Balance)
+        amounts: defaultdict[AssetWithOracles, FVal] = defaultdict(FVal)
         for entry in balances:
             try:
                 if (amount := deserialize_asset_amount(entry['holding'] + entry['staked'])) == ZERO:  # noqa: E501
                     continue
                 asset = asset_from_woo(entry['token'])
-                usd_price = Inquirer.find_usd_price(asset=asset)
             except (DeserializationError, KeyError) as e:
                 log.error('Error processing a Woo balance.', entry=entry, error=str(e))
                 self.msg_aggregator.add_error(
@@ -133,18 +131,10 @@ class Woo(ExchangeInterface):
                     details='balance query',
                 )
                 continue
-            except RemoteError as e:
-                self.msg_aggregator.add_error(
-                    f'Error processing Woo balance result due to inability to '
-                    f'query USD price: {e}. Skipping balance entry.',
-                )
-                continue
-            assets_balance[asset] += Balance(
-                amount=amount,
-                usd_value=amount * usd_price,
-            )
 
-        return dict(assets_balance), ''
+            amounts[asset] += amount
+
+        return self.balances_from_amounts(amounts), ''
 
     def _deserialize_trade(self, trade: dict[str, Any]) -> Trade:
         """
@@ -22,6 +22,8 @@ from rotkehlchen.db.settings import CachedSettings
 from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.externalapis.interface import ExternalServiceWithApiKey
+from rotkehlchen.globaldb.handler import GlobalDBHandler
+from rotkehlchen.globaldb.response_cache import CachedEndpoint
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import (
     deserialize_evm_transaction,
@@ -700,10 +702,20 @@ class Etherscan(ExternalServiceWithApiKey, ABC):
         if ts < self.earliest_ts:
             return 0  # etherscan does not handle timestamps close to genesis well
 
-        # check if value exists in the cache
+        # check if value exists in the memory cache and then in the on-disk cache
         if (block_number := self.timestamp_to_block_cache.get(ts)) is not None:
             return block_number
 
+        response_cache = GlobalDBHandler().response_cache
+        if (block_number := response_cache.get(
+            CachedEndpoint.BLOCKNUMBER_BY_TIME,
+            chain=self.chain.value,
+            ts=ts,
+            closest=closest,
+        )) is not None:
+            self.timestamp_to_block_cache.add(key=ts, value=block_number)
+            return block_number
+
         options = {'timestamp': ts, 'closest': closest}
         result = self._query(
             module='block',
@@ -719,6 +731,13 @@ class Etherscan(ExternalServiceWithApiKey, ABC):
             ) from e
 
         self.timestamp_to_block_cache.add(key=ts, value=number)
+        response_cache.set(
+            CachedEndpoint.BLOCKNUMBER_BY_TIME,
+            number,
+            chain=self.chain.value,
+            ts=ts,
+            closest=closest,
+        )
         return number
 
     def get_contract_creation_hash(self, address: ChecksumEvmAddress) -> EVMTxHash | None:
@@ -729,13 +748,30 @@ class Etherscan(ExternalServiceWithApiKey, ABC):
         May raise:
         - RemoteError in case of problems contacting etherscan.
         """
+        response_cache = GlobalDBHandler().response_cache
+        if (cached_hash := response_cache.get(
+            CachedEndpoint.CONTRACT_CREATION_HASH,
+            chain=self.chain.value,
+            address=address,
+        )) is not None:
+            return deserialize_evm_tx_hash(cached_hash)
+
         options = {'contractaddresses': address}
         result = self._query(
             module='contract',
             action='getcontractcreation',
             options=options,
         )
-        return deserialize_evm_tx_hash(result[0]['txHash']) if result is not None else None
+        if result is None:
+            return None
+
+        response_cache.set(
+            CachedEndpoint.CONTRACT_CREATION_HASH,
+            result[0]['txHash'],
+            chain=self.chain.value,
+            address=address,
+        )
+        return deserialize_evm_tx_hash(result[0]['txHash'])
 
     def get_contract_abi(self, address: ChecksumEvmAddress) -> str | None:
         """Get the contract abi from etherscan for the given address if verified.
@@ -745,6 +781,14 @@ class Etherscan(ExternalServiceWithApiKey, ABC):
         May raise:
         - RemoteError in case of problems contacting etherscan
         """
+        response_cache = GlobalDBHandler().response_cache
+        if (abi := response_cache.get(
+            CachedEndpoint.CONTRACT_ABI,
+            chain=self.chain.value,
+            address=address,
+        )) is not None:
+            return abi
+
         options = {'address': address}
         result = self._query(
             module='contract',
@@ -755,10 +799,13 @@ class Etherscan(ExternalServiceWithApiKey, ABC):
             return None
 
         try:
-            return json.loads(result)
+            abi = json.loads(result)
         except json.JSONDecodeError:
             return None
 
+        response_cache.set(CachedEndpoint.CONTRACT_ABI, abi, chain=self.chain.value, address=address)  # noqa: E501
+        return abi
+
     def _additional_transaction_processing(self, tx: EvmTransaction | EvmInternalTransaction) -> EvmTransaction | EvmInternalTransaction:  # noqa: E501
         """Performs additional processing on chain-specific tx attributes"""
         return tx
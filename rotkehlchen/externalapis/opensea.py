@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any, Final, Literal, NamedTuple
 import gevent
 import requests
 from eth_utils import to_checksum_address
+from gevent.lock import BoundedSemaphore
 
 from rotkehlchen.assets.asset import Asset
 from rotkehlchen.assets.utils import get_or_create_evm_token
@@ -37,6 +38,9 @@ if TYPE_CHECKING:
     from rotkehlchen.db.dbhandler import DBHandler
 
 ASSETS_MAX_LIMIT: Final = 50  # according to opensea docs
+# Maximum number of requests in flight to opensea. Keeps concurrent account queries
+# within the rate limit of the API
+MAX_CONCURRENT_OPENSEA_REQUESTS: Final = 3
 
 
 ERC721_RE: Final = re.compile(r'eip155:1/erc721:(.*?)/(.*)')
@@ -147,6 +151,7 @@ class Opensea(ExternalServiceWithApiKey):
         self.backup_key: str | None = None
         self.ethereum_inquirer = ethereum_inquirer
         self.eth_asset = ethereum_inquirer.native_token
+        self.requests_semaphore = BoundedSemaphore(MAX_CONCURRENT_OPENSEA_REQUESTS)
 
     def _query(
             self,
@@ -175,11 +180,12 @@ class Opensea(ExternalServiceWithApiKey):
         while backoff < backoff_limit:
             log.debug(f'Querying opensea: {query_str}')
             try:
-                response = self.session.get(
-                    query_str,
-                    params=options,
-                    timeout=timeout,
-                )
+                with self.requests_semaphore:
+                    response = self.session.get(
+                        query_str,
+                        params=options,
+                        timeout=timeout,
+                    )
             except requests.exceptions.RequestException as e:
                 raise RemoteError(
                     f'Opensea API request {query_str} failed due to {e!s}',
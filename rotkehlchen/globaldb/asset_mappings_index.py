@@ -0,0 +1,126 @@
+"""In-memory index of the asset collections and location asset mappings of the global DB
+
+Collections and exchange symbol mappings are looked up for every price query and every
+exchange asset deserialization, while they only change with asset updates or when the
+user edits them. This index loads them once and serves the lookups from memory.
+"""
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from gevent.lock import Semaphore
+
+from rotkehlchen.logging import RotkehlchenLogsAdapter
+
+if TYPE_CHECKING:
+    from rotkehlchen.db.drivers.gevent import DBConnection
+
+logger = logging.getLogger(__name__)
+log = RotkehlchenLogsAdapter(logger)
+
+
+class AssetMappingsIndex:
+    """Versioned in-memory copy of the asset_collections, multiasset_mappings,
+    location_asset_mappings and location_unsupported_assets tables
+
+    Every write to those tables has to call invalidate(), which bumps the version so
+    that the tables are loaded again at the next lookup. Reloads build new structures
+    and swap them at the end so lookups never see a partially loaded index.
+    """
+
+    def __init__(self, conn: 'DBConnection') -> None:
+        self.conn = conn
+        self.lock = Semaphore()
+        self.version = 0
+        self.loaded_version = -1
+        self.asset_collection: dict[str, int] = {}  # asset -> collection id
+        self.collection_main_asset: dict[int, str] = {}
+        self.collection_assets: dict[int, tuple[str, ...]] = {}
+        # exchange symbol -> (location, local id) in DB order. Location None applies to all.
+        self.location_mappings: dict[str, list[tuple[str | None, str]]] = {}
+        self.unsupported_assets: set[tuple[str, str]] = set()  # (location, exchange symbol)
+
+    def invalidate(self) -> None:
+        """Marks the index as outdated so that it's reloaded at the next lookup"""
+        self.version += 1
+
+    def _ensure_loaded(self) -> None:
+        if self.loaded_version == self.version:
+            return
+
+        with self.lock:
+            if self.loaded_version == self.version:
+                return  # was loaded while waiting for the lock
+
+            version = self.version
+            asset_collection: dict[str, int] = {}
+            collection_assets: defaultdict[int, list[str]] = defaultdict(list)
+            location_mappings: defaultdict[str, list[tuple[str | None, str]]] = defaultdict(list)
+            with self.conn.read_ctx() as cursor:
+                collection_main_asset: dict[int, str] = dict(cursor.execute(
+                    'SELECT id, main_asset FROM asset_collections',
+                ).fetchall())
+
+                for collection_id, asset in cursor.execute(
+                    'SELECT collection_id, asset FROM multiasset_mappings ORDER BY rowid',
+                ):
+                    asset_collection.setdefault(asset, collection_id)
+                    if collection_id in collection_main_asset:
+                        collection_assets[collection_id].append(asset)
+
+                for location, exchange_symbol, local_id in cursor.execute(
+                    'SELECT location, exchange_symbol, local_id FROM location_asset_mappings '
+                    'ORDER BY rowid',
+                ):
+                    location_mappings[exchange_symbol].append((location, local_id))
+
+                unsupported_assets = set(cursor.execute(
+                    'SELECT location, exchange_symbol FROM location_unsupported_assets',
+                ).fetchall())
+
+            self.collection_main_asset = collection_main_asset
+            self.asset_collection = asset_collection
+            self.collection_assets = {key: tuple(value) for key, value in collection_assets.items()}  # noqa: E501
+            self.location_mappings = dict(location_mappings)
+            self.unsupported_assets = unsupported_assets
+            self.loaded_version = version
+            log.debug(
+                f'Loaded asset mappings index v{version} with {len(collection_main_asset)} '
+                f'collections and {len(location_mappings)} location mapped symbols',
+            )
+
+    def get_collection_id(self, identifier: str) -> int | None:
+        self._ensure_loaded()
+        return self.asset_collection.get(identifier)
+
+    def get_collection_main_asset(self, identifier: str) -> str | None:
+        if (collection_id := self.get_collection_id(identifier)) is None:
+            return None
+
+        return self.collection_main_asset.get(collection_id)
+
+    def get_collection_assets(self, identifier: str) -> tuple[str, ...]:
+        """Returns the identifiers of all the assets in the collection of the given asset,
+        or an empty tuple if the asset is not in a collection."""
+        if (collection_id := self.get_collection_id(identifier)) is None:
+            return ()
+
+        return self.collection_assets.get(collection_id, ())
+
+    def asset_in_collection(self, collection_id: int, identifier: str) -> bool:
+        self._ensure_loaded()
+        return identifier in self.collection_assets.get(collection_id, ())
+
+    def get_location_mapping(self, location: str | None, exchange_symbol: str) -> str | None:
+        """Returns the local id of the exchange symbol either for the given serialized
+        location or for all locations. None if no mapping exists."""
+        self._ensure_loaded()
+        for mapping_location, local_id in self.location_mappings.get(exchange_symbol, []):
+            if mapping_location is None or mapping_location == location:
+                return local_id
+
+        return None
+
+    def is_unsupported(self, location: str, exchange_symbol: str) -> bool:
+        self._ensure_loaded()
+        return (location, exchange_symbol) in self.unsupported_assets
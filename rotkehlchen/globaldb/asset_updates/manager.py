@@ -1,13 +1,13 @@
 import logging
 import sqlite3
 from collections import defaultdict
-from contextlib import suppress
 from http import HTTPStatus
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Final, Literal
 
 import requests
+from gevent.pool import Pool
 
 from rotkehlchen.assets.asset import Asset
 from rotkehlchen.assets.resolver import AssetResolver
@@ -20,7 +20,7 @@ from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.globaldb.utils import initialize_globaldb
 from rotkehlchen.logging import RotkehlchenLogsAdapter
-from rotkehlchen.utils.misc import is_production
+from rotkehlchen.utils.misc import get_chunks, is_production
 from rotkehlchen.utils.network import query_file
 
 from .parsers import AssetCollectionParser, AssetParser, MultiAssetMappingsParser
@@ -40,6 +40,8 @@ ASSET_COLLECTIONS_UPDATES_URL = 'https://raw.githubusercontent.com/rotki/assets/
 ASSET_COLLECTIONS_MAPPINGS_UPDATES_URL = 'https://raw.githubusercontent.com/rotki/assets/{branch}/updates/{version}/asset_collections_mappings_updates.sql'
 FIRST_VERSION_WITH_COLLECTIONS = 16
 FIRST_GLOBAL_DB_VERSION_WITH_COLLECTIONS = 4
+MAX_CONCURRENT_UPDATE_DOWNLOADS: Final = 4
+ASSETS_LOOKUP_CHUNK_LENGTH: Final = 500
 
 
 def executeall(cursor: DBCursor, statements: str) -> None:
@@ -290,6 +292,7 @@ class AssetsUpdater:
             self,
             connection: 'DBConnection',
             remote_asset_data: AssetData,
+            local_asset: Asset | None,
             assets_conflicts: dict[Asset, Literal['remote', 'local']] | None,
             action: str,
             full_insert: str,
@@ -298,12 +301,11 @@ class AssetsUpdater:
         """
         Given the already processed information for an asset try to store it in the globaldb
         and if it is not possible due to conflicts mark it to resolve later.
-        """
-        local_asset: Asset | None = None
-        with suppress(UnknownAsset):
-            # we avoid querying the packaged db to prevent the copy of constant assets
-            local_asset = Asset(remote_asset_data.identifier).check_existence(query_packaged_db=False)  # noqa: E501
 
+        `local_asset` is the asset as it exists in the user's globaldb, or None if the
+        user doesn't have it. An asset the user doesn't have may still have been added
+        by an earlier entry of the update, in which case the newer remote entry replaces it.
+        """
         try:
             with connection.savepoint_ctx() as cursor:
                 # if the action is to update an asset, but it doesn't exist in the DB
@@ -321,7 +323,17 @@ class AssetsUpdater:
             if local_asset is None:
                 try:  # if asset is not known then simply do an insertion
                     with connection.savepoint_ctx() as cursor:
-                        executeall(cursor, full_insert)
+                        if cursor.execute(
+                            'SELECT COUNT(*) FROM assets WHERE identifier=?',
+                            (remote_asset_data.identifier,),
+                        ).fetchone()[0] == 0:
+                            executeall(cursor, full_insert)
+                        else:  # added by an earlier entry. Nothing local to conflict with
+                            _force_remote_asset(
+                                cursor=cursor,
+                                local_asset=Asset(remote_asset_data.identifier),
+                                full_insert=full_insert,
+                            )
                 except sqlite3.Error as e:
                     self.msg_aggregator.add_warning(
                         f'Failed to add asset {remote_asset_data.identifier} in the '
@@ -364,6 +376,59 @@ class AssetsUpdater:
             # always take the last one, if there is multiple conflicts for a single asset
             self.conflicts[local_asset.identifier] = (local_data, remote_asset_data)
 
+    def _get_local_assets(self, identifiers: list[str]) -> dict[str, Asset]:
+        """Find which of the given identifiers exist in the user's globaldb with a single
+        query per chunk instead of resolving them one by one. The update is applied to a
+        copy of the user's globaldb, so the result doesn't reflect the entries applied
+        before. Assets added by earlier entries of the update are handled when applying
+        each entry in `_handle_asset_update`.
+
+        Returns a mapping of lowercased identifier to the asset with normalized identifier.
+        We avoid querying the packaged db to prevent the copy of constant assets.
+        """
+        local_assets = {}
+        with self.globaldb.conn.read_ctx() as cursor:
+            for chunk in get_chunks(list(set(identifiers)), n=ASSETS_LOOKUP_CHUNK_LENGTH):
+                for (identifier,) in cursor.execute(
+                    f'SELECT identifier FROM assets WHERE identifier IN '
+                    f'({",".join(["?"] * len(chunk))})',
+                    chunk,
+                ):
+                    local_assets[identifier.lower()] = Asset(identifier)
+
+        return local_assets
+
+    def _parse_assets_batch(
+            self,
+            connection: 'DBConnection',
+            version: int,
+            entries: list[tuple[str, str]],
+    ) -> dict[int, AssetData]:
+        """Parse all the asset inserts of an update file before applying any of them.
+        Returns a mapping of the entry's index to the parsed data. Entries that fail to
+        deserialize are skipped and the user is warned about them."""
+        remote_assets_data = {}
+        for idx, (action, full_insert) in enumerate(entries):
+            if action.startswith('DELETE'):
+                continue
+
+            try:
+                remote_assets_data[idx] = self.asset_parser.parse(
+                    insert_text=full_insert,
+                    connection=connection,
+                    version=version,
+                )
+            except DeserializationError as e:
+                log.error(
+                    f'Failed to add asset with action {action} during update to v{version}',
+                )
+                self.msg_aggregator.add_warning(
+                    f'Skipping entry during assets update to v{version} due '
+                    f'to a deserialization error. {e!s}',
+                )
+
+        return remote_assets_data
+
     def _apply_single_version_update(
             self,
             connection: 'DBConnection',
@@ -376,13 +441,17 @@ class AssetsUpdater:
         Process the queried file and apply special rules depending on the type of file
         (assets updates, collections updates or mappings updates) set in update_file_type.
 
+        Assets are parsed in one batch and checked for conflicts against the user's globaldb
+        with a set based query. All the entries of the file are then applied in a single
+        transaction, each one in its own savepoint so a failing entry doesn't affect the rest.
+
         If conflicts appear while processing the assets those are handled. Deserialization
         errors are caught and the user is warned about them.
         """
+        entries: list[tuple[str, str]] = []
         lines = [x for x in text.splitlines() if x.strip() != '']
         try:  # strip() check above is to remove empty lines (say trailing newline in the file
             for action_raw, full_insert_raw in zip(*[iter(lines)] * 2, strict=True):
-
                 action: str = action_raw.strip()
                 if (full_insert := full_insert_raw.strip()) == '*':
                     full_insert = action
@@ -391,9 +460,30 @@ class AssetsUpdater:
                 # with double quotes we need to replace them here
                 # https://github.com/rotki/rotki/issues/6368
                 # TODO: Get rid of all those
-                full_insert = self.asset_parser.standardize_quotes(full_insert)
-                action = self.asset_parser.standardize_quotes(action)
+                entries.append((
+                    self.asset_parser.standardize_quotes(action),
+                    self.asset_parser.standardize_quotes(full_insert),
+                ))
+        except ValueError:
+            self.msg_aggregator.add_error(
+                f'Last entry of update {update_file_type} has an odd number of '
+                f'lines. Skipping. Report this to the developers',
+            )
 
+        remote_assets_data: dict[int, AssetData] = {}
+        local_assets: dict[str, Asset] = {}
+        if update_file_type == UpdateFileType.ASSETS:
+            remote_assets_data = self._parse_assets_batch(
+                connection=connection,
+                version=version,
+                entries=entries,
+            )
+            local_assets = self._get_local_assets(
+                identifiers=[x.identifier for x in remote_assets_data.values()],
+            )
+
+        with connection.write_ctx() as write_cursor:
+            for idx, (action, full_insert) in enumerate(entries):
                 if (
                     (update_file_type in (  # handle update/delete for collections
                         UpdateFileType.ASSET_COLLECTIONS_MAPPINGS,
@@ -402,8 +492,8 @@ class AssetsUpdater:
                     (update_file_type == UpdateFileType.ASSETS and action.startswith('DELETE'))  # handle deleting assets  # noqa: E501
                 ):
                     try:
-                        with connection.write_ctx() as write_cursor:
-                            executeall(write_cursor, action)
+                        with connection.savepoint_ctx() as cursor:
+                            executeall(cursor, action)
                     except sqlite3.Error as e:
                         log.error(
                             f'Failed to apply update/delete statement {action} from '
@@ -411,26 +501,11 @@ class AssetsUpdater:
                         )
 
                 elif update_file_type == UpdateFileType.ASSETS:  # update or insert assets
-                    remote_asset_data = None
-                    try:
-                        remote_asset_data = self.asset_parser.parse(
-                            insert_text=full_insert,
-                            connection=connection,
-                            version=version,
-                        )
-                    except DeserializationError as e:
-                        log.error(
-                            f'Failed to add asset with action {action} during update to v{version}',  # noqa: E501
-                        )
-                        self.msg_aggregator.add_warning(
-                            f'Skipping entry during assets update to v{version} due '
-                            f'to a deserialization error. {e!s}',
-                        )
-
-                    if remote_asset_data is not None:
+                    if (remote_asset_data := remote_assets_data.get(idx)) is not None:
                         self._handle_asset_update(
                             connection=connection,
                             remote_asset_data=remote_asset_data,
+                            local_asset=local_assets.get(remote_asset_data.identifier.lower()),
                             assets_conflicts=assets_conflicts,
                             action=action,
                             full_insert=full_insert,
@@ -467,17 +542,12 @@ class AssetsUpdater:
                         self.msg_aggregator.add_warning(
                             f'Tried to add unknown asset {e.identifier} to collection of assets. Skipping',  # noqa: E501
                         )
-        except ValueError:
-            self.msg_aggregator.add_error(
-                f'Last entry of update {update_file_type} has an odd number of '
-                f'lines. Skipping. Report this to the developers',
-            )
 
-        # at the very end update the current version in the DB
-        connection.execute(
-            'INSERT OR REPLACE INTO settings(name, value) VALUES(?, ?)',
-            (ASSETS_VERSION_KEY, str(version)),
-        )
+            # at the very end update the current version in the DB
+            write_cursor.execute(
+                'INSERT OR REPLACE INTO settings(name, value) VALUES(?, ?)',
+                (ASSETS_VERSION_KEY, str(version)),
+            )
 
     def perform_update(
             self,
@@ -548,6 +618,7 @@ class AssetsUpdater:
                 # now move the data to the actual global DB
                 log.info('Finishing assets update. Replacing users globaldb with the updated information')  # noqa: E501
                 _replace_assets_from_db(self.globaldb.conn, tmpdir / temp_db_name)
+                self.globaldb.invalidate_asset_indices()
 
         return None
 
@@ -625,11 +696,12 @@ class AssetsUpdater:
         """
         Query the assets update repository to retrieve the pending updates before trying to
         apply them. It returns a dict that maps each version to their update files.
+        The files of all the pending versions are downloaded concurrently.
 
         May raise:
         - RemoteError if there is a problem querying github
         """
-        updates = {}
+        urls: dict[tuple[int, UpdateFileType], str] = {}
         target_version = min(up_to_version, self.last_remote_checked_version) if up_to_version else self.last_remote_checked_version   # noqa: E501
         # type ignore since due to check_for_updates we know last_remote_checked_version exists
         for version in range(self.local_assets_version + 1, target_version + 1):
@@ -659,23 +731,20 @@ class AssetsUpdater:
                 )
                 continue
 
-            assets_url = ASSETS_UPDATES_URL.format(branch=self.branch, version=version)
-            asset_collections_url = ASSET_COLLECTIONS_UPDATES_URL.format(branch=self.branch, version=version)  # noqa: E501
-            asset_collections_mappings_url = ASSET_COLLECTIONS_MAPPINGS_UPDATES_URL.format(branch=self.branch, version=version)  # noqa: E501
-
-            assets_file = self._fetch_single_update_file(url=assets_url)
-
+            urls[version, UpdateFileType.ASSETS] = ASSETS_UPDATES_URL.format(branch=self.branch, version=version)  # noqa: E501
             if version >= FIRST_VERSION_WITH_COLLECTIONS:
-                asset_collections_file = self._fetch_single_update_file(url=asset_collections_url)
-                asset_collections_mappings_file = self._fetch_single_update_file(url=asset_collections_mappings_url)  # noqa: E501
-            else:
-                asset_collections_file, asset_collections_mappings_file = '', ''
+                urls[version, UpdateFileType.ASSET_COLLECTIONS] = ASSET_COLLECTIONS_UPDATES_URL.format(branch=self.branch, version=version)  # noqa: E501
+                urls[version, UpdateFileType.ASSET_COLLECTIONS_MAPPINGS] = ASSET_COLLECTIONS_MAPPINGS_UPDATES_URL.format(branch=self.branch, version=version)  # noqa: E501
+
+        pool = Pool(size=MAX_CONCURRENT_UPDATE_DOWNLOADS)
+        try:
+            files = pool.map(self._fetch_single_update_file, urls.values())
+        finally:
+            pool.kill()
 
-            updates[version] = {
-                UpdateFileType.ASSETS: assets_file,
-                UpdateFileType.ASSET_COLLECTIONS: asset_collections_file,
-                UpdateFileType.ASSET_COLLECTIONS_MAPPINGS: asset_collections_mappings_file,
-            }
+        updates: dict[int, dict[UpdateFileType, str]] = {}
+        for (version, update_file_type), update_file in zip(urls, files, strict=True):
+            updates.setdefault(version, dict.fromkeys(UpdateFileType, ''))[update_file_type] = update_file  # noqa: E501
 
         return updates
 
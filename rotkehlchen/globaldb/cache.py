@@ -36,6 +36,40 @@ def base_pool_tokens_key_length(chain_id: ChainID) -> int:
     return len(compute_cache_key([CacheType.CURVE_POOL_TOKENS, str(chain_id.serialize_for_db()), ZERO_ADDRESS]))  # noqa: E501
 
 
+def _cache_version_setting_name(cache_type: CacheType) -> str:
+    return f'cache_version_{cache_type.serialize()}'
+
+
+def globaldb_bump_cache_version(
+        write_cursor: DBCursor,
+        key_parts: Iterable[str | CacheType],
+) -> None:
+    """Bumps the version of the cache type of the given key. The version is stored in the
+    settings table and lets readers of the cache, such as the decoders, know whether they
+    need to read the cache again. Has to be called for every modification of the cache."""
+    for part in key_parts:
+        if isinstance(part, CacheType):
+            write_cursor.execute(
+                'INSERT INTO settings(name, value) VALUES(?, 1) ON CONFLICT(name) '
+                'DO UPDATE SET value=CAST(value AS INTEGER) + 1',
+                (_cache_version_setting_name(part),),
+            )
+            return
+
+
+def globaldb_get_cache_versions(
+        cursor: DBCursor,
+        cache_types: tuple[CacheType, ...],
+) -> tuple[int, ...]:
+    """Returns the versions of the given cache types. 0 for never modified caches"""
+    names = [_cache_version_setting_name(cache_type) for cache_type in cache_types]
+    versions = dict(cursor.execute(
+        f'SELECT name, value FROM settings WHERE name IN ({",".join("?" * len(names))})',
+        names,
+    ).fetchall())
+    return tuple(int(versions.get(name, 0)) for name in names)
+
+
 def globaldb_set_general_cache_values_at_ts(
         write_cursor: DBCursor,
         key_parts: Iterable[str | GeneralCacheType],
@@ -44,13 +78,18 @@ def globaldb_set_general_cache_values_at_ts(
 ) -> None:
     """Function to update the general cache in globaldb. Inserts all values paired
     with the cache key. If any entry exists, overwrites it."""
+    key_parts = tuple(key_parts)
     cache_key = compute_cache_key(key_parts)
     tuples = [(cache_key, value, timestamp) for value in values]
+    if len(tuples) == 0:
+        return
+
     write_cursor.executemany(
         'INSERT OR REPLACE INTO general_cache '
         '(key, value, last_queried_ts) VALUES (?, ?, ?)',
         tuples,
     )
+    globaldb_bump_cache_version(write_cursor=write_cursor, key_parts=key_parts)
 
 
 def globaldb_set_general_cache_values(
@@ -77,6 +116,7 @@ def globaldb_delete_general_cache_values(
     Delete an entry from the general_cache. If a list of values is provided it deletes
     the rows that contain any of the provided values and have the provided key.
     """
+    key_parts = tuple(key_parts)
     query = 'DELETE FROM general_cache WHERE key=?'
     bindings = [compute_cache_key(key_parts)]
 
@@ -84,7 +124,8 @@ def globaldb_delete_general_cache_values(
         query += f' AND value IN ({",".join("?" * len(values))})'
         bindings.extend(values)
 
-    write_cursor.execute(query, bindings)
+    if write_cursor.execute(query, bindings).rowcount != 0:
+        globaldb_bump_cache_version(write_cursor=write_cursor, key_parts=key_parts)
 
 
 def globaldb_get_general_cache_values(
@@ -117,12 +158,13 @@ def globaldb_set_unique_cache_value_at_ts(
 ) -> None:
     """Function that updates the unique cache in globaldb. Inserts the value paired with the
     cache key. If any entry exists, overwrites it."""
-    cache_key = compute_cache_key(key_parts)
+    key_parts = tuple(key_parts)
     write_cursor.execute(
         'INSERT OR REPLACE INTO unique_cache '
         '(key, value, last_queried_ts) VALUES (?, ?, ?)',
-        (cache_key, value, timestamp),
+        (compute_cache_key(key_parts), value, timestamp),
     )
+    globaldb_bump_cache_version(write_cursor=write_cursor, key_parts=key_parts)
 
 
 def globaldb_set_unique_cache_value(
@@ -2,7 +2,7 @@ import logging
 import shutil
 import sqlite3
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal, Optional, cast, overload
+from typing import TYPE_CHECKING, Any, Final, Literal, Optional, cast, overload
 
 from gevent.lock import Semaphore
 
@@ -48,22 +48,29 @@ from rotkehlchen.types import (
     Price,
     Timestamp,
 )
-from rotkehlchen.utils.misc import timestamp_to_date, ts_now
+from rotkehlchen.utils.misc import get_chunks, timestamp_to_date, ts_now
 from rotkehlchen.utils.serialization import (
     deserialize_asset_with_oracles_from_db,
     deserialize_generic_asset_from_db,
 )
 
+from .asset_mappings_index import AssetMappingsIndex
+from .response_cache import RESPONSE_CACHE_NAME, ResponseCache
+from .search_index import AssetsSearchIndex
 from .upgrades.manager import configure_globaldb
 from .utils import GLOBAL_DB_VERSION, globaldb_get_setting_value, initialize_globaldb
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from rotkehlchen.db.dbhandler import DBHandler
     from rotkehlchen.db.filtering import AssetsFilterQuery, LocationAssetMappingsFilterQuery
     from rotkehlchen.user_messages import MessagesAggregator
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
+# maximum number of token addresses bound in a single query to stay below sqlite's variables limit
+TOKENS_LOOKUP_CHUNK_LENGTH: Final = 500
 
 
 _ALL_ASSETS_TABLES_JOINS = """
@@ -91,6 +98,9 @@ class GlobalDBHandler:
     _packaged_db_conn: DBConnection | None = None
     conn: DBConnection
     used_backup: bool  # specifies if the global DB was restored from a backup
+    response_cache: ResponseCache
+    assets_search_index: AssetsSearchIndex
+    asset_mappings_index: AssetMappingsIndex
     packaged_db_lock: Semaphore
     msg_aggregator: 'MessagesAggregator | None' = None
 
@@ -138,6 +148,9 @@ class GlobalDBHandler:
             sql_vm_instructions_cb=sql_vm_instructions_cb,
         )
         GlobalDBHandler.__instance.packaged_db_lock = Semaphore()
+        GlobalDBHandler.__instance.response_cache = ResponseCache(path=global_dir / RESPONSE_CACHE_NAME)  # noqa: E501
+        GlobalDBHandler.__instance.assets_search_index = AssetsSearchIndex()
+        GlobalDBHandler.__instance.asset_mappings_index = AssetMappingsIndex(GlobalDBHandler.__instance.conn)  # noqa: E501
 
         # initialise the asset resolver here since asset updater class might require it.
         AssetResolver(globaldb=GlobalDBHandler.__instance, constant_assets=CONSTANT_ASSETS)
@@ -156,9 +169,20 @@ class GlobalDBHandler:
 
     def cleanup(self) -> None:
         self.conn.close()
+        self.response_cache.close()
         if self._packaged_db_conn is not None:
             self._packaged_db_conn.close()
 
+    def invalidate_asset_indices(self) -> None:
+        """Invalidates the in-memory asset indices after bulk modifications of the assets"""
+        self.assets_search_index.invalidate()
+        self.asset_mappings_index.invalidate()
+
+    def build_assets_search_index(self) -> None:
+        """Builds the in-memory assets search index so that the first search is fast"""
+        with self.conn.read_ctx() as cursor:
+            self.assets_search_index.ensure_updated(cursor)
+
     @staticmethod
     def packaged_db_conn() -> DBConnection:
         """Return a DBConnection instance for the packaged global db."""
@@ -251,6 +275,8 @@ class GlobalDBHandler:
             raise InputError(
                 f'Failed to add asset {asset.identifier} into the assets table due to {e!s}',
             ) from e
+        finally:
+            GlobalDBHandler().assets_search_index.mark_dirty(asset.identifier)
 
     @staticmethod
     def retrieve_assets(userdb: 'DBHandler', filter_query: 'AssetsFilterQuery') -> tuple[list[dict[str, Any]], int]:  # noqa: E501
@@ -696,6 +722,7 @@ class GlobalDBHandler:
                         'VALUES(?, ?, ?, ?, ?, ?, ?)',
                         (asset_id, None, None, '', None, None, None),
                     )
+                    GlobalDBHandler().assets_search_index.mark_dirty(asset_id)
                 except sqlite3.IntegrityError as e:
                     raise InputError(
                         f'Failed to add underlying tokens for {parent_token_identifier} '
@@ -853,11 +880,13 @@ class GlobalDBHandler:
             chain_id: ChainID,
             exceptions: set[ChecksumEvmAddress],
             protocol: str | None = None,
+            addresses: 'Collection[ChecksumEvmAddress] | None' = None,
     ) -> list[EvmTokenDetectionData]:
         """Query EVM token data from the database for token detection.
 
         Retrieves basic token information including identifier, address, and decimals.
-        Tokens in the exceptions set are excluded from results. If a token doesn't have
+        Tokens in the exceptions set are excluded from results. If addresses is given only
+        the tokens with those addresses are returned. If a token doesn't have
         decimals we default to 18.
         """
         result = []
@@ -867,17 +896,24 @@ class GlobalDBHandler:
             query += ' AND protocol=?'
             bindings.append(protocol)
 
+        queries: list[tuple[str, list[int | str]]] = [(query, bindings)]
+        if addresses is not None:
+            queries = [
+                (f'{query} AND address IN ({",".join("?" * len(chunk))})', [*bindings, *chunk])
+                for chunk in get_chunks(list(addresses), n=TOKENS_LOOKUP_CHUNK_LENGTH)
+            ]
+
         with GlobalDBHandler().conn.read_ctx() as cursor:
-            cursor.execute(query, bindings)
-            for identifier, address, decimals in cursor:
-                if address in exceptions:
-                    continue
+            for chunk_query, chunk_bindings in queries:
+                for identifier, address, decimals in cursor.execute(chunk_query, chunk_bindings):
+                    if address in exceptions:
+                        continue
 
-                result.append(EvmTokenDetectionData(
-                    identifier=identifier,
-                    address=address,
-                    decimals=decimals if decimals is not None else DEFAULT_TOKEN_DECIMALS,  # TODO: at least two tokens are missing the decimals in my DB and also the EvmToken class allows decimals to be None. We need to think if that is correct and if we should enforce or not for all the erc20s to have decimals.  # noqa: E501
-                ))
+                    result.append(EvmTokenDetectionData(
+                        identifier=identifier,
+                        address=address,
+                        decimals=decimals if decimals is not None else DEFAULT_TOKEN_DECIMALS,  # TODO: at least two tokens are missing the decimals in my DB and also the EvmToken class allows decimals to be None. We need to think if that is correct and if we should enforce or not for all the erc20s to have decimals.  # noqa: E501
+                    ))
 
         return result
 
@@ -1018,6 +1054,7 @@ class GlobalDBHandler:
             ) from e
 
         AssetResolver.clean_memory_cache(entry.identifier)
+        GlobalDBHandler().assets_search_index.mark_dirty(entry.identifier)
         return rotki_id
 
     @staticmethod
@@ -1093,6 +1130,8 @@ class GlobalDBHandler:
                     f'due to a constraint being hit. Make sure the new values are valid.',
                 ) from e
 
+        GlobalDBHandler().assets_search_index.mark_dirty(asset.identifier)
+
     @staticmethod
     def add_user_owned_assets(assets: list['Asset']) -> None:
         """Make sure all assets in the list are included in the user owned assets
@@ -1125,6 +1164,9 @@ class GlobalDBHandler:
                     f'but it was not found in the DB',
                 )
 
+        GlobalDBHandler().assets_search_index.mark_dirty(identifier)
+        GlobalDBHandler().asset_mappings_index.invalidate()  # deletion cascades to the mappings
+
     @staticmethod
     def get_assets_with_symbol(
             symbol: str,
@@ -1661,6 +1703,7 @@ class GlobalDBHandler:
                     with self.conn.critical_section_and_transaction_lock():
                         read_cursor.execute("DETACH DATABASE 'clean_db';")
 
+        self.invalidate_asset_indices()
         return True, ''
 
     def soft_reset_assets_list(self) -> tuple[bool, str]:
@@ -1718,6 +1761,7 @@ class GlobalDBHandler:
                 with self.conn.transaction_lock, self.conn.read_ctx() as read_cursor:
                     read_cursor.execute("DETACH DATABASE 'clean_db';")
 
+        self.invalidate_asset_indices()
         return True, ''
 
     @staticmethod
@@ -1897,25 +1941,14 @@ class GlobalDBHandler:
         TODO: There's still a need for hierarchical collections
         https://github.com/rotki/rotki/issues/8639
         """
-        with GlobalDBHandler().conn.read_ctx() as cursor:
-            cursor.execute(
-               'SELECT ac.main_asset FROM asset_collections AS ac '
-               'INNER JOIN multiasset_mappings AS mm ON mm.collection_id = ac.id '
-               'WHERE mm.asset = ?',
-               (identifier,),
-            )
-            result = cursor.fetchone()
-
-        return result[0] if result is not None else None
+        return GlobalDBHandler().asset_mappings_index.get_collection_main_asset(identifier)
 
     @staticmethod
     def asset_in_collection(collection_id: int, asset_id: str) -> bool:
-        with GlobalDBHandler().conn.read_ctx() as cursor:
-            cursor.execute(
-                'SELECT COUNT(*) FROM multiasset_mappings WHERE collection_id=? AND asset=?',
-                (collection_id, asset_id),
-            )
-            return cursor.fetchone()[0] == 1
+        return GlobalDBHandler().asset_mappings_index.asset_in_collection(
+            collection_id=collection_id,
+            identifier=asset_id,
+        )
 
     @staticmethod
     def get_or_write_abi(serialized_abi: str, abi_name: str | None = None) -> int:
@@ -1946,15 +1979,10 @@ class GlobalDBHandler:
         Query the assets that belong to the collection of the queried asset. If the
         asset isn't in any collection we return a list with the asset queried.
         """
-        with GlobalDBHandler().conn.read_ctx() as cursor:
-            cursor.execute(
-                'SELECT MM.asset FROM multiasset_mappings AS MM JOIN asset_collections AS AC '
-                'ON MM.collection_id = AC.id WHERE MM.collection_id = (SELECT collection_id '
-                'FROM multiasset_mappings WHERE asset=?)',
-                (identifier,),
-            )
-            collection_assets = tuple(Asset(row[0]) for row in cursor)
-
+        collection_assets = tuple(
+            Asset(asset_id) for asset_id in
+            GlobalDBHandler().asset_mappings_index.get_collection_assets(identifier)
+        )
         if len(collection_assets) == 0:
             return (Asset(identifier),)
 
@@ -1965,23 +1993,13 @@ class GlobalDBHandler:
         """Returns the asset's identifier from the ticker symbol of the given exchange according to
         location_asset_mappings table. Use exchange=None to get the common id for all exchanges.
         If the mapping is not present returns default."""
-        with GlobalDBHandler().conn.read_ctx() as cursor:
-            if exchange is not None and cursor.execute(
-                'SELECT COUNT(*) FROM location_unsupported_assets WHERE location=? AND exchange_symbol=?',  # noqa: E501
-                (exchange.serialize_for_db(), symbol),
-            ).fetchone()[0] > 0:
-                raise UnsupportedAsset(symbol)
-
-            location_filter, bindings = '', [symbol]
-            if exchange is not None:
-                location_filter = 'location IS ? OR'
-                bindings.append(exchange.serialize_for_db())
-            identifier = cursor.execute(
-                f'SELECT local_id FROM location_asset_mappings WHERE exchange_symbol=? AND ({location_filter} location IS NULL)',  # noqa: E501
-                bindings,
-            ).fetchone()
+        mappings_index = GlobalDBHandler().asset_mappings_index
+        location = None if exchange is None else exchange.serialize_for_db()
+        if location is not None and mappings_index.is_unsupported(location, symbol):
+            raise UnsupportedAsset(symbol)
 
-        return default if identifier is None else identifier[0]
+        identifier = mappings_index.get_location_mapping(location=location, exchange_symbol=symbol)
+        return default if identifier is None else identifier
 
     @staticmethod
     def query_location_asset_mappings(
@@ -2046,6 +2064,8 @@ class GlobalDBHandler:
                     else:
                         raise InputError(error_msg) from e
 
+        GlobalDBHandler().asset_mappings_index.invalidate()
+
     @staticmethod
     def update_location_asset_mappings(
             entries: list[LocationAssetMappingUpdateEntry],
@@ -2075,6 +2095,8 @@ class GlobalDBHandler:
                     else:
                         raise InputError(error_msg)
 
+        GlobalDBHandler().asset_mappings_index.invalidate()
+
     @staticmethod
     def delete_location_asset_mappings(
             entries: list[LocationAssetMappingDeleteEntry],
@@ -2103,14 +2125,15 @@ class GlobalDBHandler:
                     else:
                         raise InputError(error_msg)
 
+        GlobalDBHandler().asset_mappings_index.invalidate()
+
     @staticmethod
     def is_asset_symbol_unsupported(location: 'Location', asset_symbol: str) -> bool:
         """Returns if the asset with the given symbol is not supported in the given location."""
-        with GlobalDBHandler().conn.read_ctx() as cursor:
-            return cursor.execute(
-                'SELECT COUNT(*) FROM location_unsupported_assets WHERE location=? AND exchange_symbol=?',  # noqa: E501
-                (location.serialize_for_db(), asset_symbol),
-            ).fetchone()[0] > 0
+        return GlobalDBHandler().asset_mappings_index.is_unsupported(
+            location=location.serialize_for_db(),
+            exchange_symbol=asset_symbol,
+        )
 
     @staticmethod
     def get_protocol_for_asset(asset_identifier: str) -> str | None:
@@ -0,0 +1,187 @@
+"""On-disk cache for responses of remote queries whose result can never change
+
+Things like the timestamp of a finalized block, the block closest to a past timestamp,
+the creation transaction of a contract or a verified contract's ABI are the same every
+time we ask for them. This cache keeps them in a small sqlite file next to the global DB
+so that they survive restarts and don't need to be re-fetched after each one.
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+from collections import defaultdict
+from collections.abc import Callable
+from enum import Enum, auto
+from pathlib import Path
+from typing import Any, Final
+
+from rotkehlchen.constants.timing import HOUR_IN_SECONDS
+from rotkehlchen.logging import RotkehlchenLogsAdapter
+from rotkehlchen.utils.misc import ts_now
+
+logger = logging.getLogger(__name__)
+log = RotkehlchenLogsAdapter(logger)
+
+RESPONSE_CACHE_NAME: Final = 'response_cache.db'
+RESPONSE_CACHE_MAX_SIZE: Final = 128 * 1024 * 1024  # 128 MB
+# When the cache exceeds its max size entries are evicted until this fraction is reached
+RESPONSE_CACHE_EVICTION_TARGET: Final = 0.9
+RESPONSE_CACHE_EVICTION_BATCH: Final = 500
+# Data younger than this may still be affected by reorgs so it's never persisted
+FINALITY_MARGIN_SECS: Final = HOUR_IN_SECONDS
+
+DB_CREATE_RESPONSES = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT NOT NULL PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_access INTEGER NOT NULL
+);
+"""
+DB_CREATE_LAST_ACCESS_INDEX = 'CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access);'  # noqa: E501
+
+
+class CachedEndpoint(Enum):
+    """Remote queries whose responses can be stored in the response cache"""
+    BLOCK_TIMESTAMP = auto()
+    BLOCKNUMBER_BY_TIME = auto()
+    CONTRACT_CREATION_HASH = auto()
+    CONTRACT_ABI = auto()
+
+
+def _is_final_timestamp(timestamp: int) -> bool:
+    return timestamp <= ts_now() - FINALITY_MARGIN_SECS
+
+
+# Per endpoint rules deciding if a (params, result) pair is immutable and can be persisted.
+# None results are never persisted since they usually mean "not yet" (e.g. unverified ABI).
+IMMUTABILITY_RULES: Final[dict[CachedEndpoint, Callable[[dict[str, Any], Any], bool]]] = {
+    CachedEndpoint.BLOCK_TIMESTAMP: lambda _params, result: _is_final_timestamp(result),
+    CachedEndpoint.BLOCKNUMBER_BY_TIME: lambda params, _result: _is_final_timestamp(params['ts']),
+    CachedEndpoint.CONTRACT_CREATION_HASH: lambda _params, _result: True,
+    CachedEndpoint.CONTRACT_ABI: lambda _params, _result: True,
+}
+
+
+def compute_response_key(endpoint: CachedEndpoint, params: dict[str, Any]) -> str:
+    """Normalizes the request to a deterministic content addressed key"""
+    normalized = json.dumps({'endpoint': endpoint.name, **params}, sort_keys=True)
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+class ResponseCache:
+    """A size bounded LRU cache of immutable remote responses stored on disk
+
+    Values need to be json serializable. The cache is not encrypted since it only
+    contains public chain data. There are no greenlet switches inside the sqlite calls
+    so the connection can be shared without a lock.
+    """
+
+    def __init__(self, path: Path, max_size: int = RESPONSE_CACHE_MAX_SIZE) -> None:
+        self.path = path
+        self.max_size = max_size
+        self.hits: defaultdict[CachedEndpoint, int] = defaultdict(int)
+        self.misses: defaultdict[CachedEndpoint, int] = defaultdict(int)
+        self.conn = self._connect()
+        self.total_size: int = self.conn.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM responses',
+        ).fetchone()[0]
+
+    def _connect(self) -> sqlite3.Connection:
+        """Opens the cache file. If it is corrupt it's simply recreated since all
+        its contents can be queried again."""
+        try:
+            return self._open()
+        except sqlite3.DatabaseError as e:
+            log.error(f'Response cache at {self.path} is unreadable due to {e!s}. Recreating it')
+            self.path.unlink(missing_ok=True)
+            return self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL;')
+        conn.execute(DB_CREATE_RESPONSES)
+        conn.execute(DB_CREATE_LAST_ACCESS_INDEX)
+        return conn
+
+    def get(self, endpoint: CachedEndpoint, **params: Any) -> Any | None:
+        """Returns the cached value for the given request or None if not cached"""
+        key = compute_response_key(endpoint, params)
+        if (result := self.conn.execute(
+            'SELECT value FROM responses WHERE key=?', (key,),
+        ).fetchone()) is None:
+            self.misses[endpoint] += 1
+            return None
+
+        self.hits[endpoint] += 1
+        self.conn.execute('UPDATE responses SET last_access=? WHERE key=?', (ts_now(), key))
+        return json.loads(result[0])
+
+    def set(self, endpoint: CachedEndpoint, value: Any, **params: Any) -> None:
+        """Stores the value for the given request if the endpoint's rules consider it
+        immutable. Evicts least recently used entries if the size bound is exceeded."""
+        if value is None or IMMUTABILITY_RULES[endpoint](params, value) is False:
+            return
+
+        key = compute_response_key(endpoint, params)
+        serialized = json.dumps(value)
+        size = len(key) + len(serialized)
+        if (previous := self.conn.execute(
+            'SELECT size FROM responses WHERE key=?', (key,),
+        ).fetchone()) is not None:
+            self.total_size -= previous[0]
+
+        self.conn.execute(
+            'INSERT OR REPLACE INTO responses(key, endpoint, value, size, last_access) '
+            'VALUES(?, ?, ?, ?, ?)',
+            (key, endpoint.name, serialized, size, ts_now()),
+        )
+        self.total_size += size
+        if self.total_size > self.max_size:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Deletes least recently used entries until the eviction target size is reached"""
+        target = int(self.max_size * RESPONSE_CACHE_EVICTION_TARGET)
+        evicted = 0
+        while self.total_size > target:
+            rows = self.conn.execute(
+                'SELECT key, size FROM responses ORDER BY last_access ASC LIMIT ?',
+                (RESPONSE_CACHE_EVICTION_BATCH,),
+            ).fetchall()
+            if len(rows) == 0:
+                self.total_size = 0
+                break
+
+            to_delete = []
+            for key, size in rows:
+                to_delete.append((key,))
+                self.total_size -= size
+                if self.total_size <= target:
+                    break
+
+            self.conn.executemany('DELETE FROM responses WHERE key=?', to_delete)
+            evicted += len(to_delete)
+
+        log.debug(f'Evicted {evicted} entries from the response cache')
+
+    def stats(self) -> dict[str, Any]:
+        """Returns the size of the cache and the hit/miss counters per endpoint"""
+        return {
+            'entries': self.conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0],
+            'size': self.total_size,
+            'max_size': self.max_size,
+            'endpoints': {
+                endpoint.name: {'hits': self.hits[endpoint], 'misses': self.misses[endpoint]}
+                for endpoint in CachedEndpoint
+            },
+        }
+
+    def clear(self) -> None:
+        self.conn.execute('DELETE FROM responses')
+        self.total_size = 0
+
+    def close(self) -> None:
+        log.debug(f'Closing response cache. Stats: {self.stats()}')
+        self.conn.close()
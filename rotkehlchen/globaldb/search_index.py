@@ -0,0 +1,185 @@
+"""In-memory index of the global DB assets used by the levenshtein asset search
+
+Scanning all the assets tables with a LIKE filter for each keystroke of the user is slow
+for big global DBs. This index keeps the few columns the search needs in memory together
+with a trigram index over the casefolded name and symbol and a mapping of addresses to
+assets so that only a handful of candidates need to be checked for each search.
+"""
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+from gevent.lock import Semaphore
+
+from rotkehlchen.logging import RotkehlchenLogsAdapter
+from rotkehlchen.utils.misc import get_chunks
+
+if TYPE_CHECKING:
+    from rotkehlchen.db.drivers.gevent import DBCursor
+    from rotkehlchen.types import ChainID, ChecksumEvmAddress
+
+logger = logging.getLogger(__name__)
+log = RotkehlchenLogsAdapter(logger)
+
+TRIGRAM_SIZE: Final = 3
+# When more than this fraction of the indexed entries are stale, or about to be due to
+# pending changes, the index is rebuilt
+STALE_ENTRIES_REBUILD_RATIO: Final = 0.2
+DIRTY_ENTRIES_CHUNK_LENGTH: Final = 500
+
+ASSETS_SEARCH_INDEX_QUERY: Final = """
+SELECT assets.identifier, name, symbol, chain, assets.type, custom_assets.type, address
+FROM assets LEFT JOIN common_asset_details on assets.identifier=common_asset_details.identifier
+LEFT JOIN evm_tokens ON evm_tokens.identifier=assets.identifier
+LEFT JOIN custom_assets ON custom_assets.identifier=assets.identifier
+"""
+
+
+class AssetSearchEntry(NamedTuple):
+    identifier: str
+    name: str | None
+    symbol: str | None
+    chain: int | None  # as stored in the DB
+    asset_type: str  # as stored in the DB
+    custom_asset_type: str | None
+    address: 'ChecksumEvmAddress | None'
+    casefolded_name: str
+    casefolded_symbol: str
+
+    def matches_substring(self, substring: str) -> bool:
+        return substring in self.casefolded_name or substring in self.casefolded_symbol
+
+
+def _trigrams(value: str) -> set[str]:
+    return {value[i:i + TRIGRAM_SIZE] for i in range(len(value) - TRIGRAM_SIZE + 1)}
+
+
+class AssetsSearchIndex:
+    """Index of the assets in the global DB for the levenshtein search
+
+    Entries are stored in a list and referenced by position from the trigram and address
+    postings. Edited or deleted assets leave stale postings behind which are filtered out
+    when checking candidates. Once there are too many of them the index is rebuilt.
+
+    The index is built lazily in the first search after its creation or an invalidation.
+    Code writing assets to the global DB has to either mark the written identifiers as
+    dirty, or invalidate the entire index for bulk modifications.
+    """
+
+    def __init__(self) -> None:
+        self.lock = Semaphore()
+        self.built = False
+        self.entries: list[AssetSearchEntry | None] = []
+        self.positions: dict[str, int] = {}  # identifier -> position in entries
+        self.trigrams: defaultdict[str, list[int]] = defaultdict(list)
+        self.addresses: defaultdict[str, list[int]] = defaultdict(list)
+        self.dirty: set[str] = set()
+        self.stale_count = 0
+
+    def invalidate(self) -> None:
+        """Drops the index so that it's rebuilt from the DB at the next search"""
+        self.built = False
+        self.dirty.clear()
+
+    def mark_dirty(self, identifier: str) -> None:
+        """Marks an asset as modified so that it's re-read from the DB at the next search"""
+        self.dirty.add(identifier)
+
+    def _add_entry(self, row: tuple) -> None:
+        entry = AssetSearchEntry(
+            identifier=row[0],
+            name=row[1],
+            symbol=row[2],
+            chain=row[3],
+            asset_type=row[4],
+            custom_asset_type=row[5],
+            address=row[6],
+            casefolded_name=row[1].casefold() if row[1] is not None else '',
+            casefolded_symbol=row[2].casefold() if row[2] is not None else '',
+        )
+        position = len(self.entries)
+        self.entries.append(entry)
+        self.positions[entry.identifier] = position
+        for trigram in _trigrams(entry.casefolded_name) | _trigrams(entry.casefolded_symbol):
+            self.trigrams[trigram].append(position)
+        if entry.address is not None:
+            self.addresses[entry.address].append(position)
+
+    def _remove_entry(self, identifier: str) -> None:
+        if (position := self.positions.pop(identifier, None)) is not None:
+            self.entries[position] = None
+            self.stale_count += 1
+
+    def _build(self, cursor: 'DBCursor') -> None:
+        self.entries = []
+        self.positions = {}
+        self.trigrams = defaultdict(list)
+        self.addresses = defaultdict(list)
+        self.dirty = set()
+        self.stale_count = 0
+        for row in cursor.execute(ASSETS_SEARCH_INDEX_QUERY).fetchall():
+            self._add_entry(row)
+        self.built = True
+        log.debug(f'Built assets search index with {len(self.entries)} entries')
+
+    def _refresh_dirty(self, cursor: 'DBCursor') -> None:
+        dirty, self.dirty = self.dirty, set()
+        for identifier in dirty:
+            self._remove_entry(identifier)
+
+        for chunk in get_chunks(list(dirty), n=DIRTY_ENTRIES_CHUNK_LENGTH):
+            placeholders = ','.join(['?'] * len(chunk))
+            for row in cursor.execute(
+                ASSETS_SEARCH_INDEX_QUERY + f'WHERE assets.identifier IN ({placeholders})',
+                chunk,
+            ).fetchall():
+                self._add_entry(row)
+
+    def ensure_updated(self, cursor: 'DBCursor') -> None:
+        """Builds the index if needed and applies any pending changes"""
+        with self.lock:
+            if (
+                    self.built is False or
+                    self.stale_count + len(self.dirty) > len(self.entries) * STALE_ENTRIES_REBUILD_RATIO  # noqa: E501
+            ):
+                self._build(cursor)
+            if len(self.dirty) != 0:  # may have been modified while building
+                self._refresh_dirty(cursor)
+
+    def search(
+            self,
+            cursor: 'DBCursor',
+            substring: str | None,
+            chain_id: 'ChainID | None',
+            address: 'ChecksumEvmAddress | None',
+    ) -> list[AssetSearchEntry]:
+        """Returns the assets whose casefolded name or symbol contain the given casefolded
+        substring, that are either chain agnostic or in the given chain and that have the
+        given address. Filters set to None are not applied."""
+        self.ensure_updated(cursor)
+        candidates: list[int] | range
+        if address is not None:
+            candidates = self.addresses.get(address, [])
+        elif substring is not None and len(substring) >= TRIGRAM_SIZE:
+            # the rarest trigram of the substring gives the smallest list of candidates
+            candidates = min(
+                (self.trigrams.get(trigram, []) for trigram in _trigrams(substring)),
+                key=len,
+            )
+        else:  # too short for trigrams, so check all the entries
+            candidates = range(len(self.entries))
+
+        serialized_chain = chain_id.serialize_for_db() if chain_id is not None else None
+        result = []
+        for position in dict.fromkeys(candidates):  # stale postings may contain duplicates
+            if (entry := self.entries[position]) is None:
+                continue
+            if substring is not None and entry.matches_substring(substring) is False:
+                continue
+            if serialized_chain is not None and entry.chain not in (None, serialized_chain):
+                continue
+            if address is not None and entry.address != address:
+                continue
+            result.append(entry)
+
+        return result
@@ -1,6 +1,7 @@
 import logging
 import operator
 import sqlite3
+from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 from contextlib import suppress
 from functools import wraps
@@ -8,6 +9,7 @@ from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    Final,
     Literal,
     NamedTuple,
     Optional,
@@ -17,6 +19,9 @@ from typing import (
     overload,
 )
 
+from eth_abi.exceptions import DecodingError
+from gevent.pool import Pool
+
 from rotkehlchen.assets.asset import Asset, AssetWithOracles, EvmToken, FiatAsset, UnderlyingToken
 from rotkehlchen.assets.utils import TokenEncounterInfo, get_or_create_evm_token
 from rotkehlchen.chain.arbitrum_one.modules.umami.constants import CPT_UMAMI
@@ -37,7 +42,11 @@ from rotkehlchen.chain.evm.decoding.gearbox.gearbox_cache import (
 )
 from rotkehlchen.chain.evm.decoding.morpho.utils import get_morpho_vault_token_price
 from rotkehlchen.chain.evm.types import string_to_evm_address
-from rotkehlchen.chain.evm.utils import lp_price_from_uniswaplike_pool_contract
+from rotkehlchen.chain.evm.utils import (
+    lp_price_from_uniswaplike_pool_contract,
+    lp_price_from_uniswaplike_pool_output,
+    uniswaplike_pool_contract_calls,
+)
 from rotkehlchen.chain.polygon_pos.constants import POLYGON_POS_POL_HARDFORK
 from rotkehlchen.constants import ONE, ZERO
 from rotkehlchen.constants.assets import (
@@ -123,13 +132,14 @@ from rotkehlchen.types import (
     YEARN_VAULTS_V3_PROTOCOL,
     CacheType,
     ChainID,
+    ChecksumEvmAddress,
     EvmTokenKind,
     Price,
     ProtocolsWithPriceLogic,
     Timestamp,
 )
 from rotkehlchen.utils.data_structures import LRUCacheWithRemove
-from rotkehlchen.utils.misc import timestamp_to_daystart_timestamp, ts_now
+from rotkehlchen.utils.misc import get_chunks, timestamp_to_daystart_timestamp, ts_now
 from rotkehlchen.utils.mixins.penalizable_oracle import PenalizablePriceOracleMixin
 from rotkehlchen.utils.network import request_get_dict
 
@@ -153,6 +163,16 @@ logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
 CURRENT_PRICE_CACHE_SECS = 300  # 5 mins
+# Protocols of the tokens whose on-chain price reads are batched by find_usd_prices
+BATCHED_PRICE_PROTOCOLS: Final = {
+    *LP_TOKEN_AS_POOL_PROTOCOLS,
+    CURVE_POOL_PROTOCOL,
+    YEARN_VAULTS_V2_PROTOCOL,
+    YEARN_VAULTS_V3_PROTOCOL,
+    GEARBOX_PROTOCOL,
+}
+LP_PRICES_CALLS_CHUNK_SIZE: Final = 100  # calls per multicall when batching LP token prices
+MAX_CONCURRENT_PRICE_QUERIES: Final = 4  # assets priced at the same time by find_usd_prices
 DEFAULT_RATE_LIMIT_WAITING_TIME = 60  # seconds
 BTC_PER_BSQ = FVal('0.00000100')
 
@@ -299,6 +319,7 @@ def _query_currency_converterapi(base: FiatAsset, quote: FiatAsset) -> Price | N
 
 
 T = TypeVar('T', bound=Callable[..., Any])
+A = TypeVar('A', bound=Asset)
 
 
 def handle_recursion_error(return_price_only: bool = False) -> Callable:
@@ -341,6 +362,14 @@ class CachedPriceEntry(NamedTuple):
     oracle: CurrentPriceOracle
 
 
+class LPTokenPriceQuery(NamedTuple):
+    """The contract calls needed to price an LP or vault token on-chain and the function
+    that calculates the price from their output"""
+    token: EvmToken
+    calls: list[tuple[ChecksumEvmAddress, str]]
+    price_from_output: Callable[[list[tuple[bool, bytes]]], Price | None]
+
+
 class Inquirer:
     __instance: Optional['Inquirer'] = None
     _cached_forex_data: dict
@@ -764,6 +793,56 @@ class Inquirer:
             coming_from_latest_price=coming_from_latest_price,
         )
 
+    @staticmethod
+    def find_usd_prices(assets: Iterable[A]) -> dict[A, Price]:
+        """Returns the usd price of each of the given assets as find_usd_price does.
+
+        The on-chain reads needed for the LP and vault tokens among the assets are made
+        together in a multicall per chain instead of separately for each token. The rest of
+        the assets that are not in the price cache are priced concurrently in a bounded pool.
+
+        May raise:
+        - RemoteError if the price of any of the assets can't be queried
+        """
+        prices: dict[A, Price] = {}
+        lp_tokens: list[EvmToken] = []
+        for asset in (assets := list(assets)):
+            if (cache := Inquirer.get_cached_current_price_entry(cache_key=(asset, A_USD))) is not None:  # noqa: E501
+                prices[asset] = cache.price
+            elif (
+                    isinstance(asset, EvmToken) and
+                    asset.protocol in BATCHED_PRICE_PROTOCOLS and
+                    asset.chain_id in Inquirer._evm_managers and
+                    asset.identifier not in Inquirer.special_tokens and
+                    GlobalDBHandler.get_manual_current_price(asset=asset) is None
+            ):
+                lp_tokens.append(asset)
+
+        for token, price in Inquirer()._find_lp_token_prices(lp_tokens).items():
+            Inquirer.set_cached_price(
+                cache_key=(token, A_USD),
+                cached_price=CachedPriceEntry(
+                    price=price,
+                    time=ts_now(),
+                    oracle=CurrentPriceOracle.BLOCKCHAIN,
+                ),
+            )
+            prices[token] = price  # type: ignore[index]  # the token is one of the assets
+
+        # the rest, and the tokens whose batched query failed
+        if len(remaining_assets := [x for x in dict.fromkeys(assets) if x not in prices]) != 0:
+            pool = Pool(size=min(len(remaining_assets), MAX_CONCURRENT_PRICE_QUERIES))
+            try:
+                prices.update(zip(
+                    remaining_assets,
+                    pool.imap(Inquirer.find_usd_price, remaining_assets),
+                    strict=True,
+                ))
+            finally:  # stop the queries of the other assets after a failure
+                pool.kill()
+
+        return prices
+
     @staticmethod
     def _find_usd_price(
             asset: Asset,
@@ -902,6 +981,159 @@ class Inquirer:
         )
         return price, oracle
 
+    def _lp_token_price_query(self, token: EvmToken) -> LPTokenPriceQuery | None:
+        """Returns the contract calls needed to price the given token and how to calculate the
+        price from them. Returns None if the token can't be priced from a single batch of calls,
+        for example if its underlying token is not yet known.
+
+        May raise:
+        - RemoteError if the curve cache needs to be queried and fails
+        """
+        node_inquirer = self.get_evm_manager(chain_id=token.chain_id).node_inquirer
+        if token.protocol in LP_TOKEN_AS_POOL_PROTOCOLS:
+            if (contract_and_calls := uniswaplike_pool_contract_calls(
+                evm_inquirer=node_inquirer,
+                token=token,
+            )) is None:
+                return None
+
+            contract, calls = contract_and_calls
+            return LPTokenPriceQuery(
+                token=token,
+                calls=calls,
+                price_from_output=lambda output: lp_price_from_uniswaplike_pool_output(
+                    evm_inquirer=node_inquirer,
+                    token=token,
+                    contract=contract,
+                    output=[data if success else b'' for success, data in output],
+                    token_price_func=self.find_usd_price,
+                    token_price_func_args=[],
+                ),
+            )
+
+        if token.protocol == CURVE_POOL_PROTOCOL:
+            if token.chain_id not in CURVE_CHAIN_IDS or (pool_and_tokens := self._get_curve_pool_tokens(token)) is None:  # noqa: E501
+                return None
+
+            pool_address, pool_tokens = pool_and_tokens
+            lp_contract = EvmContract(
+                address=token.evm_address,
+                abi=node_inquirer.contracts.abi('ERC20_TOKEN'),
+                deployed_block=0,
+            )
+            pool_contract = EvmContract(
+                address=pool_address,
+                abi=node_inquirer.contracts.abi('CURVE_POOL'),
+                deployed_block=0,
+            )
+
+            def curve_price_from_output(output: list[tuple[bool, bytes]]) -> Price | None:
+                if (
+                    output[0][0] is False or
+                    (total_supply := lp_contract.decode(output[0][1], 'totalSupply')[0]) == 0 or
+                    (prices := self._get_curve_pool_tokens_prices(lp_token=token, tokens=pool_tokens)) is None  # noqa: E501
+                ):
+                    return None
+
+                return self._curve_pool_price_from_output(
+                    lp_token=token,
+                    pool_contract=pool_contract,
+                    tokens=pool_tokens,
+                    prices=prices,
+                    total_supply=total_supply,
+                    output=output[1:],
+                )
+
+            return LPTokenPriceQuery(
+                token=token,
+                calls=[(token.evm_address, lp_contract.encode(method_name='totalSupply'))] + [
+                    (pool_address, pool_contract.encode(method_name='balances', arguments=[i]))
+                    for i in range(len(pool_tokens))
+                ],
+                price_from_output=curve_price_from_output,
+            )
+
+        # yearn vaults and gearbox pools are priced from their single underlying token
+        if token.protocol in (YEARN_VAULTS_V2_PROTOCOL, YEARN_VAULTS_V3_PROTOCOL):
+            if token.chain_id != ChainID.ETHEREUM:
+                return None
+            abi_name: Literal['YEARN_VAULT_V2', 'YEARN_VAULT_V3', 'GEARBOX_LP'] = 'YEARN_VAULT_V2' if token.protocol == YEARN_VAULTS_V2_PROTOCOL else 'YEARN_VAULT_V3'  # noqa: E501
+            method_name, arguments = 'pricePerShare', []
+        elif token.protocol == GEARBOX_PROTOCOL:
+            if token in {x.farming_pool_token for x in read_gearbox_data_from_cache(token.chain_id)[0].values()}:  # noqa: E501
+                return None  # the LP token of farming pools has to be queried first
+            abi_name, method_name, arguments = 'GEARBOX_LP', 'convertToAssets', [10 ** token.get_decimals()]  # noqa: E501
+        else:
+            return None
+
+        with GlobalDBHandler().conn.read_ctx() as cursor:
+            underlying_tokens = GlobalDBHandler.fetch_underlying_tokens(
+                cursor=cursor,
+                parent_token_identifier=token.identifier,
+            )
+        if underlying_tokens is None or len(underlying_tokens) != 1:
+            return None
+
+        underlying_token = EvmToken(underlying_tokens[0].get_identifier(parent_chain=token.chain_id))  # noqa: E501
+        contract = EvmContract(
+            address=token.evm_address,
+            abi=node_inquirer.contracts.abi(abi_name),
+            deployed_block=0,
+        )
+
+        def share_price_from_output(output: list[tuple[bool, bytes]]) -> Price | None:
+            if output[0][0] is False:
+                return None
+
+            price_per_share = contract.decode(output[0][1], method_name, arguments)[0]
+            return Price(price_per_share * self.find_usd_price(underlying_token) / 10 ** token.get_decimals())  # noqa: E501
+
+        return LPTokenPriceQuery(
+            token=token,
+            calls=[(token.evm_address, contract.encode(method_name=method_name, arguments=arguments))],  # noqa: E501
+            price_from_output=share_price_from_output,
+        )
+
+    def _find_lp_token_prices(self, tokens: Iterable[EvmToken]) -> dict[EvmToken, Price]:
+        """Finds the usd price of the given LP and vault tokens. The contract calls of all
+        the tokens of a chain are made in the same multicall. Tokens whose price could not
+        be found are not in the result."""
+        queries: defaultdict[ChainID, list[LPTokenPriceQuery]] = defaultdict(list)
+        for token in tokens:
+            try:
+                if (query := self._lp_token_price_query(token)) is not None:
+                    queries[token.chain_id].append(query)
+            except RemoteError as e:
+                log.error(f'Failed to prepare the price query of {token} due to {e!s}')
+
+        prices: dict[EvmToken, Price] = {}
+        for chain_id, chain_queries in queries.items():
+            node_inquirer = self.get_evm_manager(chain_id=chain_id).node_inquirer
+            calls = [call for query in chain_queries for call in query.calls]
+            output: list[tuple[bool, bytes]] = []
+            try:
+                for calls_chunk in get_chunks(calls, n=LP_PRICES_CALLS_CHUNK_SIZE):
+                    output += node_inquirer.multicall_2(require_success=False, calls=calls_chunk)
+            except RemoteError as e:
+                log.error(f'Failed to query the {chain_id!s} LP token prices due to {e!s}')
+                continue
+
+            log.debug(f'Queried {len(calls)} calls for {len(chain_queries)} {chain_id!s} LP token prices')  # noqa: E501
+            idx = 0
+            for query in chain_queries:
+                query_output = output[idx:(idx := idx + len(query.calls))]
+                try:
+                    price = query.price_from_output(query_output)
+                except (DecodingError, DeserializationError, ValueError) as e:
+                    # e.g. empty output of an address with no code. Priced on its own later
+                    log.error(f'Failed to calculate the price of {query.token} from the batched query output due to {e!s}')  # noqa: E501
+                    continue
+
+                if price is not None and price != ZERO_PRICE:
+                    prices[query.token] = price
+
+        return prices
+
     def find_lp_price_from_uniswaplike_pool(
             self,
             token: EvmToken,
@@ -916,20 +1148,12 @@ class Inquirer:
             block_identifier='latest',
         )
 
-    def find_curve_pool_price(self, lp_token: EvmToken) -> Price | None:
-        """
-        1. Obtain the pool for this token
-        2. Obtain total supply of lp tokens
-        3. Obtain value (in USD) for all assets in the pool
-        4. Calculate the price for an LP token
-
-        logic source: https://medium.com/coinmonks/the-joys-of-valuing-curve-lp-tokens-4e4a148eaeb9
-
-        Returns the price of 1 LP token from the pool
-
-        May raise:
-        - RemoteError
-        """
+    def _get_curve_pool_tokens(
+            self,
+            lp_token: EvmToken,
+    ) -> tuple[ChecksumEvmAddress, list[EvmToken]] | None:
+        """Returns the address of the curve pool of the given LP token and the tokens in it.
+        Returns None if the pool or any of its tokens is not known."""
         assert lp_token.chain_id in CURVE_CHAIN_IDS, f'{lp_token} is not on a curve supported chain'  # noqa: E501
         chain_id = cast('CURVE_CHAIN_ID_TYPE', lp_token.chain_id)
         evm_manager = self.get_evm_manager(chain_id=chain_id)
@@ -968,7 +1192,14 @@ class Inquirer:
         except UnknownAsset:
             return None
 
-        # Get price for each token in the pool
+        return pool_address, tokens
+
+    def _get_curve_pool_tokens_prices(
+            self,
+            lp_token: EvmToken,
+            tokens: list[EvmToken],
+    ) -> list[Price] | None:
+        """Returns the usd price of each token in a curve pool or None if any is missing"""
         prices = []
         for token in tokens:
             price = self.find_usd_price(token)
@@ -980,32 +1211,19 @@ class Inquirer:
                 return None
             prices.append(price)
 
-        # Query total supply of the LP token
-        contract = EvmContract(
-            address=lp_token.evm_address,
-            abi=evm_manager.node_inquirer.contracts.abi('ERC20_TOKEN'),
-            deployed_block=0,
-        )
-        total_supply = contract.call(
-            node_inquirer=evm_manager.node_inquirer,
-            method_name='totalSupply',
-        )
-
-        # Query balances for each token in the pool
-        contract = EvmContract(
-            address=pool_address,
-            abi=evm_manager.node_inquirer.contracts.abi('CURVE_POOL'),
-            deployed_block=0,
-        )
-        calls = [
-            (pool_address, contract.encode(method_name='balances', arguments=[i]))
-            for i in range(len(tokens))
-        ]
-        output = evm_manager.node_inquirer.multicall_2(
-            require_success=False,
-            calls=calls,
-        )
+        return prices
 
+    @staticmethod
+    def _curve_pool_price_from_output(
+            lp_token: EvmToken,
+            pool_contract: EvmContract,
+            tokens: list[EvmToken],
+            prices: list[Price],
+            total_supply: int,
+            output: list[tuple[bool, bytes]],
+    ) -> Price | None:
+        """Calculates the price of a curve LP token from the output of the pool's
+        balances calls for each of its tokens"""
         # Check that the output has the correct structure
         if not all(len(call_result) == 2 for call_result in output):
             log.debug(
@@ -1020,7 +1238,7 @@ class Inquirer:
         # Deserialize information obtained in the multicall execution
         data = []
         for i, token in enumerate(tokens):
-            amount_decoded = contract.decode(output[i][1], 'balances', arguments=[i])
+            amount_decoded = pool_contract.decode(output[i][1], 'balances', arguments=[i])
             if not _check_curve_contract_call(amount_decoded):
                 log.debug(f'Failed to decode balances {i} while finding curve price. {output}')
                 return None
@@ -1046,6 +1264,63 @@ class Inquirer:
 
         return (total_assets_value / total_supply) * (10 ** lp_token.get_decimals())
 
+    def find_curve_pool_price(self, lp_token: EvmToken) -> Price | None:
+        """
+        1. Obtain the pool for this token
+        2. Obtain total supply of lp tokens
+        3. Obtain value (in USD) for all assets in the pool
+        4. Calculate the price for an LP token
+
+        logic source: https://medium.com/coinmonks/the-joys-of-valuing-curve-lp-tokens-4e4a148eaeb9
+
+        Returns the price of 1 LP token from the pool
+
+        May raise:
+        - RemoteError
+        """
+        if (pool_and_tokens := self._get_curve_pool_tokens(lp_token)) is None:
+            return None
+
+        pool_address, tokens = pool_and_tokens
+        # Get price for each token in the pool
+        if (prices := self._get_curve_pool_tokens_prices(lp_token=lp_token, tokens=tokens)) is None:  # noqa: E501
+            return None
+
+        # Query total supply of the LP token
+        evm_manager = self.get_evm_manager(chain_id=lp_token.chain_id)
+        contract = EvmContract(
+            address=lp_token.evm_address,
+            abi=evm_manager.node_inquirer.contracts.abi('ERC20_TOKEN'),
+            deployed_block=0,
+        )
+        total_supply = contract.call(
+            node_inquirer=evm_manager.node_inquirer,
+            method_name='totalSupply',
+        )
+
+        # Query balances for each token in the pool
+        contract = EvmContract(
+            address=pool_address,
+            abi=evm_manager.node_inquirer.contracts.abi('CURVE_POOL'),
+            deployed_block=0,
+        )
+        calls = [
+            (pool_address, contract.encode(method_name='balances', arguments=[i]))
+            for i in range(len(tokens))
+        ]
+        output = evm_manager.node_inquirer.multicall_2(
+            require_success=False,
+            calls=calls,
+        )
+        return self._curve_pool_price_from_output(
+            lp_token=lp_token,
+            pool_contract=contract,
+            tokens=tokens,
+            prices=prices,
+            total_supply=total_supply,
+            output=output,
+        )
+
     def find_gearbox_price(self, token: EvmToken) -> Price | None:
         node_inquirer = self.get_evm_manager(chain_id=token.chain_id).node_inquirer
         underlying_token = None
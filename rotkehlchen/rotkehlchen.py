@@ -519,6 +519,12 @@ class Rotkehlchen:
             exception_is_error=False,
             method=self.data_updater.check_for_updates,
         )
+        self.greenlet_manager.spawn_and_track(
+            after_seconds=None,
+            task_name='Build assets search index',
+            exception_is_error=False,
+            method=GlobalDBHandler().build_assets_search_index,
+        )
 
         self.addressbook_prioritizer = NamePrioritizer(self.data.db)  # Initialize here since it's reused by the api for addressbook endpoints.  # noqa: E501
         self.user_is_logged_in = True
@@ -567,13 +567,11 @@ def deserialize_evm_transaction(
     try:
         tx_hash = parent_tx_hash if parent_tx_hash is not None else deserialize_evm_tx_hash(data['hash'])  # noqa: E501
         block_number = read_integer(data, 'blockNumber', source)
-        block_data = None
         if 'timeStamp' not in data:
             if evm_inquirer is None:
                 raise DeserializationError('Got in deserialize evm transaction without timestamp and without evm inquirer')  # noqa: E501
 
-            block_data = evm_inquirer.get_block_by_number(block_number)
-            timestamp = Timestamp(read_integer(block_data, 'timestamp', source))
+            timestamp = evm_inquirer.get_block_timestamp(block_number)
         else:
             timestamp = deserialize_timestamp(data['timeStamp'])
 
@@ -1,8 +1,11 @@
+import heapq
+import itertools
 import logging
 import random
 from collections import defaultdict
 from collections.abc import Callable
-from typing import TYPE_CHECKING, NamedTuple
+from enum import IntEnum
+from typing import TYPE_CHECKING, Final, NamedTuple, TypeVar
 
 import gevent
 
@@ -106,6 +109,55 @@ class CCHistoQuery(NamedTuple):
     to_asset: AssetWithOracles
 
 
+class TaskPriority(IntEnum):
+    """Priority of a periodic task. Due tasks with lower values are started first"""
+    URGENT = 0  # work the user is waiting for, such as decoding freshly pulled transactions
+    NORMAL = 1  # history, balances and premium related queries
+    LOW = 2  # cache refreshes and maintenance
+
+
+# How long a due task of each priority may wait for a free slot before it counts as late
+PRIORITY_SOFT_DEADLINES: Final = {
+    TaskPriority.URGENT: 60,
+    TaskPriority.NORMAL: 600,
+    TaskPriority.LOW: HOUR_IN_SECONDS,
+}
+
+
+class TaskSchedule(NamedTuple):
+    """How a periodic task is scheduled. `recheck_secs` is how long to wait before asking
+    a task again if it did not finish earlier, so that idle ticks don't re-read its state.
+    It is 0 for tasks whose trigger can be set outside of the task manager, such as a
+    changed snapshot setting, since a delay would make them miss it."""
+    priority: TaskPriority
+    recheck_secs: int
+
+
+DEFAULT_TASK_SCHEDULE: Final = TaskSchedule(priority=TaskPriority.NORMAL, recheck_secs=0)
+TASK_SCHEDULE_ATTRIBUTE: Final = 'task_schedule'
+T = TypeVar('T', bound=Callable)
+
+
+def task_schedule(priority: TaskPriority, recheck_secs: int) -> Callable[[T], T]:
+    """Attaches the schedule to a periodic task so that it follows the method if renamed"""
+    def decorator(scheduling_fn: T) -> T:
+        setattr(scheduling_fn, TASK_SCHEDULE_ATTRIBUTE, TaskSchedule(priority, recheck_secs))
+        return scheduling_fn
+
+    return decorator
+
+
+def get_task_schedule(scheduling_fn: Callable) -> TaskSchedule:
+    return getattr(scheduling_fn, TASK_SCHEDULE_ATTRIBUTE, DEFAULT_TASK_SCHEDULE)
+
+
+class SchedulerStats(NamedTuple):
+    """Metrics of the task scheduler as of its last tick"""
+    queue_depth: int  # due tasks that could not be started due to lack of free slots
+    max_lag: int  # seconds the most overdue of those tasks has been waiting
+    late_tasks: int  # how many of those waited more than their priority's soft deadline
+
+
 class TaskManager:
 
     def __init__(
@@ -154,7 +206,13 @@ class TaskManager:
         self.data_updater = data_updater
         self.username = username
 
-        self.potential_tasks: list[Callable[[], Optional[list[gevent.Greenlet]]]] = [
+        # priority queue of (next due ts, insertion order, task). Entries whose ts does not
+        # match next_run_ts are outdated and skipped when popped.
+        self.next_runs: list[tuple[Timestamp, int, Callable]] = []
+        self.next_run_ts: dict[Callable, Timestamp] = {}
+        self.next_runs_counter = itertools.count()
+        self.scheduler_stats = SchedulerStats(queue_depth=0, max_lag=0, late_tasks=0)
+        self.potential_tasks = [
             self._maybe_schedule_cryptocompare_query,
             self._maybe_schedule_xpub_derivation,
             self._maybe_query_evm_transactions,
@@ -188,6 +246,18 @@ class TaskManager:
             self.potential_tasks.append(self._maybe_schedule_db_upload)
         self.schedule_lock = gevent.lock.Semaphore()
 
+    @property
+    def potential_tasks(self) -> list[Callable[[], Optional[list[gevent.Greenlet]]]]:
+        return self._potential_tasks
+
+    @potential_tasks.setter
+    def potential_tasks(self, tasks: list[Callable[[], Optional[list[gevent.Greenlet]]]]) -> None:
+        """Setting a new list of tasks makes all of them due immediately"""
+        self._potential_tasks = tasks
+        self.next_runs.clear()
+        self.next_run_ts.clear()
+
+    @task_schedule(TaskPriority.NORMAL, recheck_secs=60)
     def _maybe_schedule_db_upload(self) -> Optional[list[gevent.Greenlet]]:
         assert self.premium_sync_manager is not None, 'caller should make sure premium sync manager exists'  # noqa: E501
         if self.premium_sync_manager.check_if_should_sync(force_upload=False) is False:
@@ -246,6 +316,7 @@ class TaskManager:
 
         self.prepared_cryptocompare_query = True
 
+    @task_schedule(TaskPriority.LOW, recheck_secs=0)
     def _maybe_schedule_cryptocompare_query(self) -> Optional[list[gevent.Greenlet]]:
         """Schedules a cryptocompare query for a single asset history"""
         if self.prepared_cryptocompare_query is False:
@@ -280,6 +351,7 @@ class TaskManager:
             timestamp=now_ts,
         )]
 
+    @task_schedule(TaskPriority.NORMAL, recheck_secs=60)
     def _maybe_schedule_xpub_derivation(self) -> Optional[list[gevent.Greenlet]]:
         """Schedules the xpub derivation task if enough time has passed and if user has xpubs"""
         now = ts_now()
@@ -319,6 +391,7 @@ class TaskManager:
             ))
         return greenlets
 
+    @task_schedule(TaskPriority.NORMAL, recheck_secs=60)
     def _maybe_query_evm_transactions(self) -> Optional[list[gevent.Greenlet]]:
         """Schedules the evm transaction query task if enough time has passed"""
         shuffled_chains = list(EVM_CHAINS_WITH_TRANSACTIONS)
@@ -357,6 +430,7 @@ class TaskManager:
             )]
         return None
 
+    @task_schedule(TaskPriority.URGENT, recheck_secs=30)
     def _maybe_schedule_evm_txreceipts(self) -> Optional[list[gevent.Greenlet]]:
         """Schedules the evm transaction receipts query task
 
@@ -388,6 +462,7 @@ class TaskManager:
             )]
         return None
 
+    @task_schedule(TaskPriority.NORMAL, recheck_secs=60)
     def _maybe_schedule_exchange_history_query(self) -> Optional[list[gevent.Greenlet]]:
         """Schedules the exchange history query task if enough time has passed"""
         if len(self.exchange_manager.connected_exchanges) == 0:
@@ -421,6 +496,7 @@ class TaskManager:
             fail_callback=exchange_fail_cb,
         )]
 
+    @task_schedule(TaskPriority.NORMAL, recheck_secs=60)
     def _maybe_query_missing_prices(self) -> Optional[list[gevent.Greenlet]]:
         query_filter = HistoryEventFilterQuery.make(limit=100)
         db = DBHistoryEvents(self.database)
@@ -443,6 +519,7 @@ class TaskManager:
             base_entries_ignore_set=self.base_entries_ignore_set,
         )]
 
+    @task_schedule(TaskPriority.URGENT, recheck_secs=30)
     def _maybe_decode_evm_transactions(self) -> Optional[list[gevent.Greenlet]]:
         """Schedules the evm transaction decoding task
 
@@ -473,6 +550,7 @@ class TaskManager:
             )]
         return None
 
+    @task_schedule(TaskPriority.NORMAL, recheck_secs=60)
     def _maybe_check_premium_status(self) -> None:
         """
         Validates the premium status of the account and if the credentials are not valid
@@ -538,6 +616,7 @@ class TaskManager:
         finally:
             self.last_premium_status_check = now
 
+    @task_schedule(TaskPriority.NORMAL, recheck_secs=0)
     def _maybe_update_snapshot_balances(self) -> Optional[list[gevent.Greenlet]]:
         """
         Update the balances of a user if the difference between last time they were updated
@@ -561,6 +640,7 @@ class TaskManager:
             ignore_cache=True,
         )]
 
+    @task_schedule(TaskPriority.NORMAL, recheck_secs=60)
     def _maybe_query_produced_blocks(self) -> Optional[list[gevent.Greenlet]]:
         """Schedules the blocks production query if enough time has passed"""
         with self.database.conn.read_ctx() as cursor:
@@ -589,6 +669,7 @@ class TaskManager:
             indices_or_pubkeys=indices,
         )]
 
+    @task_schedule(TaskPriority.NORMAL, recheck_secs=60)
     def _maybe_query_withdrawals(self) -> Optional[list[gevent.Greenlet]]:
         """Schedules the eth withdrawal query if enough time has passed"""
         eth2 = self.chains_aggregator.get_module('eth2')
@@ -629,6 +710,7 @@ class TaskManager:
             to_ts=now,
         )]
 
+    @task_schedule(TaskPriority.NORMAL, recheck_secs=60)
     def _maybe_detect_withdrawal_exits(self) -> Optional[list[gevent.Greenlet]]:
         """Schedules the task that detects if any of the withdrawals should be exits
 
@@ -654,6 +736,7 @@ class TaskManager:
             method=eth2.detect_exited_validators,
         )]
 
+    @task_schedule(TaskPriority.NORMAL, recheck_secs=60)
     def _maybe_run_events_processing(self) -> Optional[list[gevent.Greenlet]]:
         """Schedules the events processing task which may combine/edit events"""
         now = ts_now()
@@ -675,6 +758,7 @@ class TaskManager:
             database=self.database,
         )]
 
+    @task_schedule(TaskPriority.LOW, recheck_secs=600)
     def _maybe_update_yearn_vaults(self) -> Optional[list[gevent.Greenlet]]:
         with self.database.conn.read_ctx() as cursor:
             if len(self.database.get_single_blockchain_addresses(cursor, SupportedBlockchain.ETHEREUM)) == 0:  # noqa: E501
@@ -692,6 +776,7 @@ class TaskManager:
 
         return None
 
+    @task_schedule(TaskPriority.LOW, recheck_secs=600)
     def _maybe_update_morpho_vaults(self) -> Optional[list[gevent.Greenlet]]:
         with self.database.conn.read_ctx() as cursor:
             if (
@@ -711,6 +796,7 @@ class TaskManager:
 
         return None
 
+    @task_schedule(TaskPriority.LOW, recheck_secs=600)
     def _maybe_update_aura_pools(self) -> Optional[list[gevent.Greenlet]]:
         with self.database.conn.read_ctx() as cursor:
             if (
@@ -734,6 +820,7 @@ class TaskManager:
             if should_update_protocol_cache(CacheType.AURA_POOLS, (str(chain.value),)) is True
         ]
 
+    @task_schedule(TaskPriority.LOW, recheck_secs=600)
     def _maybe_check_data_updates(self) -> Optional[list[gevent.Greenlet]]:
         """
         Function that schedules the data update task if either there is no data update
@@ -749,6 +836,7 @@ class TaskManager:
             method=self.data_updater.check_for_updates,
         )]
 
+    @task_schedule(TaskPriority.LOW, recheck_secs=600)
     def _maybe_detect_evm_accounts(self) -> Optional[list[gevent.Greenlet]]:
         """
         Function that schedules the EVM accounts detection task if there has been more than
@@ -766,6 +854,7 @@ class TaskManager:
             chains=self.database.get_chains_to_detect_evm_accounts(),
         )]
 
+    @task_schedule(TaskPriority.LOW, recheck_secs=600)
     def _maybe_update_ilk_cache(self) -> Optional[list[gevent.Greenlet]]:
         with self.database.conn.read_ctx() as cursor:
             if len(self.database.get_single_blockchain_addresses(cursor, SupportedBlockchain.ETHEREUM)) == 0:  # noqa: E501
@@ -782,6 +871,7 @@ class TaskManager:
 
         return None
 
+    @task_schedule(TaskPriority.LOW, recheck_secs=600)
     def _maybe_detect_new_spam_tokens(self) -> Optional[list[gevent.Greenlet]]:
         """
         This function queries the globaldb looking for assets that look like spam tokens
@@ -798,6 +888,7 @@ class TaskManager:
             user_db=self.database,
         )]
 
+    @task_schedule(TaskPriority.LOW, recheck_secs=600)
     def _maybe_update_owned_assets(self) -> Optional[list[gevent.Greenlet]]:
         """
         This function runs the logic to copy the owned assets from the user db to the globaldb.
@@ -815,6 +906,7 @@ class TaskManager:
             user_db=self.database,
         )]
 
+    @task_schedule(TaskPriority.LOW, recheck_secs=600)
     def _maybe_update_aave_v3_underlying_assets(self) -> Optional[list[gevent.Greenlet]]:
         """
         This function runs the logic to query the aave v3 contracts to get all the
@@ -831,6 +923,7 @@ class TaskManager:
             chains_aggregator=self.chains_aggregator,
         )]
 
+    @task_schedule(TaskPriority.NORMAL, recheck_secs=60)
     def _maybe_query_monerium(self) -> Optional[list[gevent.Greenlet]]:
         if not has_premium_check(self.chains_aggregator.premium):
             return None  # should not run in free mode
@@ -848,6 +941,7 @@ class TaskManager:
             method=monerium.get_and_process_orders,
         )]
 
+    @task_schedule(TaskPriority.NORMAL, recheck_secs=60)
     def _maybe_query_gnosispay(self) -> Optional[list[gevent.Greenlet]]:
         if not has_premium_check(self.chains_aggregator.premium):
             return None  # should not run in free mode
@@ -872,6 +966,7 @@ class TaskManager:
             after_ts=from_ts,
         )]
 
+    @task_schedule(TaskPriority.LOW, recheck_secs=600)
     def _maybe_create_calendar_reminder(self) -> Optional[list[gevent.Greenlet]]:
         """Create upcoming reminders for specific history events, if not already created."""
         if (
@@ -892,6 +987,7 @@ class TaskManager:
             database=self.database,
         )]
 
+    @task_schedule(TaskPriority.NORMAL, recheck_secs=60)
     def _maybe_trigger_calendar_reminder(self) -> Optional[list[gevent.Greenlet]]:
         """Get upcoming reminders and maybe process them"""
         if (now := ts_now()) - self.last_calendar_reminder_check < 60 * 5:
@@ -927,6 +1023,7 @@ class TaskManager:
             msg_aggregator=self.msg_aggregator,
         )]
 
+    @task_schedule(TaskPriority.LOW, recheck_secs=600)
     def _maybe_delete_past_calendar_events(self) -> Optional[list[gevent.Greenlet]]:
         """
         Delete old calendar events if the setting for deleting them allows it and if they haven't
@@ -943,6 +1040,7 @@ class TaskManager:
             database=self.database,
         )]
 
+    @task_schedule(TaskPriority.LOW, recheck_secs=600)
     def _maybe_query_graph_delegated_tokens(self) -> Optional[list[gevent.Greenlet]]:
         """
         Periodically query Ethereum transaction logs for Graph staking-related transactions,
@@ -963,39 +1061,107 @@ class TaskManager:
             addresses=self.chains_aggregator.accounts.eth,
         )]
 
+    def _set_next_run(self, scheduling_fn: Callable, timestamp: Timestamp) -> None:
+        self.next_run_ts[scheduling_fn] = timestamp
+        heapq.heappush(self.next_runs, (timestamp, next(self.next_runs_counter), scheduling_fn))
+
+    def schedule_now(self, scheduling_fn: Callable) -> None:
+        """Make the given task due so that it is considered at the next scheduling tick"""
+        self._set_next_run(scheduling_fn, ts_now())
+
+    def _pop_due_tasks(self, now: Timestamp) -> dict[Callable, Timestamp]:
+        """Pop all the tasks that are due at `now` from the priority queue and return
+        them mapped to the timestamp since which they are due"""
+        potential_tasks = set(self.potential_tasks)
+        for scheduling_fn in potential_tasks - self.next_run_ts.keys():
+            self._set_next_run(scheduling_fn, now)  # new tasks are due immediately
+
+        due_tasks: dict[Callable, Timestamp] = {}
+        while len(self.next_runs) != 0 and self.next_runs[0][0] <= now:
+            timestamp, _, scheduling_fn = heapq.heappop(self.next_runs)
+            if self.next_run_ts.get(scheduling_fn) != timestamp:
+                continue  # outdated entry. The task was rescheduled
+
+            if scheduling_fn not in potential_tasks:
+                del self.next_run_ts[scheduling_fn]  # the task was removed
+                continue
+
+            due_tasks[scheduling_fn] = timestamp
+
+        return due_tasks
+
     def _schedule(self) -> None:
-        """Schedules background tasks"""
+        """Schedules background tasks
+
+        The next due time of each task is kept in memory so ticks where nothing is due
+        don't call any of them. Due tasks are started by priority and then by how long
+        they have been due. Each task is asked again after the recheck period of its
+        schedule or as soon as it finishes. Urgent tasks are also asked again whenever
+        any task finishes.
+        """
         self.greenlet_manager.clear_finished()
         # Also clear methods mapping in the task manager
-        self.running_greenlets = {
+        running_greenlets = {
             method: greenlets
             for method, greenlets in self.running_greenlets.items()
             if not all(greenlet.dead for greenlet in greenlets)
         }
+        finished_tasks = self.running_greenlets.keys() - running_greenlets.keys()
+        self.running_greenlets = running_greenlets
+        if len(finished_tasks) != 0:  # a finished task may have produced urgent work. e.g. new txs  # noqa: E501
+            for scheduling_fn in self.potential_tasks:
+                if get_task_schedule(scheduling_fn).priority == TaskPriority.URGENT:
+                    finished_tasks.add(scheduling_fn)
+
+        for scheduling_fn in finished_tasks:  # tasks may have more work to do. e.g. more addresses
+            self.schedule_now(scheduling_fn)
+
         current_greenlets = len(self.greenlet_manager.greenlets) + len(self.api_task_greenlets)
-        not_proceed = current_greenlets >= self.max_tasks_num
-        log.debug(
-            f'At task scheduling. Current greenlets: {current_greenlets} '
-            f'Max greenlets: {self.max_tasks_num}. '
-            f'{"Will not schedule" if not_proceed else "Will schedule"}.',
+        free_slots = self.max_tasks_num - current_greenlets
+        # urgent tasks should not wait behind slower tasks so one of them can always run
+        urgent_running = any(
+            get_task_schedule(x).priority == TaskPriority.URGENT for x in self.running_greenlets
         )
-        if not_proceed:
-            return  # too busy
+        now = ts_now()
+        due_tasks = self._pop_due_tasks(now)
+        queue_depth, max_lag, late_tasks = 0, 0, 0
+        for scheduling_fn, due_ts in sorted(
+                due_tasks.items(),
+                key=lambda x: (get_task_schedule(x[0]).priority, x[1]),
+        ):
+            task_schedule = get_task_schedule(scheduling_fn)
+            if scheduling_fn in self.running_greenlets:
+                self._set_next_run(scheduling_fn, due_ts)  # the task is already running
+                continue
 
-        random.shuffle(self.potential_tasks)
-        max_tasks = min(self.max_tasks_num - current_greenlets, len(self.potential_tasks))
+            if free_slots <= 0 and (task_schedule.priority != TaskPriority.URGENT or urgent_running):  # noqa: E501
+                self._set_next_run(scheduling_fn, due_ts)  # no slot left. Stays due
+                queue_depth += 1
+                max_lag = max(max_lag, lag := now - due_ts)
+                if lag > PRIORITY_SOFT_DEADLINES[task_schedule.priority]:
+                    late_tasks += 1
+                continue
+
+            if (new_greenlets := scheduling_fn()) is None:
+                # The scheduling function for the specific task decided to not schedule it
+                self._set_next_run(scheduling_fn, Timestamp(now + task_schedule.recheck_secs))
+                continue
 
-        spawned_new = 0
-        for scheduling_fn in self.potential_tasks:
-            if spawned_new >= max_tasks:
-                break  # no more task slots left
-            if scheduling_fn in self.running_greenlets:
-                continue  # the specified task is already running
-            new_greenlets = scheduling_fn()
-            if new_greenlets is None:
-                continue  # The scheduling function for the specific task decided to not schedule it  # noqa: E501
             self.running_greenlets[scheduling_fn] = new_greenlets
-            spawned_new += 1
+            self._set_next_run(scheduling_fn, Timestamp(now + task_schedule.recheck_secs))
+            free_slots -= 1
+            urgent_running |= task_schedule.priority == TaskPriority.URGENT
+
+        self.scheduler_stats = SchedulerStats(
+            queue_depth=queue_depth,
+            max_lag=max_lag,
+            late_tasks=late_tasks,
+        )
+        log.debug(
+            f'At task scheduling. Current greenlets: {current_greenlets} '
+            f'Max greenlets: {self.max_tasks_num}. Due tasks: {len(due_tasks)}. '
+            f'{self.scheduler_stats}',
+        )
 
     def schedule(self) -> None:
         """Schedules background task while holding the scheduling lock
@@ -5,6 +5,7 @@ from unittest.mock import patch
 import gevent
 import pytest
 import requests
+from gevent.event import Event
 
 from rotkehlchen.tests.utils.api import (
     api_url_for,
@@ -13,8 +14,10 @@ from rotkehlchen.tests.utils.api import (
     assert_proper_response,
     assert_proper_sync_response_with_result,
     assert_simple_ok_response,
+    wait_for_async_task,
 )
 from rotkehlchen.tests.utils.exchanges import mock_binance_balance_response, try_get_first_exchange
+from rotkehlchen.tests.utils.mock import MockResponse
 from rotkehlchen.types import Location
 
 if TYPE_CHECKING:
@@ -192,3 +195,47 @@ def test_cancel_async_task(rotkehlchen_api_server_with_exchanges: 'APIServer') -
     response = requests.get(api_url_for(server, 'asynctasksresource'))
     result = assert_proper_sync_response_with_result(response)
     assert result == {'completed': [], 'pending': []}
+
+
+@pytest.mark.parametrize('added_exchanges', [(Location.BINANCE,)])
+def test_identical_async_queries_run_once(rotkehlchen_api_server_with_exchanges: 'APIServer') -> None:  # noqa: E501
+    """Test that identical async queries made while one is ongoing wait for its result
+    instead of running again, and that they run it themselves if that task is cancelled"""
+    server = rotkehlchen_api_server_with_exchanges
+    binance = try_get_first_exchange(server.rest_api.rotkehlchen.exchange_manager, Location.BINANCE)  # noqa: E501
+    assert binance is not None
+    calls, release = 0, Event()
+
+    def mock_slow_balance_response(url: str, **kwargs: Any) -> MockResponse:
+        nonlocal calls
+        calls += 1
+        release.wait()
+        return mock_binance_balance_response(url, **kwargs)
+
+    def query_balances() -> int:  # ignore the cache so that only the api dedupes the queries
+        return assert_ok_async_response(requests.get(api_url_for(
+            server,
+            'named_exchanges_balances_resource',
+            location='binance',
+        ), json={'async_query': True, 'ignore_cache': True}))
+
+    with patch.object(binance.session, 'get', side_effect=mock_slow_balance_response):
+        task_ids = [query_balances(), query_balances()]
+        release.set()
+        outcomes = [wait_for_async_task(server, task_id) for task_id in task_ids]
+        assert outcomes[0] == outcomes[1]
+        assert outcomes[0]['result']['assets'] is not None
+        single_query_calls = calls
+
+        # cancel the running task and see that the identical query runs by itself
+        release.clear()
+        task_ids = [query_balances(), query_balances()]
+        gevent.sleep(0.1)  # let both tasks start
+        response = requests.delete(api_url_for(server, 'specific_async_tasks_resource', task_id=task_ids[0]))  # noqa: E501
+        assert_simple_ok_response(response)
+        release.set()
+        outcome = wait_for_async_task(server, task_ids[1])
+
+    assert outcome['result'] == outcomes[0]['result']
+    assert single_query_calls < calls <= 3 * single_query_calls  # the cancelled task only ran partly  # noqa: E501
+    assert server.rest_api.inflight_async_queries == {}
@@ -69,6 +69,16 @@ def pytest_addoption(parser):
         help='If set then all tests that are aware of their mocking the network will not do that. Use this in order to easily skip mocks and test that using the network, the remote queries are still working fine and mocks dont need any changing.',  # noqa: E501
     )
     parser.addoption('--profiler', default=None, choices=['flamegraph-trace'])
+    parser.addoption(
+        '--benchmarks',
+        action='store_true',
+        help='If set then the offline benchmark suite in tests/profiling is run. It replays recorded network cassettes so it needs no network access, unless RECORD_CASSETTES is set.',  # noqa: E501
+    )
+    parser.addoption(
+        '--benchmark-output',
+        default=None,
+        help='Path of a json file where the measurements of the benchmark suite are written along with the current commit.',  # noqa: E501
+    )
 
 
 if sys.platform == 'darwin':
@@ -2752,6 +2752,44 @@ def test_latest_upgrade_correctness(user_data_dir):
     db.logout()
 
 
+@pytest.mark.parametrize('use_clean_caching_directory', [True])
+def test_single_backup_per_upgrade_run(user_data_dir, messages_aggregator):
+    """Test that upgrading across several versions makes a single backup of the DB and
+    that if a later upgrade fails the DB is restored to the version it had before the run"""
+    _use_prepared_db(user_data_dir, 'v40_rotkehlchen.db')
+    with (
+        patch('rotkehlchen.db.upgrades.v42_v43.perform_userdb_upgrade_steps', side_effect=ValueError('boom')),  # noqa: E501
+        pytest.raises(DBUpgradeError, match='Failed at database upgrade from version 42 to 43'),
+    ):
+        _init_db_with_target_version(
+            target_version=43,
+            user_data_dir=user_data_dir,
+            msg_aggregator=messages_aggregator,
+            resume_from_backup=False,
+        )
+
+    backups = [x for x in os.listdir(user_data_dir) if x.endswith('.backup')]
+    assert len(backups) == 1
+    assert backups[0].endswith('_rotkehlchen_db_v40.backup')
+
+    # the restored DB is at v40 again and upgrading it works
+    db = _init_db_with_target_version(
+        target_version=43,
+        user_data_dir=user_data_dir,
+        msg_aggregator=messages_aggregator,
+        resume_from_backup=False,
+    )
+    with db.conn.read_ctx() as cursor:
+        assert db.get_setting(cursor, 'version') == 43
+        assert db.get_setting(cursor, 'ongoing_upgrade_from_version') is None
+
+    assert all(
+        x.endswith('_rotkehlchen_db_v40.backup')
+        for x in os.listdir(user_data_dir) if x.endswith('.backup')
+    )
+    db.logout()
+
+
 def test_steps_counted_properly_in_upgrades(user_data_dir):
     """
     Tests database upgrade progress counting behaviour. Makes sure that the number of times
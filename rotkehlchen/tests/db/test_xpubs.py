@@ -157,3 +157,24 @@ def test_edit_bitcoin_xpub_not_existing_tag(setup_db_for_xpub_tests):
     assert result[0].derivation_path == xpub.derivation_path
     assert result[0].tags != {'test'}
     db.logout()
+
+
+def test_xpub_derived_addresses_cache(setup_db_for_xpub_tests):
+    """Test that derived addresses are cached per xpub and derivation path and that
+    they are removed together with the xpub"""
+    db, xpub1, xpub2, _, all_addresses = setup_db_for_xpub_tests
+    derived_addresses = {(0, 0): all_addresses[0], (0, 1): all_addresses[1], (1, 0): all_addresses[2]}  # noqa: E501
+    with db.user_write() as write_cursor:
+        db.add_xpub_derived_addresses(write_cursor, xpub1, derived_addresses)
+        db.add_xpub_derived_addresses(write_cursor, xpub1, {(0, 1): all_addresses[1]})
+
+    with db.conn.read_ctx() as cursor:
+        assert db.get_xpub_derived_addresses(cursor, xpub1) == derived_addresses
+        assert db.get_xpub_derived_addresses(cursor, xpub2) == {}
+
+    with db.user_write() as write_cursor:
+        db.delete_bitcoin_xpub(write_cursor, xpub1)
+
+    with db.conn.read_ctx() as cursor:
+        assert db.get_xpub_derived_addresses(cursor, xpub1) == {}
+    db.logout()
@@ -213,7 +213,7 @@ def test_query_balances_skips_inquirer_error(mock_bitstamp):
 
     with (
         patch(
-            'rotkehlchen.exchanges.bitstamp.Inquirer.find_usd_price',
+            'rotkehlchen.exchanges.exchange.Inquirer.find_usd_price',
             side_effect=RemoteError('test'),
         ),
         patch.object(mock_bitstamp, '_api_query', side_effect=mock_api_query_response),
@@ -17,6 +17,7 @@ from rotkehlchen.fval import FVal
 from rotkehlchen.history.events.structures.asset_movement import AssetMovement
 from rotkehlchen.history.events.structures.base import HistoryEvent
 from rotkehlchen.history.events.structures.types import HistoryEventSubType, HistoryEventType
+from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.tests.utils.exchanges import TRANSACTIONS_RESPONSE, mock_normal_coinbase_query
 from rotkehlchen.tests.utils.mock import MockResponse
 from rotkehlchen.types import Location, TimestampMS, TradeType
@@ -99,9 +100,13 @@ def test_coinbase_query_balances(function_scope_coinbase):
             """,
         )
 
-    with patch.object(coinbase.session, 'get', side_effect=mock_coinbase_accounts):
+    with (
+        patch.object(coinbase.session, 'get', side_effect=mock_coinbase_accounts),
+        patch.object(Inquirer, 'find_usd_prices', wraps=Inquirer.find_usd_prices) as prices_mock,
+    ):
         balances, msg = coinbase.query_balances()
 
+    assert prices_mock.call_count == 1, 'prices of all the assets should be queried together'
     assert msg == ''
     assert len(balances) == 2
     assert balances[A_BTC].amount == FVal('5.23')
@@ -0,0 +1,18 @@
+from pathlib import Path
+
+import pytest
+
+from rotkehlchen.tests.utils.benchmark import BenchmarkRecorder
+
+
+@pytest.fixture(scope='session', name='benchmark_recorder')
+def fixture_benchmark_recorder(request):
+    """Recorder of the offline benchmark suite. Tests using it are skipped unless
+    --benchmarks is given since they need the recorded cassettes to replay."""
+    if request.config.option.benchmarks is False:
+        pytest.skip('Benchmarks only run with --benchmarks')
+
+    output = request.config.option.benchmark_output
+    recorder = BenchmarkRecorder(output_path=Path(output) if output is not None else None)
+    yield recorder
+    recorder.write()
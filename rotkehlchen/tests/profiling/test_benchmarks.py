@@ -0,0 +1,128 @@
+"""Offline benchmark suite
+
+All network traffic of these tests goes through the recorded VCR cassettes so they
+can run without Etherscan or RPC access and their numbers are comparable per commit.
+Run them with:
+    python pytestgeventwrapper.py --benchmarks --benchmark-output=bench.json \
+    rotkehlchen/tests/profiling/test_benchmarks.py
+
+To (re-)record the cassettes set RECORD_CASSETTES=1 once with network access.
+"""
+from typing import TYPE_CHECKING
+
+import pytest
+
+from rotkehlchen.accounting.structures.balance import Balance
+from rotkehlchen.constants.assets import A_ETH, A_USDC
+from rotkehlchen.db.constants import EVMTX_DECODED
+from rotkehlchen.fval import FVal
+from rotkehlchen.history.events.structures.base import HistoryEvent
+from rotkehlchen.history.events.structures.types import HistoryEventSubType, HistoryEventType
+from rotkehlchen.tests.utils.accounting import accounting_history_process
+from rotkehlchen.types import Location, SupportedBlockchain, Timestamp, TimestampMS
+
+if TYPE_CHECKING:
+    from rotkehlchen.accounting.accountant import Accountant
+    from rotkehlchen.chain.aggregator import ChainsAggregator
+    from rotkehlchen.chain.ethereum.decoding.decoder import EthereumTransactionDecoder
+    from rotkehlchen.chain.ethereum.transactions import EthereumTransactions
+    from rotkehlchen.db.dbhandler import DBHandler
+    from rotkehlchen.tests.utils.benchmark import BenchmarkRecorder
+
+BENCHMARK_ACCOUNTS = [
+    '0x7277F7849966426d345D8F6B9AFD1d3d89183083',  # kelsos.eth
+    '0xc37b40ABdB939635068d3c5f13E7faF686F03B65',  # yabir.eth
+]
+# Fixed end of the queried range so that the recorded requests always match
+BENCHMARK_END_TS = Timestamp(1735689600)  # 01/01/2025
+PNL_BENCHMARK_EVENTS = 5000
+
+
+@pytest.mark.vcr(filter_query_parameters=['apikey'])
+@pytest.mark.parametrize('ethereum_accounts', [BENCHMARK_ACCOUNTS])
+@pytest.mark.parametrize('have_decoders', [True])
+def test_benchmark_receipts_and_decoding(
+        benchmark_recorder: 'BenchmarkRecorder',
+        database: 'DBHandler',
+        ethereum_accounts,
+        eth_transactions: 'EthereumTransactions',
+        ethereum_transaction_decoder: 'EthereumTransactionDecoder',
+):
+    """Measure receipts stored per second and transactions decoded per second"""
+    for address in ethereum_accounts:
+        eth_transactions.single_address_query_transactions(
+            address=address,
+            start_ts=Timestamp(0),
+            end_ts=BENCHMARK_END_TS,
+        )
+
+    with benchmark_recorder.measure(name='evm receipts stored', unit='receipts') as counter:
+        eth_transactions.get_receipts_for_transactions_missing_them()
+
+    with database.conn.read_ctx() as cursor:
+        counter.items = cursor.execute('SELECT COUNT(*) FROM evmtx_receipts').fetchone()[0]
+
+    with benchmark_recorder.measure(name='evm transactions decoded', unit='transactions') as counter:  # noqa: E501
+        ethereum_transaction_decoder.get_and_decode_undecoded_transactions()
+
+    with database.conn.read_ctx() as cursor:
+        counter.items = cursor.execute(
+            'SELECT COUNT(*) FROM evm_tx_mappings WHERE value=?', (EVMTX_DECODED,),
+        ).fetchone()[0]
+
+    receipts_measurement, decoding_measurement = benchmark_recorder.measurements[-2:]
+    assert receipts_measurement.items != 0
+    assert decoding_measurement.items != 0
+
+
+@pytest.mark.parametrize('mocked_price_queries', [{}])
+@pytest.mark.parametrize('default_mock_price_value', [FVal(2)])
+def test_benchmark_pnl_processing(
+        benchmark_recorder: 'BenchmarkRecorder',
+        accountant: 'Accountant',
+):
+    """Measure the PnL events processed per second by the accountant"""
+    events = []
+    for idx in range(PNL_BENCHMARK_EVENTS):
+        receive = idx % 2 == 0
+        events.append(HistoryEvent(
+            event_identifier=f'benchmark_{idx}',
+            sequence_index=0,
+            timestamp=TimestampMS(1600000000000 + idx * 60000),
+            location=Location.EXTERNAL,
+            event_type=HistoryEventType.RECEIVE if receive else HistoryEventType.SPEND,
+            event_subtype=HistoryEventSubType.NONE,
+            asset=A_ETH if idx % 3 == 0 else A_USDC,
+            balance=Balance(amount=FVal(2) if receive else FVal(1)),
+        ))
+
+    with benchmark_recorder.measure(name='pnl events processed', unit='events') as counter:
+        _, processed = accounting_history_process(
+            accountant=accountant,
+            start_ts=Timestamp(0),
+            end_ts=BENCHMARK_END_TS,
+            history_list=events,
+        )
+        counter.items = len(events)
+
+    assert len(processed) != 0
+
+
+@pytest.mark.vcr(filter_query_parameters=['apikey'])
+@pytest.mark.parametrize('ethereum_accounts', [BENCHMARK_ACCOUNTS])
+@pytest.mark.parametrize('ethereum_manager_connect_at_start', ['DEFAULT'])
+def test_benchmark_balance_snapshot(
+        benchmark_recorder: 'BenchmarkRecorder',
+        blockchain: 'ChainsAggregator',
+        ethereum_accounts,
+):
+    """Measure the latency of a full ethereum balance query including token detection"""
+    with benchmark_recorder.measure(name='ethereum balance snapshot', unit='addresses') as counter:
+        blockchain.ethereum.tokens.detect_tokens(
+            only_cache=False,
+            addresses=ethereum_accounts,
+        )
+        blockchain.query_balances(blockchain=SupportedBlockchain.ETHEREUM, ignore_cache=True)
+        counter.items = len(ethereum_accounts)
+
+    assert len(blockchain.balances.eth) == len(ethereum_accounts)
@@ -9,6 +9,12 @@ from rotkehlchen.chain.ethereum.decoding.decoder import EthereumTransactionDecod
 from rotkehlchen.chain.ethereum.transactions import EthereumTransactions
 from rotkehlchen.chain.evm.constants import GENESIS_HASH, ZERO_ADDRESS
 from rotkehlchen.chain.evm.decoding.constants import CPT_GAS
+from rotkehlchen.chain.evm.decoding.decoder import find_chain_decoders, find_decoders_details
+from rotkehlchen.chain.evm.decoding.decoders_manifest import (
+    DECODERS_COUNTERPARTIES,
+    DECODERS_MANIFEST,
+    DECODERS_PRODUCTS,
+)
 from rotkehlchen.chain.evm.decoding.utils import maybe_reshuffle_events
 from rotkehlchen.chain.evm.l2_with_l1_fees.types import L2WithL1FeesTransaction
 from rotkehlchen.chain.evm.structures import EvmTxReceipt, EvmTxReceiptLog
@@ -25,6 +31,7 @@ from rotkehlchen.tests.utils.constants import A_OPTIMISM_USDT
 from rotkehlchen.tests.utils.ethereum import INFURA_ETH_NODE, get_decoded_events_of_transaction
 from rotkehlchen.tests.utils.factories import make_ethereum_event
 from rotkehlchen.types import (
+    EVM_CHAIN_IDS_WITH_TRANSACTIONS,
     ChainID,
     EvmTransaction,
     Location,
@@ -125,7 +132,7 @@ def test_decoders_initialization(ethereum_transaction_decoder: EthereumTransacti
         'Zerox',
     }
 
-    counterparty_ids = {counterparty.identifier for counterparty in ethereum_transaction_decoder.rules.all_counterparties}  # noqa: E501
+    counterparty_ids = {counterparty.identifier for counterparty in ethereum_transaction_decoder.get_all_counterparties()}  # noqa: E501
     assert counterparty_ids == {
         '0x',
         'aura-finance',
@@ -926,6 +933,54 @@ def test_phising_zero_transfers(database, ethereum_inquirer):
     assert ignored_actions == {ActionType.HISTORY_EVENT: {f'{ChainID.ETHEREUM.value}{tx_hex}'}}, 'Transaction with only zero transfers should have been marked as ignored'  # noqa: E501
 
 
+def test_decoders_manifest_is_up_to_date():
+    """Make sure that the generated decoders manifest contains all the decoders of each chain.
+    If this fails run tools/scripts/generate_decoders_manifest.py"""
+    for chain_id in EVM_CHAIN_IDS_WITH_TRANSACTIONS:
+        chain_name = chain_id.to_name()
+        chain_decoders = find_chain_decoders(f'rotkehlchen.chain.{chain_name}.modules')
+        assert list(DECODERS_MANIFEST[chain_name]) == chain_decoders, f'{chain_name} decoders manifest is outdated'  # noqa: E501
+        counterparties, products = find_decoders_details(chain_decoders)
+        assert list(DECODERS_COUNTERPARTIES[chain_name]) == counterparties, f'{chain_name} decoders counterparties are outdated'  # noqa: E501
+        assert DECODERS_PRODUCTS[chain_name] == products, f'{chain_name} decoders products are outdated'  # noqa: E501
+
+
+def test_decoders_initialized_at_first_use(database, ethereum_inquirer, eth_transactions):
+    """Make sure that decoders are only initialized the first time the rules are needed"""
+    decoder = EthereumTransactionDecoder(database=database, ethereum_inquirer=ethereum_inquirer, transactions=eth_transactions)  # noqa: E501
+    assert decoder.decoders_initialized is False
+    assert len(decoder._decoders) == 0
+
+    counterparties = decoder.get_all_counterparties()  # doesn't need the decoders
+    assert {x.identifier for x in counterparties}.issuperset({CPT_GAS, 'aave-v3', 'airdrops'})
+    assert len(decoder._decoders) == 0
+
+    rules = decoder.rules
+    assert decoder.decoders_initialized is True
+    assert {name for name, _, addresses in DECODERS_MANIFEST['ethereum'] if addresses is None}.issubset(decoder._decoders)  # noqa: E501
+    assert 'Airdrops' not in decoder._decoders  # initialized at the first of its addresses
+    assert decoder.rules is rules  # initialized only once
+    assert decoder.decoders['Aavev3'] is decoder.decoders['Aavev3']
+    assert {name for name, _, _ in DECODERS_MANIFEST['ethereum']}.issubset(decoder._decoders)
+    assert decoder.get_all_counterparties() == decoder.rules.all_counterparties
+
+
+def test_decoder_initialized_at_first_address(database, ethereum_inquirer, eth_transactions):
+    """Make sure that decoders whose rules are all tied to addresses are initialized
+    the first time one of their addresses is decoded"""
+    decoder = EthereumTransactionDecoder(database=database, ethereum_inquirer=ethereum_inquirer, transactions=eth_transactions)  # noqa: E501
+    _, _, airdrop_addresses = next(x for x in DECODERS_MANIFEST['ethereum'] if x[0] == 'Airdrops')
+    assert airdrop_addresses is not None
+    assert decoder.rules.address_mappings.get(airdrop_addresses[0]) is None
+    assert 'Airdrops' not in decoder._decoders
+
+    decoder._maybe_initialize_decoder_of_address(airdrop_addresses[0])
+    assert 'Airdrops' in decoder._decoders
+    assert set(airdrop_addresses).issubset(decoder.rules.address_mappings)
+    assert len(decoder._lazy_decoders_addresses.keys() & set(airdrop_addresses)) == 0
+    assert decoder.get_decoder('Aave') is decoder.get_decoder('Aave') is not None
+
+
 def test_error_at_decoder_initialization(database, ethereum_inquirer, eth_transactions):
     """Regression test for https://github.com/rotki/rotki/issues/7039"""
     faulty_get_or_create_evm_token = patch(
@@ -934,7 +989,7 @@ def test_error_at_decoder_initialization(database, ethereum_inquirer, eth_transa
     )
     with faulty_get_or_create_evm_token:
         decoder = EthereumTransactionDecoder(database=database, ethereum_inquirer=ethereum_inquirer, transactions=eth_transactions)  # noqa: E501
-        assert decoder is not None
+        assert 'Lockedgno' not in decoder.decoders  # decoders are initialized at first use
 
     errors = database.msg_aggregator.consume_errors()
     warnings = database.msg_aggregator.consume_warnings()
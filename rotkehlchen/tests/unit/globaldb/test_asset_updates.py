@@ -2,6 +2,7 @@ import json
 from collections.abc import Callable
 from unittest.mock import patch
 
+import gevent
 import pytest
 import requests
 
@@ -11,7 +12,12 @@ from rotkehlchen.chain.evm.types import string_to_evm_address
 from rotkehlchen.constants.assets import A_BTC, A_ETH
 from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.globaldb.asset_updates.manager import (
+    ASSET_COLLECTIONS_MAPPINGS_UPDATES_URL,
+    ASSET_COLLECTIONS_UPDATES_URL,
+    ASSETS_UPDATES_URL,
     ASSETS_VERSION_KEY,
+    FIRST_VERSION_WITH_COLLECTIONS,
+    MAX_CONCURRENT_UPDATE_DOWNLOADS,
     AssetsUpdater,
     UpdateFileType,
 )
@@ -588,3 +594,69 @@ def test_conflict_updates(assets_updater: AssetsUpdater, globaldb: GlobalDBHandl
             'SELECT COUNT(*) FROM multiasset_mappings WHERE asset=?;',
             ('eip155:42161/erc20:0xFF970A61A04b1cA14834A43f5dE4533eBDDB5CC8',),
         ).fetchone()[0] == 1
+
+
+def test_update_files_are_downloaded_concurrently(assets_updater: AssetsUpdater) -> None:
+    """Test that the update files of all pending versions are downloaded concurrently
+    and that each downloaded file is mapped back to its version and file type"""
+    running, max_running = 0, 0
+
+    def mock_query_file(url: str, is_json: bool) -> str:  # pylint: disable=unused-argument
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        gevent.sleep(0.01)
+        running -= 1
+        return url
+
+    infojson = {'updates': {
+        str(version): {'min_schema_version': 1, 'max_schema_version': GLOBAL_DB_VERSION}
+        for version in range(14, 19)
+    }}
+    assets_updater.local_assets_version = 13
+    assets_updater.last_remote_checked_version = 18
+    with patch('rotkehlchen.globaldb.asset_updates.manager.query_file', side_effect=mock_query_file):  # noqa: E501
+        updates = assets_updater._retrieve_update_files(
+            local_schema_version=GLOBAL_DB_VERSION,
+            infojson=infojson,
+            up_to_version=None,
+        )
+
+    assert 1 < max_running <= MAX_CONCURRENT_UPDATE_DOWNLOADS
+    assert list(updates) == list(range(14, 19))
+    for version, files in updates.items():
+        assert files[UpdateFileType.ASSETS] == ASSETS_UPDATES_URL.format(branch=assets_updater.branch, version=version)  # noqa: E501
+        has_collections = version >= FIRST_VERSION_WITH_COLLECTIONS
+        assert files[UpdateFileType.ASSET_COLLECTIONS] == (ASSET_COLLECTIONS_UPDATES_URL.format(branch=assets_updater.branch, version=version) if has_collections else '')  # noqa: E501
+        assert files[UpdateFileType.ASSET_COLLECTIONS_MAPPINGS] == (ASSET_COLLECTIONS_MAPPINGS_UPDATES_URL.format(branch=assets_updater.branch, version=version) if has_collections else '')  # noqa: E501
+
+
+def test_asset_added_earlier_in_the_update(assets_updater: AssetsUpdater, globaldb: GlobalDBHandler) -> None:  # noqa: E501
+    """Test that an asset inserted again by a later entry of the update replaces the one
+    added by an earlier entry instead of failing, since the user has no local copy of it"""
+    update = """INSERT INTO assets(identifier, name, type) VALUES("MYBONK", "Bonk", "Y"); INSERT INTO common_asset_details(identifier, symbol, coingecko, cryptocompare, forked, started, swapped_for) VALUES("MYBONK", "BONK", "bonk", "BONK", NULL, 1672279200, NULL);
+*
+INSERT INTO assets(identifier, name, type) VALUES("MYBONK", "Bonk Inu", "Y"); INSERT INTO common_asset_details(identifier, symbol, coingecko, cryptocompare, forked, started, swapped_for) VALUES("MYBONK", "BONK", "bonk-inu", "BONK", NULL, 1672279200, NULL);
+*"""  # noqa: E501
+    assets_updater.msg_aggregator.consume_warnings()
+    with globaldb.conn.write_ctx() as write_cursor:
+        write_cursor.execute('DELETE FROM settings WHERE name=?', (ASSETS_VERSION_KEY,))
+    with mock_asset_updates(
+        original_requests_get=requests.get,
+        latest=15,
+        updates={'15': {
+            'changes': 2,
+            'min_schema_version': GLOBAL_DB_VERSION,
+            'max_schema_version': GLOBAL_DB_VERSION,
+        }},
+        sql_actions={'15': {'assets': update, 'collections': '', 'mappings': ''}},
+    ):
+        assert assets_updater.perform_update(up_to_version=15, conflicts=None) is None
+
+    assert assets_updater.msg_aggregator.consume_warnings() == []
+    with globaldb.conn.read_ctx() as cursor:
+        assert cursor.execute(
+            'SELECT A.name, C.coingecko FROM assets A INNER JOIN common_asset_details C '
+            'ON A.identifier=C.identifier WHERE A.identifier=?',
+            ('MYBONK',),
+        ).fetchall() == [('Bonk Inu', 'bonk-inu')]
@@ -67,6 +67,8 @@ from rotkehlchen.types import (
     ChainID,
     EvmTokenKind,
     Location,
+    LocationAssetMappingDeleteEntry,
+    LocationAssetMappingUpdateEntry,
     Price,
     Timestamp,
     TradeType,
@@ -1292,6 +1294,37 @@ def test_assets_in_same_collection(globaldb: GlobalDBHandler):
     assert globaldb.get_assets_in_same_collection(identifier=A_DOGE.identifier) == (A_DOGE,)
 
 
+def test_asset_mappings_index_invalidation(globaldb: GlobalDBHandler):
+    """Check that the in-memory asset mappings index is reloaded after modifications
+    of the mappings and gives the same results as querying the DB"""
+    wsteth = Asset('eip155:1/erc20:0x7f39C581F595B53c5cb19bD0b3f8dA6c935E2Ca0')
+    with globaldb.conn.read_ctx() as cursor:
+        main_asset = cursor.execute(
+            'SELECT ac.main_asset FROM asset_collections AS ac INNER JOIN multiasset_mappings '
+            'AS mm ON mm.collection_id = ac.id WHERE mm.asset = ?',
+            (wsteth.identifier,),
+        ).fetchone()[0]
+    assert globaldb.get_collection_main_asset(wsteth.identifier) == main_asset
+    assert globaldb.get_collection_main_asset(A_DOGE.identifier) is None
+
+    version = globaldb.asset_mappings_index.version
+    assert globaldb.get_assetid_from_exchange_name(Location.KRAKEN, 'NEWDOGE', 'default') == 'default'  # noqa: E501
+    globaldb.add_location_asset_mappings([LocationAssetMappingUpdateEntry(
+        location=Location.KRAKEN,
+        location_symbol='NEWDOGE',
+        asset=A_DOGE,
+    )])
+    assert globaldb.asset_mappings_index.version == version + 1
+    assert globaldb.get_assetid_from_exchange_name(Location.KRAKEN, 'NEWDOGE', 'default') == A_DOGE.identifier  # noqa: E501
+    assert globaldb.get_assetid_from_exchange_name(Location.BINANCE, 'NEWDOGE', 'default') == 'default'  # noqa: E501
+
+    globaldb.delete_location_asset_mappings([LocationAssetMappingDeleteEntry(
+        location=Location.KRAKEN,
+        location_symbol='NEWDOGE',
+    )])
+    assert globaldb.get_assetid_from_exchange_name(Location.KRAKEN, 'NEWDOGE', 'default') == 'default'  # noqa: E501
+
+
 def test_check_wal_mode_of_package_db(globaldb: GlobalDBHandler) -> None:
     """
     If the packaged db is modified and the wal mode is activated users can have issues
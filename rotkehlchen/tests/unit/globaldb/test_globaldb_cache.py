@@ -42,6 +42,10 @@ from rotkehlchen.constants.timing import WEEK_IN_SECONDS
 from rotkehlchen.db.addressbook import DBAddressbook
 from rotkehlchen.db.filtering import AddressbookFilterQuery
 from rotkehlchen.errors.misc import InputError
+from rotkehlchen.globaldb.cache import (
+    globaldb_set_general_cache_values,
+    globaldb_update_cache_last_ts,
+)
 from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.tests.utils.factories import make_evm_address
 from rotkehlchen.tests.utils.mock import MockResponse
@@ -489,3 +493,40 @@ def test_reload_cache_timestamps(blockchain: ChainsAggregator, freezer):
         cache_key=CacheType.CURVE_LP_TOKENS,
         args=(str(ChainID.ETHEREUM.serialize_for_db()),),
     ) is False
+
+
+@pytest.mark.parametrize('load_global_caches', [[CPT_VELODROME]])
+def test_reload_data_only_after_cache_changes(optimism_transaction_decoder):
+    """Check that reloadable decoders only read the cache again once it has been modified"""
+    velodrome = optimism_transaction_decoder.decoders['Velodrome']
+    velodrome.reload_data()  # loads the existing cache data
+    with patch.object(
+        target=velodrome,
+        attribute='read_data_from_cache_method',
+        wraps=velodrome.read_data_from_cache_method,
+    ) as read_mock:
+        assert velodrome.reload_data() is None
+        assert read_mock.call_count == 0
+
+        with GlobalDBHandler().conn.write_ctx() as write_cursor:  # doesn't modify the data
+            globaldb_update_cache_last_ts(
+                write_cursor=write_cursor,
+                cache_type=CacheType.VELODROME_POOL_ADDRESS,
+                key_parts=None,
+            )
+        assert velodrome.reload_data() is None
+        assert read_mock.call_count == 0
+
+        new_pool = make_evm_address()
+        with GlobalDBHandler().conn.write_ctx() as write_cursor:
+            globaldb_set_general_cache_values(
+                write_cursor=write_cursor,
+                key_parts=(CacheType.VELODROME_POOL_ADDRESS,),
+                values=[new_pool],
+            )
+        assert list(velodrome.reload_data()) == [new_pool]
+        assert read_mock.call_count == 1
+        assert new_pool in velodrome.pools
+
+        assert velodrome.reload_data() is None
+        assert read_mock.call_count == 1
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+from freezegun import freeze_time
+
+from rotkehlchen.constants.timing import HOUR_IN_SECONDS
+from rotkehlchen.globaldb.handler import GlobalDBHandler
+from rotkehlchen.globaldb.response_cache import CachedEndpoint, ResponseCache
+from rotkehlchen.utils.misc import ts_now
+
+
+def test_response_cache_persists_across_instances(tmp_path: Path):
+    path = tmp_path / 'cache.db'
+    cache = ResponseCache(path=path)
+    assert cache.get(CachedEndpoint.CONTRACT_ABI, chain='ETH', address='0x1') is None
+    cache.set(CachedEndpoint.CONTRACT_ABI, [{'type': 'function'}], chain='ETH', address='0x1')
+    assert cache.get(CachedEndpoint.CONTRACT_ABI, chain='ETH', address='0x1') == [{'type': 'function'}]  # noqa: E501
+    assert cache.get(CachedEndpoint.CONTRACT_ABI, chain='OPTIMISM', address='0x1') is None
+    assert cache.stats()['endpoints'][CachedEndpoint.CONTRACT_ABI.name] == {'hits': 1, 'misses': 2}
+    cache.close()
+
+    cache = ResponseCache(path=path)
+    assert cache.get(CachedEndpoint.CONTRACT_ABI, chain='ETH', address='0x1') == [{'type': 'function'}]  # noqa: E501
+    assert cache.total_size > 0
+    cache.close()
+
+
+def test_response_cache_immutability_rules(tmp_path: Path):
+    cache = ResponseCache(path=tmp_path / 'cache.db')
+    now = ts_now()
+    # recent blocks may still be reorged so they should not be stored
+    cache.set(CachedEndpoint.BLOCK_TIMESTAMP, now, chain='ETH', block=2)
+    assert cache.get(CachedEndpoint.BLOCK_TIMESTAMP, chain='ETH', block=2) is None
+    cache.set(CachedEndpoint.BLOCK_TIMESTAMP, now - 2 * HOUR_IN_SECONDS, chain='ETH', block=1)
+    assert cache.get(CachedEndpoint.BLOCK_TIMESTAMP, chain='ETH', block=1) == now - 2 * HOUR_IN_SECONDS  # noqa: E501
+    # the block closest to a future or very recent timestamp can change
+    cache.set(CachedEndpoint.BLOCKNUMBER_BY_TIME, 42, chain='ETH', ts=now, closest='before')
+    assert cache.get(CachedEndpoint.BLOCKNUMBER_BY_TIME, chain='ETH', ts=now, closest='before') is None  # noqa: E501
+    # None results are never stored
+    cache.set(CachedEndpoint.CONTRACT_CREATION_HASH, None, chain='ETH', address='0x1')
+    assert cache.stats()['entries'] == 1
+    cache.close()
+
+
+def test_response_cache_lru_eviction(tmp_path: Path):
+    cache = ResponseCache(path=tmp_path / 'cache.db', max_size=1200)
+    for idx in range(10):
+        with freeze_time(f'2024-01-01 00:00:{idx:02}'):
+            cache.set(CachedEndpoint.CONTRACT_ABI, 'x' * 20, chain='ETH', address=str(idx))
+
+    with freeze_time('2024-01-01 00:01:00'):  # touch the oldest entry so it is kept
+        assert cache.get(CachedEndpoint.CONTRACT_ABI, chain='ETH', address='0') is not None
+
+    with freeze_time('2024-01-01 00:02:00'):
+        for idx in range(10, 20):
+            cache.set(CachedEndpoint.CONTRACT_ABI, 'x' * 20, chain='ETH', address=str(idx))
+
+    assert cache.total_size <= 1200
+    assert cache.get(CachedEndpoint.CONTRACT_ABI, chain='ETH', address='0') is not None
+    assert cache.get(CachedEndpoint.CONTRACT_ABI, chain='ETH', address='1') is None
+    assert cache.get(CachedEndpoint.CONTRACT_ABI, chain='ETH', address='19') is not None
+    cache.close()
+
+
+def test_response_cache_recreated_if_corrupt(tmp_path: Path):
+    path = tmp_path / 'cache.db'
+    path.write_bytes(b'definitely not a sqlite file' * 100)
+    cache = ResponseCache(path=path)
+    cache.set(CachedEndpoint.CONTRACT_ABI, [], chain='ETH', address='0x1')
+    assert cache.get(CachedEndpoint.CONTRACT_ABI, chain='ETH', address='0x1') == []
+    cache.close()
+
+
+def test_globaldb_response_cache(globaldb: GlobalDBHandler):
+    assert globaldb.response_cache.path.parent == globaldb.filepath().parent
@@ -1,10 +1,15 @@
 import re
+from collections import defaultdict
 from contextlib import nullcontext
 from unittest.mock import MagicMock, patch
 
+import gevent
 import pytest
 
-from rotkehlchen.chain.bitcoin import get_bitcoin_addresses_balances
+from rotkehlchen.chain.bitcoin import (
+    MAX_CONCURRENT_REQUESTS_PER_HOST,
+    get_bitcoin_addresses_balances,
+)
 from rotkehlchen.chain.bitcoin.hdkey import HDKey, XpubType
 from rotkehlchen.chain.bitcoin.utils import (
     WitnessVersion,
@@ -16,8 +21,13 @@ from rotkehlchen.chain.bitcoin.utils import (
     scriptpubkey_to_p2pkh_address,
     scriptpubkey_to_p2sh_address,
 )
-from rotkehlchen.chain.bitcoin.xpub import XpubData
+from rotkehlchen.chain.bitcoin.xpub import (
+    XPUB_LOOKAHEAD_WINDOWS,
+    XpubData,
+    _derive_addresses_from_xpub_data,
+)
 from rotkehlchen.chain.constants import NON_BITCOIN_CHAINS, SupportedBlockchain
+from rotkehlchen.constants import ONE, ZERO
 from rotkehlchen.errors.misc import RemoteError, XPUBError
 from rotkehlchen.fval import FVal
 from rotkehlchen.tests.utils.ens import ENS_BRUNO_BTC_ADDR, ENS_BRUNO_BTC_BYTES
@@ -325,6 +335,74 @@ def test_xpub_data_comparison():
     assert not xpubdata1 == xpubdata2  # pylint: disable=unneeded-not  # noqa: SIM201
 
 
+def test_derive_addresses_with_lookahead():
+    """Test that querying windows of addresses ahead of the gap limit concurrently finds
+    the same addresses as querying them one window at a time"""
+    hdkey = HDKey.from_xpub('xpub68V4ZQQ62mea7ZUKn2urQu47Bdn2Wr7SxrBxBDDwE3kjytj361YBGSKDT4WoBrE5htrSB8eAMe59NPnKrcAbiv2veN5GQUmfdjRddD1Hxrk', path='m')  # noqa: E501
+    xpub_data = XpubData(xpub=hdkey, blockchain=SupportedBlockchain.BITCOIN)
+    used_addresses = {
+        hdkey.derive_path(f'm/{account_index}/{derived_index}').address(): FVal(derived_index + 1)
+        for account_index, derived_index in ((0, 0), (0, 3), (0, 7), (1, 1))
+    }
+
+    def mock_have_transactions(accounts):
+        gevent.sleep(0.01)
+        return {x: (x in used_addresses, used_addresses.get(x, ZERO)) for x in accounts}
+
+    results = []
+    for lookahead_windows in (1, 3):
+        with (
+            patch('rotkehlchen.chain.bitcoin.xpub.XPUB_LOOKAHEAD_WINDOWS', new=lookahead_windows),
+            patch('rotkehlchen.chain.bitcoin.xpub.have_bitcoin_transactions', side_effect=mock_have_transactions),  # noqa: E501
+        ):
+            results.append(_derive_addresses_from_xpub_data(
+                xpub_data=xpub_data,
+                start_receiving_index=0,
+                start_change_index=0,
+                gap_limit=5,
+                derived_addresses_cache={},
+            ))
+        assert {x.address for x in results[-1] if x.balance != ZERO} == set(used_addresses)
+
+    assert sorted(results[0]) == sorted(results[1])
+
+
+def test_derive_addresses_lookahead_only_after_activity():
+    """Test that windows are only queried ahead after a window with used addresses, so an
+    xpub with no new activity needs a single query per chain, and that the addresses of the
+    windows that were not checked are not kept in the derived addresses cache"""
+    hdkey = HDKey.from_xpub('xpub68V4ZQQ62mea7ZUKn2urQu47Bdn2Wr7SxrBxBDDwE3kjytj361YBGSKDT4WoBrE5htrSB8eAMe59NPnKrcAbiv2veN5GQUmfdjRddD1Hxrk', path='m')  # noqa: E501
+    xpub_data = XpubData(xpub=hdkey, blockchain=SupportedBlockchain.BITCOIN)
+    used_address = hdkey.derive_path('m/0/2').address()
+    have_transactions_mock = MagicMock(side_effect=lambda accounts: {
+        x: (x == used_address, ONE if x == used_address else ZERO) for x in accounts
+    })
+    with patch('rotkehlchen.chain.bitcoin.xpub.have_bitcoin_transactions', new=have_transactions_mock):  # noqa: E501
+        derived_addresses_cache: dict[tuple[int, int], BTCAddress] = {}
+        assert _derive_addresses_from_xpub_data(
+            xpub_data=xpub_data,
+            start_receiving_index=5,
+            start_change_index=5,
+            gap_limit=5,
+            derived_addresses_cache=derived_addresses_cache,
+        ) == []
+        assert have_transactions_mock.call_count == 2
+        assert set(derived_addresses_cache) == {(x, y) for x in (0, 1) for y in range(5, 10)}
+
+        derived_addresses_cache = {}
+        have_transactions_mock.reset_mock()
+        _derive_addresses_from_xpub_data(
+            xpub_data=xpub_data,
+            start_receiving_index=0,
+            start_change_index=5,
+            gap_limit=5,
+            derived_addresses_cache=derived_addresses_cache,
+        )
+        # windows after the used address are queried ahead but only the checked ones are cached
+        assert have_transactions_mock.call_count == 2 + XPUB_LOOKAHEAD_WINDOWS
+        assert set(derived_addresses_cache) == {(0, y) for y in range(10)} | {(1, y) for y in range(5, 10)}  # noqa: E501
+
+
 def test_is_valid_derivation_path():
     valid, msg = is_valid_derivation_path('m')
     assert valid
@@ -535,3 +613,30 @@ def test_bitcoin_balance_api_resolver(network_mocking):
             # Third source fails - FATALITY!!!
             with patch('rotkehlchen.chain.bitcoin._query_mempool_space', MagicMock(side_effect=RemoteError('Fatality'))), pytest.raises(RemoteError):  # noqa: E501
                 get_bitcoin_addresses_balances(addresses)
+
+
+def test_per_address_balance_queries_are_concurrent():
+    """Test that the APIs queried once per address are queried concurrently without exceeding
+    the requests limit of each host, and that a failed request makes the next source be used"""
+    addresses = [BTCAddress(f'bc1qaddress{idx}') for idx in range(20)]
+    in_flight: dict[str, int] = defaultdict(int)
+    max_in_flight: dict[str, int] = defaultdict(int)
+
+    def mock_request_get_dict(url, **kwargs):  # pylint: disable=unused-argument
+        host = url.split('/')[2]
+        in_flight[host] += 1
+        max_in_flight[host] = max(max_in_flight[host], in_flight[host])
+        gevent.sleep(0.01)
+        in_flight[host] -= 1
+        if host == 'blockstream.info' and url.endswith('address7'):
+            raise RemoteError('blockstream is down')
+        return {'chain_stats': {'funded_txo_sum': 300000000, 'spent_txo_sum': 100000000, 'tx_count': 2}}  # noqa: E501
+
+    with patch('rotkehlchen.chain.bitcoin.request_get_dict', side_effect=mock_request_get_dict):
+        balances = get_bitcoin_addresses_balances(addresses)
+
+    assert balances == dict.fromkeys(addresses, FVal(2))
+    assert max_in_flight == {
+        'blockstream.info': MAX_CONCURRENT_REQUESTS_PER_HOST,
+        'mempool.space': MAX_CONCURRENT_REQUESTS_PER_HOST,
+    }
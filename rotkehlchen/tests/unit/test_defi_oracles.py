@@ -1,10 +1,15 @@
+import datetime
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
+from freezegun import freeze_time
 
 from rotkehlchen.assets.asset import Asset, EvmToken
 from rotkehlchen.assets.resolver import AssetResolver
+from rotkehlchen.chain.ethereum.oracles.uniswap import NO_POOLS_CACHE_TTL
+from rotkehlchen.chain.evm.constants import ZERO_ADDRESS
+from rotkehlchen.chain.evm.contracts import EvmContract
 from rotkehlchen.chain.evm.types import string_to_evm_address
 from rotkehlchen.constants import ONE
 from rotkehlchen.constants.assets import A_1INCH, A_BTC, A_DOGE, A_ETH, A_LINK, A_USDC, A_WETH
@@ -15,6 +20,7 @@ from rotkehlchen.fval import FVal
 from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.inquirer import CurrentPriceOracle
 from rotkehlchen.tests.utils.ethereum import INFURA_ETH_NODE
+from rotkehlchen.tests.utils.factories import make_evm_address
 from rotkehlchen.tests.utils.mock import MockResponse
 from rotkehlchen.types import ChainID, EvmTokenKind, Price
 
@@ -209,3 +215,45 @@ def test_invalid_token_kind_price_query(inquirer_defi: 'Inquirer'):
             from_asset=nft_token,
             to_asset=A_USDC.resolve_to_evm_token(),
         )
+
+
+@pytest.mark.parametrize('use_clean_caching_directory', [True])
+def test_uniswap_pools_are_cached(inquirer_defi: 'Inquirer'):
+    """Test that the pools that exist for two tokens are stored in the globaldb and are not
+    queried again while the cache is valid, and that the uniswap v3 pool with the highest
+    liquidity is still chosen at each query"""
+    uniswapv2, uniswapv3 = inquirer_defi._uniswapv2, inquirer_defi._uniswapv3
+    assert uniswapv2 is not None
+    assert uniswapv3 is not None
+    uniswapv2.cache_ttl_secs = uniswapv3.cache_ttl_secs = 0  # only check the globaldb cache
+    weth, usdc, link = (x.resolve_to_evm_token() for x in (A_WETH, A_USDC, A_LINK))
+    pool_1, pool_2 = make_evm_address(), make_evm_address()
+    with patch.object(uniswapv2, '_query_pools', return_value=[pool_1]) as query_pools:
+        assert uniswapv2.get_pool(weth, usdc) == [pool_1]
+        assert uniswapv2.get_pool(weth, usdc) == [pool_1]
+        assert query_pools.call_count == 1
+
+    liquidity = {pool_1: 5, pool_2: 10}
+    with (  # the cache is per oracle version
+        patch.object(uniswapv3, '_query_pools', return_value=[pool_1, ZERO_ADDRESS, pool_2]) as query_pools,  # noqa: E501
+        patch.object(EvmContract, 'call', autospec=True, side_effect=lambda contract, **kwargs: liquidity[contract.address]),  # noqa: E501
+    ):
+        assert uniswapv3.get_pool(weth, usdc) == [pool_2]
+        liquidity[pool_2] = 0
+        assert uniswapv3.get_pool(weth, usdc) == [pool_1]
+        liquidity[pool_1] = 0
+        assert uniswapv3.get_pool(weth, usdc) == []
+        assert query_pools.call_count == 1
+
+    with patch.object(uniswapv2, '_query_pools', return_value=[ZERO_ADDRESS]) as query_pools:
+        assert uniswapv2.get_pool(weth, link) == []
+        assert uniswapv2.get_pool(weth, link) == []
+        assert query_pools.call_count == 1
+
+    # known absences expire so that new pools can be found
+    future_timestamp = datetime.datetime.now(tz=datetime.UTC) + datetime.timedelta(seconds=NO_POOLS_CACHE_TTL + 1)  # noqa: E501
+    with (
+        freeze_time(future_timestamp),
+        patch.object(uniswapv2, '_query_pools', return_value=[pool_1]),
+    ):
+        assert uniswapv2.get_pool(weth, link) == [pool_1]
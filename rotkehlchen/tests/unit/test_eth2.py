@@ -19,6 +19,7 @@ from rotkehlchen.chain.evm.types import string_to_evm_address
 from rotkehlchen.constants import ONE, ZERO
 from rotkehlchen.constants.assets import A_ETH
 from rotkehlchen.constants.timing import DAY_IN_SECONDS, HOUR_IN_SECONDS
+from rotkehlchen.db.cache import DBCacheStatic
 from rotkehlchen.db.dbhandler import DBHandler
 from rotkehlchen.db.eth2 import DBEth2
 from rotkehlchen.db.evmtx import DBEvmTx
@@ -26,6 +27,7 @@ from rotkehlchen.db.filtering import Eth2DailyStatsFilterQuery, HistoryEventFilt
 from rotkehlchen.db.history_events import DBHistoryEvents
 from rotkehlchen.externalapis.beaconchain.service import BeaconChain
 from rotkehlchen.fval import FVal
+from rotkehlchen.history.events.structures.base import HistoryBaseEntryType
 from rotkehlchen.history.events.structures.eth2 import (
     EthBlockEvent,
     EthDepositEvent,
@@ -825,6 +827,72 @@ def test_eth_validators_performance(eth2, database, ethereum_accounts):
     assert performance['validators'] == {}
 
 
+def test_validators_daily_profit_is_maintained(database):
+    """Test that the materialized daily profit of validators follows additions, edits and
+    deletions of staking events and that partial days are read from the events"""
+    dbevents, dbeth2 = DBHistoryEvents(database), DBEth2(database)
+    day_start = Timestamp(1700006400)  # 2023-11-15 00:00:00 UTC
+    withdrawal = EthWithdrawalEvent(
+        validator_index=1,
+        timestamp=ts_sec_to_ms(Timestamp(day_start + 2 * HOUR_IN_SECONDS)),
+        balance=Balance(FVal('0.05')),
+        withdrawal_address=ADDR1,
+        is_exit=False,
+    )
+    with database.user_write() as write_cursor:
+        dbevents.add_history_events(write_cursor, [withdrawal, EthBlockEvent(
+            validator_index=2,
+            timestamp=ts_sec_to_ms(Timestamp(day_start + DAY_IN_SECONDS + HOUR_IN_SECONDS)),
+            balance=Balance(FVal('0.1')),
+            fee_recipient=ADDR1,
+            block_number=1,
+            is_mev_reward=False,
+        ), EthBlockEvent(  # recipient not tracked so it should not count
+            validator_index=2,
+            timestamp=ts_sec_to_ms(Timestamp(day_start + DAY_IN_SECONDS + HOUR_IN_SECONDS)),
+            balance=Balance(FVal('0.2')),
+            fee_recipient=ADDR2,
+            block_number=1,
+            is_mev_reward=True,
+        )])
+
+    def assert_profit(from_ts, to_ts, expected):
+        with database.user_write() as write_cursor:
+            dbeth2.refresh_validators_daily_profit(write_cursor)
+        with database.conn.read_ctx() as cursor:
+            assert dbeth2.get_validators_profit(
+                cursor=cursor,
+                from_ts=Timestamp(from_ts),
+                to_ts=Timestamp(to_ts),
+                validator_indices=None,
+                tracked_addresses=[ADDR1],
+            ) == expected
+
+    full_range = (day_start, day_start + 3 * DAY_IN_SECONDS)
+    assert_profit(*full_range, ({1: FVal('0.05')}, {}, {2: FVal('0.1')}))
+    assert_profit(day_start + 3 * HOUR_IN_SECONDS, full_range[1], ({}, {}, {2: FVal('0.1')}))
+    with database.conn.read_ctx() as cursor:
+        assert cursor.execute('SELECT COUNT(*) FROM eth2_validators_daily_profit').fetchone()[0] == 3  # noqa: E501
+
+    with database.user_write() as write_cursor:  # new events are added to the daily sums
+        dbevents.add_history_event(write_cursor, EthWithdrawalEvent(
+            validator_index=1,
+            timestamp=ts_sec_to_ms(Timestamp(day_start + 5 * HOUR_IN_SECONDS)),
+            balance=Balance(FVal('32.5')),
+            withdrawal_address=ADDR1,
+            is_exit=True,
+        ))
+    assert_profit(*full_range, ({1: FVal('0.05')}, {1: FVal('0.5')}, {2: FVal('0.1')}))
+
+    withdrawal.balance = Balance(FVal('0.07'))  # edits make the validator be rebuilt
+    withdrawal.identifier = 1
+    assert dbevents.edit_history_event(withdrawal) == (True, '')
+    assert_profit(*full_range, ({1: FVal('0.07')}, {1: FVal('0.5')}, {2: FVal('0.1')}))
+
+    assert dbevents.delete_history_events_by_identifier([2]) is None
+    assert_profit(*full_range, ({1: FVal('0.07')}, {1: FVal('0.5')}, {}))
+
+
 @pytest.mark.vcr
 @pytest.mark.freeze_time('2024-02-02 13:34:45 GMT')
 @pytest.mark.parametrize('network_mocking', [False])
@@ -985,6 +1053,103 @@ def test_combine_block_with_tx_events(eth2, database):
         hidden_ids = dbevents.get_hidden_event_ids(cursor)
         assert hidden_ids == [2]
 
+    # a block event added after its transaction event was examined should still be combined
+    with database.user_write() as write_cursor:
+        dbevmtx.add_evm_transactions(
+            write_cursor=write_cursor,
+            evm_transactions=[EvmTransaction(
+                tx_hash=(tx_hash_2 := make_evm_tx_hash()),
+                chain_id=ChainID.ETHEREUM,
+                timestamp=Timestamp(1666693619),
+                block_number=block_number + 1,
+                from_address=mev_builder_address,
+                to_address=vindex1_address,
+                value=1,
+                gas=27500,
+                gas_price=9213569214,
+                gas_used=0,
+                input_data=b'',
+                nonce=16240,
+            )],
+            relevant_address=vindex1_address,
+        )
+        dbevents.add_history_event(write_cursor, EvmEvent(
+            tx_hash=tx_hash_2,
+            sequence_index=0,
+            timestamp=TimestampMS(timestampms + 12000),
+            location=Location.ETHEREUM,
+            event_type=HistoryEventType.RECEIVE,
+            event_subtype=HistoryEventSubType.NONE,
+            asset=A_ETH,
+            balance=Balance(mev_reward),
+            location_label=vindex1_address,
+        ))
+
+    eth2.combine_block_with_tx_events()
+    with database.user_write() as write_cursor:
+        dbevents.add_history_event(write_cursor, EthBlockEvent(
+            validator_index=vindex1,
+            timestamp=TimestampMS(timestampms + 12000),
+            balance=Balance(mev_reward),
+            fee_recipient=vindex1_address,
+            block_number=block_number + 1,
+            is_mev_reward=True,
+        ))
+
+    eth2.combine_block_with_tx_events()
+    with database.conn.read_ctx() as cursor:
+        assert cursor.execute(
+            'SELECT event_identifier, type, subtype FROM history_events WHERE identifier=4',
+        ).fetchone() == (
+            EthBlockEvent.form_event_identifier(block_number + 1),
+            HistoryEventType.STAKING.serialize(),
+            HistoryEventSubType.MEV_REWARD.serialize(),
+        )
+        assert cursor.execute(
+            'SELECT value FROM key_value_cache WHERE name=?',
+            (DBCacheStatic.COMBINE_BLOCK_EVENTS_WATERMARK.value,),
+        ).fetchone()[0] == '5'
+
+    # purging the events lowers the watermark so that the redecoded events, which reuse
+    # the identifiers of the deleted ones, are combined again
+    with database.user_write() as write_cursor:
+        dbevents.delete_events_by_location(write_cursor=write_cursor, location=Location.ETHEREUM)
+        assert write_cursor.execute(
+            'SELECT value FROM key_value_cache WHERE name=?',
+            (DBCacheStatic.COMBINE_BLOCK_EVENTS_WATERMARK.value,),
+        ).fetchone()[0] == '0'
+        dbevents.add_history_events(write_cursor, [EvmEvent(
+            tx_hash=tx_hash_2,
+            sequence_index=0,
+            timestamp=TimestampMS(timestampms + 12000),
+            location=Location.ETHEREUM,
+            event_type=HistoryEventType.RECEIVE,
+            event_subtype=HistoryEventSubType.NONE,
+            asset=A_ETH,
+            balance=Balance(mev_reward),
+            location_label=vindex1_address,
+        ), EthBlockEvent(
+            validator_index=vindex1,
+            timestamp=TimestampMS(timestampms + 12000),
+            balance=Balance(mev_reward),
+            fee_recipient=vindex1_address,
+            block_number=block_number + 1,
+            is_mev_reward=True,
+        )])
+
+    eth2.combine_block_with_tx_events()
+    with database.conn.read_ctx() as cursor:
+        assert cursor.execute(
+            'SELECT identifier, event_identifier, type, subtype FROM history_events '
+            'WHERE entry_type=?',
+            (HistoryBaseEntryType.EVM_EVENT.serialize_for_db(),),
+        ).fetchall() == [(
+            1,
+            EthBlockEvent.form_event_identifier(block_number + 1),
+            HistoryEventType.STAKING.serialize(),
+            HistoryEventSubType.MEV_REWARD.serialize(),
+        )]
+
 
 @pytest.mark.vcr
 @pytest.mark.parametrize('network_mocking', [False])
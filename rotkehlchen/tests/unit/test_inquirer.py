@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 from unittest import mock
 from unittest.mock import MagicMock, patch
 
+import gevent
 import pytest
 import requests
 from freezegun import freeze_time
@@ -58,6 +59,7 @@ from rotkehlchen.history.types import HistoricalPrice, HistoricalPriceOracle
 from rotkehlchen.inquirer import (
     CURRENT_PRICE_CACHE_SECS,
     DEFAULT_RATE_LIMIT_WAITING_TIME,
+    MAX_CONCURRENT_PRICE_QUERIES,
     CurrentPriceOracle,
     Inquirer,
     _query_currency_converterapi,
@@ -70,11 +72,13 @@ from rotkehlchen.tests.unit.decoders.test_curve_lend import (
 )
 from rotkehlchen.tests.unit.test_cost_basis import ONE_PRICE
 from rotkehlchen.tests.utils.constants import A_CNY, A_JPY
+from rotkehlchen.tests.utils.factories import make_evm_address
 from rotkehlchen.tests.utils.mock import MockResponse
 from rotkehlchen.tests.utils.morpho import create_ethereum_morpho_vault_token
 from rotkehlchen.types import (
     EVM_CHAINS_WITH_TRANSACTIONS,
     VELODROME_POOL_PROTOCOL,
+    YEARN_VAULTS_V2_PROTOCOL,
     YEARN_VAULTS_V3_PROTOCOL,
     CacheType,
     ChainID,
@@ -677,6 +681,120 @@ def test_find_yearn_vaults_v2_price(inquirer_defi, globaldb):
             assert result and result[0].address == underlying_token.resolve_to_evm_token().evm_address  # noqa: E501
 
 
+@pytest.mark.parametrize('should_mock_current_price_queries', [False])
+def test_find_usd_prices_batches_onchain_queries(
+        database: 'DBHandler',
+        inquirer_defi: 'Inquirer',
+) -> None:
+    """Test that the on-chain reads for the prices of multiple vault tokens are made in a
+    single multicall and that the assets without on-chain logic are priced as usual"""
+    yvusdc, yvdai = (get_or_create_evm_token(
+        userdb=database,
+        evm_address=make_evm_address(),
+        chain_id=ChainID.ETHEREUM,
+        decimals=decimals,
+        name=f'yv{underlying_token.symbol}',
+        symbol=f'yv{underlying_token.symbol}',
+        protocol=YEARN_VAULTS_V2_PROTOCOL,
+        underlying_tokens=[UnderlyingToken(
+            address=underlying_token.evm_address,
+            token_kind=EvmTokenKind.ERC20,
+            weight=ONE,
+        )],
+    ) for underlying_token, decimals in (
+        (A_USDC.resolve_to_evm_token(), 6),
+        (A_DAI.resolve_to_evm_token(), 18),
+    ))
+    node_inquirer = inquirer_defi.get_evm_manager(ChainID.ETHEREUM).node_inquirer
+    price_per_share = {  # 1.1 USDC and 1.05 DAI per share
+        yvusdc.evm_address: (11 * 10 ** 5).to_bytes(32, 'big'),
+        yvdai.evm_address: (105 * 10 ** 16).to_bytes(32, 'big'),
+    }
+    multicall_mock = MagicMock(side_effect=lambda calls, **kwargs: [
+        (True, price_per_share[address]) for address, _ in calls
+    ])
+    with (
+        patch.object(node_inquirer, 'multicall_2', new=multicall_mock),
+        patch.object(Inquirer, 'find_usd_price', return_value=ONE),
+    ):
+        prices = inquirer_defi.find_usd_prices([yvusdc, yvdai, A_ETH])
+
+    assert multicall_mock.call_count == 1
+    assert len(multicall_mock.call_args.kwargs['calls']) == 2
+    assert prices == {yvusdc: FVal('1.1'), yvdai: FVal('1.05'), A_ETH: ONE}
+    assert inquirer_defi.get_cached_current_price_entry((yvdai, A_USD)).price == FVal('1.05')  # type: ignore[union-attr]
+
+
+@pytest.mark.parametrize('should_mock_current_price_queries', [False])
+def test_find_usd_prices_batch_decoding_error(
+        database: 'DBHandler',
+        inquirer_defi: 'Inquirer',
+) -> None:
+    """Test that a token whose batched query output can't be decoded, like the empty
+    output of an address with no code, is priced on its own instead of failing the batch"""
+    yvusdc, yvbroken = (get_or_create_evm_token(
+        userdb=database,
+        evm_address=make_evm_address(),
+        chain_id=ChainID.ETHEREUM,
+        decimals=6,
+        name=name,
+        symbol=name,
+        protocol=YEARN_VAULTS_V2_PROTOCOL,
+        underlying_tokens=[UnderlyingToken(
+            address=A_USDC.resolve_to_evm_token().evm_address,
+            token_kind=EvmTokenKind.ERC20,
+            weight=ONE,
+        )],
+    ) for name in ('yvUSDC', 'yvBROKEN'))
+    node_inquirer = inquirer_defi.get_evm_manager(ChainID.ETHEREUM).node_inquirer
+    multicall_mock = MagicMock(side_effect=lambda calls, **kwargs: [
+        (True, (11 * 10 ** 5).to_bytes(32, 'big') if address == yvusdc.evm_address else b'')
+        for address, _ in calls
+    ])
+    with (
+        patch.object(node_inquirer, 'multicall_2', new=multicall_mock),
+        patch.object(Inquirer, 'find_usd_price', return_value=FVal(2)) as find_usd_price_mock,
+    ):
+        prices = inquirer_defi.find_usd_prices([yvusdc, yvbroken])
+
+    assert multicall_mock.call_count == 1
+    assert prices == {yvusdc: FVal('2.2'), yvbroken: FVal(2)}
+    assert find_usd_price_mock.call_args.args == (yvbroken,)
+
+
+@pytest.mark.parametrize('should_mock_current_price_queries', [False])
+def test_find_usd_prices_queries_concurrently(inquirer: 'Inquirer') -> None:
+    """Test that the assets without on-chain price logic are priced concurrently within the
+    limit and that a failing price query stops the others"""
+    assets = [A_BTC, A_ETH, A_DAI, A_USDC, A_USDT, A_XDAI]
+    in_flight, max_in_flight, failing_asset, priced_assets = 0, 0, None, []
+
+    def mock_find_usd_price(asset: Asset) -> FVal:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        try:
+            gevent.sleep(0.01)
+        finally:
+            in_flight -= 1
+        if asset == failing_asset:
+            raise RemoteError('price query failed')
+        priced_assets.append(asset)
+        return FVal(assets.index(asset))
+
+    with patch.object(Inquirer, 'find_usd_price', side_effect=mock_find_usd_price):
+        assert inquirer.find_usd_prices(assets + [A_BTC]) == {
+            asset: FVal(idx) for idx, asset in enumerate(assets)
+        }
+        assert max_in_flight == MAX_CONCURRENT_PRICE_QUERIES
+
+        failing_asset, priced_assets = A_BTC, []
+        with pytest.raises(RemoteError):
+            inquirer.find_usd_prices(assets)
+        gevent.sleep(0.05)
+        assert A_XDAI not in priced_assets  # the queries of the other assets were killed
+
+
 @pytest.mark.vcr(filter_query_parameters=['apikey'])
 @pytest.mark.parametrize('use_clean_caching_directory', [True])
 @pytest.mark.parametrize('should_mock_current_price_queries', [False])
@@ -1,14 +1,27 @@
+import datetime
+from typing import Literal
+from unittest.mock import patch
+
 import pytest
 
 from rotkehlchen.api.server import APIServer
 from rotkehlchen.assets.asset import Asset
 from rotkehlchen.assets.utils import get_or_create_evm_token
 from rotkehlchen.chain.aggregator import ChainsAggregator
+from rotkehlchen.chain.ethereum.modules.nft.nfts import NFTS_REFRESH_MAX_AGE
 from rotkehlchen.chain.evm.types import string_to_evm_address
 from rotkehlchen.constants.assets import A_ETH, A_USDC
 from rotkehlchen.db.filtering import NFTFilterQuery
+from rotkehlchen.externalapis.opensea import NFT
 from rotkehlchen.fval import FVal
-from rotkehlchen.types import ChainID, ChecksumEvmAddress, EvmTokenKind
+from rotkehlchen.types import (
+    ChainID,
+    ChecksumEvmAddress,
+    EvmTokenKind,
+    SupportedBlockchain,
+    Timestamp,
+)
+from rotkehlchen.utils.misc import ts_now
 
 TEST_ACC1 = '0xc37b40ABdB939635068d3c5f13E7faF686F03B65'  # yabir.eth
 TEST_ACC2 = '0x2B888954421b424C5D3D9Ce9bB67c9bD47537d12'  # lefteris.eth
@@ -26,6 +39,7 @@ def test_addresses_queried_for_nfts(blockchain):
     nft_module.query_balances(
         addresses=[TEST_ACC1, TEST_ACC2],
         uniswap_nfts=None,
+        ignore_cache=True,
     )
     balances = nft_module.get_db_nft_balances(filter_query=NFTFilterQuery.make())['entries']
     assert any(x['name'] == 'yabir.eth' for x in balances)
@@ -132,6 +146,7 @@ def test_duplicate_balances(
     nft_module.query_balances(
         addresses=ethereum_accounts,
         uniswap_nfts=None,
+        ignore_cache=True,
     )
     balances = rotki.query_balances()
     assert Asset('eip155:1/erc721:0x524cAB2ec69124574082676e6F654a18df49A048') not in balances['assets']  # noqa: E501
@@ -140,3 +155,70 @@ def test_duplicate_balances(
     assert Asset('_nft_0x524cAB2ec69124574082676e6F654a18df49A048_13990') in balances['assets']
     assert Asset('_nft_0x524cAB2ec69124574082676e6F654a18df49A048_10346') in balances['assets']
     assert Asset('eip155:100/erc721:0x88997988a6A5aAF29BA973d298D276FE75fb69ab') in balances['assets']  # noqa: E501
+
+
+@pytest.mark.parametrize('ethereum_accounts', [[TEST_ACC1]])
+@pytest.mark.parametrize('start_with_valid_premium', [True])
+@pytest.mark.parametrize('ethereum_modules', [['nfts']])
+def test_unchanged_addresses_keep_saved_nfts(blockchain: ChainsAggregator, freezer):
+    """Test that the NFTs of an address with no NFT transfers since it was last queried are
+    not queried again until they are too old or the cache is ignored, and that the saved
+    NFTs are updated in place"""
+    nft_module = blockchain.get_module('nfts')
+    assert nft_module is not None
+
+    def make_nft(token_id: int, price: int) -> NFT:
+        return NFT(
+            token_identifier=f'_nft_0xfd9d8036f899ed5a9fd8cac7968e5f24d3db2a64_{token_id}',
+            background_color=None,
+            image_url=None,
+            name=f'NFT {token_id}',
+            external_link=None,
+            permalink=None,
+            price_asset=A_ETH,
+            price_in_asset=FVal(price),
+            price_usd=FVal(price),
+            collection=None,
+        )
+
+    def query_and_assert(
+            nfts: list[NFT],
+            call_count: int,
+            expected: list[tuple[str, str]],
+            ignore_cache: bool = False,
+    ) -> None:
+        assert nft_module is not None
+        get_account_nfts_mock.return_value = nfts
+        nft_module.query_balances(
+            addresses=[string_to_evm_address(TEST_ACC1)],
+            uniswap_nfts=None,
+            ignore_cache=ignore_cache,
+        )
+        assert get_account_nfts_mock.call_count == call_count
+        with blockchain.database.conn.read_ctx() as cursor:
+            assert cursor.execute(
+                'SELECT identifier, last_price FROM nfts ORDER BY identifier',
+            ).fetchall() == expected
+
+    nft_1, nft_2 = make_nft(token_id=1, price=1), make_nft(token_id=2, price=2)
+    id_1, id_2 = nft_1.token_identifier, nft_2.token_identifier
+    with patch.object(nft_module.opensea, 'get_account_nfts') as get_account_nfts_mock:
+        query_and_assert([nft_1, nft_2], call_count=1, expected=[(id_1, '1'), (id_2, '2')])
+        query_and_assert([nft_1], call_count=2, expected=[(id_1, '1')])  # txs not queried
+        with blockchain.database.user_write() as write_cursor:
+            prefixes: tuple[Literal['txs', 'internaltxs', 'tokentxs'], ...] = ('txs', 'internaltxs', 'tokentxs')  # noqa: E501
+            for prefix in prefixes:
+                blockchain.database.update_used_query_range(
+                    write_cursor=write_cursor,
+                    name=f'{SupportedBlockchain.ETHEREUM.to_range_prefix(prefix)}_{TEST_ACC1}',
+                    start_ts=Timestamp(0),
+                    end_ts=ts_now(),
+                )
+
+        nft_1 = make_nft(token_id=1, price=3)
+        query_and_assert([nft_1], call_count=2, expected=[(id_1, '1')])  # no nft transfers
+        query_and_assert([nft_1], call_count=3, expected=[(id_1, '3')], ignore_cache=True)
+        nft_1 = make_nft(token_id=1, price=4)
+        query_and_assert([nft_1], call_count=3, expected=[(id_1, '3')])
+        freezer.tick(datetime.timedelta(seconds=NFTS_REFRESH_MAX_AGE))
+        query_and_assert([nft_1], call_count=4, expected=[(id_1, '4')])  # saved nfts too old
@@ -1,17 +1,22 @@
 import logging
 import subprocess  # noqa: S404  # is only used to execute rotki code here
+from unittest.mock import patch
 
 import gevent
 
-from rotkehlchen.assets.asset import Asset
+from rotkehlchen.assets.asset import Asset, CryptoAsset
+from rotkehlchen.assets.ignored_assets_handling import IgnoredAssetsHandling
+from rotkehlchen.assets.types import AssetType
 from rotkehlchen.config import default_data_directory
 from rotkehlchen.constants.assets import A_USD
 from rotkehlchen.db.filtering import LevenshteinFilterQuery
 from rotkehlchen.db.search_assets import search_assets_levenshtein
 from rotkehlchen.fval import FVal
+from rotkehlchen.globaldb.handler import GlobalDBHandler
+from rotkehlchen.globaldb.search_index import ASSETS_SEARCH_INDEX_QUERY
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.tests.fixtures.globaldb import create_globaldb
-from rotkehlchen.types import Price
+from rotkehlchen.types import ChainID, Price
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
@@ -39,6 +44,113 @@ def test_search_assets_levensthein_multiple(globaldb, database):  # pylint: disa
     assert all(x.exception is None for x in greenlets)
 
 
+def test_assets_search_index_matches_db(globaldb):
+    """Test that the in-memory assets search index returns the same assets as filtering
+    the assets tables directly in the DB"""
+    for substring, chain_id in (
+            ('eth', None),
+            ('usd', ChainID.ETHEREUM),
+            ('dai', ChainID.GNOSIS),
+            ('b', None),
+            ('tether', None),
+    ):
+        with globaldb.conn.read_ctx() as cursor:
+            query = ASSETS_SEARCH_INDEX_QUERY + 'WHERE (name LIKE ? OR symbol LIKE ?)'
+            bindings: list = [f'%{substring}%', f'%{substring}%']
+            if chain_id is not None:
+                query += ' AND (chain=? OR chain IS NULL)'
+                bindings.append(chain_id.serialize_for_db())
+            expected = {x[0] for x in cursor.execute(query, bindings)}
+            result = globaldb.assets_search_index.search(
+                cursor=cursor,
+                substring=substring,
+                chain_id=chain_id,
+                address=None,
+            )
+
+        assert {x.identifier for x in result} == expected
+
+
+def test_assets_search_index_updates(globaldb, database):
+    """Test that the assets search index picks up assets being added, edited and deleted"""
+    def search(substring):
+        return [x['identifier'] for x in search_assets_levenshtein(
+            db=database,
+            filter_query=LevenshteinFilterQuery.make(substring_search=substring),
+            limit=None,
+            search_nfts=False,
+        )]
+
+    assert search('zorbotron') == []  # builds the index
+    asset = CryptoAsset.initialize(
+        identifier='ZORB',
+        asset_type=AssetType.OWN_CHAIN,
+        name='Zorbotron',
+        symbol='ZRB',
+    )
+    GlobalDBHandler.add_asset(asset)
+    assert search('zorbotron') == ['ZORB']
+
+    GlobalDBHandler.edit_user_asset(CryptoAsset.initialize(
+        identifier='ZORB',
+        asset_type=AssetType.OWN_CHAIN,
+        name='Flurbonium',
+        symbol='FLB',
+    ))
+    assert search('zorbotron') == []
+    assert search('flurbo') == ['ZORB']
+
+    globaldb.delete_asset_by_identifier('ZORB')
+    assert search('flurbo') == []
+
+
+def test_assets_search_index_refreshes_dirty_in_chunks(globaldb):
+    """Test that the modified assets are re-read from the DB in chunks"""
+    index = globaldb.assets_search_index
+    with globaldb.conn.read_ctx() as cursor:
+        identifiers = [x.identifier for x in index.search(
+            cursor=cursor,
+            substring='usd',
+            chain_id=None,
+            address=None,
+        )][:5]
+        for identifier in identifiers:
+            index.mark_dirty(identifier)
+
+        with patch('rotkehlchen.globaldb.search_index.DIRTY_ENTRIES_CHUNK_LENGTH', new=2):
+            index.ensure_updated(cursor)
+        assert index.dirty == set()
+        assert set(identifiers) <= {x.identifier for x in index.search(
+            cursor=cursor,
+            substring='usd',
+            chain_id=None,
+            address=None,
+        )}
+
+
+def test_search_excludes_ignored_assets(globaldb, database):  # pylint: disable=unused-argument
+    """Test that with a limit only the top search results are checked for ignored assets
+    and that the results after the ignored ones fill the limit"""
+    def search(limit):
+        return [x['identifier'] for x in search_assets_levenshtein(
+            db=database,
+            filter_query=LevenshteinFilterQuery.make(
+                substring_search='usd',
+                ignored_assets_handling=IgnoredAssetsHandling.EXCLUDE,
+            ),
+            limit=limit,
+            search_nfts=False,
+        )]
+
+    all_results = search(limit=None)
+    with database.user_write() as write_cursor:
+        database.ignore_multiple_assets(write_cursor=write_cursor, assets=all_results[:3])
+
+    with patch('rotkehlchen.db.search_assets.IGNORED_SEARCH_RESULTS_CHUNK_LENGTH', new=2):
+        assert search(limit=5) == all_results[3:8]
+    assert search(limit=None) == all_results[3:]
+
+
 def get_identifier_from_stdout(stdout: str) -> str | None:
     """Utility function to extract the identifier from the stdout of a subprocess."""
     for line in stdout.splitlines():
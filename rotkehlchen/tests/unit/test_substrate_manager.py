@@ -1,7 +1,8 @@
 from typing import Any, NamedTuple
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
+from substrateinterface.exceptions import SubstrateRequestException
 
 from rotkehlchen.chain.substrate.manager import SubstrateManager
 from rotkehlchen.chain.substrate.types import (
@@ -10,6 +11,7 @@ from rotkehlchen.chain.substrate.types import (
     NodeNameAttributes,
     PolkadotNodeName,
 )
+from rotkehlchen.chain.substrate.utils import SUBSTRATE_ACCOUNTS_CHUNK_LENGTH
 from rotkehlchen.constants import ZERO
 from rotkehlchen.constants.assets import A_KSM
 from rotkehlchen.errors.misc import RemoteError
@@ -101,6 +103,42 @@ def test_get_account_balance_calculation(kusama_manager):
     assert balance == FVal(111.004701754251)  # (free + reserved)/10**12
 
 
+def test_get_accounts_balance_in_chunks(kusama_manager):
+    """Test `get_accounts_balance()` queries the storage of the accounts in chunks with
+    a single request each, and that each chunk fails over to the next node separately.
+    """
+    accounts = [f'account{idx}' for idx in range(SUBSTRATE_ACCOUNTS_CHUNK_LENGTH * 2 + 1)]
+    account_info = AccountInfo(value={'data': {'free': 2000000000000, 'reserved': 1000000000000}})
+
+    def mock_create_storage_key(pallet, storage_function, params):
+        assert (pallet, storage_function) == ('System', 'Account')
+        return MagicMock(params=params)
+
+    def mock_query_multi(storage_keys):
+        return [(storage_key, account_info) for storage_key in storage_keys]
+
+    def mock_failing_query_multi(storage_keys):
+        if failing_node_interface.query_multi.call_count == 2:  # only the second chunk fails
+            raise SubstrateRequestException('node is down')
+        return mock_query_multi(storage_keys)
+
+    failing_node_interface = MagicMock()
+    failing_node_interface.create_storage_key.side_effect = mock_create_storage_key
+    failing_node_interface.query_multi.side_effect = mock_failing_query_multi
+    node_interface = MagicMock()
+    node_interface.create_storage_key.side_effect = mock_create_storage_key
+    node_interface.query_multi.side_effect = mock_query_multi
+    with patch.object(kusama_manager, 'available_nodes_call_order', [
+        (KusamaNodeName.PARITY, NodeNameAttributes(node_interface=failing_node_interface, weight_block=1000)),  # noqa: E501
+        (KusamaNodeName.ELARA, NodeNameAttributes(node_interface=node_interface, weight_block=1000)),  # noqa: E501
+    ]):
+        balances = kusama_manager.get_accounts_balance(accounts)
+
+    assert balances == dict.fromkeys(accounts, FVal(3))
+    assert failing_node_interface.query_multi.call_count == 3
+    assert node_interface.query_multi.call_count == 1
+
+
 def test_set_available_nodes_call_order(kusama_manager):
     """Test `_set_available_nodes_call_order()` sets the available nodes sorted
     by preference; currently own node first and then by the highest 'weight_block'.
@@ -0,0 +1,74 @@
+import stat
+from http import HTTPStatus
+from pathlib import Path
+
+from freezegun import freeze_time
+
+from rotkehlchen.api.task_results import TaskResultsStore, serialize_task_result
+from rotkehlchen.fval import FVal
+
+
+def test_task_results_store_bounds():
+    """Test that the task results store evicts the oldest results when exceeding its
+    bounds and that results are returned processed for the api"""
+    store = TaskResultsStore(max_entries=2, max_memory_bytes=100)
+    assert store.add(0, serialize_task_result({'result': {'amount': FVal('1.5')}, 'message': ''})) == []  # noqa: E501
+    assert store.add(1, serialize_task_result({'result': None, 'message': 'error', 'status_code': HTTPStatus.CONFLICT})) == []  # noqa: E501
+    assert store.add(2, serialize_task_result({'result': True, 'message': ''})) == [0]
+    assert 0 not in store
+    assert store.pop(1) == {'result': None, 'message': 'error', 'status_code': HTTPStatus.CONFLICT}
+    assert store.pop(1) is None
+
+    assert store.add(3, serialize_task_result({'result': 'a' * 100, 'message': ''})) == [2]  # over the size bound  # noqa: E501
+    assert store.stats.entries == 1
+    assert store.stats.evicted == 2
+
+    store = TaskResultsStore()
+    assert store.add(0, serialize_task_result({'result': {'amount': FVal('1.5')}, 'message': ''})) == []  # noqa: E501
+    assert store.pop(0) == {'result': {'amount': '1.5'}, 'message': ''}
+    assert store.stats.memory_bytes == 0
+
+
+def test_task_results_store_ttl():
+    """Test that results not fetched within the TTL are evicted"""
+    store = TaskResultsStore(ttl_secs=60)
+    with freeze_time('2024-01-01 00:00:00'):
+        store.add(0, serialize_task_result({'result': 1, 'message': ''}))
+    with freeze_time('2024-01-01 00:00:30'):
+        store.add(1, serialize_task_result({'result': 2, 'message': ''}))
+        assert store.evict() == []
+    with freeze_time('2024-01-01 00:01:15'):
+        assert store.evict() == [0]
+        assert store.pop(1) == {'result': 2, 'message': ''}
+
+
+def test_task_results_store_spill_to_disk(tmp_path: Path):
+    """Test that large results are written to the given directory readable only by the
+    user, that they are removed after being fetched and that files left by a previous
+    run are removed"""
+    spill_dir = tmp_path / 'task_results'
+    spill_dir.mkdir()
+    (leftover_path := spill_dir / '5.json').write_text('{}', encoding='utf8')
+    store = TaskResultsStore(max_disk_bytes=1000, spill_dir=spill_dir, spill_threshold_bytes=100)
+    assert not leftover_path.exists()
+
+    store.add(0, serialize_task_result({'result': 'a' * 500, 'message': ''}))
+    store.add(1, serialize_task_result({'result': 'b', 'message': ''}))
+    assert store.stats.spilled_entries == 1
+    assert store.stats.disk_bytes > 500
+    spilled_path = spill_dir / '0.json'
+    assert stat.S_IMODE(spill_dir.stat().st_mode) == 0o700
+    assert stat.S_IMODE(spilled_path.stat().st_mode) == 0o600
+    assert store.pop(0) == {'result': 'a' * 500, 'message': ''}
+    assert not spilled_path.exists()
+
+    store.add(2, serialize_task_result({'result': 'c' * 500, 'message': ''}))
+    assert store.add(3, serialize_task_result({'result': 'd' * 500, 'message': ''})) == [2]  # over the disk bound  # noqa: E501
+    assert not (spill_dir / '2.json').exists()
+    assert 1 in store  # results in memory are not evicted due to the disk bound
+
+    store.clear()
+    assert not spill_dir.exists()
+    assert store.stats.entries == 0
+    store.add(4, serialize_task_result({'result': 'e' * 500, 'message': ''}))  # dir is recreated
+    assert (spill_dir / '4.json').exists()
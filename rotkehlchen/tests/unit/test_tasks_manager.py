@@ -36,7 +36,13 @@ from rotkehlchen.premium.premium import (
     SubscriptionStatus,
 )
 from rotkehlchen.serialization.deserialize import deserialize_timestamp
-from rotkehlchen.tasks.manager import PREMIUM_STATUS_CHECK, TaskManager
+from rotkehlchen.tasks.manager import (
+    PREMIUM_STATUS_CHECK,
+    TASK_SCHEDULE_ATTRIBUTE,
+    TaskManager,
+    TaskPriority,
+    task_schedule,
+)
 from rotkehlchen.tasks.utils import should_run_periodic_task
 from rotkehlchen.tests.fixtures.websockets import WebsocketReader
 from rotkehlchen.tests.utils.ethereum import (
@@ -75,9 +81,64 @@ if TYPE_CHECKING:
 
 
 def test_potential_maybe_schedule_task(task_manager: TaskManager):
-    """Check that all the _maybe_... tasks are included in the potential tasks."""
+    """Check that all the _maybe_... tasks are included in the potential tasks
+    and that all of them have a schedule."""
     tasks = {function.__name__ for function in task_manager.potential_tasks}
     assert all(func in tasks for func in dir(task_manager) if func.startswith('_maybe_'))
+    assert all(
+        hasattr(getattr(task_manager, func), TASK_SCHEDULE_ATTRIBUTE)
+        for func in dir(task_manager) if func.startswith('_maybe_')
+    )
+    assert all(hasattr(x, TASK_SCHEDULE_ATTRIBUTE) for x in task_manager.potential_tasks)
+
+
+@pytest.mark.parametrize('max_tasks_num', [1])
+def test_urgent_tasks_do_not_wait(task_manager: TaskManager) -> None:
+    """Check that urgent tasks run before other due tasks and even when all slots are taken
+    and that tasks which decided not to run are not asked again until their recheck time"""
+    task_manager.should_schedule = True
+    calls = []
+
+    def make_task(name: str, priority: TaskPriority, spawn: bool) -> Any:
+        def task() -> list[gevent.Greenlet] | None:
+            calls.append(name)
+            if spawn is False:
+                return None
+            return [task_manager.greenlet_manager.spawn_and_track(
+                after_seconds=None,
+                task_name=name,
+                exception_is_error=True,
+                method=gevent.sleep,
+                seconds=10,
+            )]
+
+        task.__name__ = name
+        return task_schedule(priority, recheck_secs=60)(task)
+
+    cache_task = make_task('_maybe_update_curve_pools', TaskPriority.LOW, spawn=True)
+    decline_task = make_task('_maybe_query_produced_blocks', TaskPriority.NORMAL, spawn=False)
+    urgent_task = make_task('_maybe_decode_evm_transactions', TaskPriority.URGENT, spawn=True)
+    try:
+        task_manager.potential_tasks = [cache_task, decline_task]
+        task_manager.schedule()
+        assert calls == ['_maybe_query_produced_blocks', '_maybe_update_curve_pools']
+
+        # the only slot is taken by the cache refresh but the urgent task still runs
+        task_manager.potential_tasks.append(urgent_task)
+        task_manager.schedule()
+        assert calls[2:] == ['_maybe_decode_evm_transactions']
+        assert task_manager.running_greenlets.keys() == {cache_task, urgent_task}
+
+        # nothing is due so nothing is called
+        task_manager.schedule()
+        assert len(calls) == 3
+        assert task_manager.scheduler_stats.queue_depth == 0
+        task_manager.schedule_now(decline_task)
+        task_manager.schedule()
+        assert len(calls) == 3  # no slot left for it
+        assert task_manager.scheduler_stats.queue_depth == 1
+    finally:
+        gevent.killall(task_manager.greenlet_manager.greenlets)
 
 
 @pytest.mark.parametrize('number_of_eth_accounts', [2])
@@ -1,28 +1,42 @@
 import datetime
 from contextlib import suppress
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 from unittest.mock import MagicMock, patch
 
 import gevent
 import pytest
 
+from rotkehlchen.assets.asset import Asset
 from rotkehlchen.assets.utils import _query_or_get_given_token_info, get_or_create_evm_token
 from rotkehlchen.chain.ethereum.tokens import EthereumTokens
-from rotkehlchen.chain.evm.tokens import generate_multicall_chunks
-from rotkehlchen.chain.evm.types import string_to_evm_address
+from rotkehlchen.chain.evm.decoding.constants import ERC20_OR_ERC721_TRANSFER
+from rotkehlchen.chain.evm.tokens import (
+    ADDRESS_TOKEN_BALANCES_MAX_AGE,
+    ADDRESS_TOKEN_BALANCES_RANGE_TOLERANCE,
+    TOKEN_CHUNK_LENGTH_INCREASE,
+    generate_multicall_chunks,
+)
+from rotkehlchen.chain.evm.types import NodeName, WeightedNode, string_to_evm_address
 from rotkehlchen.chain.structures import EvmTokenDetectionData
 from rotkehlchen.constants import ONE
 from rotkehlchen.constants.assets import A_DAI, A_OMG, A_WETH
 from rotkehlchen.constants.resolver import evm_address_to_identifier
 from rotkehlchen.db.constants import EVM_ACCOUNTS_DETAILS_TOKENS
-from rotkehlchen.errors.misc import InputError
+from rotkehlchen.db.evmtx import DBEvmTx
+from rotkehlchen.errors.misc import InputError, NodesQueryError, RemoteError
 from rotkehlchen.fval import FVal
 from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.tests.utils.constants import A_GNOSIS_EURE, A_LPT
-from rotkehlchen.tests.utils.factories import make_evm_address
-from rotkehlchen.types import ChainID, ChecksumEvmAddress, EvmTokenKind, SupportedBlockchain
-from rotkehlchen.utils.misc import ts_now
+from rotkehlchen.tests.utils.factories import make_evm_address, make_evm_tx_hash
+from rotkehlchen.types import (
+    ChainID,
+    ChecksumEvmAddress,
+    EvmTokenKind,
+    SupportedBlockchain,
+    Timestamp,
+)
+from rotkehlchen.utils.misc import address_to_bytes32, ts_now
 
 if TYPE_CHECKING:
     from rotkehlchen.chain.ethereum.node_inquirer import EthereumInquirer
@@ -146,6 +160,178 @@ def test_generate_chunks():
     assert generated_chunks == expected_chunks
 
 
+def test_concurrent_chunks_adapt_length(tokens: EthereumTokens) -> None:
+    """Test that token balance chunks are spread over the nodes, that chunks failing due to
+    the node limits are split in halves and that the chunk length adapts to the failures"""
+    address = make_evm_address()
+    detection_data = [EvmTokenDetectionData(
+        identifier=f'eip155:1/erc20:{(token_address := make_evm_address())}',
+        address=token_address,
+        decimals=18,
+    ) for _ in range(400)]
+    call_order = [WeightedNode(
+        node_info=NodeName(name=f'node{idx}', endpoint=f'https://node{idx}', owned=False, blockchain=SupportedBlockchain.ETHEREUM),  # noqa: E501
+        active=True,
+        weight=ONE,
+    ) for idx in range(2)]
+    queried_nodes = set()
+
+    def mock_call(arguments, call_order, **kwargs):
+        queried_nodes.add(call_order[0].node_info.name)
+        if len(arguments[1]) > 60:
+            raise RemoteError('Response size exceeded')
+        return [10 ** 18] * len(arguments[1])
+
+    with patch.object(tokens.evm_inquirer.contract_scan, 'call', side_effect=mock_call):
+        balances = tokens._query_chunks(
+            address=address,
+            tokens=detection_data,
+            chunk_size=200,
+            call_order=call_order,
+        )
+
+    assert balances == {Asset(x.identifier): ONE for x in detection_data}
+    assert queried_nodes == {'node0', 'node1'}
+    assert tokens.max_chunk_length is not None and tokens.max_chunk_length <= 100 + TOKEN_CHUNK_LENGTH_INCREASE  # noqa: E501
+
+
+def test_chunks_other_errors_are_raised(tokens: EthereumTokens) -> None:
+    """Test that token balance chunks failing for reasons other than the node limits are not
+    split, that the error is raised and that the queries of the other chunks are stopped"""
+    detection_data = [EvmTokenDetectionData(
+        identifier=f'eip155:1/erc20:{(token_address := make_evm_address())}',
+        address=token_address,
+        decimals=18,
+    ) for _ in range(400)]
+    call_order = [WeightedNode(
+        node_info=NodeName(name=f'node{idx}', endpoint=f'https://node{idx}', owned=False, blockchain=SupportedBlockchain.ETHEREUM),  # noqa: E501
+        active=True,
+        weight=ONE,
+    ) for idx in range(2)]
+    queried_chunks = []
+
+    def mock_call(arguments, call_order, **kwargs):
+        queried_chunks.append(len(arguments[1]))
+        gevent.sleep(0.01 * (chunk_idx := len(queried_chunks)))
+        if chunk_idx == 1:
+            raise NodesQueryError(message='Nodes not reachable', node_errors=['Connection refused'])  # noqa: E501
+        return [10 ** 18] * len(arguments[1])
+
+    with (
+        patch.object(tokens.evm_inquirer.contract_scan, 'call', side_effect=mock_call),
+        pytest.raises(RemoteError, match='Nodes not reachable'),
+    ):
+        tokens._query_chunks(
+            address=make_evm_address(),
+            tokens=detection_data,
+            chunk_size=20,
+            call_order=call_order,
+        )
+
+    gevent.sleep(0.5)
+    assert set(queried_chunks) == {20}  # not split
+    assert len(queried_chunks) < 20  # the remaining chunks were not queried
+    assert tokens.max_chunk_length is None
+
+
+def test_inactive_address_balances_are_reused(tokens: EthereumTokens, freezer) -> None:
+    """Test that the token balances of an address are only queried again if the address
+    may have had activity since the last query"""
+    address, dai = make_evm_address(), A_DAI.resolve_to_evm_token()
+    with tokens.db.user_write() as write_cursor:
+        tokens.db.save_tokens_for_address(
+            write_cursor=write_cursor,
+            address=address,
+            blockchain=SupportedBlockchain.ETHEREUM,
+            tokens=[dai],
+        )
+
+    multicall_mock = MagicMock(return_value={address: {dai: ONE}})
+    with (
+        patch.object(tokens, '_get_multicall_token_balances', new=multicall_mock),
+        patch.object(tokens.evm_inquirer, 'get_latest_block_number', return_value=100),
+        patch.object(Inquirer, 'find_usd_price', return_value=ONE),
+    ):
+        def query_and_assert(
+                native_balance: FVal,
+                call_count: int,
+                ignore_cache: bool = False,
+        ) -> None:
+            balances, _ = tokens.query_tokens_for_addresses(
+                addresses=[address],
+                native_balances={address: native_balance},
+                ignore_cache=ignore_cache,
+            )
+            assert balances == {address: {dai: ONE}}
+            assert multicall_mock.call_count == call_count
+
+        def query_transactions() -> None:
+            range_types: tuple[Literal['txs', 'internaltxs', 'tokentxs'], ...] = ('txs', 'internaltxs', 'tokentxs')  # noqa: E501
+            with tokens.db.user_write() as write_cursor:
+                for range_type in range_types:
+                    tokens.db.update_used_query_range(
+                        write_cursor=write_cursor,
+                        name=f'{SupportedBlockchain.ETHEREUM.to_range_prefix(range_type)}_{address}',
+                        start_ts=Timestamp(0),
+                        end_ts=ts_now(),
+                    )
+
+        query_and_assert(native_balance=ONE, call_count=1)
+        query_and_assert(native_balance=ONE, call_count=2)  # transactions were never queried
+        query_transactions()
+        query_and_assert(native_balance=ONE, call_count=2)  # inactive, balances are reused
+        query_and_assert(native_balance=ONE, call_count=3, ignore_cache=True)
+        query_and_assert(native_balance=FVal(2), call_count=4)  # native balance changed
+        query_and_assert(native_balance=FVal(2), call_count=4)
+        freezer.tick(datetime.timedelta(seconds=ADDRESS_TOKEN_BALANCES_RANGE_TOLERANCE + 1))
+        query_and_assert(native_balance=FVal(2), call_count=5, ignore_cache=True)
+        query_and_assert(native_balance=FVal(2), call_count=6)  # txs not queried since then
+        query_transactions()
+        query_and_assert(native_balance=FVal(2), call_count=6)
+        freezer.tick(datetime.timedelta(seconds=ADDRESS_TOKEN_BALANCES_MAX_AGE))
+        query_transactions()
+        query_and_assert(native_balance=FVal(2), call_count=7)  # cached balances are too old
+
+
+def test_balances_reused_after_earlier_transactions_query(tokens: EthereumTokens) -> None:
+    """Test that the token balances of an inactive address are reused when its transactions
+    were queried shortly before the balances and not in the same second"""
+    address, dai = make_evm_address(), A_DAI.resolve_to_evm_token()
+    with tokens.db.user_write() as write_cursor:
+        tokens.db.save_tokens_for_address(
+            write_cursor=write_cursor,
+            address=address,
+            blockchain=SupportedBlockchain.ETHEREUM,
+            tokens=[dai],
+        )
+
+    def query_transactions(end_ts: Timestamp) -> None:
+        range_types: tuple[Literal['txs', 'internaltxs', 'tokentxs'], ...] = ('txs', 'internaltxs', 'tokentxs')  # noqa: E501
+        with tokens.db.user_write() as write_cursor:
+            for range_type in range_types:
+                tokens.db.update_used_query_range(
+                    write_cursor=write_cursor,
+                    name=f'{SupportedBlockchain.ETHEREUM.to_range_prefix(range_type)}_{address}',
+                    start_ts=Timestamp(0),
+                    end_ts=end_ts,
+                )
+
+    multicall_mock = MagicMock(return_value={address: {dai: ONE}})
+    with (
+        patch.object(tokens, '_get_multicall_token_balances', new=multicall_mock),
+        patch.object(tokens.evm_inquirer, 'get_latest_block_number', return_value=100),
+        patch.object(Inquirer, 'find_usd_price', return_value=ONE),
+    ):
+        query_transactions(end_ts=Timestamp(ts_now() - 5))
+        for _ in range(2):
+            tokens.query_tokens_for_addresses(addresses=[address], native_balances={address: ONE})
+        assert multicall_mock.call_count == 1
+
+        query_transactions(end_ts=Timestamp(ts_now() - ADDRESS_TOKEN_BALANCES_RANGE_TOLERANCE - 5))
+        tokens.query_tokens_for_addresses(addresses=[address], native_balances={address: ONE})
+        assert multicall_mock.call_count == 2  # txs were not queried around the last query
+
+
 def test_last_queried_ts(tokens, freezer):
     """
     Checks that after detecting evm tokens last_queried_timestamp is updated and there
@@ -188,6 +374,66 @@ def test_last_queried_ts(tokens, freezer):
         assert int(after_second_query[0][1]) >= continuation
 
 
+def test_incremental_detection(tokens):
+    """Checks that after a full detection only the tokens transferred in new receipt logs
+    are checked, and that all the known tokens are checked again when a full scan is asked.
+    Also checks that new logs reusing the identifiers of deleted logs are checked."""
+    address, token_address, tx_hash = make_evm_address(), make_evm_address(), make_evm_tx_hash()
+    queried_addresses = []
+
+    def mock_get_token_detection_data(chain_id, exceptions, protocol=None, addresses=None):
+        queried_addresses.append(addresses)
+        return []
+
+    def add_transfer_log() -> None:
+        with tokens.db.user_write() as write_cursor:
+            write_cursor.execute(
+                'INSERT INTO evm_transactions(identifier, tx_hash, chain_id, timestamp, '
+                'block_number, from_address, to_address, value, gas, gas_price, gas_used, '
+                "input_data, nonce) VALUES(1, ?, 1, 1, 1, ?, ?, '0', '0', '0', '0', ?, 0)",
+                (tx_hash, make_evm_address(), token_address, b''),
+            )
+            write_cursor.execute('INSERT INTO evmtx_receipts(tx_id, status, type) VALUES(1, 1, 0)')
+            write_cursor.execute(
+                'INSERT INTO evmtx_receipt_logs(identifier, tx_id, log_index, data, address) '
+                'VALUES(1, 1, 0, ?, ?)',
+                (b'', token_address),
+            )
+            write_cursor.executemany(
+                'INSERT INTO evmtx_receipt_log_topics(log, topic, topic_index) VALUES(1, ?, ?)',
+                [
+                    (ERC20_OR_ERC721_TRANSFER, 0),
+                    (address_to_bytes32(make_evm_address()), 1),
+                    (address_to_bytes32(address), 2),
+                ],
+            )
+
+    with patch(
+        'rotkehlchen.globaldb.handler.GlobalDBHandler.get_token_detection_data',
+        new=mock_get_token_detection_data,
+    ):
+        tokens.detect_tokens(only_cache=False, addresses=[address])
+        assert queried_addresses == [None]  # first detection checks all the known tokens
+
+        tokens.detect_tokens(only_cache=False, addresses=[address])
+        assert queried_addresses == [None]  # no new transfers so nothing to check
+
+        add_transfer_log()
+        tokens.detect_tokens(only_cache=False, addresses=[address])
+        assert queried_addresses == [None, {token_address}]
+        tokens.detect_tokens(only_cache=False, addresses=[address])
+        assert queried_addresses == [None, {token_address}]  # the log was already checked
+
+        tokens.detect_tokens(only_cache=False, addresses=[address], full_scan=True)
+        assert queried_addresses == [None, {token_address}, None]
+
+        # delete the single transaction and save it again so that its log reuses identifier 1
+        DBEvmTx(tokens.db).delete_evm_transaction_data(chain=SupportedBlockchain.ETHEREUM, tx_hash=tx_hash)  # noqa: E501
+        add_transfer_log()
+        tokens.detect_tokens(only_cache=False, addresses=[address])
+        assert queried_addresses == [None, {token_address}, None, {token_address}]
+
+
 def test_cache_is_per_token_type(ethereum_inquirer):
     """This test makes sure that different info cache is used per token type."""
     address = make_evm_address()
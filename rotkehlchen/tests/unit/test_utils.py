@@ -4,6 +4,7 @@ from datetime import datetime
 from json.decoder import JSONDecodeError
 from unittest.mock import patch
 
+import gevent
 import pytest
 from eth_typing import HexAddress, HexStr
 from eth_utils import to_checksum_address
@@ -11,6 +12,7 @@ from hexbytes import HexBytes
 from packaging.version import Version
 
 from rotkehlchen.chain.ethereum.utils import generate_address_via_create2
+from rotkehlchen.errors.misc import GreenletKilledError
 from rotkehlchen.errors.serialization import ConversionError
 from rotkehlchen.externalapis.github import Github
 from rotkehlchen.fval import FVal
@@ -183,6 +185,7 @@ class Foo(CacheableMixIn):
         self.do_sum_call_count = 0
         self.do_something_call_count = 0
         self.do_something_arguments_dont_matter_count = 0
+        self.do_slow_division_call_count = 0
 
     @cache_response_timewise()
     def do_sum(self, arg1, arg2, **kwargs):  # pylint: disable=unused-argument
@@ -199,6 +202,12 @@ class Foo(CacheableMixIn):
         self.do_something_arguments_dont_matter_count += 1
         return arg1 + arg2
 
+    @cache_response_timewise()
+    def do_slow_division(self, arg1, arg2, **kwargs):  # pylint: disable=unused-argument
+        self.do_slow_division_call_count += 1
+        gevent.sleep(0.1)
+        return arg1 / arg2
+
 
 def test_cache_response_timewise():
     """Test that cached value is called and not the function again"""
@@ -248,6 +257,33 @@ def test_cache_response_timewise_with_arguments_matter_false():
     assert instance.do_something_arguments_dont_matter_count == 2
 
 
+def test_cache_response_timewise_single_flight():
+    """Test that concurrent calls that miss the cache wait for the first call
+    and get its result or its exception instead of calling the function again.
+    If the first call is killed then the waiting calls compute the result again."""
+    instance = Foo()
+    greenlets = [gevent.spawn(instance.do_slow_division, 4, 2) for _ in range(3)]
+    greenlets.append(gevent.spawn(instance.do_slow_division, 9, 3))
+    gevent.joinall(greenlets, raise_error=True)
+    assert [x.value for x in greenlets] == [2, 2, 2, 3]
+    assert instance.do_slow_division_call_count == 2
+    assert instance.inflight_results == {}
+
+    greenlets = [gevent.spawn(instance.do_slow_division, 1, 0) for _ in range(3)]
+    gevent.joinall(greenlets)
+    assert all(isinstance(x.exception, ZeroDivisionError) for x in greenlets)
+    assert instance.do_slow_division_call_count == 3
+    assert instance.inflight_results == {}
+
+    greenlets = [gevent.spawn(instance.do_slow_division, 8, 2) for _ in range(3)]
+    gevent.sleep(0.01)  # let all of them start and wait for the first
+    greenlets[0].kill(exception=GreenletKilledError('Killed due to api request'))
+    gevent.joinall(greenlets[1:], raise_error=True)
+    assert [x.value for x in greenlets[1:]] == [4, 4]
+    assert instance.do_slow_division_call_count == 5  # only one of the waiters computed it
+    assert instance.inflight_results == {}
+
+
 def test_convert_to_int():
     assert convert_to_int('5') == 5
     assert convert_to_int('37451082560000003241000000000003221111111111') == 37451082560000003241000000000003221111111111  # noqa: E501
@@ -0,0 +1,76 @@
+import datetime
+import json
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, NamedTuple
+
+
+class BenchmarkCounter:
+    """Set by the benchmarked code to the number of items it processed"""
+
+    def __init__(self) -> None:
+        self.items = 0
+
+
+class BenchmarkMeasurement(NamedTuple):
+    name: str
+    unit: str
+    counter: BenchmarkCounter
+    seconds: float
+
+    @property
+    def items(self) -> int:
+        """Read lazily so that the items can also be counted after the timed code"""
+        return self.counter.items
+
+    @property
+    def per_second(self) -> float:
+        return self.items / self.seconds if self.seconds != 0 else 0.0
+
+    def serialize(self) -> dict[str, Any]:
+        return {
+            'name': self.name,
+            'unit': self.unit,
+            'items': self.items,
+            'seconds': round(self.seconds, 6),
+            'per_second': round(self.per_second, 3),
+        }
+
+
+class BenchmarkRecorder:
+    """Collects the measurements of the offline benchmark suite and writes them to a
+    json file tagged with the current commit so that runs can be compared per commit"""
+
+    def __init__(self, output_path: Path | None) -> None:
+        self.output_path = output_path
+        self.measurements: list[BenchmarkMeasurement] = []
+
+    @contextmanager
+    def measure(self, name: str, unit: str) -> Iterator[BenchmarkCounter]:
+        """Time the code inside the context. The caller should set the counter's
+        items to the number of items processed so that throughput can be computed.
+        The items may also be set after the context exits, so that counting them
+        is not timed."""
+        counter = BenchmarkCounter()
+        start = time.perf_counter()
+        yield counter
+        self.measurements.append(BenchmarkMeasurement(
+            name=name,
+            unit=unit,
+            counter=counter,
+            seconds=time.perf_counter() - start,
+        ))
+
+    def write(self) -> None:
+        if self.output_path is None or len(self.measurements) == 0:
+            return
+
+        commit = os.popen('git rev-parse HEAD').read().rstrip('\n')
+        self.output_path.write_text(json.dumps({
+            'commit': commit,
+            'timestamp': datetime.datetime.now(tz=datetime.UTC).isoformat(),
+            'measurements': [x.serialize() for x in self.measurements],
+        }, indent=2), encoding='utf8')
@@ -592,7 +592,7 @@ def assert_poloniex_balances_result(balances: dict[str, Any]) -> None:
     assert balances['ETH']['usd_value'] is not None
 
 
-def mock_binance_balance_response(url, **kwargs):  # pylint: disable=unused-argument
+def mock_binance_balance_response(url: str, **kwargs: Any) -> MockResponse:  # pylint: disable=unused-argument
     if 'futures' in url:
         return MockResponse(200, BINANCE_FUTURES_WALLET_RESPONSE)
     if 'https://fapi' in url:
@@ -1161,6 +1161,7 @@ class CacheType(Enum):
     CURVE_LENDING_VAULT_COLLATERAL_TOKEN = auto()
     CURVE_LENDING_VAULT_BORROWED_TOKEN = auto()
     AURA_POOLS = auto()  # stores count of pools in db + chain_id (stringified)
+    UNISWAP_ORACLE_POOLS = auto()  # comma separated pools in which two tokens can be swapped
 
     def serialize(self) -> str:
         # Using custom serialize method instead of SerializableEnumMixin since mixin replaces
@@ -1200,6 +1201,7 @@ UniqueCacheType = Literal[
     CacheType.CURVE_LENDING_VAULT_COLLATERAL_TOKEN,
     CacheType.CURVE_LENDING_VAULT_BORROWED_TOKEN,
     CacheType.AURA_POOLS,
+    CacheType.UNISWAP_ORACLE_POOLS,
 ]
 
 UNIQUE_CACHE_KEYS: tuple[UniqueCacheType, ...] = typing.get_args(UniqueCacheType)
@@ -4,13 +4,15 @@ import functools
 import logging
 import operator
 import re
+import shutil
 import sys
 import time
 from binascii import unhexlify
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Iterator, Sequence
 from itertools import zip_longest
-from typing import TYPE_CHECKING, Any, TypeVar, overload
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final, TypeVar, overload
 
 from eth_utils import is_hexstr
 from eth_utils.address import to_checksum_address
@@ -25,6 +27,8 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+FICLONE: Final = 0x40049409  # linux ioctl that makes dst share src's data blocks (reflink)
+
 
 def ts_now() -> Timestamp:
     return Timestamp(int(time.time()))
@@ -264,6 +268,23 @@ def bytes32hexstr_to_address(hexstr: str) -> ChecksumEvmAddress:
 T = TypeVar('T')
 
 
+def clone_or_copy_file(source: Path, destination: Path) -> None:
+    """Copy source to destination. On linux filesystems with copy-on-write support
+    (btrfs, xfs, bcachefs etc.) this is a reflink which shares the data blocks with the
+    source so it is instant regardless of the file size. Otherwise falls back to a full copy."""
+    if sys.platform == 'linux':
+        import fcntl
+        try:
+            with open(source, 'rb') as source_file, open(destination, 'wb') as destination_file:
+                fcntl.ioctl(destination_file.fileno(), FICLONE, source_file.fileno())
+        except OSError as e:
+            log.debug(f'Could not reflink {source} to {destination} due to {e!s}. Copying it')
+        else:
+            return
+
+    shutil.copyfile(source, destination)
+
+
 @overload
 def get_chunks(lst: list[T], n: int) -> Iterator[list[T]]:
     ...
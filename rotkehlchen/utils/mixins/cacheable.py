@@ -3,6 +3,10 @@ from copy import deepcopy
 from functools import wraps
 from typing import TYPE_CHECKING, Any, NamedTuple
 
+import gevent
+from gevent.event import AsyncResult
+
+from rotkehlchen.errors.misc import GreenletKilledError, InflightResultAbortedError
 from rotkehlchen.utils.misc import ts_now
 
 from .common import function_sig_key
@@ -17,6 +21,12 @@ class ResultCache(NamedTuple):
     timestamp: 'Timestamp'
 
 
+class InflightResult(NamedTuple):
+    """Represents a result of some API query that is still being computed"""
+    result: AsyncResult
+    greenlet: gevent.Greenlet  # the greenlet computing the result
+
+
 # Seconds for which cached api queries will be cached
 # By default 10 minutes.
 # TODO: Make configurable!
@@ -33,6 +43,8 @@ class CacheableMixIn:
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.results_cache: dict[int, ResultCache] = {}
+        # results that are being computed right now, keyed like results_cache
+        self.inflight_results: dict[int, InflightResult] = {}
         # Can also be 0 which means cache is disabled.
         self.cache_ttl_secs = CACHE_RESPONSE_FOR_SECS
 
@@ -45,6 +57,8 @@ class CacheableMixIn:
             **kwargs,
         )
         self.results_cache.pop(cache_key, None)
+        # also make sure that following calls don't wait for a result computed before the flush
+        self.inflight_results.pop(cache_key, None)
 
 
 def _cache_response_timewise_base(
@@ -54,7 +68,7 @@ def _cache_response_timewise_base(
         forward_ignore_cache: bool,
         *args: Any,
         **kwargs: Any,
-) -> tuple[bool, int, 'Timestamp', dict]:
+) -> tuple[bool, bool, int, 'Timestamp', dict]:
     """Base code used in the 2 cache_response_timewise decorators"""
     if forward_ignore_cache:
         ignore_cache = kwargs.get('ignore_cache', False)
@@ -77,7 +91,54 @@ def _cache_response_timewise_base(
         cache_key not in wrappingobj.results_cache or
         cache_life_secs >= wrappingobj.cache_ttl_secs
     )
-    return cache_miss, cache_key, now, kwargs
+    return cache_miss, ignore_cache, cache_key, now, kwargs
+
+
+def _compute_single_flight(
+        wrappingobj: CacheableMixIn,
+        f: Callable,
+        cache_key: int,
+        now: 'Timestamp',
+        ignore_cache: bool,
+        *args: Any,
+        **kwargs: Any,
+) -> Any:
+    """Compute the result of a cache miss and write it in the cache.
+
+    If the same result is already being computed by another greenlet then wait for it
+    instead of computing it again. Exceptions are raised to all the waiting callers.
+    If the computing greenlet is killed then the waiting callers compute the result
+    again. Callers that ignore the cache always compute the result and following
+    callers wait for their result.
+    """
+    while (
+            ignore_cache is False and
+            (inflight := wrappingobj.inflight_results.get(cache_key)) is not None and
+            inflight.greenlet is not gevent.getcurrent()  # avoid waiting on ourselves
+    ):
+        try:
+            return inflight.result.get()
+        except InflightResultAbortedError:
+            continue  # the first woken up caller computes it and the rest wait for it
+
+    async_result = AsyncResult()
+    wrappingobj.inflight_results[cache_key] = InflightResult(async_result, gevent.getcurrent())
+    try:
+        result = f(wrappingobj, *args, **kwargs)
+    except BaseException as e:
+        if isinstance(e, Exception) and not isinstance(e, GreenletKilledError):
+            async_result.set_exception(e)
+        else:  # killed. Waiters wake up after the entry is dropped below and compute it again
+            async_result.set_exception(InflightResultAbortedError())
+        raise
+    else:
+        wrappingobj.results_cache[cache_key] = ResultCache(result, now)
+        async_result.set(result)
+    finally:  # a caller ignoring the cache may have replaced our entry in the meantime
+        if (entry := wrappingobj.inflight_results.get(cache_key)) is not None and entry.result is async_result:  # noqa: E501
+            del wrappingobj.inflight_results[cache_key]
+
+    return result
 
 
 def cache_response_timewise(
@@ -101,6 +162,9 @@ def cache_response_timewise(
     If the special keyword argument ignore_cache=True is given then the cache check
     is completely skipped
 
+    On a cache miss only one call per cache key runs at a time. Concurrent callers with
+    the same key wait for the ongoing call and get its result or its exception.
+
     If arguments_matter is True then a different cache is kept for each different
     combination of arguments.
 
@@ -110,7 +174,7 @@ def cache_response_timewise(
     def _cache_response_timewise(f: Callable) -> Callable:
         @wraps(f)
         def wrapper(wrappingobj: CacheableMixIn, *args: Any, **kwargs: Any) -> Any:
-            cache_miss, cache_key, now, kwargs = _cache_response_timewise_base(
+            cache_miss, ignore_cache, cache_key, now, kwargs = _cache_response_timewise_base(
                 wrappingobj,
                 f,
                 arguments_matter,
@@ -119,10 +183,16 @@ def cache_response_timewise(
                 **kwargs,
             )
             if cache_miss:
-                # Call the function, write the result in cache and return it
-                result = f(wrappingobj, *args, **kwargs)
-                wrappingobj.results_cache[cache_key] = ResultCache(result, now)
-                return result
+                # Call the function or wait for the ongoing call. Cache the result and return it
+                return _compute_single_flight(
+                    wrappingobj,
+                    f,
+                    cache_key,
+                    now,
+                    ignore_cache,
+                    *args,
+                    **kwargs,
+                )
 
             # else hit the cache and return it
             return wrappingobj.results_cache[cache_key].result
@@ -141,7 +211,7 @@ def cache_response_timewise_immutable(
     def _cache_response_timewise_immutable(f: Callable) -> Callable:
         @wraps(f)
         def wrapper(wrappingobj: CacheableMixIn, *args: Any, **kwargs: Any) -> Any:
-            cache_miss, cache_key, now, kwargs = _cache_response_timewise_base(
+            cache_miss, ignore_cache, cache_key, now, kwargs = _cache_response_timewise_base(
                 wrappingobj,
                 f,
                 arguments_matter,
@@ -150,12 +220,21 @@ def cache_response_timewise_immutable(
                 **kwargs,
             )
             if cache_miss:
-                # Call the function, and write the result in cache
-                result = f(wrappingobj, *args, **kwargs)
-                wrappingobj.results_cache[cache_key] = ResultCache(result, now)
-
-            # in any case return a copy of the cache to avoid potential mutation
-            return deepcopy(wrappingobj.results_cache[cache_key].result)
+                # Call the function (or wait for the ongoing call), and write the result in cache
+                result = _compute_single_flight(
+                    wrappingobj,
+                    f,
+                    cache_key,
+                    now,
+                    ignore_cache,
+                    *args,
+                    **kwargs,
+                )
+            else:
+                result = wrappingobj.results_cache[cache_key].result
+
+            # in any case return a copy of the result to avoid potential mutation
+            return deepcopy(result)
 
         return wrapper
     return _cache_response_timewise_immutable
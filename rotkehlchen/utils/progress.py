@@ -93,18 +93,18 @@ def perform_userdb_upgrade_steps(
         should_vacuum: bool = False,
 ) -> None:
     """Performs caller introspection and gathers the userDB upgrade steps. Sets the total,
-    calls each step along with its description and if needed performs a VACUUM at the end
+    calls each step along with its description and if needed marks that a VACUUM is required.
+    The VACUUM rewrites the entire DB so it is done only once after all pending upgrades.
     NB: The function definition order is the function calling order"""
     step_functions = gather_caller_functions(depth=2)
-    progress_handler.set_total_steps(len(step_functions) + (1 if should_vacuum else 0))
+    progress_handler.set_total_steps(len(step_functions))
     with db.user_write() as write_cursor:
         for function, original_function in step_functions:
             progress_handler.new_step(original_function._description)  # type: ignore  # we do confirm all gathered functions have the attribute
             function(write_cursor)
 
-    if should_vacuum:  # TODO: Probably can generalize this to a given post-transaction step
-        progress_handler.new_step('Vacuuming database.')
-        db.conn.execute('VACUUM;')
+    if should_vacuum:
+        progress_handler.vacuum_pending = True
 
 
 def perform_globaldb_upgrade_steps(
@@ -1,9 +1,12 @@
 from collections.abc import Callable
-from typing import Any, NamedTuple
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from rotkehlchen.api.websockets.typedefs import WSMessageType
 from rotkehlchen.utils.interfaces import ProgressUpdater
 
+if TYPE_CHECKING:
+    from rotkehlchen.user_messages import MessagesAggregator
+
 
 class UpgradeRecord(NamedTuple):
     from_version: int
@@ -14,6 +17,11 @@ class UpgradeRecord(NamedTuple):
 class DBUpgradeProgressHandler(ProgressUpdater):
     """Class to notify users through websockets about progress of upgrading the database."""
 
+    def __init__(self, messages_aggregator: 'MessagesAggregator', target_version: int) -> None:
+        super().__init__(messages_aggregator=messages_aggregator, target_version=target_version)
+        # set by user DB upgrades that need a VACUUM. It is done once after all of them
+        self.vacuum_pending = False
+
     def _notify_frontend(self, step_name: str | None = None) -> None:
         """Sends to the user through websockets all information about db upgrading progress."""
         self.messages_aggregator.add_message(
@@ -0,0 +1,77 @@
+"""
+This script generates the manifest of the protocol decoders of each EVM chain and puts it in
+rotkehlchen/chain/evm/decoding/decoders_manifest.py. The transaction decoders read the
+manifest to know which decoder modules to import instead of walking the chain packages,
+which addresses need which decoder, and the counterparties and products of the decoders.
+
+It needs to be run every time a decoder is added, removed or renamed or its address rules,
+counterparties or products change. The test_decoders_manifest_is_up_to_date test fails if
+the manifest is stale.
+"""
+
+import argparse
+import datetime
+from pathlib import Path
+
+from rotkehlchen.chain.evm.decoding.decoder import find_chain_decoders, find_decoders_details
+from rotkehlchen.types import EVM_CHAIN_IDS_WITH_TRANSACTIONS
+from rotkehlchen.utils.misc import get_system_spec
+
+p = argparse.ArgumentParser()
+p.add_argument(
+    '--author',
+    help='Who is running this script? Used just for informational purposes',
+    type=str,
+    required=True,
+)
+args = p.parse_args()
+
+created_at = datetime.datetime.now(tz=datetime.UTC).strftime('%Y-%m-%d %H:%M:%S')
+rotki_version = get_system_spec()['rotkehlchen']
+manifest_lines, counterparties_lines, products_lines = [], [], []
+for chain_id in EVM_CHAIN_IDS_WITH_TRANSACTIONS:
+    chain_name = chain_id.to_name()
+    chain_decoders = find_chain_decoders(f'rotkehlchen.chain.{chain_name}.modules')
+    counterparties, products = find_decoders_details(chain_decoders)
+    manifest_lines.append(f"    '{chain_name}': (")
+    manifest_lines.extend(
+        f"        ('{class_name}', '{module_name}', {addresses!r}),"
+        for class_name, module_name, addresses in chain_decoders
+    )
+    manifest_lines.append('    ),')
+    counterparties_lines.append(f"    '{chain_name}': (")
+    counterparties_lines.extend(f'        {counterparty!r},' for counterparty in counterparties)
+    counterparties_lines.append('    ),')
+    products_lines.append(f"    '{chain_name}': {{")
+    products_lines.extend(
+        f"        '{counterparty}': [{', '.join(f'EvmProduct.{x.name}' for x in counterparty_products)}],"  # noqa: E501
+        for counterparty, counterparty_products in products.items()
+    )
+    products_lines.append('    },')
+
+lines = [
+    '# This file contains the decoders of each EVM chain and it should not be touched manually '
+    'but only generated by tools/scripts/generate_decoders_manifest.py',
+    f'# Created at {created_at} UTC with rotki version {rotki_version} by {args.author}',
+    'from typing import Final',
+    '',
+    'from rotkehlchen.chain.evm.decoding.types import CounterpartyDetails',
+    'from rotkehlchen.history.events.structures.evm_event import EvmProduct',
+    '',
+    '# chain name -> (decoder class name without the Decoder suffix, decoder module, addresses',
+    '# at the first of which the decoder is initialized or None if it is initialized up front)',
+    'DECODERS_MANIFEST: Final[dict[str, tuple[tuple[str, str, tuple[str, ...] | None], ...]]] = {',
+    *manifest_lines,
+    '}',
+    '',
+    '# chain name -> counterparties of the chain decoders',
+    'DECODERS_COUNTERPARTIES: Final[dict[str, tuple[CounterpartyDetails, ...]]] = {',
+    *counterparties_lines,
+    '}',
+    '',
+    '# chain name -> counterparty -> possible products of the chain decoders',
+    'DECODERS_PRODUCTS: Final[dict[str, dict[str, list[EvmProduct]]]] = {',
+    *products_lines,
+    '}',
+]
+Path('rotkehlchen/chain/evm/decoding/decoders_manifest.py').write_text('\n'.join(lines) + '\n', encoding='utf8')  # noqa: E501
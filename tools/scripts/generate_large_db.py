@@ -0,0 +1,386 @@
+"""
+Generate a synthetic rotki data directory at a chosen scale, to reproduce and benchmark
+how the backend behaves with big databases without having to sync real accounts.
+
+The user DB is created and encrypted by the normal DBHandler, so it has the real schema,
+and all rows are written through the same serializers and DB methods the app uses
+(HistoryBaseEntry.serialize_for_db, DBEvmTx, DBEth2, timed balances etc.). Price history
+is written to the global DB of the same data directory.
+
+Example of execution:
+
+python tools/scripts/generate_large_db.py --data-dir /tmp/rotki_scale --history-events 5000000 \
+    --evm-transactions 100000 --validators 2000 --balance-years 10 --price-days 3650
+
+Then start the backend with --data-dir /tmp/rotki_scale and log in with the given user.
+Generation is deterministic for a given --seed and --end-ts.
+"""
+
+import argparse
+import random
+import time
+from collections import defaultdict
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import TypeVar
+
+from eth_utils import to_checksum_address
+
+from rotkehlchen.accounting.structures.balance import Balance, BalanceType
+from rotkehlchen.assets.asset import Asset
+from rotkehlchen.chain.accounts import BlockchainAccountData
+from rotkehlchen.chain.ethereum.modules.eth2.structures import ValidatorDetails
+from rotkehlchen.constants.assets import A_BTC, A_DAI, A_ETH, A_USD, A_USDC, A_WETH
+from rotkehlchen.constants.misc import DEFAULT_SQL_VM_INSTRUCTIONS_CB
+from rotkehlchen.constants.timing import DAY_IN_SECONDS, HOUR_IN_SECONDS, YEAR_IN_SECONDS
+from rotkehlchen.data_handler import DataHandler
+from rotkehlchen.db.dbhandler import DBHandler
+from rotkehlchen.db.eth2 import DBEth2
+from rotkehlchen.db.evmtx import DBEvmTx
+from rotkehlchen.db.history_events import DBHistoryEvents
+from rotkehlchen.db.utils import DBAssetBalance, LocationData
+from rotkehlchen.fval import FVal
+from rotkehlchen.globaldb.handler import GlobalDBHandler
+from rotkehlchen.history.events.structures.base import HistoryBaseEntry, HistoryEvent
+from rotkehlchen.history.events.structures.eth2 import EthWithdrawalEvent
+from rotkehlchen.history.events.structures.evm_event import EvmEvent
+from rotkehlchen.history.events.structures.types import HistoryEventSubType, HistoryEventType
+from rotkehlchen.history.types import HistoricalPrice, HistoricalPriceOracle
+from rotkehlchen.types import (
+    ChainID,
+    ChecksumEvmAddress,
+    Eth2PubKey,
+    EvmTransaction,
+    Location,
+    Price,
+    SupportedBlockchain,
+    Timestamp,
+    TimestampMS,
+    deserialize_evm_tx_hash,
+)
+from rotkehlchen.user_messages import MessagesAggregator
+from rotkehlchen.utils.misc import ts_sec_to_ms
+
+T = TypeVar('T')
+BATCH_SIZE = 10000
+DEFAULT_END_TS = 1735689600  # 01/01/2025. Fixed so that the output does not depend on the clock
+ASSETS: tuple[Asset, ...] = (A_ETH, A_WETH, A_USDC, A_DAI, A_BTC)
+EXCHANGE_LOCATIONS = (Location.KRAKEN, Location.BINANCE, Location.COINBASE, Location.EXTERNAL)
+
+
+def chunks(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    for idx in range(0, len(items), size):
+        yield items[idx:idx + size]
+
+
+def random_address(rng: random.Random) -> ChecksumEvmAddress:
+    return ChecksumEvmAddress(to_checksum_address(rng.randbytes(20)))
+
+
+def random_amount(rng: random.Random) -> FVal:
+    return FVal(round(rng.uniform(0.0001, 100), 6))
+
+
+def report(what: str, count: int, start: float) -> None:
+    print(f'Generated {count} {what} in {time.perf_counter() - start:.1f} seconds')
+
+
+def generate_accounts(db: DBHandler, rng: random.Random, count: int) -> list[ChecksumEvmAddress]:
+    addresses = [random_address(rng) for _ in range(count)]
+    with db.user_write() as write_cursor:
+        db.add_blockchain_accounts(
+            write_cursor=write_cursor,
+            account_data=[
+                BlockchainAccountData(chain=SupportedBlockchain.ETHEREUM, address=x)
+                for x in addresses
+            ],
+        )
+    return addresses
+
+
+def generate_evm_transactions(
+        db: DBHandler,
+        rng: random.Random,
+        addresses: list[ChecksumEvmAddress],
+        count: int,
+        start_ts: Timestamp,
+        end_ts: Timestamp,
+) -> list[EvmTransaction]:
+    """Transactions are spread uniformly over the period and between the addresses"""
+    start = time.perf_counter()
+    dbevmtx = DBEvmTx(db)
+    per_address: defaultdict[ChecksumEvmAddress, list[EvmTransaction]] = defaultdict(list)
+    step = max((end_ts - start_ts) // max(count, 1), 1)
+    for idx in range(count):
+        address = addresses[idx % len(addresses)]
+        timestamp = Timestamp(start_ts + idx * step)
+        per_address[address].append(EvmTransaction(
+            tx_hash=deserialize_evm_tx_hash(rng.randbytes(32)),
+            chain_id=ChainID.ETHEREUM,
+            timestamp=timestamp,
+            block_number=(timestamp - 1438269973) // 12,  # roughly from genesis
+            from_address=address,
+            to_address=random_address(rng),
+            value=rng.randint(0, 10 ** 20),
+            gas=21000,
+            gas_price=rng.randint(10 ** 9, 10 ** 11),
+            gas_used=21000,
+            input_data=b'',
+            nonce=len(per_address[address]),
+        ))
+
+    transactions = []
+    for address, address_transactions in per_address.items():
+        for batch in chunks(address_transactions, BATCH_SIZE):
+            with db.user_write() as write_cursor:
+                dbevmtx.add_evm_transactions(
+                    write_cursor=write_cursor,
+                    evm_transactions=list(batch),
+                    relevant_address=address,
+                )
+        transactions.extend(address_transactions)
+
+    report('evm transactions', count, start)
+    return transactions
+
+
+def generate_validators(
+        db: DBHandler,
+        rng: random.Random,
+        count: int,
+        withdrawal_address: ChecksumEvmAddress,
+        activation_ts: Timestamp,
+) -> list[ValidatorDetails]:
+    start = time.perf_counter()
+    validators = [ValidatorDetails(
+        validator_index=idx,
+        public_key=Eth2PubKey('0x' + rng.randbytes(48).hex()),
+        withdrawal_address=withdrawal_address,
+        activation_timestamp=activation_ts,
+    ) for idx in range(count)]
+    with db.user_write() as write_cursor:
+        DBEth2(db).add_or_update_validators(write_cursor=write_cursor, validators=validators)
+
+    report('validators', count, start)
+    return validators
+
+
+def _make_history_event(
+        idx: int,
+        rng: random.Random,
+        transactions: list[EvmTransaction],
+        validators: list[ValidatorDetails],
+        start_ts: Timestamp,
+        end_ts: Timestamp,
+) -> HistoryBaseEntry:
+    """Make the idx-th event. Roughly 60% are evm events of the generated transactions,
+    20% withdrawals of the generated validators and the rest exchange-like events."""
+    kind = idx % 5
+    if kind < 3 and len(transactions) != 0:
+        evm_idx = (idx // 5) * 3 + kind
+        tx = transactions[evm_idx % len(transactions)]
+        receive = rng.random() < 0.5
+        return EvmEvent(
+            tx_hash=tx.tx_hash,
+            sequence_index=evm_idx // len(transactions),
+            timestamp=ts_sec_to_ms(tx.timestamp),
+            location=Location.ETHEREUM,
+            event_type=HistoryEventType.RECEIVE if receive else HistoryEventType.SPEND,
+            event_subtype=HistoryEventSubType.NONE,
+            asset=rng.choice(ASSETS),
+            balance=Balance(amount=random_amount(rng)),
+            location_label=tx.from_address,
+            notes='Synthetic transfer',
+            address=tx.to_address,
+        )
+
+    if kind == 3 and len(validators) != 0:
+        withdrawal_idx = idx // 5
+        validator = validators[withdrawal_idx % len(validators)]
+        assert validator.validator_index is not None, 'generated validators have an index'
+        # each validator withdraws every 5 days so that event identifiers are unique
+        timestamp = Timestamp(end_ts - (withdrawal_idx // len(validators)) * 5 * DAY_IN_SECONDS)
+        return EthWithdrawalEvent(
+            validator_index=validator.validator_index,
+            timestamp=ts_sec_to_ms(timestamp),
+            balance=Balance(amount=FVal(round(rng.uniform(0.01, 0.07), 6))),
+            withdrawal_address=validator.withdrawal_address,  # type: ignore[arg-type]  # always set for generated validators
+            is_exit=False,
+        )
+
+    return HistoryEvent(
+        event_identifier=f'synthetic_{idx}',
+        sequence_index=0,
+        timestamp=TimestampMS(rng.randint(ts_sec_to_ms(start_ts), ts_sec_to_ms(end_ts))),
+        location=rng.choice(EXCHANGE_LOCATIONS),
+        event_type=rng.choice((HistoryEventType.DEPOSIT, HistoryEventType.WITHDRAWAL)),
+        event_subtype=HistoryEventSubType.NONE,
+        asset=rng.choice(ASSETS),
+        balance=Balance(amount=random_amount(rng)),
+        notes='Synthetic exchange event',
+    )
+
+
+def generate_history_events(
+        db: DBHandler,
+        rng: random.Random,
+        count: int,
+        transactions: list[EvmTransaction],
+        validators: list[ValidatorDetails],
+        start_ts: Timestamp,
+        end_ts: Timestamp,
+) -> None:
+    start = time.perf_counter()
+    dbevents = DBHistoryEvents(db)
+    for batch_start in range(0, count, BATCH_SIZE):
+        events = [
+            _make_history_event(idx, rng, transactions, validators, start_ts, end_ts)
+            for idx in range(batch_start, min(batch_start + BATCH_SIZE, count))
+        ]
+        with db.user_write() as write_cursor:
+            dbevents.add_history_events(write_cursor=write_cursor, history=events)
+
+        if (batch_start // BATCH_SIZE) % 50 == 0:
+            print(f'{batch_start + len(events)}/{count} history events written')
+
+    report('history events', count, start)
+
+
+def generate_timed_balances(
+        db: DBHandler,
+        rng: random.Random,
+        years: int,
+        end_ts: Timestamp,
+) -> None:
+    """One balance snapshot per day with an entry per asset and the location totals"""
+    start = time.perf_counter()
+    days = years * YEAR_IN_SECONDS // DAY_IN_SECONDS
+    first_ts = end_ts - days * DAY_IN_SECONDS
+    snapshots = 0
+    for batch in chunks(range(days), BATCH_SIZE // len(ASSETS)):
+        balances, location_data = [], []
+        for day in batch:
+            timestamp = Timestamp(first_ts + day * DAY_IN_SECONDS)
+            total = FVal(0)
+            for asset in ASSETS:
+                amount = random_amount(rng)
+                usd_value = amount * FVal(round(rng.uniform(0.5, 4000), 2))
+                total += usd_value
+                balances.append(DBAssetBalance(
+                    category=BalanceType.ASSET,
+                    time=timestamp,
+                    asset=asset,
+                    amount=amount,
+                    usd_value=usd_value,
+                ))
+            location_data.append(LocationData(
+                time=timestamp,
+                location=Location.TOTAL.serialize_for_db(),
+                usd_value=str(total),
+            ))
+
+        with db.user_write() as write_cursor:
+            db.add_multiple_balances(write_cursor=write_cursor, balances=balances)
+            db.add_multiple_location_data(write_cursor=write_cursor, location_data=location_data)
+        snapshots += len(batch)
+
+    report('daily balance snapshots', snapshots, start)
+
+
+def generate_price_history(rng: random.Random, days: int, end_ts: Timestamp) -> None:
+    """Hourly prices of every generated asset to USD in the global DB"""
+    start = time.perf_counter()
+    hours = days * DAY_IN_SECONDS // HOUR_IN_SECONDS
+    first_ts = end_ts - hours * HOUR_IN_SECONDS
+    for asset in ASSETS:
+        price = rng.uniform(0.5, 4000)
+        for batch in chunks(range(hours), BATCH_SIZE):
+            entries = []
+            for hour in batch:
+                price = max(price * rng.uniform(0.98, 1.02), 0.0001)  # random walk
+                entries.append(HistoricalPrice(
+                    from_asset=asset,
+                    to_asset=A_USD,
+                    source=HistoricalPriceOracle.CRYPTOCOMPARE,
+                    timestamp=Timestamp(first_ts + hour * HOUR_IN_SECONDS),
+                    price=Price(FVal(round(price, 8))),
+                ))
+            GlobalDBHandler.add_historical_prices(entries)
+
+    report('hourly price entries', hours * len(ASSETS), start)
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description='Generate a synthetic rotki data directory for scaling tests')  # noqa: E501
+    p.add_argument('--data-dir', type=Path, required=True, help='The data directory to create or extend')  # noqa: E501
+    p.add_argument('--username', default='scale', help='Name of the user to create')
+    p.add_argument('--password', default='scale', help='Password of the user DB')
+    p.add_argument('--accounts', type=int, default=200, help='Number of ethereum accounts')
+    p.add_argument('--evm-transactions', type=int, default=100000)
+    p.add_argument('--history-events', type=int, default=1000000)
+    p.add_argument('--validators', type=int, default=2000)
+    p.add_argument('--balance-years', type=int, default=10, help='Years of daily balance snapshots')  # noqa: E501
+    p.add_argument('--price-days', type=int, default=3650, help='Days of hourly price history per asset in the global DB')  # noqa: E501
+    p.add_argument('--seed', type=int, default=0, help='Seed of the random generator')
+    p.add_argument('--end-ts', type=int, default=DEFAULT_END_TS, help='Timestamp of the newest generated data')  # noqa: E501
+    args = p.parse_args()
+
+    rng = random.Random(args.seed)
+    end_ts = Timestamp(args.end_ts)
+    start_ts = Timestamp(end_ts - max(args.balance_years, 1) * YEAR_IN_SECONDS)
+    msg_aggregator = MessagesAggregator()
+    args.data_dir.mkdir(parents=True, exist_ok=True)
+    GlobalDBHandler(
+        data_dir=args.data_dir,
+        sql_vm_instructions_cb=DEFAULT_SQL_VM_INSTRUCTIONS_CB,
+        msg_aggregator=msg_aggregator,
+        perform_assets_updates=False,
+    )
+    data_handler = DataHandler(
+        data_directory=args.data_dir,
+        msg_aggregator=msg_aggregator,
+        sql_vm_instructions_cb=DEFAULT_SQL_VM_INSTRUCTIONS_CB,
+    )
+    data_handler.unlock(
+        username=args.username,
+        password=args.password,
+        create_new=True,
+        resume_from_backup=False,
+    )
+    db = data_handler.db
+
+    addresses = generate_accounts(db=db, rng=rng, count=max(args.accounts, 1))
+    transactions = generate_evm_transactions(
+        db=db,
+        rng=rng,
+        addresses=addresses,
+        count=args.evm_transactions,
+        start_ts=start_ts,
+        end_ts=end_ts,
+    )
+    validators = generate_validators(
+        db=db,
+        rng=rng,
+        count=args.validators,
+        withdrawal_address=addresses[0],
+        activation_ts=start_ts,
+    )
+    generate_history_events(
+        db=db,
+        rng=rng,
+        count=args.history_events,
+        transactions=transactions,
+        validators=validators,
+        start_ts=start_ts,
+        end_ts=end_ts,
+    )
+    generate_timed_balances(db=db, rng=rng, years=args.balance_years, end_ts=end_ts)
+    generate_price_history(rng=rng, days=args.price_days, end_ts=end_ts)
+
+    data_handler.logout()
+    GlobalDBHandler().cleanup()
+    print(f'Done. Log in as {args.username} with --data-dir {args.data_dir}')
+
+
+if __name__ == '__main__':
+    main()